@@ -98,6 +98,53 @@ class Settings(BaseSettings):
         description="Delay in seconds between agent starts in same wave (to avoid rate limits)"
     )
 
+    # LLM gateway concurrency (max in-flight blocking SDK calls per provider)
+    llm_default_max_concurrency: int = Field(
+        default=4,
+        description="Default max concurrent LLM requests for providers without an explicit limit"
+    )
+    gemini_max_concurrency: int = Field(
+        default=8,
+        description="Max concurrent Gemini requests across the process"
+    )
+    claude_max_concurrency: int = Field(
+        default=4,
+        description="Max concurrent Claude requests across the process"
+    )
+    azure_max_concurrency: int = Field(
+        default=4,
+        description="Max concurrent Azure OpenAI requests across the process"
+    )
+
+    # SOA merge analysis
+    soa_merge_max_concurrent_pairs: int = Field(
+        default=4,
+        description="Max adjacent table pairs analyzed concurrently at LLM merge levels 2-8"
+    )
+
+    # SOA merge-group interpretation (Stage 3 worker)
+    soa_interpretation_max_parallel_groups: int = Field(
+        default=3,
+        description="Max merge groups interpreted concurrently in one SOA job"
+    )
+
+    # SSE progress streams
+    sse_heartbeat_seconds: float = Field(
+        default=15.0,
+        description="Max wait between DB reads for SSE streams while the LISTEN/NOTIFY event bus is connected"
+    )
+
+    # Content-addressed PDF store shared by workers
+    pdf_store_dir: Optional[str] = Field(
+        default=None,
+        alias="PDF_STORE_DIR",
+        description="Directory for materialized protocol PDFs (default: <tmp>/protocol_pdfs)"
+    )
+    pdf_store_max_bytes: int = Field(
+        default=2 * 1024 * 1024 * 1024,
+        description="Total size of the PDF store before least recently used PDFs are evicted"
+    )
+
     # Quality thresholds (use method to get with defaults)
     quality_accuracy_threshold: float = Field(
         default=0.95,
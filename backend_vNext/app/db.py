@@ -10,10 +10,11 @@ from typing import Optional, List, Dict, Any
 
 from sqlalchemy import (
     Column, String, Text, Integer, Float, Boolean, DateTime,
-    ForeignKey, Index, UniqueConstraint, create_engine, text, LargeBinary, BigInteger
+    ForeignKey, Index, UniqueConstraint, create_engine, text, LargeBinary, BigInteger,
+    event,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
+from sqlalchemy.orm import declarative_base, deferred, relationship, sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
 from app.config import settings
@@ -22,6 +23,14 @@ from app.config import settings
 # Schema name for all tables
 SCHEMA_NAME = "public"
 
+# Deferred column groups: multi-megabyte BYTEA/JSONB payloads are not loaded
+# with the row; a group loads together on first access to any of its columns
+# (or up front via undefer_group()). Status checks, listings and SSE reads
+# therefore only fetch scalar columns.
+PDF_GROUP = "pdf"          # PDF binaries
+USDM_GROUP = "usdm"        # Protocol-level USDM document
+RESULTS_GROUP = "results"  # Pipeline outputs, reviews and audit trails
+
 # Create base with schema
 Base = declarative_base()
 
@@ -37,10 +46,10 @@ class Protocol(Base):
     protocol_name = Column(String(255), nullable=True)  # Human-readable protocol name
     file_hash = Column(String(64), nullable=False, unique=True)
     file_path = Column(String(500), nullable=True)  # Kept for backward compatibility
-    file_data = Column(LargeBinary, nullable=True)  # PDF binary data (BYTEA)
+    file_data = deferred(Column(LargeBinary, nullable=True), group=PDF_GROUP)  # PDF binary data (BYTEA)
     file_size = Column(BigInteger, nullable=True)  # File size in bytes
     content_type = Column(String(100), nullable=True, default="application/pdf")
-    usdm_json = Column(JSONB, nullable=True)  # Extracted USDM 4.0 data for display
+    usdm_json = deferred(Column(JSONB, nullable=True), group=USDM_GROUP)  # Extracted USDM 4.0 data for display
     extraction_status = Column(String(50), nullable=True)  # pending, processing, completed, failed
     gemini_file_uri = Column(String(500), nullable=True)
     gemini_file_expires_at = Column(DateTime, nullable=True)
@@ -142,8 +151,8 @@ class ExtractionOutput(Base):
     protocol_name = Column(String(255), nullable=True)  # Human-readable protocol name
     file_type = Column(String(50), nullable=False)
     file_name = Column(String(255), nullable=False)
-    file_data = Column(LargeBinary, nullable=True)
-    json_data = Column(JSONB, nullable=True)
+    file_data = deferred(Column(LargeBinary, nullable=True), group=PDF_GROUP)
+    json_data = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)
     file_size = Column(BigInteger, nullable=True)
     content_type = Column(String(100), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -202,13 +211,13 @@ class SOAJob(Base):
     current_phase = Column(String(50), nullable=True)  # Current phase name
 
     # Results
-    usdm_data = Column(JSONB, nullable=True)  # Final USDM output
-    quality_report = Column(JSONB, nullable=True)  # Quality validation results
-    extraction_review = Column(JSONB, nullable=True)  # Raw extraction for review
-    interpretation_review = Column(JSONB, nullable=True)  # Interpretation stages output
+    usdm_data = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # Final USDM output
+    quality_report = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # Quality validation results
+    extraction_review = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # Raw extraction for review
+    interpretation_review = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # Interpretation stages output
 
     # Merge Analysis (Phase 3.5) - stores merge plan and confirmation
-    merge_analysis = Column(JSONB, nullable=True)
+    merge_analysis = deferred(Column(JSONB, nullable=True))  # Loaded on its own (merge confirmation flow)
 
     # Error handling
     error_message = Column(Text, nullable=True)
@@ -258,7 +267,7 @@ class SOATableResult(Base):
     error_message = Column(Text, nullable=True)
 
     # Core USDM data for this table
-    usdm_data = Column(JSONB, nullable=True)  # Full USDM for this specific table
+    usdm_data = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # Full USDM for this specific table
 
     # Quality metrics
     quality_score = Column(JSONB, nullable=True)  # 5D quality scores
@@ -270,7 +279,7 @@ class SOATableResult(Base):
     footnotes_count = Column(Integer, default=0)
 
     # Interpretation pipeline stages (optional - for debugging)
-    interpretation_stages = Column(JSONB, nullable=True)  # Stage-by-stage results
+    interpretation_stages = deferred(Column(JSONB, nullable=True))  # Stage-by-stage results
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -368,11 +377,11 @@ class SOAMergeGroupResult(Base):
     error_message = Column(Text, nullable=True)
 
     # Combined USDM before interpretation
-    merged_usdm = Column(JSONB, nullable=True)
+    merged_usdm = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)
 
     # Interpretation result
-    interpretation_result = Column(JSONB, nullable=True)
-    final_usdm = Column(JSONB, nullable=True)
+    interpretation_result = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)
+    final_usdm = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)
 
     # Quality metrics
     quality_score = Column(JSONB, nullable=True)
@@ -418,12 +427,12 @@ class EligibilityJob(Base):
     # Note: stage info is stored in phase_progress["stage"], no separate column needed
 
     # Results
-    usdm_data = Column(JSONB, nullable=True)  # Final USDM eligibility output
-    quality_report = Column(JSONB, nullable=True)  # 5D quality validation results
-    interpretation_result = Column(JSONB, nullable=True)  # Full interpretation pipeline audit trail
-    raw_criteria = Column(JSONB, nullable=True)  # Raw extracted criteria (Phase 2 output)
-    feasibility_result = Column(JSONB, nullable=True)  # Stage 11 feasibility analysis
-    qeb_result = Column(JSONB, nullable=True)  # Stage 12 QEB builder output
+    usdm_data = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # Final USDM eligibility output
+    quality_report = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # 5D quality validation results
+    interpretation_result = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # Full interpretation pipeline audit trail
+    raw_criteria = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # Raw extracted criteria (Phase 2 output)
+    feasibility_result = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # Stage 11 feasibility analysis
+    qeb_result = deferred(Column(JSONB, nullable=True), group=RESULTS_GROUP)  # Stage 12 QEB builder output
 
     # Counts
     inclusion_count = Column(Integer, nullable=True)
@@ -509,6 +518,51 @@ Index("idx_soa_merge_group_results_plan_id", SOAMergeGroupResult.merge_plan_id)
 Index("idx_soa_merge_group_results_status", SOAMergeGroupResult.status)
 
 
+# Progress notifications (consumed by app.services.event_bus for SSE)
+NOTIFY_JOB_EVENTS = "job_events"
+NOTIFY_SOA_JOBS = "soa_jobs"
+NOTIFY_ELIGIBILITY_JOBS = "eligibility_jobs"
+
+# Model -> (channel, attribute holding the job id)
+_NOTIFY_MODELS = {
+    Job: (NOTIFY_JOB_EVENTS, "id"),
+    JobEvent: (NOTIFY_JOB_EVENTS, "job_id"),
+    SOAJob: (NOTIFY_SOA_JOBS, "id"),
+    EligibilityJob: (NOTIFY_ELIGIBILITY_JOBS, "id"),
+}
+
+
+@event.listens_for(Session, "after_flush")
+def _notify_progress_changes(session: Session, flush_context) -> None:
+    """
+    Issue pg_notify for job progress rows written in this flush.
+
+    NOTIFY is transactional, so listeners only hear about committed changes
+    and a rollback discards the notification. This covers every worker
+    process without each status update having to publish explicitly.
+    """
+    targets = set()
+    for obj in list(session.new) + list(session.dirty):
+        mapping = _NOTIFY_MODELS.get(type(obj))
+        if mapping:
+            channel, attr = mapping
+            job_id = getattr(obj, attr, None)
+            if job_id is not None:
+                targets.add((channel, str(job_id)))
+
+    if not targets:
+        return
+
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+    for channel, job_id in targets:
+        connection.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": channel, "payload": job_id},
+        )
+
+
 # Database engine and session factory
 _engine = None
 _SessionLocal = None
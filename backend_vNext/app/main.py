@@ -48,11 +48,17 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database schema: {e}")
         raise
 
+    # Start LISTEN/NOTIFY event bus for SSE progress streams
+    from app.services.event_bus import get_event_bus
+    event_bus = get_event_bus()
+    event_bus.start()
+
     logger.info("backend_vNext application started")
     yield
 
     # Shutdown
     logger.info("Shutting down backend_vNext application...")
+    event_bus.stop()
 
 
 # Create FastAPI application
@@ -9,26 +9,28 @@ Endpoints:
 - GET /protocols/{protocol_id}/eligibility/latest - Get latest eligibility job for protocol
 """
 
-import asyncio
 import json
 import logging
-import tempfile
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
-from app.db import get_db, Protocol, EligibilityJob
+from app.db import (
+    get_db, get_session_factory, Protocol, EligibilityJob,
+    NOTIFY_ELIGIBILITY_JOBS, RESULTS_GROUP,
+)
+from app.services.event_bus import get_event_bus
 from app.services.eligibility_worker import (
     spawn_section_detection_process,
     spawn_full_extraction_process,
     register_eligibility_process,
 )
+from app.utils.pdf_store import get_protocol_pdf_path
 
 logger = logging.getLogger(__name__)
 
@@ -106,27 +108,12 @@ class EligibilityResultsResponse(BaseModel):
 
 def get_pdf_path_for_protocol(protocol: Protocol, db: Session) -> str:
     """
-    Get or create a temporary file path for the protocol PDF.
+    Get a filesystem path for the protocol PDF.
 
-    If the protocol has file_data (stored in DB), write it to a temp file.
-    Otherwise, use the file_path if available.
+    PDFs stored in the database are materialized once in the shared
+    content-addressed store (keyed by file_hash); otherwise file_path is used.
     """
-    if protocol.file_data:
-        # Write binary data to temp file
-        temp_dir = Path(tempfile.gettempdir()) / "eligibility_extraction"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_path = temp_dir / f"{protocol.id}_{protocol.filename}"
-
-        if not temp_path.exists():
-            with open(temp_path, 'wb') as f:
-                f.write(protocol.file_data)
-            logger.info(f"Created temp PDF file: {temp_path}")
-
-        return str(temp_path)
-    elif protocol.file_path:
-        return protocol.file_path
-    else:
-        raise ValueError(f"Protocol {protocol.id} has no PDF data or file path")
+    return get_protocol_pdf_path(protocol)
 
 
 def get_protocol_by_study_id(study_id: str, db: Session) -> Optional[Protocol]:
@@ -509,7 +496,10 @@ async def get_eligibility_results(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid job ID format")
 
-    job = db.query(EligibilityJob).filter(EligibilityJob.id == job_uuid).first()
+    # Results columns are deferred; load them together in the same query
+    job = db.query(EligibilityJob).options(
+        undefer_group(RESULTS_GROUP)
+    ).filter(EligibilityJob.id == job_uuid).first()
     if not job:
         raise HTTPException(status_code=404, detail=f"Eligibility job not found: {job_id}")
 
@@ -632,60 +622,62 @@ async def get_eligibility_events(
         last_status = None
         last_phase = None
         last_stage = None
-
-        while True:
-            # Get fresh job state
-            from app.db import get_session_factory
-            SessionLocal = get_session_factory()
-            fresh_db = SessionLocal()
-            try:
-                fresh_job = fresh_db.query(EligibilityJob).filter(
-                    EligibilityJob.id == job_uuid
-                ).first()
-
-                if not fresh_job:
-                    yield f"event: error\ndata: {json.dumps({'message': 'Job not found'})}\n\n"
-                    break
-
-                # Check for changes (get current_stage from phase_progress JSONB)
-                current_stage_value = (fresh_job.phase_progress or {}).get("stage")
-                if (fresh_job.status != last_status or
-                    fresh_job.current_phase != last_phase or
-                    current_stage_value != last_stage):
-
-                    event_data = {
-                        "status": fresh_job.status,
-                        "current_phase": fresh_job.current_phase,
-                        "current_stage": current_stage_value,
-                        "phase_progress": fresh_job.phase_progress,
-                        "detected_sections": fresh_job.detected_sections if fresh_job.status == "awaiting_section_confirmation" else None,
-                    }
-
-                    yield f"event: progress\ndata: {json.dumps(event_data)}\n\n"
-
-                    last_status = fresh_job.status
-                    last_phase = fresh_job.current_phase
-                    last_stage = current_stage_value
-
-                # Check if job is terminal
-                if fresh_job.status in ("completed", "failed", "cancelled"):
-                    final_data = {
-                        "status": fresh_job.status,
-                        "error_message": fresh_job.error_message,
-                    }
-                    if fresh_job.status == "completed":
-                        final_data["counts"] = {
-                            "inclusion": fresh_job.inclusion_count or 0,
-                            "exclusion": fresh_job.exclusion_count or 0,
-                            "atomic": fresh_job.atomic_count or 0,
+        SessionLocal = get_session_factory()
+
+        # Subscribe before the first read so no notification is missed
+        with get_event_bus().subscribe(NOTIFY_ELIGIBILITY_JOBS, str(job_uuid)) as subscription:
+            while True:
+                # Get fresh job state
+                fresh_db = SessionLocal()
+                try:
+                    fresh_job = fresh_db.query(EligibilityJob).filter(
+                        EligibilityJob.id == job_uuid
+                    ).first()
+
+                    if not fresh_job:
+                        yield f"event: error\ndata: {json.dumps({'message': 'Job not found'})}\n\n"
+                        break
+
+                    # Check for changes (get current_stage from phase_progress JSONB)
+                    current_stage_value = (fresh_job.phase_progress or {}).get("stage")
+                    if (fresh_job.status != last_status or
+                        fresh_job.current_phase != last_phase or
+                        current_stage_value != last_stage):
+
+                        event_data = {
+                            "status": fresh_job.status,
+                            "current_phase": fresh_job.current_phase,
+                            "current_stage": current_stage_value,
+                            "phase_progress": fresh_job.phase_progress,
+                            "detected_sections": fresh_job.detected_sections if fresh_job.status == "awaiting_section_confirmation" else None,
                         }
-                    yield f"event: complete\ndata: {json.dumps(final_data)}\n\n"
-                    break
 
-            finally:
-                fresh_db.close()
+                        yield f"event: progress\ndata: {json.dumps(event_data)}\n\n"
 
-            await asyncio.sleep(2)  # Poll every 2 seconds
+                        last_status = fresh_job.status
+                        last_phase = fresh_job.current_phase
+                        last_stage = current_stage_value
+
+                    # Check if job is terminal
+                    if fresh_job.status in ("completed", "failed", "cancelled"):
+                        final_data = {
+                            "status": fresh_job.status,
+                            "error_message": fresh_job.error_message,
+                        }
+                        if fresh_job.status == "completed":
+                            final_data["counts"] = {
+                                "inclusion": fresh_job.inclusion_count or 0,
+                                "exclusion": fresh_job.exclusion_count or 0,
+                                "atomic": fresh_job.atomic_count or 0,
+                            }
+                        yield f"event: complete\ndata: {json.dumps(final_data)}\n\n"
+                        break
+
+                finally:
+                    fresh_db.close()
+
+                # Wait for a push notification (falls back to 2s polling without the bus)
+                await subscription.wait(fallback_interval=2.0)
 
     return StreamingResponse(
         event_generator(),
@@ -4,24 +4,24 @@ Jobs router for status tracking and SSE streaming.
 Endpoints:
 - GET /{job_id} - Get job status
 - GET /{job_id}/results - Get all module results
-- GET /{job_id}/events - SSE stream of job events
+- GET /{job_id}/events - SSE stream of job events (push-based via event bus)
 """
 
-import asyncio
 import json
 import logging
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sse_starlette.sse import EventSourceResponse
 
-from app.db import get_db, Job, ModuleResult, JobEvent
+from app.db import get_db, get_session_factory, Job, ModuleResult, JobEvent, NOTIFY_JOB_EVENTS
 from app.services.checkpoint_service import CheckpointService
+from app.services.event_bus import get_event_bus
 
 logger = logging.getLogger(__name__)
 
@@ -189,59 +189,75 @@ async def get_module_result(
 async def stream_job_events(
     job_id: UUID,
     last_event_id: Optional[int] = Query(None, description="Last received event ID"),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
     db: Session = Depends(get_db),
 ):
     """
     SSE stream of job events for real-time progress tracking.
 
-    Events are streamed as they occur. Use last_event_id to resume from
-    a specific point after reconnection.
+    Events are pushed when workers commit (PostgreSQL LISTEN/NOTIFY via the
+    event bus) instead of polling once per second. Use last_event_id, or the
+    Last-Event-ID header browsers send on automatic reconnect, to replay
+    events missed while disconnected.
     """
     job = db.query(Job).filter(Job.id == job_id).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
+    if last_event_id is None and last_event_id_header and last_event_id_header.isdigit():
+        last_event_id = int(last_event_id_header)
+
     async def event_generator():
         """Generate SSE events."""
         current_id = last_event_id or 0
-
-        while True:
-            # Query new events
-            events = db.query(JobEvent).filter(
-                JobEvent.job_id == job_id,
-                JobEvent.id > current_id,
-            ).order_by(JobEvent.id).all()
-
-            for event in events:
-                current_id = event.id
-                data = {
-                    "event_type": event.event_type,
-                    "module_id": event.module_id,
-                    "payload": event.payload,
-                    "timestamp": event.created_at.isoformat(),
-                }
-                yield {
-                    "event": event.event_type,
-                    "id": str(event.id),
-                    "data": json.dumps(data),
-                }
-
-            # Check if job is complete
-            job_check = db.query(Job).filter(Job.id == job_id).first()
-            if job_check and job_check.status in ("completed", "failed", "completed_with_errors"):
-                # Send final status
-                yield {
-                    "event": "job_finished",
-                    "data": json.dumps({
-                        "status": job_check.status,
-                        "completed_modules": job_check.completed_modules,
-                        "failed_modules": job_check.failed_modules,
-                    }),
-                }
-                break
-
-            # Poll interval
-            await asyncio.sleep(1)
+        SessionLocal = get_session_factory()
+
+        # Subscribe before the first read so no notification is missed
+        with get_event_bus().subscribe(NOTIFY_JOB_EVENTS, str(job_id)) as subscription:
+            while True:
+                # Short-lived session per wake-up (replays everything after current_id)
+                fresh_db = SessionLocal()
+                try:
+                    events = fresh_db.query(JobEvent).filter(
+                        JobEvent.job_id == job_id,
+                        JobEvent.id > current_id,
+                    ).order_by(JobEvent.id).all()
+
+                    for event in events:
+                        current_id = event.id
+                        data = {
+                            "event_type": event.event_type,
+                            "module_id": event.module_id,
+                            "payload": event.payload,
+                            "timestamp": event.created_at.isoformat(),
+                        }
+                        yield {
+                            "event": event.event_type,
+                            "id": str(event.id),
+                            "data": json.dumps(data),
+                        }
+
+                    # Check if job is complete
+                    job_check = fresh_db.query(
+                        Job.status, Job.completed_modules, Job.failed_modules
+                    ).filter(Job.id == job_id).first()
+                finally:
+                    fresh_db.close()
+
+                if job_check and job_check.status in ("completed", "failed", "completed_with_errors"):
+                    # Send final status
+                    yield {
+                        "event": "job_finished",
+                        "data": json.dumps({
+                            "status": job_check.status,
+                            "completed_modules": job_check.completed_modules,
+                            "failed_modules": job_check.failed_modules,
+                        }),
+                    }
+                    break
+
+                # Wait for a push notification (falls back to 1s polling without the bus)
+                await subscription.wait(fallback_interval=1.0)
 
     return EventSourceResponse(event_generator())
 
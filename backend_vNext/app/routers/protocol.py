@@ -14,47 +14,68 @@ from pathlib import Path
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
 from app.config import settings
 from app.db import get_db, Protocol, Job
 from app.services.checkpoint_service import CheckpointService
+from app.utils.pdf_store import get_protocol_pdf_path
+from app.utils.pdf_streaming import build_pdf_response, bytea_length, make_etag
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# usdm_json.study fields shown on the landing page protocol cards; projected
+# on their own so the listing does not read whole USDM documents
+STUDY_SUMMARY_FIELDS = (
+    "id",
+    "name",
+    "officialTitle",
+    "sponsorName",
+    "studyIdentifiers",
+    "studyPhase",
+    "therapeuticArea",
+    "indication",
+)
+
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def get_protocol_by_id_or_study_id(protocol_id: str, db: Session) -> Optional[Protocol]:
+def get_protocol_by_id_or_study_id(
+    protocol_id: str,
+    db: Session,
+    *load_options,
+) -> Optional[Protocol]:
     """
     Find protocol by UUID or studyId (filename without .pdf extension).
 
     Args:
         protocol_id: Either a UUID string or a studyId
         db: Database session
+        *load_options: Optional loader options (e.g. defer(Protocol.file_data))
 
     Returns:
         Protocol if found, None otherwise
     """
+    query = db.query(Protocol).options(*load_options)
+
     # Try to parse as UUID first
     try:
         protocol_uuid = UUID(protocol_id)
-        return db.query(Protocol).filter(Protocol.id == protocol_uuid).first()
+        return query.filter(Protocol.id == protocol_uuid).first()
     except ValueError:
         # Not a UUID, try as studyId (filename match)
-        protocol = db.query(Protocol).filter(
+        protocol = query.filter(
             Protocol.filename == f"{protocol_id}.pdf"
         ).first()
         if not protocol:
             # Try partial match
-            protocol = db.query(Protocol).filter(
+            protocol = query.filter(
                 Protocol.filename.ilike(f"%{protocol_id}%")
             ).first()
         return protocol
@@ -73,6 +94,7 @@ class ProtocolListResponse(BaseModel):
     studyId: Optional[str] = None
     studyTitle: Optional[str] = None
     usdmData: Optional[dict] = None
+    studySummary: Optional[dict] = None  # Subset of usdmData.study (STUDY_SUMMARY_FIELDS)
     extractionStatus: Optional[str] = None  # pending, processing, completed, failed
     created_at: str
 
@@ -117,15 +139,35 @@ def compute_hash_from_bytes(file_data: bytes) -> str:
 
 @router.get("", response_model=list[ProtocolListResponse])
 async def list_protocols(
+    include_usdm: bool = Query(False, description="Include extracted USDM data per protocol"),
     db: Session = Depends(get_db),
 ):
     """
     List all uploaded protocols.
 
     Returns protocols from the protocols table for display on landing page.
-    Includes extracted USDM data for rich metadata display.
+    Each protocol carries studySummary, the card fields of the extracted
+    USDM study. The full USDM document is only read and returned with
+    include_usdm=true; the column projection keeps PDF binaries and USDM
+    documents out of the plain listing.
     """
-    protocols = db.query(Protocol).order_by(Protocol.created_at.desc()).all()
+    columns = [
+        Protocol.id,
+        Protocol.filename,
+        Protocol.file_hash,
+        Protocol.file_size,
+        Protocol.extraction_status,
+        Protocol.created_at,
+    ]
+    if include_usdm:
+        columns.append(Protocol.usdm_json)
+    else:
+        columns.extend(
+            Protocol.usdm_json[("study", field)].label(f"study_{field}")
+            for field in STUDY_SUMMARY_FIELDS
+        )
+
+    protocols = db.query(*columns).order_by(Protocol.created_at.desc()).all()
 
     return [
         ProtocolListResponse(
@@ -135,7 +177,8 @@ async def list_protocols(
             file_size=protocol.file_size,
             studyId=protocol.filename.replace(".pdf", ""),
             studyTitle=protocol.filename.replace(".pdf", "").replace("_", " "),
-            usdmData=protocol.usdm_json,  # Extracted USDM 4.0 data
+            usdmData=protocol.usdm_json if include_usdm else None,  # Extracted USDM 4.0 data
+            studySummary=_study_summary(protocol, include_usdm),
             extractionStatus=protocol.extraction_status,  # extraction status
             created_at=protocol.created_at.isoformat(),
         )
@@ -143,6 +186,17 @@ async def list_protocols(
     ]
 
 
+def _study_summary(row, include_usdm: bool) -> Optional[dict]:
+    """Build studySummary from a list_protocols row (None before extraction)."""
+    if include_usdm:
+        study = (row.usdm_json or {}).get("study") or {}
+        values = {field: study.get(field) for field in STUDY_SUMMARY_FIELDS}
+    else:
+        values = {field: getattr(row, f"study_{field}") for field in STUDY_SUMMARY_FIELDS}
+    summary = {field: value for field, value in values.items() if value is not None}
+    return summary or None
+
+
 @router.post("/upload", response_model=ProtocolResponse)
 async def upload_protocol(
     file: UploadFile = File(...),
@@ -246,35 +300,42 @@ async def get_protocol(
 @router.get("/{protocol_id}/pdf")
 async def get_protocol_pdf(
     protocol_id: str,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
     Retrieve the PDF binary data for a protocol.
 
     Accepts either UUID or studyId (filename without .pdf extension).
-    Returns the PDF file as binary data with appropriate content-type header.
-    Frontend can use this endpoint to display or download the PDF.
+    Streams the PDF from the database in chunks. Supports Range requests
+    (206 Partial Content) so pdf.js can fetch pages lazily, and ETag
+    revalidation (file_hash) so browsers can reuse cached copies.
     """
-    protocol = get_protocol_by_id_or_study_id(protocol_id, db)
+    protocol = get_protocol_by_id_or_study_id(
+        protocol_id, db, defer(Protocol.file_data), defer(Protocol.usdm_json)
+    )
     if not protocol:
         raise HTTPException(status_code=404, detail="Protocol not found")
 
-    if not protocol.file_data:
+    row_filter = Protocol.id == protocol.id
+    total_size = protocol.file_size or bytea_length(db, Protocol.file_data, row_filter)
+    if not total_size:
         raise HTTPException(status_code=404, detail="PDF data not found in database")
 
-    return Response(
-        content=protocol.file_data,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'inline; filename="{protocol.filename}"',
-            "Content-Length": str(protocol.file_size or len(protocol.file_data)),
-        }
+    return build_pdf_response(
+        request,
+        column=Protocol.file_data,
+        row_filter=row_filter,
+        total_size=total_size,
+        etag=make_etag(protocol.file_hash),
+        filename=protocol.filename,
     )
 
 
 @router.get("/{protocol_id}/pdf/annotated")
 async def get_annotated_pdf(
     protocol_id: str,
+    request: Request,
     job_id: Optional[UUID] = Query(None, description="Specific job ID (default: latest)"),
     db: Session = Depends(get_db),
 ):
@@ -283,17 +344,26 @@ async def get_annotated_pdf(
 
     Accepts either UUID or studyId (filename without .pdf extension).
     Falls back to original PDF if no annotated version exists.
+    Streams with Range/ETag support like get_protocol_pdf.
     """
     from app.db import ExtractionOutput
 
-    protocol = get_protocol_by_id_or_study_id(protocol_id, db)
+    protocol = get_protocol_by_id_or_study_id(
+        protocol_id, db, defer(Protocol.file_data), defer(Protocol.usdm_json)
+    )
     if not protocol:
         raise HTTPException(status_code=404, detail="Protocol not found")
 
-    # Find annotated PDF
-    query = db.query(ExtractionOutput).filter(
+    # Find annotated PDF (metadata only - the binary is streamed below)
+    query = db.query(
+        ExtractionOutput.id,
+        ExtractionOutput.file_name,
+        ExtractionOutput.file_size,
+        ExtractionOutput.created_at,
+    ).filter(
         ExtractionOutput.protocol_id == protocol.id,
-        ExtractionOutput.file_type == "annotated_pdf"
+        ExtractionOutput.file_type == "annotated_pdf",
+        ExtractionOutput.file_data.isnot(None),
     )
 
     if job_id:
@@ -303,28 +373,34 @@ async def get_annotated_pdf(
 
     annotated_output = query.first()
 
-    if annotated_output and annotated_output.file_data:
-        return Response(
-            content=annotated_output.file_data,
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f'inline; filename="{annotated_output.file_name}"',
-                "Content-Length": str(annotated_output.file_size)
-            }
+    if annotated_output:
+        row_filter = ExtractionOutput.id == annotated_output.id
+        total_size = annotated_output.file_size or bytea_length(
+            db, ExtractionOutput.file_data, row_filter
+        )
+        return build_pdf_response(
+            request,
+            column=ExtractionOutput.file_data,
+            row_filter=row_filter,
+            total_size=total_size,
+            etag=make_etag(protocol.file_hash, annotated_output.id, total_size),
+            filename=annotated_output.file_name,
         )
 
     # Fallback to original PDF
     logger.info(f"No annotated PDF for protocol {protocol_id}, serving original")
-    if not protocol.file_data:
+    row_filter = Protocol.id == protocol.id
+    total_size = protocol.file_size or bytea_length(db, Protocol.file_data, row_filter)
+    if not total_size:
         raise HTTPException(status_code=404, detail="No PDF available")
 
-    return Response(
-        content=protocol.file_data,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f'inline; filename="{protocol.filename}"',
-            "Content-Length": str(protocol.file_size)
-        }
+    return build_pdf_response(
+        request,
+        column=Protocol.file_data,
+        row_filter=row_filter,
+        total_size=total_size,
+        etag=make_etag(protocol.file_hash),
+        filename=protocol.filename,
     )
 
 
@@ -353,24 +429,13 @@ async def start_extraction(
     if not protocol:
         raise HTTPException(status_code=404, detail="Protocol not found")
 
-    # Check if PDF data is available (either in database or on filesystem)
-    has_db_data = protocol.file_data is not None
-    has_file_path = protocol.file_path and Path(protocol.file_path).exists()
-
-    if not has_db_data and not has_file_path:
+    # Materialize the PDF in the shared store (no write if already present)
+    try:
+        pdf_path = get_protocol_pdf_path(protocol)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Protocol PDF data not found")
+    if not Path(pdf_path).exists():
         raise HTTPException(status_code=400, detail="Protocol PDF data not found")
-
-    # If we have database data but no file path, create a temp file for extraction
-    # (extraction pipeline will be updated to read from DB directly later)
-    pdf_path = protocol.file_path
-    temp_file_path = None
-    if has_db_data and not has_file_path:
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp.write(protocol.file_data)
-            temp_file_path = tmp.name
-        pdf_path = temp_file_path
-        logger.info(f"Created temp file for protocol {protocol_id}: {temp_file_path}")
 
     # Update protocol status to processing
     protocol.extraction_status = "processing"
@@ -390,7 +455,7 @@ async def start_extraction(
     process = spawn_extraction_process(
         job_id=job.id,
         protocol_id=protocol_id,
-        pdf_path=pdf_path,  # Use pdf_path (includes temp file path if needed)
+        pdf_path=pdf_path,
         resume=request.resume,
     )
 
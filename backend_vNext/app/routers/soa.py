@@ -14,24 +14,27 @@ import copy
 import json
 import logging
 import re
-import tempfile
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 from sqlalchemy.orm.attributes import flag_modified
 
-from app.db import get_db, Protocol, SOAJob, SOAEditAudit, SOATableResult
+from app.db import (
+    get_db, get_session_factory, Protocol, SOAJob, SOAEditAudit, SOATableResult,
+    NOTIFY_SOA_JOBS, RESULTS_GROUP,
+)
+from app.services.event_bus import get_event_bus
 from app.services.soa_worker import (
     spawn_page_detection_process,
     spawn_full_extraction_process,
     register_soa_process,
 )
+from app.utils.pdf_store import get_protocol_pdf_path
 
 logger = logging.getLogger(__name__)
 
@@ -95,27 +98,12 @@ class SOAResultsResponse(BaseModel):
 
 def get_pdf_path_for_protocol(protocol: Protocol, db: Session) -> str:
     """
-    Get or create a temporary file path for the protocol PDF.
+    Get a filesystem path for the protocol PDF.
 
-    If the protocol has file_data (stored in DB), write it to a temp file.
-    Otherwise, use the file_path if available.
+    PDFs stored in the database are materialized once in the shared
+    content-addressed store (keyed by file_hash); otherwise file_path is used.
     """
-    if protocol.file_data:
-        # Write binary data to temp file
-        temp_dir = Path(tempfile.gettempdir()) / "soa_extraction"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_path = temp_dir / f"{protocol.id}_{protocol.filename}"
-
-        if not temp_path.exists():
-            with open(temp_path, 'wb') as f:
-                f.write(protocol.file_data)
-            logger.info(f"Created temp PDF file: {temp_path}")
-
-        return str(temp_path)
-    elif protocol.file_path:
-        return protocol.file_path
-    else:
-        raise ValueError(f"Protocol {protocol.id} has no PDF data or file path")
+    return get_protocol_pdf_path(protocol)
 
 
 def get_protocol_by_study_id(study_id: str, db: Session) -> Optional[Protocol]:
@@ -393,7 +381,10 @@ async def get_soa_results(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid job ID format")
 
-    soa_job = db.query(SOAJob).filter(SOAJob.id == job_uuid).first()
+    # Results columns are deferred; load them together in the same query
+    soa_job = db.query(SOAJob).options(
+        undefer_group(RESULTS_GROUP)
+    ).filter(SOAJob.id == job_uuid).first()
     if not soa_job:
         raise HTTPException(status_code=404, detail=f"SOA job not found: {job_id}")
 
@@ -465,7 +456,10 @@ async def get_soa_per_table_results(
         )
 
     # Get per-table results
-    table_results = db.query(SOATableResult).filter(
+    table_query = db.query(SOATableResult)
+    if include_usdm:
+        table_query = table_query.options(undefer_group(RESULTS_GROUP))
+    table_results = table_query.filter(
         SOATableResult.soa_job_id == job_uuid
     ).order_by(SOATableResult.table_id).all()
 
@@ -769,46 +763,56 @@ async def get_soa_events(
         last_status = None
         last_phase = None
         last_progress = None
-        poll_count = 0
-        max_polls = 600  # 10 minutes at 1s intervals
-
-        while poll_count < max_polls:
-            # Refresh job from database
-            db.refresh(soa_job)
-
-            current_status = soa_job.status
-            current_phase = soa_job.current_phase
-            current_progress = soa_job.phase_progress
-
-            # Send event if something changed
-            if (current_status != last_status or
-                current_phase != last_phase or
-                current_progress != last_progress):
-
-                event_data = {
-                    "status": current_status,
-                    "phase": current_phase,
-                    "progress": current_progress,
-                    "detected_pages": soa_job.detected_pages if current_status == "awaiting_page_confirmation" else None,
-                    "error": soa_job.error_message if current_status == "failed" else None,
-                }
-
-                # Include merge_plan from soa_job.merge_analysis when awaiting merge confirmation
-                if current_status == "awaiting_merge_confirmation" and soa_job.merge_analysis:
-                    event_data["merge_plan"] = soa_job.merge_analysis
-
-                yield f"data: {json.dumps(event_data)}\n\n"
-
-                last_status = current_status
-                last_phase = current_phase
-                last_progress = current_progress
-
-                # Stop if job is complete or failed or awaiting merge confirmation
-                if current_status in ["completed", "failed", "awaiting_merge_confirmation"]:
-                    break
-
-            await asyncio.sleep(1)
-            poll_count += 1
+        max_stream_seconds = 600  # 10 minutes
+        deadline = asyncio.get_running_loop().time() + max_stream_seconds
+        SessionLocal = get_session_factory()
+
+        # Subscribe before the first read so no notification is missed
+        with get_event_bus().subscribe(NOTIFY_SOA_JOBS, str(job_uuid)) as subscription:
+            while asyncio.get_running_loop().time() < deadline:
+                # Short-lived session per wake-up instead of refreshing the request session
+                fresh_db = SessionLocal()
+                try:
+                    job = fresh_db.query(SOAJob).filter(SOAJob.id == job_uuid).first()
+                    if not job:
+                        break
+
+                    current_status = job.status
+                    current_phase = job.current_phase
+                    current_progress = job.phase_progress
+
+                    # Send event if something changed
+                    changed = (current_status != last_status or
+                               current_phase != last_phase or
+                               current_progress != last_progress)
+                    if changed:
+                        event_data = {
+                            "status": current_status,
+                            "phase": current_phase,
+                            "progress": current_progress,
+                            "detected_pages": job.detected_pages if current_status == "awaiting_page_confirmation" else None,
+                            "error": job.error_message if current_status == "failed" else None,
+                        }
+
+                        # Include merge_plan from soa_job.merge_analysis when awaiting merge confirmation
+                        if current_status == "awaiting_merge_confirmation" and job.merge_analysis:
+                            event_data["merge_plan"] = job.merge_analysis
+                finally:
+                    fresh_db.close()
+
+                if changed:
+                    yield f"data: {json.dumps(event_data)}\n\n"
+
+                    last_status = current_status
+                    last_phase = current_phase
+                    last_progress = current_progress
+
+                    # Stop if job is complete or failed or awaiting merge confirmation
+                    if current_status in ["completed", "failed", "awaiting_merge_confirmation"]:
+                        break
+
+                # Wait for a push notification (falls back to 1s polling without the bus)
+                await subscription.wait(fallback_interval=1.0)
 
         # Send final event
         yield f"data: {json.dumps({'status': 'stream_ended'})}\n\n"
@@ -1299,6 +1303,7 @@ async def get_merge_group_results(
             "source_table_ids": gr.get("sourceTableIds", gr.get("tableIds", [])),
             "merge_type": gr.get("mergeType", ""),
             "status": gr.get("status", "pending"),
+            "progress": gr.get("progress"),
             "error_message": gr.get("errorMessage"),
             "counts": gr.get("counts", {
                 "visits": 0,
@@ -0,0 +1,217 @@
+"""
+In-process event bus for SSE progress streams.
+
+Worker processes write job progress through SQLAlchemy; app.db issues a
+pg_notify on commit for every Job, JobEvent, SOAJob and EligibilityJob
+change. This bus holds a single dedicated LISTEN connection in the API
+process and wakes the SSE handlers subscribed to the affected job, so
+each connected browser costs one query per actual change instead of one
+query per second.
+
+Handles:
+- One background listener thread per API process (LISTEN on all channels)
+- Per-(channel, job_id) subscriptions with sticky wake-ups (no lost events
+  between a handler's DB read and its next wait)
+- Automatic reconnect with backoff; while disconnected, handlers fall back
+  to the original poll interval
+"""
+
+import asyncio
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Set, Tuple
+
+from app.config import settings
+from app.db import NOTIFY_ELIGIBILITY_JOBS, NOTIFY_JOB_EVENTS, NOTIFY_SOA_JOBS
+
+logger = logging.getLogger(__name__)
+
+CHANNELS = (NOTIFY_JOB_EVENTS, NOTIFY_SOA_JOBS, NOTIFY_ELIGIBILITY_JOBS)
+
+# Listener select() timeout; bounds shutdown latency
+LISTEN_POLL_SECONDS = 5.0
+RECONNECT_MAX_DELAY = 30.0
+
+
+class Subscription:
+    """
+    Wake-up handle for one SSE stream.
+
+    Notifications set an asyncio.Event on the subscriber's loop; wait()
+    clears it, so a notification arriving while the handler is reading
+    the database is not lost.
+    """
+
+    def __init__(self, bus: "EventBus", channel: str, key: str):
+        self.bus = bus
+        self.channel = channel
+        self.key = key
+        self.loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def _notify(self) -> None:
+        """Thread-safe wake-up (called from the listener thread)."""
+        self.loop.call_soon_threadsafe(self._event.set)
+
+    async def wait(self, fallback_interval: float) -> bool:
+        """
+        Wait for the next change to this job.
+
+        Args:
+            fallback_interval: Poll interval used when the bus is not connected
+
+        Returns:
+            True if woken by a notification, False on timeout
+        """
+        timeout = settings.sse_heartbeat_seconds if self.bus.connected else fallback_interval
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._event.clear()
+
+    def close(self) -> None:
+        """Unsubscribe."""
+        self.bus._unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EventBus:
+    """LISTEN/NOTIFY fan-out to asyncio subscribers."""
+
+    def __init__(self, database_url: Optional[str] = None):
+        self.database_url = database_url or settings.database_url
+        self._subscribers: Dict[Tuple[str, str], Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.connected = False
+
+    def start(self) -> None:
+        """Start the listener thread (no-op for non-PostgreSQL databases)."""
+        if self._thread is not None:
+            return
+        if not self.database_url.startswith(("postgresql", "postgres")):
+            logger.info("Event bus disabled (database is not PostgreSQL); SSE will poll")
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen_loop, name="sse-event-bus", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the listener thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=LISTEN_POLL_SECONDS + 1)
+            self._thread = None
+        self.connected = False
+
+    def subscribe(self, channel: str, key: str) -> Subscription:
+        """
+        Subscribe the current event loop to changes of one job.
+
+        Args:
+            channel: Notification channel (see app.db NOTIFY_*)
+            key: Job ID as string
+        """
+        subscription = Subscription(self, channel, str(key))
+        with self._lock:
+            self._subscribers[(channel, subscription.key)].add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get((subscription.channel, subscription.key))
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[(subscription.channel, subscription.key)]
+
+    def dispatch(self, channel: str, key: str) -> int:
+        """
+        Wake all subscribers of a job.
+
+        Also usable for in-process publishing (e.g. from routers).
+
+        Returns:
+            Number of subscribers woken
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get((channel, key), ()))
+        for subscription in subscribers:
+            try:
+                subscription._notify()
+            except RuntimeError:
+                # Subscriber's loop already closed
+                self._unsubscribe(subscription)
+        return len(subscribers)
+
+    def _listen_loop(self) -> None:
+        """Listener thread: hold a LISTEN connection, reconnecting on failure."""
+        import psycopg2
+        import psycopg2.extensions
+
+        delay = 1.0
+        while not self._stop.is_set():
+            conn = None
+            try:
+                # psycopg2 does not understand SQLAlchemy "+driver" URL schemes
+                conn = psycopg2.connect(self.database_url.replace("+psycopg2", "", 1))
+                conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cursor:
+                    for channel in CHANNELS:
+                        cursor.execute(f'LISTEN "{channel}"')
+                self.connected = True
+                delay = 1.0
+                logger.info(f"Event bus listening on {', '.join(CHANNELS)}")
+
+                while not self._stop.is_set():
+                    readable, _, _ = select.select([conn], [], [], LISTEN_POLL_SECONDS)
+                    if not readable:
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        self.dispatch(notify.channel, notify.payload)
+
+            except Exception as e:
+                self.connected = False
+                if self._stop.is_set():
+                    break
+                logger.warning(f"Event bus connection lost: {e}. Reconnecting in {delay:.0f}s")
+                # Wake everyone so they re-read state during the outage
+                with self._lock:
+                    keys = list(self._subscribers)
+                for channel, key in keys:
+                    self.dispatch(channel, key)
+                time.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+            finally:
+                self.connected = False
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+# Singleton instance
+_bus_instance: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Get the singleton event bus instance."""
+    global _bus_instance
+    if _bus_instance is None:
+        _bus_instance = EventBus()
+    return _bus_instance
@@ -0,0 +1,214 @@
+"""
+Process-wide cache of resolved Gemini file handles.
+
+genai.get_file() is a metadata round-trip. The main extraction pipeline,
+SOA stages and eligibility stages all resolve the same uploaded protocol
+PDF before every generate call (including retries), so a single job paid
+dozens of identical lookups.
+
+Handles:
+- Resolve each Gemini file once per process, keyed by file name
+- Expiry tied to Protocol.gemini_file_expires_at (registered by callers)
+- Per-key locking so concurrent callers share one resolution (a key's
+  lock is dropped once its last holder releases it)
+- Explicit invalidation when a file is deleted or re-uploaded
+
+This module deliberately avoids importing app.config / app.db so that
+soa_analyzer and eligibility_analyzer can use it without settings.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Same safety margin GeminiFileService._is_cache_valid uses
+EXPIRY_BUFFER = timedelta(hours=1)
+
+# TTL for handles whose upload expiry was never registered
+UNREGISTERED_TTL = timedelta(hours=1)
+
+
+def normalize_file_name(gemini_file_uri: str) -> str:
+    """
+    Normalize a Gemini file URI or name to the bare file id.
+
+    Accepts "https://.../files/abc123", "files/abc123" or "abc123".
+    """
+    return gemini_file_uri.rstrip("/").split("/")[-1]
+
+
+@dataclass
+class _HandleEntry:
+    """Cached handle with its validity window."""
+
+    handle: Any
+    valid_until: datetime
+
+
+@dataclass
+class _KeyLock:
+    """Resolution lock for one key with its holder count (waiters included)."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    holders: int = 0
+
+
+class GeminiFileHandleCache:
+    """Thread-safe cache of genai File objects keyed by file name."""
+
+    def __init__(self):
+        self._entries: Dict[str, _HandleEntry] = {}
+        self._expiries: Dict[str, datetime] = {}
+        self._key_locks: Dict[str, _KeyLock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def register(self, gemini_file_uri: str, expires_at: Optional[datetime]) -> None:
+        """
+        Record the upload expiry for a file URI.
+
+        Args:
+            gemini_file_uri: Gemini file URI or name
+            expires_at: Protocol.gemini_file_expires_at (naive UTC)
+        """
+        if not gemini_file_uri or not expires_at:
+            return
+        key = normalize_file_name(gemini_file_uri)
+        with self._lock:
+            self._expiries[key] = expires_at
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.valid_until = expires_at - EXPIRY_BUFFER
+
+    def get(
+        self,
+        gemini_file_uri: str,
+        resolver: Optional[Callable[[str], Any]] = None,
+    ) -> Any:
+        """
+        Get the resolved handle for a file, resolving it on first use.
+
+        Args:
+            gemini_file_uri: Gemini file URI or name
+            resolver: Callable taking the file name (default: genai.get_file)
+
+        Returns:
+            Resolved Gemini File object
+        """
+        key = normalize_file_name(gemini_file_uri)
+
+        handle = self._lookup(key)
+        if handle is not None:
+            return handle
+
+        with self._hold_key_lock(key):
+            # Another thread may have resolved it while we waited
+            handle = self._lookup(key)
+            if handle is not None:
+                return handle
+
+            if resolver is None:
+                import google.generativeai as genai
+                resolver = genai.get_file
+
+            handle = resolver(key)
+            now = datetime.utcnow()
+            with self._lock:
+                self.misses += 1
+                expires_at = self._expiries.get(key)
+                valid_until = (
+                    expires_at - EXPIRY_BUFFER if expires_at else now + UNREGISTERED_TTL
+                )
+                self._entries[key] = _HandleEntry(handle=handle, valid_until=valid_until)
+
+            logger.debug(f"Resolved Gemini file handle: {key}")
+            return handle
+
+    def _lookup(self, key: str) -> Any:
+        """Return a live cached handle or None, dropping expired entries."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if datetime.utcnow() >= entry.valid_until:
+                del self._entries[key]
+                return None
+            self.hits += 1
+            return entry.handle
+
+    @contextmanager
+    def _hold_key_lock(self, key: str) -> Iterator[None]:
+        """Hold the resolution lock for a key, dropping it after the last holder."""
+        with self._lock:
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = _KeyLock()
+                self._key_locks[key] = key_lock
+            key_lock.holders += 1
+        try:
+            with key_lock.lock:
+                yield
+        finally:
+            with self._lock:
+                key_lock.holders -= 1
+                if key_lock.holders == 0:
+                    del self._key_locks[key]
+
+    def invalidate(self, gemini_file_uri: str) -> None:
+        """Drop a cached handle (e.g. after delete or re-upload)."""
+        key = normalize_file_name(gemini_file_uri)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._expiries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached handles."""
+        with self._lock:
+            self._entries.clear()
+            self._expiries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "key_locks": len(self._key_locks),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Singleton instance
+_handle_cache_instance: Optional[GeminiFileHandleCache] = None
+_handle_cache_lock = threading.Lock()
+
+
+def get_file_handle_cache() -> GeminiFileHandleCache:
+    """Get the singleton handle cache instance."""
+    global _handle_cache_instance
+    if _handle_cache_instance is None:
+        with _handle_cache_lock:
+            if _handle_cache_instance is None:
+                _handle_cache_instance = GeminiFileHandleCache()
+    return _handle_cache_instance
+
+
+def get_gemini_file(
+    gemini_file_uri: str,
+    resolver: Optional[Callable[[str], Any]] = None,
+) -> Any:
+    """Resolve a Gemini file handle through the shared cache."""
+    return get_file_handle_cache().get(gemini_file_uri, resolver=resolver)
+
+
+def register_gemini_file(gemini_file_uri: str, expires_at: Optional[datetime]) -> None:
+    """Register a file's upload expiry with the shared cache."""
+    get_file_handle_cache().register(gemini_file_uri, expires_at)
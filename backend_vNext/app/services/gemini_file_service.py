@@ -6,6 +6,8 @@ Handles:
 - 48-hour file caching
 - File reference management
 - Retry logic with exponential backoff for transient errors
+- Non-blocking SDK calls via the shared LLM gateway
+- Process-wide file handle cache (one get_file per uploaded PDF)
 """
 
 import asyncio
@@ -14,10 +16,7 @@ import logging
 import random
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Tuple, Union
-import time
-import tempfile
-import os
+from typing import Dict, Optional, Tuple, Union
 from uuid import UUID
 
 import google.generativeai as genai
@@ -25,6 +24,12 @@ from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.db import Protocol
+from app.services.gemini_file_cache import (
+    get_file_handle_cache,
+    register_gemini_file,
+)
+from app.services.llm_gateway import get_llm_gateway, make_request_key
+from app.utils.pdf_store import content_hash_for_path, get_protocol_pdf_path
 
 logger = logging.getLogger(__name__)
 
@@ -134,6 +139,9 @@ class GeminiFileService:
         """Initialize Gemini API client."""
         genai.configure(api_key=settings.gemini_api_key)
         self._model = None
+        self._generation_configs: Dict[int, "genai.GenerationConfig"] = {}
+        self.gateway = get_llm_gateway()
+        self.file_cache = get_file_handle_cache()
 
     @property
     def model(self):
@@ -144,6 +152,9 @@ class GeminiFileService:
 
     def compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA-256 hash of file for deduplication."""
+        known_hash = content_hash_for_path(file_path)
+        if known_hash:
+            return known_hash
         sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
             for chunk in iter(lambda: f.read(8192), b""):
@@ -180,49 +191,31 @@ class GeminiFileService:
         # Check if Gemini cache is still valid
         if protocol.gemini_file_uri and self._is_cache_valid(protocol):
             logger.info(f"Using cached Gemini file: {protocol.gemini_file_uri}")
+            register_gemini_file(protocol.gemini_file_uri, protocol.gemini_file_expires_at)
             return protocol.gemini_file_uri, protocol
 
-        # Get PDF data (prefer database, fallback to filesystem)
-        pdf_data = None
-        temp_file_path = None
-
-        if protocol.file_data:
-            # Have binary data in database
-            pdf_data = protocol.file_data
-            logger.info(f"Using PDF data from database ({len(pdf_data)} bytes)")
-        elif protocol.file_path and Path(protocol.file_path).exists():
-            # Fallback to filesystem
-            with open(protocol.file_path, 'rb') as f:
-                pdf_data = f.read()
-            logger.info(f"Using PDF data from filesystem ({len(pdf_data)} bytes)")
-        else:
-            raise ValueError(f"No PDF data found for protocol {protocol_id}")
-
-        # Create temporary file for Gemini upload (Gemini API requires file path)
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp.write(pdf_data)
-            temp_file_path = tmp.name
-
+        # Materialize the PDF once in the shared store (Gemini API requires a path)
         try:
-            # Upload to Gemini
-            logger.info(f"Uploading PDF to Gemini File API: {protocol.filename}")
-            gemini_file = await self._upload_to_gemini(Path(temp_file_path))
+            pdf_path = Path(get_protocol_pdf_path(protocol))
+        except ValueError:
+            raise ValueError(f"No PDF data found for protocol {protocol_id}")
+        if not pdf_path.exists():
+            raise ValueError(f"No PDF data found for protocol {protocol_id}")
 
-            # Update protocol with Gemini URI
-            expires_at = datetime.utcnow() + timedelta(hours=self.CACHE_DURATION_HOURS)
-            protocol.gemini_file_uri = gemini_file.uri
-            protocol.gemini_file_expires_at = expires_at
-            db.commit()
-            db.refresh(protocol)
+        # Upload to Gemini
+        logger.info(f"Uploading PDF to Gemini File API: {protocol.filename}")
+        gemini_file = await self._upload_to_gemini(pdf_path)
 
-            logger.info(f"Uploaded file with URI: {gemini_file.uri}")
-            return gemini_file.uri, protocol
+        # Update protocol with Gemini URI
+        expires_at = datetime.utcnow() + timedelta(hours=self.CACHE_DURATION_HOURS)
+        protocol.gemini_file_uri = gemini_file.uri
+        protocol.gemini_file_expires_at = expires_at
+        db.commit()
+        db.refresh(protocol)
+        register_gemini_file(gemini_file.uri, expires_at)
 
-        finally:
-            # Clean up temp file
-            if temp_file_path and os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
-                logger.debug(f"Deleted temp file: {temp_file_path}")
+        logger.info(f"Uploaded file with URI: {gemini_file.uri}")
+        return gemini_file.uri, protocol
 
     async def get_or_upload_file(
         self,
@@ -248,6 +241,7 @@ class GeminiFileService:
 
         if protocol and self._is_cache_valid(protocol):
             logger.info(f"Using cached Gemini file: {protocol.gemini_file_uri}")
+            register_gemini_file(protocol.gemini_file_uri, protocol.gemini_file_expires_at)
             return protocol.gemini_file_uri, protocol
 
         # Upload to Gemini File API
@@ -275,6 +269,7 @@ class GeminiFileService:
 
         db.commit()
         db.refresh(protocol)
+        register_gemini_file(gemini_file.uri, expires_at)
 
         logger.info(f"Uploaded file with URI: {gemini_file.uri}")
         return gemini_file.uri, protocol
@@ -290,8 +285,10 @@ class GeminiFileService:
 
     async def _upload_to_gemini(self, file_path: Path):
         """Upload file to Gemini File API."""
-        # Gemini upload_file is synchronous
-        gemini_file = genai.upload_file(
+        # Gemini upload_file is synchronous - run it off the event loop
+        gemini_file = await self.gateway.run(
+            "gemini",
+            genai.upload_file,
             path=str(file_path),
             display_name=file_path.name,
         )
@@ -299,8 +296,8 @@ class GeminiFileService:
         # Wait for file to be processed
         while gemini_file.state.name == "PROCESSING":
             logger.info("Waiting for Gemini to process file...")
-            time.sleep(2)
-            gemini_file = genai.get_file(gemini_file.name)
+            await asyncio.sleep(2)
+            gemini_file = await self.gateway.run("gemini", genai.get_file, gemini_file.name)
 
         if gemini_file.state.name == "FAILED":
             raise RuntimeError(f"Gemini file processing failed: {gemini_file.name}")
@@ -333,22 +330,23 @@ class GeminiFileService:
         """
         max_attempts = settings.api_retry_max_attempts
         last_error: Optional[Exception] = None
+        max_tokens = max_output_tokens or settings.gemini_max_output_tokens
+
+        # Identical concurrent requests (same file, prompt and limits) share one call
+        request_key = make_request_key(
+            settings.gemini_model, gemini_file_uri, max_tokens, prompt
+        )
 
         for attempt in range(max_attempts):
             try:
-                # Get file reference
-                gemini_file = genai.get_file(gemini_file_uri.split("/")[-1])
-
-                # Configure generation
-                generation_config = genai.GenerationConfig(
-                    max_output_tokens=max_output_tokens or settings.gemini_max_output_tokens,
-                    temperature=0.1,  # Low temperature for consistent extraction
-                )
-
-                # Generate content
-                response = self.model.generate_content(
-                    [gemini_file, prompt],
-                    generation_config=generation_config,
+                # Blocking SDK call runs in the gateway's bounded Gemini pool
+                response = await self.gateway.run(
+                    "gemini",
+                    self._generate_content_sync,
+                    gemini_file_uri,
+                    prompt,
+                    max_tokens,
+                    coalesce_key=request_key,
                 )
 
                 # Extract text from response
@@ -390,6 +388,42 @@ class GeminiFileService:
             raise last_error
         raise RuntimeError("Unexpected state: no response and no error")
 
+    def _generate_content_sync(
+        self,
+        gemini_file_uri: str,
+        prompt: str,
+        max_output_tokens: int,
+    ):
+        """
+        Blocking Gemini call executed in a gateway worker thread.
+
+        Args:
+            gemini_file_uri: URI of uploaded file
+            prompt: Prompt to send with file
+            max_output_tokens: Maximum output tokens
+
+        Returns:
+            Raw Gemini response
+        """
+        # Get file reference (resolved once per process, shared across stages)
+        gemini_file = self.file_cache.get(gemini_file_uri, resolver=genai.get_file)
+
+        return self.model.generate_content(
+            [gemini_file, prompt],
+            generation_config=self._get_generation_config(max_output_tokens),
+        )
+
+    def _get_generation_config(self, max_output_tokens: int) -> "genai.GenerationConfig":
+        """Get a reusable GenerationConfig for the given token limit."""
+        generation_config = self._generation_configs.get(max_output_tokens)
+        if generation_config is None:
+            generation_config = genai.GenerationConfig(
+                max_output_tokens=max_output_tokens,
+                temperature=0.1,  # Low temperature for consistent extraction
+            )
+            self._generation_configs[max_output_tokens] = generation_config
+        return generation_config
+
     def delete_file(self, gemini_file_uri: str) -> bool:
         """
         Delete file from Gemini File API.
@@ -403,6 +437,7 @@ class GeminiFileService:
         try:
             file_name = gemini_file_uri.split("/")[-1]
             genai.delete_file(file_name)
+            self.file_cache.invalidate(file_name)
             logger.info(f"Deleted Gemini file: {file_name}")
             return True
         except Exception as e:
@@ -0,0 +1,222 @@
+"""
+Non-blocking gateway for synchronous LLM SDK calls.
+
+The google-generativeai, anthropic and openai clients used across the
+pipeline expose blocking calls. Invoking them directly inside a coroutine
+stalls the event loop, so semaphore-based fan-out (e.g. the wave execution
+in ParallelOrchestrator) degrades to one request at a time.
+
+Handles:
+- Offloading blocking SDK calls to a bounded per-provider thread pool
+- Per-provider concurrency limits (the pool size is the limit)
+- Request coalescing: identical in-flight requests share a single call
+- Simple per-provider counters (calls, coalesced, in-flight, latency)
+"""
+
+import asyncio
+import functools
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def make_request_key(*parts: Any) -> str:
+    """
+    Build a stable coalescing key from request parts.
+
+    Args:
+        *parts: Values identifying the request (model, file URI, prompt, ...)
+
+    Returns:
+        SHA-256 hex digest of the joined parts
+    """
+    sha256 = hashlib.sha256()
+    for part in parts:
+        sha256.update(str(part).encode("utf-8"))
+        sha256.update(b"\x1f")
+    return sha256.hexdigest()
+
+
+class LLMGateway:
+    """
+    Process-wide gateway that runs blocking LLM calls off the event loop.
+
+    Each provider gets its own ThreadPoolExecutor whose size is the
+    provider's concurrency limit, so callers can fan out freely with
+    asyncio.gather and the gateway queues the excess. In-flight requests
+    are tracked as concurrent.futures.Future objects, which keeps
+    coalescing independent of the event loop (Celery tasks call
+    asyncio.run once per job).
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None):
+        """
+        Initialize gateway.
+
+        Args:
+            limits: Max concurrent requests per provider. Providers not listed
+                use settings.llm_default_max_concurrency.
+        """
+        self._limits = dict(limits or {})
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_limit(self, provider: str) -> int:
+        """Get the concurrency limit for a provider."""
+        return max(1, self._limits.get(provider, settings.llm_default_max_concurrency))
+
+    def _get_executor(self, provider: str) -> ThreadPoolExecutor:
+        """Get or create the bounded executor for a provider."""
+        with self._lock:
+            executor = self._executors.get(provider)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.get_limit(provider),
+                    thread_name_prefix=f"llm-{provider}",
+                )
+                self._executors[provider] = executor
+                self._stats[provider] = {
+                    "calls": 0,
+                    "coalesced": 0,
+                    "errors": 0,
+                    "in_flight": 0,
+                    "total_latency_seconds": 0.0,
+                }
+            return executor
+
+    def _timed(self, provider: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run fn in a worker thread while recording latency counters."""
+        stats = self._stats[provider]
+        with self._lock:
+            stats["in_flight"] += 1
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                stats["errors"] += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                stats["in_flight"] -= 1
+                stats["total_latency_seconds"] += elapsed
+
+    def submit(
+        self,
+        provider: str,
+        fn: Callable[..., Any],
+        *args,
+        coalesce_key: Optional[str] = None,
+        **kwargs,
+    ) -> Future:
+        """
+        Submit a blocking call to the provider's pool.
+
+        Args:
+            provider: Provider name ("gemini", "claude", "azure", ...)
+            fn: Blocking callable
+            *args: Positional arguments for fn
+            coalesce_key: If set, an identical in-flight request is reused
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future resolving to fn's return value
+        """
+        executor = self._get_executor(provider)
+
+        with self._lock:
+            if coalesce_key is not None:
+                existing = self._in_flight.get(coalesce_key)
+                if existing is not None and not existing.done():
+                    self._stats[provider]["coalesced"] += 1
+                    logger.debug(f"Coalesced {provider} request {coalesce_key[:12]}")
+                    return existing
+
+            future = executor.submit(self._timed, provider, fn, *args, **kwargs)
+            self._stats[provider]["calls"] += 1
+
+            if coalesce_key is not None:
+                self._in_flight[coalesce_key] = future
+                future.add_done_callback(
+                    functools.partial(self._release, coalesce_key)
+                )
+
+        return future
+
+    def _release(self, coalesce_key: str, future: Future) -> None:
+        """Drop a finished request from the in-flight table."""
+        with self._lock:
+            if self._in_flight.get(coalesce_key) is future:
+                del self._in_flight[coalesce_key]
+
+    async def run(
+        self,
+        provider: str,
+        fn: Callable[..., Any],
+        *args,
+        coalesce_key: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Await a blocking call without blocking the event loop.
+
+        Args:
+            provider: Provider name
+            fn: Blocking callable
+            *args: Positional arguments for fn
+            coalesce_key: Optional key for request coalescing
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's return value
+        """
+        future = self.submit(provider, fn, *args, coalesce_key=coalesce_key, **kwargs)
+        # Shield so a cancelled waiter does not cancel a call shared by others
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get a snapshot of per-provider counters."""
+        with self._lock:
+            return {
+                provider: {**stats, "limit": self.get_limit(provider)}
+                for provider, stats in self._stats.items()
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down all provider pools."""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+            self._stats.clear()
+            self._in_flight.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait)
+
+
+# Singleton instance
+_gateway_instance: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the singleton gateway instance."""
+    global _gateway_instance
+    if _gateway_instance is None:
+        with _gateway_lock:
+            if _gateway_instance is None:
+                _gateway_instance = LLMGateway(limits={
+                    "gemini": settings.gemini_max_concurrency,
+                    "claude": settings.claude_max_concurrency,
+                    "azure": settings.azure_max_concurrency,
+                })
+    return _gateway_instance
@@ -0,0 +1,509 @@
+"""
+Shared LLM response cache (SQLite, WAL mode).
+
+The SOA interpretation stages, the SOA LLM terminology mapper and the
+eligibility concept expander each kept their own JSON file under .cache/,
+loaded it whole and rewrote it whole on every save. The SOA and
+eligibility workers run as separate spawned processes, so concurrent
+saves also overwrote each other's entries.
+
+Handles:
+- Content-addressed entries: (namespace, provider, model, prompt hash,
+  input key), stored under the SHA-256 of those parts
+- SQLite in WAL mode, so readers never block and writers from several
+  processes queue on the busy timeout instead of losing updates
+- Incremental saves: CacheView.save() writes only new, changed or
+  removed entries
+- Size-based eviction of the least recently used entries once the
+  database grows past max_bytes
+- Per-namespace hit / miss / write / eviction counters
+- One-time import of the legacy per-stage JSON files
+
+This module deliberately avoids importing app.config / app.db so that
+soa_analyzer and eligibility_analyzer can use it without settings.
+Configuration comes from LLM_RESPONSE_CACHE_PATH and
+LLM_RESPONSE_CACHE_MAX_MB. With LLM_RESPONSE_CACHE_BACKEND=log,
+get_cache_view() returns views of the append-only log backend
+(app.services.llm_response_log) instead.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# backend_vNext/.cache/llm_responses.db
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent.parent / ".cache" / "llm_responses.db"
+DEFAULT_MAX_MB = 512
+
+# Check the database size after this many writes (SUM over all rows)
+EVICTION_CHECK_WRITES = 200
+
+# Evict down to this fraction of max_bytes so eviction does not run on every write
+EVICTION_TARGET_RATIO = 0.8
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    cache_key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_hash TEXT NOT NULL,
+    input_key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_scope
+    ON llm_responses (namespace, provider, model, prompt_hash);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed
+    ON llm_responses (accessed_at);
+"""
+
+
+def hash_text(text: Optional[str]) -> str:
+    """SHA-256 of a prompt (or any text); empty string for no text."""
+    if not text:
+        return ""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(namespace: str, provider: str, model: str, prompt_hash: str, input_key: str) -> str:
+    """
+    Build the content-addressed row key.
+
+    Args:
+        namespace: Cache namespace (e.g. "domain_categorization")
+        provider: LLM provider, or "" when results do not depend on it
+        model: Model name
+        prompt_hash: hash_text() of the prompt template
+        input_key: Caller's key for the input (e.g. normalized term hash)
+
+    Returns:
+        SHA-256 hex digest of the joined parts
+    """
+    sha256 = hashlib.sha256()
+    for part in (namespace, provider, model, prompt_hash, input_key):
+        sha256.update(str(part).encode("utf-8"))
+        sha256.update(b"\x1f")
+    return sha256.hexdigest()
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class CacheView:
+    """
+    One scope of the cache: a namespace, provider, model and prompt hash.
+
+    Stages that keep an in-memory dict use load() once and save() after
+    each batch; save() compares against what this view last loaded or
+    wrote and only touches the differences. Entries that other processes
+    added in the meantime are left alone.
+    """
+
+    def __init__(self, cache: "LLMResponseCache", namespace: str, provider: str, model: str, prompt_hash: str):
+        self.cache = cache
+        self.namespace = namespace
+        self.provider = provider
+        self.model = model
+        self.prompt_hash = prompt_hash
+        self._persisted: Dict[str, str] = {}  # input_key -> serialized value
+        self._touched: set = set()  # input_keys hit since last save
+
+    @property
+    def scope(self) -> Tuple[str, str, str, str]:
+        return (self.namespace, self.provider, self.model, self.prompt_hash)
+
+    def _row_key(self, input_key: str) -> str:
+        return make_cache_key(*self.scope, input_key)
+
+    def load(
+        self,
+        legacy_file: Optional[Path] = None,
+        legacy_entries: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Load all entries of this scope.
+
+        Args:
+            legacy_file: Old per-stage JSON cache, imported once if the
+                scope is still empty
+            legacy_entries: Extracts {input_key: value} from the legacy
+                JSON document (default: the document itself)
+
+        Returns:
+            Dict mapping input keys to JSON values
+        """
+        rows = self.cache._select_scope(self.scope)
+        if not rows and legacy_file is not None and Path(legacy_file).exists():
+            try:
+                with open(legacy_file, "r", encoding="utf-8") as f:
+                    document = json.load(f)
+                imported = legacy_entries(document) if legacy_entries else document
+                if imported:
+                    self.save(imported)
+                    logger.info(
+                        f"Imported {len(imported)} entries from {legacy_file} into LLM cache "
+                        f"namespace '{self.namespace}'"
+                    )
+                    return dict(imported)
+            except Exception as e:
+                logger.warning(f"Failed to import legacy cache {legacy_file}: {e}")
+
+        entries = {}
+        for input_key, serialized in rows:
+            try:
+                entries[input_key] = json.loads(serialized)
+            except json.JSONDecodeError:
+                continue
+            self._persisted[input_key] = serialized
+        self.cache._count(self.namespace, "loaded", len(entries))
+        return entries
+
+    def record_lookup(self, input_key: str, hit: bool) -> None:
+        """Count a lookup against the loaded entries; hits refresh the entry's LRU age."""
+        self.cache._count(self.namespace, "hits" if hit else "misses")
+        if hit:
+            self._touched.add(input_key)
+
+    def get(self, input_key: str) -> Optional[Any]:
+        """Read a single entry (counts a hit or miss)."""
+        value = self.cache._select_one(self._row_key(input_key))
+        self.cache._count(self.namespace, "hits" if value is not None else "misses")
+        if value is None:
+            return None
+        self._persisted[input_key] = value
+        return json.loads(value)
+
+    def put(self, input_key: str, value: Any) -> None:
+        """Write a single entry."""
+        self.save({input_key: value}, remove_missing=False)
+
+    def save(self, entries: Dict[str, Any], remove_missing: bool = True) -> int:
+        """
+        Persist the differences between entries and the stored scope.
+
+        Args:
+            entries: Full {input_key: JSON-serializable value} of the caller
+            remove_missing: Delete keys this view loaded or wrote earlier
+                that are no longer in entries
+
+        Returns:
+            Number of rows written or deleted
+        """
+        now = time.time()
+        upserts = []
+        for input_key, value in entries.items():
+            serialized = _dumps(value)
+            if self._persisted.get(input_key) == serialized:
+                continue
+            upserts.append((
+                self._row_key(input_key), *self.scope, input_key,
+                serialized, len(serialized), now, now,
+            ))
+            self._persisted[input_key] = serialized
+
+        deletes = []
+        if remove_missing:
+            for input_key in list(self._persisted):
+                if input_key not in entries:
+                    deletes.append(self._row_key(input_key))
+                    del self._persisted[input_key]
+
+        touched = [self._row_key(k) for k in self._touched if k in self._persisted]
+        self._touched.clear()
+
+        if upserts or deletes or touched:
+            self.cache._write(self.namespace, upserts, deletes, touched, now)
+        return len(upserts) + len(deletes)
+
+    def clear(self) -> int:
+        """Delete every entry of this scope."""
+        self._persisted.clear()
+        self._touched.clear()
+        return self.cache._delete_scope(self.scope)
+
+
+class LLMResponseCache:
+    """
+    Process-safe SQLite store for LLM-derived results.
+
+    Each thread (and each process after spawn) gets its own connection.
+    Writes run in short IMMEDIATE transactions; WAL mode keeps readers in
+    other processes unblocked while a writer commits.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite file (default: LLM_RESPONSE_CACHE_PATH or
+                backend_vNext/.cache/llm_responses.db)
+            max_bytes: Size limit of stored values before LRU eviction
+                (default: LLM_RESPONSE_CACHE_MAX_MB, 512 MB)
+        """
+        self.path = Path(path or os.getenv("LLM_RESPONSE_CACHE_PATH") or DEFAULT_CACHE_PATH)
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("LLM_RESPONSE_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._writes_since_check = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection (re-opened after fork / spawn)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def view(self, namespace: str, provider: str = "", model: str = "", prompt: Optional[str] = None) -> CacheView:
+        """
+        Get a view of one cache scope.
+
+        Args:
+            namespace: Cache namespace (one per stage / component)
+            provider: LLM provider ("" for results cached across a fallback chain)
+            model: Model name
+            prompt: Prompt template; changing it starts a fresh scope
+
+        Returns:
+            CacheView for the scope
+        """
+        return CacheView(self, namespace, provider, model, hash_text(prompt))
+
+    # ========================================================================
+    # STORAGE
+    # ========================================================================
+
+    def _select_scope(self, scope: Tuple[str, str, str, str]) -> list:
+        return self._connect().execute(
+            "SELECT input_key, value FROM llm_responses "
+            "WHERE namespace = ? AND provider = ? AND model = ? AND prompt_hash = ?",
+            scope,
+        ).fetchall()
+
+    def _select_one(self, cache_key: str) -> Optional[str]:
+        row = self._connect().execute(
+            "SELECT value FROM llm_responses WHERE cache_key = ?", (cache_key,)
+        ).fetchone()
+        if row is not None:
+            self._connect().execute(
+                "UPDATE llm_responses SET accessed_at = ? WHERE cache_key = ?", (time.time(), cache_key)
+            )
+        return row[0] if row else None
+
+    def _write(
+        self,
+        namespace: str,
+        upserts: list,
+        deletes: Iterable[str],
+        touched: Iterable[str],
+        now: float,
+    ) -> None:
+        conn = self._connect()
+        deletes = [(key,) for key in deletes]
+        touched = [(now, key) for key in touched]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if upserts:
+                conn.executemany(
+                    "INSERT INTO llm_responses (cache_key, namespace, provider, model, prompt_hash, "
+                    "input_key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(cache_key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                    "accessed_at = excluded.accessed_at",
+                    upserts,
+                )
+            if deletes:
+                conn.executemany("DELETE FROM llm_responses WHERE cache_key = ?", deletes)
+            if touched:
+                conn.executemany("UPDATE llm_responses SET accessed_at = ? WHERE cache_key = ?", touched)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._count(namespace, "writes", len(upserts))
+        self._count(namespace, "deletes", len(deletes))
+
+        with self._lock:
+            self._writes_since_check += len(upserts)
+            check = self._writes_since_check >= EVICTION_CHECK_WRITES
+            if check:
+                self._writes_since_check = 0
+        if check:
+            self.evict()
+
+    def _delete_scope(self, scope: Tuple[str, str, str, str]) -> int:
+        cursor = self._connect().execute(
+            "DELETE FROM llm_responses "
+            "WHERE namespace = ? AND provider = ? AND model = ? AND prompt_hash = ?",
+            scope,
+        )
+        self._count(scope[0], "deletes", cursor.rowcount)
+        return cursor.rowcount
+
+    def evict(self) -> int:
+        """
+        Evict least recently used entries while the cache exceeds max_bytes.
+
+        Returns:
+            Number of entries evicted
+        """
+        conn = self._connect()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        excess = total - int(self.max_bytes * EVICTION_TARGET_RATIO)
+        victims = []
+        freed = 0
+        for cache_key, namespace, size in conn.execute(
+            "SELECT cache_key, namespace, size FROM llm_responses ORDER BY accessed_at"
+        ):
+            victims.append((cache_key, namespace))
+            freed += size
+            if freed >= excess:
+                break
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany("DELETE FROM llm_responses WHERE cache_key = ?", [(key,) for key, _ in victims])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        for _, namespace in victims:
+            self._count(namespace, "evictions")
+        logger.info(f"LLM response cache evicted {len(victims)} entries ({freed:,} bytes)")
+        return len(victims)
+
+    # ========================================================================
+    # METRICS
+    # ========================================================================
+
+    def _count(self, namespace: str, counter: str, amount: int = 1) -> None:
+        if not amount:
+            return
+        with self._lock:
+            stats = self._stats.setdefault(
+                namespace,
+                {"hits": 0, "misses": 0, "loaded": 0, "writes": 0, "deletes": 0, "evictions": 0},
+            )
+            stats[counter] += amount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-namespace counters (this process) and stored sizes (all processes).
+
+        Returns:
+            {"path", "maxBytes", "totalBytes", "namespaces": {name: {...}}}
+        """
+        rows = self._connect().execute(
+            "SELECT namespace, COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses GROUP BY namespace"
+        ).fetchall()
+        with self._lock:
+            namespaces = {name: dict(stats) for name, stats in self._stats.items()}
+        for namespace, entries, size in rows:
+            namespaces.setdefault(namespace, {}).update({"entries": entries, "bytes": size})
+        for stats in namespaces.values():
+            lookups = stats.get("hits", 0) + stats.get("misses", 0)
+            stats["hitRate"] = round(stats.get("hits", 0) / lookups, 3) if lookups else 0.0
+        return {
+            "path": str(self.path),
+            "maxBytes": self.max_bytes,
+            "totalBytes": sum(size for _, _, size in rows),
+            "namespaces": namespaces,
+        }
+
+
+# Singleton instances (one per database path; None = default path)
+_cache_instances: Dict[Optional[str], LLMResponseCache] = {}
+_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache(path: Optional[str] = None) -> LLMResponseCache:
+    """
+    Get the shared LLM response cache.
+
+    Args:
+        path: Database file for callers isolated from the shared cache
+            (e.g. a stage constructed with its own cache_dir); None for
+            the process-wide default
+
+    Returns:
+        LLMResponseCache singleton for the path
+    """
+    key = str(path) if path is not None else None
+    cache = _cache_instances.get(key)
+    if cache is None:
+        with _cache_lock:
+            cache = _cache_instances.get(key)
+            if cache is None:
+                cache = LLMResponseCache(path=key)
+                _cache_instances[key] = cache
+    return cache
+
+
+def get_cache_view(
+    namespace: str,
+    model: str = "",
+    provider: str = "",
+    prompt: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
+    backend: Optional[str] = None,
+):
+    """
+    Get a cache scope, shorthand for the per-stage caches.
+
+    Args:
+        namespace: Cache namespace (one per stage / component)
+        model: Model name
+        provider: LLM provider ("" for results cached across a fallback chain)
+        prompt: Prompt template; changing it starts a fresh scope
+        cache_dir: Directory for an isolated store (llm_responses.db or
+            llm_response_logs/ inside it); None for the shared cache
+        backend: "sqlite" or "log" (default: LLM_RESPONSE_CACHE_BACKEND,
+            else "sqlite")
+
+    Returns:
+        CacheView (sqlite) or LogCacheView (log) for the scope
+    """
+    backend = (backend or os.getenv("LLM_RESPONSE_CACHE_BACKEND") or "sqlite").lower()
+    if backend == "log":
+        from app.services.llm_response_log import get_log_structured_cache
+
+        directory = str(Path(cache_dir) / "llm_response_logs") if cache_dir is not None else None
+        return get_log_structured_cache(directory).view(namespace, provider=provider, model=model, prompt=prompt)
+    if backend != "sqlite":
+        logger.warning(f"Unknown LLM response cache backend '{backend}', using sqlite")
+
+    path = str(Path(cache_dir) / "llm_responses.db") if cache_dir is not None else None
+    return get_llm_response_cache(path).view(namespace, provider=provider, model=model, prompt=prompt)
+
+
+def reset_llm_response_cache() -> None:
+    """Reset the singleton caches (useful for testing)."""
+    with _cache_lock:
+        _cache_instances.clear()
@@ -0,0 +1,408 @@
+"""
+Append-only, log-structured backend for the LLM response cache.
+
+An alternative to the SQLite store in app.services.llm_response_cache
+for caches that prefer plain files. Each cache scope (namespace,
+provider, model, prompt hash) is one JSON Lines log:
+
+    {"k": "<input key>", "v": <value>}     upsert
+    {"k": "<input key>", "d": 1}           delete
+
+Handles:
+- O(new entries) saves: CacheView-compatible save() appends only new,
+  changed or removed entries
+- Cross-process safety: appends and compaction hold an exclusive flock
+  on a sidecar .lock file; readers take a shared lock and only consume
+  complete lines
+- Incremental reads: each view remembers its offset and replays only
+  what other processes appended since its last read
+- Periodic compaction: once the log holds COMPACTION_RATIO times more
+  records than live entries, it is rewritten to one record per entry
+  and swapped in atomically with os.replace()
+
+Caches opt in with LLM_RESPONSE_CACHE_BACKEND=log or
+get_cache_view(..., backend="log"). There is no size-based eviction;
+compaction only drops superseded records.
+"""
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from app.services.llm_response_cache import _dumps, hash_text, make_cache_key
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# backend_vNext/.cache/llm_response_logs/
+DEFAULT_LOG_DIR = Path(__file__).parent.parent.parent / ".cache" / "llm_response_logs"
+
+# Compact when the log holds this many records per live entry...
+COMPACTION_RATIO = 2.0
+
+# ...and at least this many records (small logs are not worth rewriting)
+COMPACTION_MIN_RECORDS = 1000
+
+
+class LogCacheView:
+    """
+    One scope of the log-structured cache.
+
+    Same interface as llm_response_cache.CacheView: load() once, then
+    save() the full in-memory dict after each batch; only differences
+    against what this view last loaded or wrote are appended.
+    """
+
+    def __init__(self, cache: "LogStructuredCache", namespace: str, provider: str, model: str, prompt_hash: str):
+        self.cache = cache
+        self.namespace = namespace
+        self.provider = provider
+        self.model = model
+        self.prompt_hash = prompt_hash
+
+        scope_key = make_cache_key(namespace, provider, model, prompt_hash, "")
+        self.path = cache.directory / namespace / f"{scope_key[:32]}.jsonl"
+        self.lock_path = self.path.with_suffix(".lock")
+
+        self._entries: Dict[str, str] = {}  # input_key -> serialized value, replayed from the log
+        self._records = 0  # records in the log (including superseded ones)
+        self._offset = 0  # bytes of the log replayed so far
+        self._inode: Optional[int] = None  # changes when the log is compacted
+        self._persisted: Dict[str, str] = {}  # input_key -> serialized value this view loaded or wrote
+        self._lock = threading.Lock()
+
+    @property
+    def scope(self) -> Tuple[str, str, str, str]:
+        return (self.namespace, self.provider, self.model, self.prompt_hash)
+
+    # ========================================================================
+    # LOG I/O
+    # ========================================================================
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """Hold a shared or exclusive flock on the scope's lock file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _apply(self, line: bytes) -> None:
+        """Apply one log record to the replayed state."""
+        try:
+            record = json.loads(line)
+            input_key = record["k"]
+        except (ValueError, KeyError, TypeError):
+            return  # torn write from a crashed process
+        self._records += 1
+        if record.get("d"):
+            self._entries.pop(input_key, None)
+        else:
+            self._entries[input_key] = _dumps(record.get("v"))
+
+    def _refresh(self) -> None:
+        """Replay records appended since the last read (caller holds a file lock)."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._entries.clear()
+            self._records = self._offset = 0
+            self._inode = None
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # First read, or the log was compacted / cleared by another process
+            self._entries.clear()
+            self._records = self._offset = 0
+            self._inode = stat.st_ino
+
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(stat.st_size - self._offset)
+        end = data.rfind(b"\n") + 1  # only complete lines
+        for line in data[:end].splitlines():
+            if line.strip():
+                self._apply(line)
+        self._offset += end
+
+    def _append(self, lines: list) -> None:
+        """Append records (caller holds the exclusive lock and has refreshed)."""
+        payload = "".join(lines).encode("utf-8")
+        with open(self.path, "ab") as f:
+            if f.tell() > self._offset:
+                # Partial record left by a crashed writer: terminate it so it
+                # is skipped as one invalid line instead of corrupting ours
+                payload = b"\n" + payload
+            f.write(payload)
+            f.flush()
+        self._refresh()
+
+    def _maybe_compact(self) -> bool:
+        """Rewrite the log if superseded records dominate (caller holds the exclusive lock)."""
+        if self._records < COMPACTION_MIN_RECORDS:
+            return False
+        if self._records < COMPACTION_RATIO * max(len(self._entries), 1):
+            return False
+
+        before = self._offset
+        tmp_path = self.path.with_suffix(f".compact.{os.getpid()}")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for input_key, serialized in self._entries.items():
+                f.write(_record(input_key, serialized))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        self._inode = None
+        self._refresh()
+        self.cache._count(self.namespace, "compactions")
+        logger.info(
+            f"Compacted LLM response log {self.path.name} ({self.namespace}): "
+            f"{before:,} -> {self._offset:,} bytes, {len(self._entries)} entries"
+        )
+        return True
+
+    # ========================================================================
+    # CACHEVIEW INTERFACE
+    # ========================================================================
+
+    def load(
+        self,
+        legacy_file: Optional[Path] = None,
+        legacy_entries: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Load all entries of this scope.
+
+        Args:
+            legacy_file: Old per-stage JSON cache, imported once if the
+                scope is still empty
+            legacy_entries: Extracts {input_key: value} from the legacy
+                JSON document (default: the document itself)
+
+        Returns:
+            Dict mapping input keys to JSON values
+        """
+        with self._lock, self._file_lock(exclusive=False):
+            self._refresh()
+            snapshot = dict(self._entries)
+
+        if not snapshot and legacy_file is not None and Path(legacy_file).exists():
+            try:
+                with open(legacy_file, "r", encoding="utf-8") as f:
+                    document = json.load(f)
+                imported = legacy_entries(document) if legacy_entries else document
+                if imported:
+                    self.save(imported)
+                    logger.info(
+                        f"Imported {len(imported)} entries from {legacy_file} into LLM response log "
+                        f"namespace '{self.namespace}'"
+                    )
+                    return dict(imported)
+            except Exception as e:
+                logger.warning(f"Failed to import legacy cache {legacy_file}: {e}")
+
+        self._persisted.update(snapshot)
+        self.cache._count(self.namespace, "loaded", len(snapshot))
+        return {input_key: json.loads(serialized) for input_key, serialized in snapshot.items()}
+
+    def record_lookup(self, input_key: str, hit: bool) -> None:
+        """Count a lookup against the loaded entries."""
+        self.cache._count(self.namespace, "hits" if hit else "misses")
+
+    def get(self, input_key: str) -> Optional[Any]:
+        """Read a single entry, including entries appended by other processes (counts a hit or miss)."""
+        with self._lock, self._file_lock(exclusive=False):
+            self._refresh()
+            serialized = self._entries.get(input_key)
+        self.cache._count(self.namespace, "hits" if serialized is not None else "misses")
+        if serialized is None:
+            return None
+        self._persisted[input_key] = serialized
+        return json.loads(serialized)
+
+    def put(self, input_key: str, value: Any) -> None:
+        """Write a single entry."""
+        self.save({input_key: value}, remove_missing=False)
+
+    def save(self, entries: Dict[str, Any], remove_missing: bool = True) -> int:
+        """
+        Append the differences between entries and what this view last saw.
+
+        Args:
+            entries: Full {input_key: JSON-serializable value} of the caller
+            remove_missing: Delete keys this view loaded or wrote earlier
+                that are no longer in entries
+
+        Returns:
+            Number of records appended
+        """
+        lines = []
+        for input_key, value in entries.items():
+            serialized = _dumps(value)
+            if self._persisted.get(input_key) == serialized:
+                continue
+            lines.append(_record(input_key, serialized))
+            self._persisted[input_key] = serialized
+
+        deletes = 0
+        if remove_missing:
+            for input_key in list(self._persisted):
+                if input_key not in entries:
+                    lines.append(json.dumps({"k": input_key, "d": 1}, ensure_ascii=False) + "\n")
+                    del self._persisted[input_key]
+                    deletes += 1
+
+        if not lines:
+            return 0
+
+        with self._lock, self._file_lock(exclusive=True):
+            self._refresh()
+            self._append(lines)
+            self._maybe_compact()
+
+        self.cache._count(self.namespace, "writes", len(lines) - deletes)
+        self.cache._count(self.namespace, "deletes", deletes)
+        return len(lines)
+
+    def compact(self) -> bool:
+        """Compact the log now if it is worth it; returns True if rewritten."""
+        with self._lock, self._file_lock(exclusive=True):
+            self._refresh()
+            return self._maybe_compact()
+
+    def clear(self) -> int:
+        """Delete every entry of this scope."""
+        with self._lock, self._file_lock(exclusive=True):
+            self._refresh()
+            count = len(self._entries)
+            tmp_path = self.path.with_suffix(f".clear.{os.getpid()}")
+            tmp_path.touch()
+            os.replace(tmp_path, self.path)
+            self._inode = None
+            self._refresh()
+        self._persisted.clear()
+        self.cache._count(self.namespace, "deletes", count)
+        return count
+
+
+def _record(input_key: str, serialized: str) -> str:
+    """One upsert line; serialized is already _dumps() output."""
+    return f'{{"k": {json.dumps(input_key, ensure_ascii=False)}, "v": {serialized}}}\n'
+
+
+class LogStructuredCache:
+    """
+    Directory of append-only logs, one per cache scope.
+
+    Views of the same scope share nothing in memory; each replays the
+    log itself, so views in different processes stay consistent.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Log directory (default: LLM_RESPONSE_LOG_DIR or
+                backend_vNext/.cache/llm_response_logs)
+        """
+        self.directory = Path(directory or os.getenv("LLM_RESPONSE_LOG_DIR") or DEFAULT_LOG_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def view(self, namespace: str, provider: str = "", model: str = "", prompt: Optional[str] = None) -> LogCacheView:
+        """
+        Get a view of one cache scope.
+
+        Args:
+            namespace: Cache namespace (one per stage / component)
+            provider: LLM provider ("" for results cached across a fallback chain)
+            model: Model name
+            prompt: Prompt template; changing it starts a fresh log
+
+        Returns:
+            LogCacheView for the scope
+        """
+        return LogCacheView(self, namespace, provider, model, hash_text(prompt))
+
+    def _count(self, namespace: str, counter: str, amount: int = 1) -> None:
+        if not amount:
+            return
+        with self._lock:
+            stats = self._stats.setdefault(
+                namespace,
+                {"hits": 0, "misses": 0, "loaded": 0, "writes": 0, "deletes": 0, "compactions": 0},
+            )
+            stats[counter] += amount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-namespace counters (this process) and log sizes on disk.
+
+        Returns:
+            {"directory", "totalBytes", "namespaces": {name: {...}}}
+        """
+        with self._lock:
+            namespaces = {name: dict(stats) for name, stats in self._stats.items()}
+        total = 0
+        for log_file in self.directory.glob("*/*.jsonl"):
+            size = log_file.stat().st_size
+            total += size
+            stats = namespaces.setdefault(log_file.parent.name, {})
+            stats["logs"] = stats.get("logs", 0) + 1
+            stats["bytes"] = stats.get("bytes", 0) + size
+        for stats in namespaces.values():
+            lookups = stats.get("hits", 0) + stats.get("misses", 0)
+            stats["hitRate"] = round(stats.get("hits", 0) / lookups, 3) if lookups else 0.0
+        return {"directory": str(self.directory), "totalBytes": total, "namespaces": namespaces}
+
+
+# Singleton instances (one per directory; None = default directory)
+_log_instances: Dict[Optional[str], LogStructuredCache] = {}
+_log_lock = threading.Lock()
+
+
+def get_log_structured_cache(directory: Optional[str] = None) -> LogStructuredCache:
+    """
+    Get the shared log-structured cache.
+
+    Args:
+        directory: Log directory for callers isolated from the shared
+            cache; None for the process-wide default
+
+    Returns:
+        LogStructuredCache singleton for the directory
+    """
+    key = str(directory) if directory is not None else None
+    cache = _log_instances.get(key)
+    if cache is None:
+        with _log_lock:
+            cache = _log_instances.get(key)
+            if cache is None:
+                cache = LogStructuredCache(directory=key)
+                _log_instances[key] = cache
+    return cache
+
+
+def reset_log_structured_cache() -> None:
+    """Reset the singleton caches (useful for testing)."""
+    with _log_lock:
+        _log_instances.clear()
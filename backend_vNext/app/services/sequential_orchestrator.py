@@ -1,7 +1,8 @@
 """
 Sequential orchestrator for module-by-module extraction.
 
-Executes 10 modules in order with:
+Executes modules with:
+- Dependency-aware scheduling (a module starts once its dependencies finish)
 - Two-phase extraction per module
 - Checkpoint after each module
 - Resumption from last completed module
@@ -22,6 +23,7 @@ from app.config import settings
 from app.db import Job, Protocol
 from app.module_registry import get_enabled_modules, get_module
 from app.services.gemini_file_service import GeminiFileService
+from app.services.module_scheduler import ModuleDAGScheduler
 from app.services.two_phase_extractor import TwoPhaseExtractor
 from app.services.checkpoint_service import CheckpointService
 from app.services.usdm_sync_service import UsdmSyncService
@@ -32,11 +34,12 @@ logger = logging.getLogger(__name__)
 
 class SequentialOrchestrator:
     """
-    Orchestrates sequential extraction across all modules.
+    Orchestrates extraction across all modules.
 
     Execution flow:
     1. Upload PDF to Gemini (or use cached)
-    2. For each module in order:
+    2. For each module, as soon as its dependencies have finished
+       (up to max_concurrent_modules at once):
        a. Execute Pass 1 (values)
        b. Execute Pass 2 (provenance)
        c. Validate and save checkpoint
@@ -63,6 +66,7 @@ class SequentialOrchestrator:
         pdf_path: Path,
         resume: bool = True,
         output_dir: Optional[Path] = None,
+        max_concurrent_modules: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Run complete extraction pipeline.
@@ -73,6 +77,8 @@ class SequentialOrchestrator:
             pdf_path: Path to PDF file
             resume: Whether to resume from last checkpoint
             output_dir: Optional output directory for intermediate stages
+            max_concurrent_modules: Modules extracted at once
+                (default: settings.max_parallel_agents; 1 = strictly sequential)
 
         Returns:
             Extraction summary with all results
@@ -110,13 +116,20 @@ class SequentialOrchestrator:
 
             logger.info(f"Processing {len(pending_modules)} modules")
 
-            # Extract each module sequentially
-            results = []
-            for module_id in pending_modules:
+            # Modules not pending are either completed (resume) or disabled;
+            # either way they no longer block their dependents
+            pending_set = set(pending_modules)
+            scheduler = ModuleDAGScheduler(
+                modules=[m for m in get_enabled_modules() if m.module_id in pending_set],
+                completed=[m.module_id for m in get_enabled_modules() if m.module_id not in pending_set],
+                max_concurrent=max_concurrent_modules or settings.max_parallel_agents,
+            )
+
+            async def extract_scheduled(module) -> Dict[str, Any]:
                 try:
-                    result = await self._extract_module(
+                    return await self._extract_module(
                         job_id=job_id,
-                        module_id=module_id,
+                        module_id=module.module_id,
                         gemini_file_uri=gemini_file_uri,
                         protocol_id=protocol.filename.replace(".pdf", ""),
                         protocol_uuid=protocol_id,  # Pass UUID for cache linking
@@ -124,13 +137,12 @@ class SequentialOrchestrator:
                         intermediate_dir=intermediate_dir,
                         use_cache=True,  # Enable caching (same as main.py default)
                     )
-                    results.append(result)
                 except Exception as e:
-                    logger.error(f"Module {module_id} failed: {e}")
-                    # Save failed result
+                    logger.error(f"Module {module.module_id} failed: {e}")
+                    # Save failed result; dependents still run (resilient execution)
                     self.checkpoint_service.save_module_result(
                         job_id=job_id,
-                        module_id=module_id,
+                        module_id=module.module_id,
                         status="failed",
                         extracted_data={},
                         provenance_coverage=0.0,
@@ -138,7 +150,9 @@ class SequentialOrchestrator:
                         pass2_duration=0.0,
                         error_details={"error": str(e)},
                     )
-                    # Continue with next module (resilient execution)
+                    raise
+
+            results = await scheduler.run(extract_scheduled)
 
             # Complete job
             failed_modules = self.checkpoint_service.get_job_status(job_id).get(
@@ -215,6 +215,7 @@ def _run_full_extraction(
 
         # Import after setting environment
         from app.db import get_session_factory, SOAJob, SOATableResult, Protocol
+        from app.services.gemini_file_cache import register_gemini_file
         from soa_analyzer.soa_extraction_pipeline import run_soa_extraction
 
         # Update initial job status with fresh connection
@@ -234,6 +235,7 @@ def _run_full_extraction(
                 raise ValueError(f"Protocol not found: {protocol_id}")
             protocol_name = protocol.filename.replace('.pdf', '')
             gemini_file_uri = protocol.gemini_file_uri
+            register_gemini_file(gemini_file_uri, protocol.gemini_file_expires_at)
         finally:
             db.close()
 
@@ -509,6 +511,7 @@ def _run_merge_analysis(
         os.environ.setdefault('SOA_WORKER', 'true')
 
         # Import after setting environment
+        from app.config import settings
         from app.db import get_session_factory, SOAJob, SOATableResult, Protocol
         from soa_analyzer.table_merge_analyzer import TableMergeAnalyzer
 
@@ -573,7 +576,9 @@ def _run_merge_analysis(
             asyncio.set_event_loop(loop)
 
             try:
-                analyzer = TableMergeAnalyzer()
+                analyzer = TableMergeAnalyzer(
+                    max_concurrent_pairs=settings.soa_merge_max_concurrent_pairs,
+                )
                 merge_plan = loop.run_until_complete(
                     analyzer.analyze_merge_candidates(per_table_results, protocol_name)
                 )
@@ -698,6 +703,31 @@ def spawn_merge_analysis_process(
     return process
 
 
+def _serialize_stage_results(pipeline_result: Any, logger: logging.Logger) -> Dict[Any, Any]:
+    """Convert interpretation stage results into JSON-storable dicts."""
+    serialized_stage_results = {}
+    stage_results = getattr(pipeline_result, 'stage_results', {}) or {}
+    for stage_num, stage_result in stage_results.items():
+        if stage_result is not None:
+            try:
+                if hasattr(stage_result, 'to_dict'):
+                    serialized_stage_results[stage_num] = stage_result.to_dict()
+                elif hasattr(stage_result, '__dict__'):
+                    # Filter out private attributes and non-serializable items
+                    serialized_stage_results[stage_num] = {
+                        k: v for k, v in stage_result.__dict__.items()
+                        if not k.startswith('_') and not callable(v)
+                    }
+                elif isinstance(stage_result, dict):
+                    serialized_stage_results[stage_num] = stage_result
+                else:
+                    serialized_stage_results[stage_num] = str(stage_result)
+            except Exception as se:
+                logger.warning(f"    Could not serialize stage {stage_num} result: {se}")
+                serialized_stage_results[stage_num] = {"error": str(se)}
+    return serialized_stage_results
+
+
 def _run_merge_interpretation(
     soa_job_id: str,
     protocol_id: str,
@@ -708,9 +738,13 @@ def _run_merge_interpretation(
     """
     Stage 3: Run 12-stage interpretation on confirmed merge groups.
 
-    This function runs after the merge plan is confirmed. It processes
-    each merge group sequentially, running the full interpretation pipeline.
-    Group results are stored in soa_job.merge_analysis.groupResults.
+    This function runs after the merge plan is confirmed. Merge groups are
+    independent, so up to settings.soa_interpretation_max_parallel_groups
+    run the full interpretation pipeline concurrently. Their LLM calls go
+    through the shared LLM gateway, whose per-provider *_max_concurrency
+    settings are the only limit on in-flight calls.
+    Group results (with per-group progress) are stored in
+    soa_job.merge_analysis.groupResults.
     """
     import time
     from sqlalchemy.orm.attributes import flag_modified
@@ -722,7 +756,9 @@ def _run_merge_interpretation(
         os.environ.setdefault('SOA_WORKER', 'true')
 
         # Import after setting environment
+        from app.config import settings
         from app.db import get_session_factory, SOAJob, SOATableResult, Protocol
+        from app.services.gemini_file_cache import register_gemini_file
         from soa_analyzer.table_merge_analyzer import combine_table_usdm
         from soa_analyzer.interpretation import InterpretationPipeline, PipelineConfig as InterpretationConfig
 
@@ -742,6 +778,7 @@ def _run_merge_interpretation(
                 raise ValueError(f"Protocol not found: {protocol_id}")
             protocol_name = protocol.filename.replace('.pdf', '')
             gemini_file_uri = protocol.gemini_file_uri
+            register_gemini_file(gemini_file_uri, protocol.gemini_file_expires_at)
 
             # Get merge plan from soa_job.merge_analysis
             soa_job = db.query(SOAJob).filter(SOAJob.id == UUID(soa_job_id)).first()
@@ -818,87 +855,88 @@ def _run_merge_interpretation(
 
         logger.info(f"Processing {len(groups_to_process)} merge groups")
 
-        # Initialize group results list to store in merge_analysis
-        group_results = []
-
-        # Create async event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
         # Stage-level progress tracking
         total_groups = len(groups_to_process)
-        total_stages = total_groups * 12  # 12 stages per group
-
-        # Mutable state for progress callback (allows callback to access current group info)
-        progress_state = {
-            "group_idx": 0,
-            "group_id": "",
-            "stages_in_current_group": 0,
-        }
+        stages_per_group = 12
+        total_stages = total_groups * stages_per_group
+        max_parallel_groups = max(1, settings.soa_interpretation_max_parallel_groups)
+
+        # One entry per group, in plan order, stored in merge_analysis.groupResults.
+        # Groups run concurrently; each entry carries its own progress.
+        group_results = [
+            {
+                "id": group["id"],
+                "mergeGroupId": group["id"],
+                "sourceTableIds": group["table_ids"],
+                "mergeType": group["merge_type"],
+                "status": "pending",
+                "progress": {"stagesCompleted": 0, "stagesTotal": stages_per_group},
+                "createdAt": datetime.utcnow().isoformat(),
+            }
+            for group in groups_to_process
+        ]
+        progress_state = {"groups_completed": 0, "last_group": ""}
 
-        def stage_progress_callback(stage_num: int, stage_name: str, status: str):
-            """Callback to update database after each stage completes."""
-            progress_state["stages_in_current_group"] += 1
+        def save_group_results():
+            """Persist merge_analysis.groupResults (all groups, plan order)."""
+            SessionLocal = get_session_factory()
+            db = SessionLocal()
+            try:
+                soa_job = db.query(SOAJob).filter(SOAJob.id == UUID(soa_job_id)).first()
+                if soa_job and soa_job.merge_analysis:
+                    merge_analysis = dict(soa_job.merge_analysis)
+                    merge_analysis["groupResults"] = group_results
+                    soa_job.merge_analysis = merge_analysis
+                    flag_modified(soa_job, "merge_analysis")
+                    db.commit()
+            finally:
+                db.close()
 
-            # Calculate overall progress: (completed_groups * 12 + current_stage) / total_stages * 100
-            group_idx = progress_state["group_idx"]
-            completed_stages = (group_idx * 12) + progress_state["stages_in_current_group"]
+        def report_progress(group_id: str, stage_num: int, stage_name: str, status: str):
+            """Update overall and per-group progress in phase_progress."""
+            completed_stages = sum(e["progress"]["stagesCompleted"] for e in group_results)
             progress_pct = int((completed_stages / total_stages) * 100) if total_stages > 0 else 0
+            progress_state["last_group"] = group_id
 
             _update_soa_job(soa_job_id, {
                 "phase_progress": {
                     "phase": "interpretation",
                     "progress": progress_pct,
-                    "current_group": progress_state["group_id"],
+                    "current_group": group_id,
                     "current_stage": stage_num,
                     "current_stage_name": stage_name,
                     "current_stage_status": status,
-                    "groups_completed": group_idx,
+                    "groups_completed": progress_state["groups_completed"],
+                    "groups_in_flight": sum(1 for e in group_results if e["status"] == "interpreting"),
                     "groups_total": total_groups,
+                    "groups": {e["id"]: {"status": e["status"], **e["progress"]} for e in group_results},
                 },
             }, logger)
 
-            logger.debug(f"[Progress] Stage {stage_num} ({stage_name}): {status} - Overall: {progress_pct}%")
-
-        try:
-            interpretation_pipeline = InterpretationPipeline(progress_callback=stage_progress_callback)
-
-            for i, group in enumerate(groups_to_process):
-                group_id = group["id"]
-                table_ids = group["table_ids"]
-                merge_type = group["merge_type"]
-
-                logger.info(f"Processing group {group_id} ({i+1}/{total_groups}): tables {table_ids}")
-
-                # Update progress state for the callback to use
-                progress_state["group_idx"] = i
-                progress_state["group_id"] = group_id
-                progress_state["stages_in_current_group"] = 0
-
-                # Initial progress update at start of group
-                initial_progress = int((i * 12 / total_stages) * 100) if total_stages > 0 else 0
-                _update_soa_job(soa_job_id, {
-                    "phase_progress": {
-                        "phase": "interpretation",
-                        "progress": initial_progress,
-                        "current_group": group_id,
-                        "current_stage": 0,
-                        "current_stage_name": "Starting...",
-                        "groups_completed": i,
-                        "groups_total": total_groups,
-                    },
-                }, logger)
-
-                # Initialize group result entry for merge_analysis.groupResults
-                import uuid as uuid_module
-                group_result_entry = {
-                    "id": group_id,
-                    "mergeGroupId": group_id,
-                    "sourceTableIds": table_ids,
-                    "mergeType": merge_type,
-                    "status": "interpreting",
-                    "createdAt": datetime.utcnow().isoformat(),
+            logger.debug(f"[Progress] {group_id} stage {stage_num} ({stage_name}): {status} - Overall: {progress_pct}%")
+
+        async def interpret_group(index: int, group: Dict[str, Any], semaphore: asyncio.Semaphore):
+            """Run the 12-stage pipeline for one merge group."""
+            group_id = group["id"]
+            table_ids = group["table_ids"]
+            entry = group_results[index]
+
+            def stage_progress_callback(stage_num: int, stage_name: str, status: str):
+                """Callback to update database after each stage completes."""
+                entry["progress"] = {
+                    "stagesCompleted": entry["progress"]["stagesCompleted"] + 1,
+                    "stagesTotal": stages_per_group,
+                    "currentStage": stage_num,
+                    "currentStageName": stage_name,
+                    "currentStageStatus": status,
                 }
+                report_progress(group_id, stage_num, stage_name, status)
+
+            async with semaphore:
+                logger.info(f"Processing group {group_id} ({index+1}/{total_groups}): tables {table_ids}")
+                entry["status"] = "interpreting"
+                entry["startedAt"] = datetime.utcnow().isoformat()
+                report_progress(group_id, 0, "Starting...", "running")
 
                 try:
                     # Combine USDM from tables in this group
@@ -907,7 +945,8 @@ def _run_merge_interpretation(
                     if not combined_usdm:
                         raise ValueError(f"No USDM data found for tables: {table_ids}")
 
-                    group_result_entry["mergedUsdm"] = combined_usdm
+                    entry["mergedUsdm"] = combined_usdm
+                    save_group_results()
 
                     # Run 12-stage interpretation pipeline
                     # Determine output directory for saving intermediate results
@@ -925,74 +964,62 @@ def _run_merge_interpretation(
                         output_dir=output_dir,
                     )
 
-                    pipeline_result = loop.run_until_complete(
-                        interpretation_pipeline.run(combined_usdm, interp_config)
-                    )
+                    # One pipeline per group: handlers and the progress callback
+                    # are per-instance state
+                    interpretation_pipeline = InterpretationPipeline(progress_callback=stage_progress_callback)
+                    pipeline_result = await interpretation_pipeline.run(combined_usdm, interp_config)
 
                     # Serialize stage results for storage
-                    serialized_stage_results = {}
-                    stage_results = getattr(pipeline_result, 'stage_results', {}) or {}
-                    for stage_num, stage_result in stage_results.items():
-                        if stage_result is not None:
-                            try:
-                                if hasattr(stage_result, 'to_dict'):
-                                    serialized_stage_results[stage_num] = stage_result.to_dict()
-                                elif hasattr(stage_result, '__dict__'):
-                                    # Filter out private attributes and non-serializable items
-                                    serialized_stage_results[stage_num] = {
-                                        k: v for k, v in stage_result.__dict__.items()
-                                        if not k.startswith('_') and not callable(v)
-                                    }
-                                elif isinstance(stage_result, dict):
-                                    serialized_stage_results[stage_num] = stage_result
-                                else:
-                                    serialized_stage_results[stage_num] = str(stage_result)
-                            except Exception as se:
-                                logger.warning(f"    Could not serialize stage {stage_num} result: {se}")
-                                serialized_stage_results[stage_num] = {"error": str(se)}
+                    serialized_stage_results = _serialize_stage_results(pipeline_result, logger)
 
                     # Update group result with interpretation output
                     final_usdm = pipeline_result.final_usdm or combined_usdm
-                    group_result_entry["status"] = "completed"
-                    group_result_entry["interpretationResult"] = {
+                    entry["status"] = "completed"
+                    entry["interpretationResult"] = {
                         **(pipeline_result.to_dict() if hasattr(pipeline_result, 'to_dict') else {}),
                         "stageResults": serialized_stage_results,  # Add full stage results
                     }
-                    group_result_entry["stageResults"] = serialized_stage_results  # Also store at top level for easy access
-                    group_result_entry["finalUsdm"] = final_usdm
-                    group_result_entry["counts"] = {
+                    entry["stageResults"] = serialized_stage_results  # Also store at top level for easy access
+                    entry["finalUsdm"] = final_usdm
+                    entry["counts"] = {
                         "visits": len(final_usdm.get("visits", [])),
                         "activities": len(final_usdm.get("activities", [])),
                         "sais": len(final_usdm.get("scheduledActivityInstances", [])),
                         "footnotes": len(final_usdm.get("footnotes", [])),
                     }
-                    group_result_entry["completedAt"] = datetime.utcnow().isoformat()
+                    entry["completedAt"] = datetime.utcnow().isoformat()
 
                     logger.info(f"  Group {group_id} completed: {pipeline_result.get_summary() if hasattr(pipeline_result, 'get_summary') else 'OK'}")
                     logger.info(f"    Saved {len(serialized_stage_results)} stage results")
 
                 except Exception as e:
                     logger.error(f"  Group {group_id} failed: {e}")
-                    group_result_entry["status"] = "failed"
-                    group_result_entry["errorMessage"] = str(e)[:1000]
-                    group_result_entry["completedAt"] = datetime.utcnow().isoformat()
-
-                # Add to results list
-                group_results.append(group_result_entry)
+                    entry["status"] = "failed"
+                    entry["errorMessage"] = str(e)[:1000]
+                    entry["completedAt"] = datetime.utcnow().isoformat()
 
+                progress_state["groups_completed"] += 1
                 # Update merge_analysis.groupResults in database after each group
-                SessionLocal = get_session_factory()
-                db = SessionLocal()
-                try:
-                    soa_job = db.query(SOAJob).filter(SOAJob.id == UUID(soa_job_id)).first()
-                    if soa_job and soa_job.merge_analysis:
-                        merge_analysis = dict(soa_job.merge_analysis)
-                        merge_analysis["groupResults"] = group_results
-                        soa_job.merge_analysis = merge_analysis
-                        flag_modified(soa_job, "merge_analysis")
-                        db.commit()
-                finally:
-                    db.close()
+                save_group_results()
+                report_progress(group_id, entry["progress"].get("currentStage", 0), "Finished", entry["status"])
+
+        async def interpret_all_groups():
+            semaphore = asyncio.Semaphore(max_parallel_groups)
+            await asyncio.gather(*(
+                interpret_group(i, group, semaphore)
+                for i, group in enumerate(groups_to_process)
+            ))
+
+        # Create async event loop. Stage LLM calls run on the LLM gateway's
+        # per-provider pools, shared by all concurrent groups.
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        logger.info(f"Interpreting {total_groups} groups ({max_parallel_groups} in parallel)")
+
+        try:
+            save_group_results()
+            loop.run_until_complete(interpret_all_groups())
 
             # Final update - mark job as completed
             _update_soa_job(soa_job_id, {
@@ -0,0 +1,67 @@
+"""
+Unit tests for the SSE event bus.
+
+Tests cover:
+- Dispatch waking only the subscribers of the affected job
+- Sticky wake-ups (notification before wait is not lost)
+- Wake-ups from another thread (the listener thread)
+- Fallback poll interval while disconnected
+- Unsubscribe and non-PostgreSQL databases
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.db import NOTIFY_JOB_EVENTS, NOTIFY_SOA_JOBS
+from app.services.event_bus import EventBus
+
+
+@pytest.fixture
+def bus():
+    return EventBus(database_url="sqlite:///:memory:")
+
+
+@pytest.mark.asyncio
+async def test_dispatch_wakes_matching_subscribers(bus):
+    with bus.subscribe(NOTIFY_SOA_JOBS, "job-1") as first, \
+            bus.subscribe(NOTIFY_SOA_JOBS, "job-1") as second, \
+            bus.subscribe(NOTIFY_JOB_EVENTS, "job-1") as other_channel:
+        assert bus.dispatch(NOTIFY_SOA_JOBS, "job-1") == 2
+        assert await first.wait(fallback_interval=1.0)
+        assert await second.wait(fallback_interval=1.0)
+        assert not await other_channel.wait(fallback_interval=0.01)
+
+
+@pytest.mark.asyncio
+async def test_wake_up_is_sticky_and_cleared(bus):
+    with bus.subscribe(NOTIFY_SOA_JOBS, "job-1") as subscription:
+        # Change committed while the handler was reading the database
+        bus.dispatch(NOTIFY_SOA_JOBS, "job-1")
+        await asyncio.sleep(0)
+        assert await subscription.wait(fallback_interval=1.0)
+        assert not await subscription.wait(fallback_interval=0.01)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_from_listener_thread(bus):
+    with bus.subscribe(NOTIFY_SOA_JOBS, "job-1") as subscription:
+        threading.Timer(0.02, bus.dispatch, args=(NOTIFY_SOA_JOBS, "job-1")).start()
+        assert await subscription.wait(fallback_interval=2.0)
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe(bus):
+    subscription = bus.subscribe(NOTIFY_SOA_JOBS, "job-1")
+    subscription.close()
+
+    assert bus.dispatch(NOTIFY_SOA_JOBS, "job-1") == 0
+    assert bus._subscribers == {}
+
+
+def test_non_postgres_database_does_not_listen(bus):
+    bus.start()
+    assert bus._thread is None
+    assert not bus.connected
+    bus.stop()
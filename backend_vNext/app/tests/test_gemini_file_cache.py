@@ -0,0 +1,134 @@
+"""
+Unit tests for the process-wide Gemini file handle cache.
+
+Tests cover:
+- URI normalization and one resolution per file
+- Expiry from registered upload times and invalidation
+- Concurrent callers sharing one resolution
+- Key locks released and pruned after their last holder
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.gemini_file_cache import EXPIRY_BUFFER, GeminiFileHandleCache, normalize_file_name
+
+
+class CountingResolver:
+    """Fake genai.get_file recording the names it resolved."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, name):
+        with self._lock:
+            self.calls.append(name)
+        time.sleep(self.delay)
+        return {"name": name}
+
+
+@pytest.fixture
+def cache():
+    return GeminiFileHandleCache()
+
+
+def test_normalize_file_name():
+    assert normalize_file_name("https://host/v1beta/files/abc123") == "abc123"
+    assert normalize_file_name("files/abc123/") == "abc123"
+    assert normalize_file_name("abc123") == "abc123"
+
+
+def test_resolves_once_per_file(cache):
+    resolver = CountingResolver()
+
+    first = cache.get("https://host/files/abc", resolver=resolver)
+    second = cache.get("files/abc", resolver=resolver)
+
+    assert first is second
+    assert resolver.calls == ["abc"]
+    assert cache.stats() == {"entries": 1, "key_locks": 0, "hits": 1, "misses": 1}
+
+
+def test_registered_expiry_and_invalidate(cache):
+    resolver = CountingResolver()
+
+    # Upload already inside the safety margin: handle is never served from cache
+    cache.register("files/old", datetime.utcnow() + EXPIRY_BUFFER - timedelta(minutes=1))
+    cache.get("files/old", resolver=resolver)
+    cache.get("files/old", resolver=resolver)
+    assert resolver.calls == ["old", "old"]
+
+    cache.register("files/new", datetime.utcnow() + timedelta(hours=48))
+    cache.get("files/new", resolver=resolver)
+    cache.invalidate("https://host/files/new")
+    cache.get("files/new", resolver=resolver)
+    assert resolver.calls.count("new") == 2
+
+
+def test_concurrent_callers_share_resolution(cache):
+    resolver = CountingResolver(delay=0.05)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get("files/shared", resolver=resolver)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert resolver.calls == ["shared"]
+    assert all(result is results[0] for result in results)
+    assert cache.stats()["key_locks"] == 0
+
+
+def test_key_locks_pruned_after_release(cache):
+    resolver = CountingResolver()
+    for i in range(50):
+        cache.get(f"files/protocol-{i}", resolver=resolver)
+    assert cache.stats()["key_locks"] == 0
+
+
+def test_key_lock_released_when_resolver_fails(cache):
+    def failing(name):
+        raise RuntimeError("file not found")
+
+    with pytest.raises(RuntimeError):
+        cache.get("files/missing", resolver=failing)
+    assert cache.stats()["key_locks"] == 0
+
+    # The key is usable again after the failure
+    assert cache.get("files/missing", resolver=CountingResolver()) == {"name": "missing"}
+
+
+def test_key_lock_kept_while_waiters_hold_it(cache):
+    release = threading.Event()
+    entered = threading.Event()
+
+    def slow(name):
+        entered.set()
+        release.wait(timeout=5)
+        return {"name": name}
+
+    first = threading.Thread(target=cache.get, args=("files/slow",), kwargs={"resolver": slow})
+    first.start()
+    assert entered.wait(timeout=5)
+    second = threading.Thread(target=cache.get, args=("files/slow",), kwargs={"resolver": slow})
+    second.start()
+
+    deadline = time.monotonic() + 5
+    while cache._key_locks["slow"].holders < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache._key_locks["slow"].holders == 2
+
+    release.set()
+    first.join()
+    second.join()
+    assert cache.stats()["key_locks"] == 0
+    assert cache.stats()["misses"] == 1
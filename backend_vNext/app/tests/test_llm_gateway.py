@@ -0,0 +1,143 @@
+"""
+Unit tests for the non-blocking LLM gateway.
+
+Tests cover:
+- Per-provider concurrency limits (independent pools per provider)
+- Event loop staying responsive while calls run
+- Request coalescing and release of finished requests
+- Call / error / in-flight / latency counters
+- Request key stability
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.config import settings
+from app.services.llm_gateway import LLMGateway, get_llm_gateway, make_request_key
+
+
+class TrackingCall:
+    """Blocking fake SDK call recording max concurrency."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, value=None):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return value
+
+
+@pytest.fixture
+def gateway():
+    gateway = LLMGateway(limits={"gemini": 3, "claude": 1})
+    yield gateway
+    gateway.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_limit_per_provider(gateway):
+    gemini = TrackingCall()
+    claude = TrackingCall()
+
+    results = await asyncio.gather(
+        *[gateway.run("gemini", gemini, i) for i in range(9)],
+        *[gateway.run("claude", claude, i) for i in range(3)],
+    )
+
+    assert results == list(range(9)) + list(range(3))
+    assert gemini.max_in_flight == 3
+    assert claude.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_event_loop_not_blocked(gateway):
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    await gateway.run("gemini", time.sleep, 0.1)
+    task.cancel()
+
+    assert ticks > 5
+
+
+def test_default_limit():
+    gateway = LLMGateway()
+    assert gateway.get_limit("azure") == max(1, settings.llm_default_max_concurrency)
+    assert LLMGateway(limits={"azure": 0}).get_limit("azure") == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesces_identical_in_flight_requests(gateway):
+    call = TrackingCall(delay=0.05)
+    key = make_request_key("model", "file", "prompt")
+
+    results = await asyncio.gather(
+        *[gateway.run("gemini", call, "response", coalesce_key=key) for _ in range(5)]
+    )
+
+    assert results == ["response"] * 5
+    assert call.calls == 1
+    stats = gateway.get_stats()["gemini"]
+    assert (stats["calls"], stats["coalesced"]) == (1, 4)
+
+    # Finished requests are released, so a later identical request runs again
+    await gateway.run("gemini", call, "response", coalesce_key=key)
+    assert call.calls == 2
+    assert gateway._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_stats_counters(gateway):
+    def failing():
+        raise RuntimeError("quota exceeded")
+
+    await gateway.run("claude", time.sleep, 0.01)
+    with pytest.raises(RuntimeError):
+        await gateway.run("claude", failing)
+
+    stats = gateway.get_stats()["claude"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+    assert stats["in_flight"] == 0
+    assert stats["total_latency_seconds"] >= 0.01
+    assert stats["limit"] == 1
+    assert "gemini" not in gateway.get_stats()
+
+
+def test_submit_from_threads(gateway):
+    call = TrackingCall()
+    futures = [gateway.submit("gemini", call, i) for i in range(6)]
+    assert [future.result() for future in futures] == list(range(6))
+    assert call.max_in_flight == 3
+
+
+def test_request_key_stable():
+    assert make_request_key("a", "b") == make_request_key("a", "b")
+    assert make_request_key("a", "b") != make_request_key("ab")
+    assert make_request_key("a", 1) == make_request_key("a", "1")
+
+
+def test_singleton_uses_provider_settings():
+    gateway = get_llm_gateway()
+    assert gateway is get_llm_gateway()
+    assert gateway.get_limit("gemini") == max(1, settings.gemini_max_concurrency)
+    assert gateway.get_limit("claude") == max(1, settings.claude_max_concurrency)
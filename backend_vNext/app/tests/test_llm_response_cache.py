@@ -0,0 +1,140 @@
+"""
+Unit tests for the shared LLM response cache.
+
+Tests cover:
+- Incremental saves (only new / changed / removed entries are written)
+- Scopes separated by namespace, model and prompt
+- One-time import of legacy JSON cache files
+- LRU eviction past max_bytes
+- Concurrent writers from several processes
+- ConceptExpansionCache round-trip through the shared store
+"""
+
+import json
+import multiprocessing
+
+import pytest
+
+from app.services.llm_response_cache import (
+    LLMResponseCache,
+    get_llm_response_cache,
+    make_cache_key,
+    reset_llm_response_cache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(path=str(tmp_path / "llm_responses.db"))
+
+
+def _write_entries(path, worker, count):
+    view = LLMResponseCache(path=path).view("stress", model="m")
+    for i in range(count):
+        view.put(f"w{worker}-{i}", {"worker": worker, "i": i})
+
+
+def test_save_writes_only_differences(cache):
+    view = cache.view("stage", model="m")
+    assert view.save({"a": {"v": 1}, "b": {"v": 2}}) == 2
+    assert view.save({"a": {"v": 1}, "b": {"v": 2}}) == 0
+    assert view.save({"a": {"v": 1}, "b": {"v": 3}, "c": {"v": 4}}) == 2
+    assert view.save({"a": {"v": 1}, "c": {"v": 4}}) == 1
+
+    reloaded = cache.view("stage", model="m").load()
+    assert reloaded == {"a": {"v": 1}, "c": {"v": 4}}
+
+    stats = cache.get_stats()["namespaces"]["stage"]
+    assert (stats["writes"], stats["deletes"], stats["entries"]) == (4, 1, 2)
+
+
+def test_scopes_are_isolated(cache):
+    cache.view("stage", model="m1", prompt="v1").save({"k": 1})
+    cache.view("stage", model="m2", prompt="v1").save({"k": 2})
+    cache.view("other", model="m1", prompt="v1").save({"k": 3})
+
+    assert cache.view("stage", model="m1", prompt="v1").load() == {"k": 1}
+    assert cache.view("stage", model="m1", prompt="v2").load() == {}
+    assert cache.view("stage", model="m1", prompt="v1").get("k") == 1
+    assert make_cache_key("stage", "", "m1", "", "k") != make_cache_key("stage", "", "m2", "", "k")
+
+
+def test_record_lookup_counts_hit_rate(cache):
+    view = cache.view("stage")
+    view.save({"a": 1})
+    view.record_lookup("a", True)
+    view.record_lookup("b", False)
+    view.record_lookup("a", True)
+    view.save({"a": 1})
+
+    stats = cache.get_stats()["namespaces"]["stage"]
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hitRate"] == pytest.approx(0.667)
+
+
+def test_legacy_json_imported_once(cache, tmp_path):
+    legacy = tmp_path / "decisions_cache.json"
+    legacy.write_text(json.dumps({"metadata": {}, "decisions": {"x": {"v": 1}}}))
+
+    def extract(document):
+        return document["decisions"]
+
+    assert cache.view("stage").load(legacy_file=legacy, legacy_entries=extract) == {"x": {"v": 1}}
+
+    legacy.write_text(json.dumps({"metadata": {}, "decisions": {"y": {"v": 2}}}))
+    assert cache.view("stage").load(legacy_file=legacy, legacy_entries=extract) == {"x": {"v": 1}}
+
+
+def test_lru_eviction(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / "small.db"), max_bytes=2000)
+    view = cache.view("stage")
+    value = "x" * 90
+    for i in range(30):
+        view.put(f"k{i}", value)
+    view.get("k0")  # most recently used survives
+
+    evicted = cache.evict()
+
+    stats = cache.get_stats()
+    assert evicted > 0
+    assert stats["totalBytes"] <= 2000 * 0.8
+    assert cache.view("stage").get("k0") == value
+    assert cache.view("stage").get("k1") is None
+
+
+def test_concurrent_writers_do_not_lose_entries(tmp_path):
+    path = str(tmp_path / "shared.db")
+    LLMResponseCache(path=path)
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_write_entries, args=(path, w, 25)) for w in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    entries = LLMResponseCache(path=path).view("stress", model="m").load()
+    assert len(entries) == 100
+
+
+def test_concept_expansion_cache_round_trip(tmp_path, monkeypatch):
+    pytest.importorskip("google.generativeai")  # eligibility_analyzer.interpretation imports the SDK
+    from eligibility_analyzer.interpretation import concept_expansion_cache as module
+
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_PATH", str(tmp_path / "llm_responses.db"))
+    monkeypatch.setattr(module, "CACHE_DIR", tmp_path / "concept_expansions")
+    monkeypatch.setattr(module, "CACHE_FILE", tmp_path / "concept_expansions" / "cache.json")
+    reset_llm_response_cache()
+    try:
+        first = module.ConceptExpansionCache()
+        first.set_batch({"HbA1c": module.ConceptExpansion(original_term="HbA1c", synonyms=["A1C"])})
+
+        second = module.ConceptExpansionCache()
+        cached, uncached = second.get_batch(["HbA1c", "eGFR"])
+
+        assert cached["HbA1c"].synonyms == ["A1C"]
+        assert cached["HbA1c"].source == "cache"
+        assert uncached == ["eGFR"]
+        assert get_llm_response_cache().get_stats()["namespaces"]["concept_expansions"]["entries"] == 1
+    finally:
+        reset_llm_response_cache()
@@ -0,0 +1,128 @@
+"""
+Unit tests for the append-only log backend of the LLM response cache.
+
+Tests cover:
+- Saves appending only new / changed / removed entries
+- Views picking up records appended by other views
+- Compaction once superseded records dominate
+- Torn trailing records left by a crashed writer
+- Concurrent appenders from several processes
+- Backend selection in get_cache_view
+"""
+
+import multiprocessing
+
+import pytest
+
+from app.services import llm_response_log
+from app.services.llm_response_cache import CacheView, get_cache_view
+from app.services.llm_response_log import LogCacheView, LogStructuredCache
+
+
+@pytest.fixture
+def log_cache(tmp_path):
+    return LogStructuredCache(directory=str(tmp_path / "logs"))
+
+
+def _line_count(view):
+    return len(view.path.read_text(encoding="utf-8").splitlines())
+
+
+def _append_entries(directory, worker, count):
+    view = LogStructuredCache(directory=directory).view("stress", model="m")
+    view.load()
+    entries = {}
+    for i in range(count):
+        entries[f"w{worker}-{i}"] = {"worker": worker, "i": i}
+        view.save(entries, remove_missing=False)
+
+
+def test_save_appends_only_differences(log_cache):
+    view = log_cache.view("stage", model="m")
+    view.load()
+    assert view.save({"a": {"v": 1}, "b": {"v": 2}}) == 2
+    assert view.save({"a": {"v": 1}, "b": {"v": 2}}) == 0
+    assert view.save({"a": {"v": 1}, "b": {"v": 3}, "c": {"v": 4}}) == 2
+    assert view.save({"a": {"v": 1}, "c": {"v": 4}}) == 1
+    assert _line_count(view) == 5
+
+    assert log_cache.view("stage", model="m").load() == {"a": {"v": 1}, "c": {"v": 4}}
+    assert log_cache.view("stage", model="other").load() == {}
+
+
+def test_views_see_other_appends(log_cache):
+    first = log_cache.view("stage")
+    second = log_cache.view("stage")
+    first.load()
+    second.load()
+
+    first.save({"a": 1})
+    second.save({"b": 2})  # does not delete "a", which only first wrote
+
+    assert second.get("a") == 1
+    assert log_cache.view("stage").load() == {"a": 1, "b": 2}
+
+
+def test_compaction(log_cache, monkeypatch):
+    monkeypatch.setattr(llm_response_log, "COMPACTION_MIN_RECORDS", 10)
+    view = log_cache.view("stage")
+    view.load()
+    for i in range(12):
+        view.save({"a": i, "b": "fixed"})
+
+    assert _line_count(view) < 12
+    assert log_cache.get_stats()["namespaces"]["stage"]["compactions"] >= 1
+    assert log_cache.view("stage").load() == {"a": 11, "b": "fixed"}
+
+    reader = log_cache.view("stage")
+    reader.load()
+    for i in range(12, 30):
+        view.save({"a": i, "b": "fixed"})
+    assert reader.get("a") == 29  # re-reads the log after it was swapped
+
+
+def test_torn_record_is_skipped(log_cache):
+    view = log_cache.view("stage")
+    view.load()
+    view.save({"a": 1})
+    with open(view.path, "a", encoding="utf-8") as f:
+        f.write('{"k": "b", "v": ')  # writer died mid-record
+
+    other = log_cache.view("stage")
+    assert other.load() == {"a": 1}
+    other.save({"a": 1, "c": 3})
+    assert log_cache.view("stage").load() == {"a": 1, "c": 3}
+
+
+def test_legacy_json_imported_once(log_cache, tmp_path):
+    legacy = tmp_path / "domain_cache.json"
+    legacy.write_text('{"x": {"v": 1}}')
+
+    assert log_cache.view("stage").load(legacy_file=legacy) == {"x": {"v": 1}}
+    legacy.write_text('{"y": {"v": 2}}')
+    assert log_cache.view("stage").load(legacy_file=legacy) == {"x": {"v": 1}}
+
+
+def test_concurrent_appenders_do_not_lose_entries(tmp_path):
+    directory = str(tmp_path / "logs")
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_append_entries, args=(directory, w, 25)) for w in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    entries = LogStructuredCache(directory=directory).view("stress", model="m").load()
+    assert len(entries) == 100
+
+
+def test_backend_selection(tmp_path, monkeypatch):
+    monkeypatch.delenv("LLM_RESPONSE_CACHE_BACKEND", raising=False)
+    assert isinstance(get_cache_view("stage", cache_dir=tmp_path), CacheView)
+    assert isinstance(get_cache_view("stage", cache_dir=tmp_path, backend="log"), LogCacheView)
+
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_BACKEND", "log")
+    view = get_cache_view("stage", cache_dir=tmp_path)
+    assert isinstance(view, LogCacheView)
+    assert view.path.is_relative_to(tmp_path / "llm_response_logs")
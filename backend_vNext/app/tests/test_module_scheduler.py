@@ -0,0 +1,115 @@
+"""
+Unit tests for the dependency-aware module scheduler.
+
+Tests cover:
+- Modules starting as soon as their dependencies finish
+- Concurrency cap (1 = strictly sequential)
+- Completed and out-of-plan dependencies not blocking
+- Failed modules releasing their dependents
+- Cycle detection
+"""
+
+import asyncio
+
+import pytest
+
+from app.module_registry import ExtractionModuleConfig
+from app.services.module_scheduler import ModuleDAGScheduler
+
+
+def module(module_id, dependencies=(), wave=0, order=0):
+    return ExtractionModuleConfig(
+        module_id=module_id,
+        instance_type=module_id,
+        display_name=module_id,
+        schema_file=f"{module_id}.json",
+        wave=wave,
+        order=order,
+        dependencies=list(dependencies),
+    )
+
+
+class Runner:
+    """Fake module runner recording start / finish order and concurrency."""
+
+    def __init__(self, delays=None, failing=()):
+        self.delays = delays or {}
+        self.failing = set(failing)
+        self.events = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, config):
+        self.events.append(("start", config.module_id))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delays.get(config.module_id, 0.01))
+        self.in_flight -= 1
+        self.events.append(("finish", config.module_id))
+        if config.module_id in self.failing:
+            raise RuntimeError(f"{config.module_id} failed")
+        return config.module_id
+
+    def index(self, event, module_id):
+        return self.events.index((event, module_id))
+
+
+@pytest.mark.asyncio
+async def test_dependents_start_after_dependencies():
+    modules = [
+        module("metadata", order=1),
+        module("arms", ["metadata"], wave=1, order=2),
+        module("endpoints", ["metadata"], wave=1, order=3),
+        module("soa", ["arms"], wave=2, order=4),
+    ]
+    runner = Runner(delays={"arms": 0.01, "endpoints": 0.08})
+    scheduler = ModuleDAGScheduler(modules, max_concurrent=4)
+
+    results = await scheduler.run(runner)
+
+    assert results == ["metadata", "arms", "endpoints", "soa"]
+    assert runner.index("start", "arms") > runner.index("finish", "metadata")
+    # soa does not wait for the unrelated, slower endpoints module
+    assert runner.index("start", "soa") < runner.index("finish", "endpoints")
+    assert scheduler.completed == {"metadata", "arms", "endpoints", "soa"}
+    assert scheduler.critical_path_seconds() > 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap():
+    modules = [module(f"m{i}", order=i) for i in range(6)]
+    runner = Runner()
+
+    await ModuleDAGScheduler(modules, max_concurrent=2).run(runner)
+    assert runner.max_in_flight == 2
+
+    sequential = Runner()
+    await ModuleDAGScheduler(modules, max_concurrent=1).run(sequential)
+    assert sequential.max_in_flight == 1
+    assert [m for event, m in sequential.events if event == "start"] == [f"m{i}" for i in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_completed_and_disabled_dependencies_do_not_block():
+    modules = [module("arms", ["metadata", "disabled_module"])]
+    scheduler = ModuleDAGScheduler(modules, completed=["metadata"])
+
+    assert await scheduler.run(Runner()) == ["arms"]
+    assert scheduler.completed == {"metadata", "arms"}
+
+
+@pytest.mark.asyncio
+async def test_failed_module_releases_dependents():
+    modules = [module("metadata"), module("arms", ["metadata"], wave=1)]
+    scheduler = ModuleDAGScheduler(modules)
+
+    results = await scheduler.run(Runner(failing={"metadata"}))
+
+    assert results == ["arms"]
+    assert scheduler.failed == {"metadata": "metadata failed"}
+    assert "metadata" not in scheduler.completed
+
+
+def test_cycle_detected():
+    with pytest.raises(ValueError, match="Circular"):
+        ModuleDAGScheduler([module("a", ["b"]), module("b", ["a"])])
@@ -0,0 +1,109 @@
+"""
+Unit tests for the content-addressed PDF store.
+
+Tests cover:
+- Put / lookup by content hash and read-only materialization
+- Extra filenames linked to existing content
+- content_hash_for_path for store and non-store paths
+- LRU eviction by size, keeping recently used entries
+"""
+
+import hashlib
+import os
+import stat
+import time
+
+import pytest
+
+from app.utils.pdf_store import PDFStore, content_hash_for_path
+
+PDF_A = b"%PDF-1.7 protocol A" + b"\0" * 1000
+PDF_B = b"%PDF-1.7 protocol B" + b"\0" * 1000
+PDF_C = b"%PDF-1.7 protocol C" + b"\0" * 1000
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def age(store, data, seconds):
+    """Backdate an entry's last use."""
+    past = time.time() - seconds
+    os.utime(store.root / sha256(data), (past, past))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PDFStore(root=tmp_path / "store", max_bytes=10_000, min_idle_seconds=0)
+
+
+def test_put_and_get(store):
+    assert store.get_path(sha256(PDF_A)) is None
+
+    path = store.put(PDF_A, filename="../study A.pdf")
+
+    assert path.read_bytes() == PDF_A
+    assert path.name == "study A.pdf"
+    assert path.parent.name == sha256(PDF_A)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o444
+    assert store.put(PDF_A) == path
+    assert store.stats()["hits"] == 1
+    assert store.stats()["misses"] == 2  # lookup above and the first put
+
+
+def test_extra_filename_links_content(store):
+    first = store.put(PDF_A, filename="a.pdf")
+    second = store.get_path(sha256(PDF_A), filename="renamed")
+
+    assert second.name == "renamed.pdf"
+    assert second.read_bytes() == PDF_A
+    assert os.stat(first).st_ino == os.stat(second).st_ino
+
+
+def test_invalid_hash_rejected(store):
+    with pytest.raises(ValueError):
+        store.get_path("../../etc/passwd")
+
+
+def test_content_hash_for_path(store, tmp_path):
+    path = store.put(PDF_A)
+    assert content_hash_for_path(path) == sha256(PDF_A)
+
+    outside = tmp_path / sha256(PDF_A) / "a.pdf"
+    outside.parent.mkdir()
+    outside.write_bytes(PDF_A)
+    assert content_hash_for_path(outside) is None
+
+
+def test_open_mmap(store):
+    store.put(PDF_A)
+    mapped = store.open_mmap(sha256(PDF_A))
+    try:
+        assert mapped[:8] == b"%PDF-1.7"
+    finally:
+        mapped.close()
+    assert store.open_mmap(sha256(PDF_B)) is None
+
+
+def test_evicts_least_recently_used(tmp_path):
+    store = PDFStore(root=tmp_path / "store", max_bytes=2500, min_idle_seconds=0)
+    store.put(PDF_A)
+    store.put(PDF_B)
+    age(store, PDF_A, 120)
+    age(store, PDF_B, 60)
+
+    store.put(PDF_C)
+
+    assert store.get_path(sha256(PDF_A)) is None
+    assert store.get_path(sha256(PDF_B)) is not None
+    assert store.get_path(sha256(PDF_C)) is not None
+    assert store.stats()["evictions"] == 1
+
+
+def test_recently_used_entries_not_evicted(tmp_path):
+    store = PDFStore(root=tmp_path / "store", max_bytes=1500, min_idle_seconds=3600)
+    store.put(PDF_A)
+    store.put(PDF_B)
+
+    assert store.get_path(sha256(PDF_A)) is not None
+    assert store.stats()["evictions"] == 0
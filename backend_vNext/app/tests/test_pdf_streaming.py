@@ -0,0 +1,87 @@
+"""
+Unit tests for chunked PDF delivery helpers.
+
+Tests cover:
+- Range header parsing (open, closed, suffix, multi-range, invalid)
+- ETag construction
+- Response status and headers for Range, If-Range and If-None-Match
+"""
+
+import pytest
+from starlette.requests import Request
+
+from app.utils.pdf_streaming import RangeNotSatisfiable, build_pdf_response, make_etag, parse_range_header
+
+ETAG = make_etag("a" * 64)
+
+
+def request_with(**headers):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/pdf",
+        "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+def response_for(**headers):
+    # column / row_filter are only used when the body is iterated
+    return build_pdf_response(request_with(**headers), None, None, 1000, ETAG, "protocol.pdf")
+
+
+class TestParseRangeHeader:
+
+    @pytest.mark.parametrize("header, expected", [
+        (None, None),
+        ("", None),
+        ("items=0-10", None),
+        ("bytes=0-99", (0, 99)),
+        ("bytes=100-", (100, 999)),
+        ("bytes=-200", (800, 999)),
+        ("bytes=-5000", (0, 999)),
+        ("bytes=900-5000", (900, 999)),
+        ("bytes=0-10,20-30", None),
+        ("bytes=abc-def", None),
+    ])
+    def test_ranges(self, header, expected):
+        assert parse_range_header(header, 1000) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=1000-", "bytes=50-10", "bytes=-0"])
+    def test_unsatisfiable(self, header):
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range_header(header, 1000)
+
+
+def test_make_etag():
+    assert ETAG == f'"{"a" * 64}"'
+    assert make_etag("id", 3) == make_etag("id", 3)
+    assert make_etag("id", 3) != make_etag("id", 4)
+
+
+class TestBuildPDFResponse:
+
+    def test_full_body(self):
+        response = response_for()
+        assert response.status_code == 200
+        assert response.headers["content-length"] == "1000"
+        assert response.headers["etag"] == ETAG
+        assert response.headers["accept-ranges"] == "bytes"
+
+    def test_partial_content(self):
+        response = response_for(range="bytes=100-199")
+        assert response.status_code == 206
+        assert response.headers["content-range"] == "bytes 100-199/1000"
+        assert response.headers["content-length"] == "100"
+
+    def test_not_modified(self):
+        response = response_for(if_none_match=f'"other", {ETAG}')
+        assert response.status_code == 304
+
+    def test_stale_if_range_sends_full_body(self):
+        assert response_for(range="bytes=0-9", if_range=ETAG).status_code == 206
+        assert response_for(range="bytes=0-9", if_range='"stale"').status_code == 200
+
+    def test_range_not_satisfiable(self):
+        response = response_for(range="bytes=5000-")
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */1000"
@@ -0,0 +1,90 @@
+"""
+Unit tests for the compiled JSON Schema cache behind SchemaValidator.
+
+Tests cover:
+- One compiled validator per schema file, shared across SchemaValidator instances
+- Rebuild when the schema file changes
+- $refs to shared schemas resolved from the pre-registered registry
+- Memoized required-field counts
+"""
+
+import json
+import os
+
+import pytest
+
+from app.utils.schema_validator import (
+    CompiledSchemaCache,
+    SchemaValidator,
+    count_required_fields,
+)
+
+SCHEMA = {
+    "type": "object",
+    "required": ["title", "concept"],
+    "properties": {
+        "title": {"type": "string"},
+        "concept": {"$ref": "shared/concept.json"},
+        "tags": {"type": "array", "items": {"type": "object", "required": ["name"]}},
+    },
+}
+
+SHARED_CONCEPT = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "$id": "concept",
+    "type": "object",
+    "required": ["conceptName"],
+    "properties": {"conceptName": {"type": "string"}},
+}
+
+
+@pytest.fixture
+def schema_path(tmp_path):
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir()
+    (shared_dir / "concept.json").write_text(json.dumps(SHARED_CONCEPT))
+    path = tmp_path / "module_schema.json"
+    path.write_text(json.dumps(SCHEMA))
+    return path
+
+
+@pytest.fixture
+def cache(schema_path):
+    return CompiledSchemaCache(shared_dir=schema_path.parent / "shared")
+
+
+def test_compiled_once_and_rebuilt_on_change(cache, schema_path):
+    first = cache.get(schema_path)
+    assert cache.get(schema_path) is first
+    assert cache.builds == 1
+    assert first.required_fields == count_required_fields(SCHEMA) == 3
+
+    stat = schema_path.stat()
+    schema_path.write_text(json.dumps({**SCHEMA, "required": ["title"]}))
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = cache.get(schema_path)
+    assert second is not first
+    assert second.schema["required"] == ["title"]
+    assert cache.builds == 2
+
+
+def test_shared_refs_resolved(cache, schema_path):
+    validator = cache.get(schema_path).validator
+    assert list(validator.iter_errors({"title": "x", "concept": {"conceptName": "Aspirin"}})) == []
+
+    errors = list(validator.iter_errors({"title": 1, "concept": {}}))
+    assert sorted(error.validator for error in errors) == ["required", "type"]
+
+
+def test_validators_shared_across_instances(cache):
+    first = SchemaValidator(compiled_cache=cache)
+    second = SchemaValidator(compiled_cache=cache)
+
+    assert first.load_schema("study_metadata") is second.load_schema("study_metadata")
+    first.validate({}, "study_metadata")
+    report = second.calculate_compliance_score({}, "study_metadata")
+    assert cache.builds == 1
+    assert report["expected_fields"] == count_required_fields(first.load_schema("study_metadata"))
+
+    with pytest.raises(ValueError):
+        first.validate({}, "no_such_module")
@@ -0,0 +1,262 @@
+"""
+Unit tests for SOA merge-group interpretation progress reporting.
+
+Tests cover:
+- _serialize_stage_results for to_dict, plain-object, dict and other results
+- groupResults moving pending -> interpreting -> completed / failed, in plan order
+- groups_in_flight and the per-group "groups" map in phase_progress
+- soa_interpretation_max_parallel_groups capping concurrent groups
+- A failed group not dropping its siblings' results
+"""
+
+import asyncio
+import copy
+import logging
+import uuid
+from types import SimpleNamespace
+
+import pytest
+import sqlalchemy.orm.attributes
+
+import app.db
+import app.services.gemini_file_cache
+import soa_analyzer.interpretation
+import soa_analyzer.table_merge_analyzer
+from app.config import settings
+from app.services import soa_worker
+
+logger = logging.getLogger(__name__)
+
+GROUP_IDS = ["MG-001", "MG-002", "MG-003", "MG-004"]
+STAGES = 3
+
+
+class FakeQuery:
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def filter(self, *criteria):
+        return self
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """In-memory stand-in for a SQLAlchemy session over one job record."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def query(self, model):
+        return FakeQuery(self.store[model])
+
+    def commit(self):
+        job = self.store[app.db.SOAJob][0]
+        self.store["group_snapshots"].append(copy.deepcopy(job.merge_analysis["groupResults"]))
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeInterpretationPipeline:
+    """Stub 12-stage pipeline reporting a few stages per group."""
+
+    failing = set()
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, progress_callback=None):
+        self.progress_callback = progress_callback
+
+    async def run(self, usdm, config):
+        cls = FakeInterpretationPipeline
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            for stage_num in range(1, STAGES + 1):
+                await asyncio.sleep(0.01)
+                if stage_num == 2 and usdm["group"] in cls.failing:
+                    raise RuntimeError("stage 2 exploded")
+                self.progress_callback(stage_num, f"Stage {stage_num}", "success")
+        finally:
+            cls.in_flight -= 1
+        return SimpleNamespace(
+            final_usdm={**usdm, "visits": [{"id": "V1"}]},
+            stage_results={1: {"ok": True}},
+            to_dict=lambda: {"success": True},
+        )
+
+
+@pytest.fixture
+def worker(monkeypatch, tmp_path):
+    """Patch the worker's database, USDM combiner and pipeline; return its record."""
+    store = {
+        app.db.Protocol: [SimpleNamespace(
+            filename="protocol.pdf", gemini_file_uri=None, gemini_file_expires_at=None,
+        )],
+        app.db.SOAJob: [SimpleNamespace(merge_analysis={
+            "mergeGroups": [
+                {"id": group_id, "tableIds": [group_id.replace("MG-", "SOA-")], "mergeType": "standalone"}
+                for group_id in GROUP_IDS
+            ],
+        })],
+        app.db.SOATableResult: [],
+        "group_snapshots": [],
+        "job_updates": [],
+    }
+
+    def update_soa_job(job_id, updates, logger=None):
+        store["job_updates"].append(copy.deepcopy(updates))
+        return True
+
+    def combine_table_usdm(per_table_results, table_ids):
+        return {"group": table_ids[0].replace("SOA-", "MG-"), "activities": []}
+
+    FakeInterpretationPipeline.failing = set()
+    FakeInterpretationPipeline.max_in_flight = 0
+
+    monkeypatch.setenv("SOA_WORKER", "true")
+    monkeypatch.setattr(soa_worker, "_update_soa_job", update_soa_job)
+    monkeypatch.setattr(app.db, "get_session_factory", lambda: lambda: FakeSession(store))
+    monkeypatch.setattr(app.services.gemini_file_cache, "register_gemini_file", lambda *args: None)
+    monkeypatch.setattr(sqlalchemy.orm.attributes, "flag_modified", lambda instance, key: None)
+    monkeypatch.setattr(soa_analyzer.table_merge_analyzer, "combine_table_usdm", combine_table_usdm)
+    monkeypatch.setattr(soa_analyzer.interpretation, "InterpretationPipeline", FakeInterpretationPipeline)
+
+    store["pdf_path"] = str(tmp_path / "protocol.pdf")
+    yield store
+    asyncio.set_event_loop(None)
+
+
+def run_worker(store, max_parallel_groups, monkeypatch):
+    monkeypatch.setattr(settings, "soa_interpretation_max_parallel_groups", max_parallel_groups)
+    with pytest.raises(SystemExit) as exc_info:
+        soa_worker._run_merge_interpretation(
+            str(uuid.uuid4()),
+            str(uuid.uuid4()),
+            store["pdf_path"],
+            {"confirmedGroups": [{"id": group_id} for group_id in GROUP_IDS]},
+            "sqlite://",
+        )
+    return exc_info.value.code
+
+
+def group_progress(store):
+    return [
+        update["phase_progress"] for update in store["job_updates"]
+        if update.get("phase_progress", {}).get("groups")
+    ]
+
+
+def status_history(store, group_id):
+    history = []
+    for snapshot in store["group_snapshots"]:
+        status = next(e["status"] for e in snapshot if e["id"] == group_id)
+        if not history or history[-1] != status:
+            history.append(status)
+    return history
+
+
+class TestSerializeStageResults:
+
+    def test_serializes_each_result_type(self):
+        class WithToDict:
+            def to_dict(self):
+                return {"kind": "to_dict"}
+
+        class Plain:
+            def __init__(self):
+                self.count = 2
+                self._private = "hidden"
+                self.method = lambda: None
+
+        class Broken:
+            def to_dict(self):
+                raise TypeError("not serializable")
+
+        result = SimpleNamespace(stage_results={
+            1: WithToDict(), 2: Plain(), 3: {"kind": "dict"}, 4: None, 5: 42, 6: Broken(),
+        })
+
+        assert soa_worker._serialize_stage_results(result, logger) == {
+            1: {"kind": "to_dict"},
+            2: {"count": 2},
+            3: {"kind": "dict"},
+            5: "42",
+            6: {"error": "not serializable"},
+        }
+
+    def test_missing_stage_results(self):
+        assert soa_worker._serialize_stage_results(SimpleNamespace(), logger) == {}
+        assert soa_worker._serialize_stage_results(SimpleNamespace(stage_results=None), logger) == {}
+
+
+class TestMergeInterpretationProgress:
+
+    def test_group_status_transitions_in_plan_order(self, worker, monkeypatch):
+        assert run_worker(worker, 2, monkeypatch) == 0
+
+        final = worker["group_snapshots"][-1]
+        assert [e["id"] for e in final] == GROUP_IDS
+        assert all(e["status"] == "completed" for e in final)
+        assert all(e["progress"]["stagesCompleted"] == STAGES for e in final)
+        assert final[0]["counts"]["visits"] == 1
+        assert final[0]["stageResults"] == {1: {"ok": True}}
+        for group_id in GROUP_IDS:
+            assert status_history(worker, group_id) == ["pending", "interpreting", "completed"]
+        assert worker["job_updates"][-1]["status"] == "completed"
+
+    def test_phase_progress_reports_groups_in_flight(self, worker, monkeypatch):
+        run_worker(worker, 2, monkeypatch)
+
+        progress = group_progress(worker)
+        assert max(p["groups_in_flight"] for p in progress) == 2
+        assert all(list(p["groups"]) == GROUP_IDS for p in progress)
+        assert all(p["groups_total"] == len(GROUP_IDS) for p in progress)
+
+        last = progress[-1]
+        assert last["groups_completed"] == len(GROUP_IDS)
+        assert last["groups_in_flight"] == 0
+        assert last["progress"] == int(len(GROUP_IDS) * STAGES / (len(GROUP_IDS) * 12) * 100)
+        assert last["groups"]["MG-001"] == {
+            "status": "completed",
+            "stagesCompleted": STAGES,
+            "stagesTotal": 12,
+            "currentStage": STAGES,
+            "currentStageName": f"Stage {STAGES}",
+            "currentStageStatus": "success",
+        }
+
+    @pytest.mark.parametrize("max_parallel_groups", [1, 3])
+    def test_parallel_group_cap(self, worker, monkeypatch, max_parallel_groups):
+        run_worker(worker, max_parallel_groups, monkeypatch)
+
+        assert FakeInterpretationPipeline.max_in_flight == max_parallel_groups
+        assert max(p["groups_in_flight"] for p in group_progress(worker)) == max_parallel_groups
+
+    def test_failed_group_keeps_sibling_results(self, worker, monkeypatch):
+        FakeInterpretationPipeline.failing = {"MG-002"}
+
+        assert run_worker(worker, 2, monkeypatch) == 0
+
+        final = {e["id"]: e for e in worker["group_snapshots"][-1]}
+        assert list(final) == GROUP_IDS
+        assert final["MG-002"]["status"] == "failed"
+        assert "stage 2 exploded" in final["MG-002"]["errorMessage"]
+        assert final["MG-002"]["progress"]["stagesCompleted"] == 1
+        assert status_history(worker, "MG-002") == ["pending", "interpreting", "failed"]
+        for group_id in ["MG-001", "MG-003", "MG-004"]:
+            assert final[group_id]["status"] == "completed"
+            assert final[group_id]["finalUsdm"]["visits"] == [{"id": "V1"}]
+
+        last = group_progress(worker)[-1]
+        assert last["groups_completed"] == len(GROUP_IDS)
+        assert last["groups"]["MG-002"]["status"] == "failed"
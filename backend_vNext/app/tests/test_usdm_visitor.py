@@ -0,0 +1,118 @@
+"""
+Unit tests for the single-pass USDM visitor walk and QualityChecker on top of it.
+
+Tests cover:
+- Copy-on-write: input untouched, unchanged subtrees shared with the result
+- Per-visitor subtree skipping and error isolation
+- QualityChecker.post_process fixes applied in one walk
+"""
+
+import pytest
+
+from app.utils.usdm_visitor import SKIP, TreeVisitor, child_path, walk
+
+
+class UpperCaseFixer(TreeVisitor):
+    """Upper-cases "status" values."""
+
+    def fix(self, node, path, state):
+        status = node.get("status")
+        if isinstance(status, str) and status != status.upper():
+            return {**node, "status": status.upper()}
+        return node
+
+
+class PathCollector(TreeVisitor):
+    """Records scalar paths, skipping "provenance" subtrees."""
+
+    def __init__(self):
+        self.paths = []
+
+    def visit_child(self, parent, key, value, path, scope):
+        if key == "provenance":
+            return SKIP
+        if not isinstance(value, (dict, list)):
+            self.paths.append(child_path(path, key))
+        return scope
+
+
+class FailingCollector(TreeVisitor):
+    def visit_child(self, parent, key, value, path, scope):
+        if key == "boom":
+            raise ValueError("bad value")
+        return scope
+
+
+def test_copy_on_write():
+    data = {
+        "arms": [{"status": "active", "name": "A"}, {"status": "DONE"}],
+        "design": {"blinding": {"status": "OPEN"}},
+    }
+    fixed = walk(data, [UpperCaseFixer()])
+
+    assert fixed == {
+        "arms": [{"status": "ACTIVE", "name": "A"}, {"status": "DONE"}],
+        "design": {"blinding": {"status": "OPEN"}},
+    }
+    assert data["arms"][0]["status"] == "active"
+    assert fixed is not data and fixed["arms"] is not data["arms"]
+    assert fixed["arms"][1] is data["arms"][1]
+    assert fixed["design"] is data["design"]
+    assert walk(fixed, [UpperCaseFixer()]) is fixed
+
+
+def test_visitors_share_one_walk():
+    data = {
+        "name": "x",
+        "provenance": {"page_number": 1},
+        "items": [1, {"status": "new", "provenance": {"text_snippet": "s"}}, [2]],
+    }
+    collector = PathCollector()
+    failing = FailingCollector()
+    fixed = walk(data, [UpperCaseFixer(), failing, collector])
+
+    assert collector.paths == ["$.name", "$.items[0]", "$.items[1].status", "$.items[2][0]"]
+    assert fixed["items"][1]["status"] == "NEW"
+    assert failing.error is None
+
+    data["boom"] = 1
+    failing = FailingCollector()
+    collector = PathCollector()
+    walk(data, [failing, collector])
+    assert isinstance(failing.error, ValueError)
+    assert "$.boom" in collector.paths
+
+
+@pytest.fixture(scope="module")
+def quality_checker():
+    from app.utils.quality_checker import QualityChecker
+
+    return QualityChecker()
+
+
+def test_post_process(quality_checker):
+    data = {
+        "studyPopulation": {
+            "sex": {"allowed": [{"code": "C20197", "decode": "Male", "instanceType": "Code"}]},
+        },
+        "site_personnel": {
+            "other_personnel": [{"role": "Pharmacist", "responsibilities": "Dispensing"}, {"id": "P-9"}],
+        },
+        "approval_status": "Approved",
+        "provenance": {"page_number": 3, "text_snippet": "word " * 150},
+        "objectives": [{"name": "Primary", "provenance": {"page_number": 4, "text_snippet": "Short snippet."}}],
+    }
+    fixed = quality_checker.post_process(data, "study_metadata")
+
+    assert fixed["approval_status"] == "approved"
+    assert fixed["studyPopulation"]["sex"]["allowed"] == [{"code": "C20197", "decode": "Male"}]
+    personnel = fixed["site_personnel"]["other_personnel"]
+    assert personnel[0] == {"role": "Pharmacist", "responsibilities": ["Dispensing"], "id": "PERS-001"}
+    assert personnel[1] == {"id": "P-9"}
+    assert len(fixed["provenance"]["text_snippet"]) <= quality_checker.MAX_SNIPPET_LENGTH
+
+    # Input untouched; untouched subtrees shared
+    assert data["approval_status"] == "Approved"
+    assert "instanceType" in data["studyPopulation"]["sex"]["allowed"][0]
+    assert "id" not in data["site_personnel"]["other_personnel"][0]
+    assert fixed["objectives"] is data["objectives"]
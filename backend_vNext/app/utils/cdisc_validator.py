@@ -13,6 +13,7 @@ from typing import Dict, List, Optional, Any, Tuple
 import yaml
 
 from .cdisc_ct_parser import CDISCTerminologyParser
+from .usdm_visitor import SKIP, TreeVisitor, walk
 
 logger = logging.getLogger(__name__)
 
@@ -490,57 +491,11 @@ class CDISCTerminologyValidator:
         Yields:
             Tuples of (path, field_name, value_dict, inferred_domain)
         """
-        results = []
-
-        if isinstance(data, dict):
-            # Check if this dict has code/decode pair
-            if "code" in data and isinstance(data.get("code"), str):
-                # Infer domain from parent key or context
-                domain = self._infer_domain(parent_key, path, context)
-                results.append((path, parent_key or "unknown", data, domain))
-
-            # Check for decode-only fields (like blindingType)
-            for key in ["blindingType", "interventionModel", "interventionType"]:
-                if key in data and isinstance(data[key], str):
-                    domain = self.FIELD_TO_DOMAIN.get(key)
-                    if domain:
-                        results.append((f"{path}.{key}", key, {"decode": data[key]}, domain))
-
-            # Recurse into nested structures
-            for key, value in data.items():
-                if key in ("provenance", "extensionAttributes", "_metadata"):
-                    continue  # Skip metadata fields
-
-                new_path = f"{path}.{key}"
-
-                # Update context based on key
-                new_context = context
-                if "endpoint" in key.lower():
-                    new_context = "endpoint"
-                elif "objective" in key.lower():
-                    new_context = "objective"
-                elif "arm" in key.lower():
-                    new_context = "arm"
-                elif "epoch" in key.lower():
-                    new_context = "epoch"
-                elif "estimand" in key.lower():
-                    new_context = "estimand"
-
-                if isinstance(value, dict):
-                    results.extend(self._find_coded_fields(value, new_path, key, new_context))
-                elif isinstance(value, list):
-                    for i, item in enumerate(value):
-                        item_path = f"{new_path}[{i}]"
-                        if isinstance(item, dict):
-                            results.extend(self._find_coded_fields(item, item_path, key, new_context))
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                item_path = f"{path}[{i}]"
-                if isinstance(item, dict):
-                    results.extend(self._find_coded_fields(item, item_path, parent_key, context))
-
-        return results
+        visitor = CodedFieldVisitor(self, parent_key, context)
+        walk(data, [visitor], path)
+        if visitor.error is not None:
+            raise visitor.error
+        return visitor.coded_fields
 
     # Fields that require context-aware domain inference
     CONTEXT_DEPENDENT_FIELDS = {"level", "arm_type", "armType"}
@@ -620,7 +575,8 @@ class CDISCTerminologyValidator:
 
     def validate_extraction_data(
         self,
-        data: Dict[str, Any]
+        data: Dict[str, Any],
+        coded_fields: Optional[List[Tuple[str, str, Dict[str, Any], Optional[str]]]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Validate CDISC terminology in extraction data.
@@ -631,6 +587,7 @@ class CDISCTerminologyValidator:
 
         Args:
             data: Extracted data dictionary
+            coded_fields: Result of _find_coded_fields(data) when already collected
 
         Returns:
             List of validation issues
@@ -639,7 +596,8 @@ class CDISCTerminologyValidator:
         validated_paths = set()  # Track validated paths to avoid duplicates
 
         # Phase 1: Recursive traversal to find all coded fields
-        coded_fields = self._find_coded_fields(data)
+        if coded_fields is None:
+            coded_fields = self._find_coded_fields(data)
 
         for path, field_name, value, domain in coded_fields:
             if path in validated_paths:
@@ -715,7 +673,11 @@ class CDISCTerminologyValidator:
 
         return issues
 
-    def get_validation_stats(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def get_validation_stats(
+        self,
+        data: Dict[str, Any],
+        coded_fields: Optional[List[Tuple[str, str, Dict[str, Any], Optional[str]]]] = None,
+    ) -> Dict[str, Any]:
         """
         Get statistics about coded fields in the data.
 
@@ -723,11 +685,13 @@ class CDISCTerminologyValidator:
 
         Args:
             data: Extracted data dictionary
+            coded_fields: Result of _find_coded_fields(data) when already collected
 
         Returns:
             Statistics dictionary
         """
-        coded_fields = self._find_coded_fields(data)
+        if coded_fields is None:
+            coded_fields = self._find_coded_fields(data)
 
         domains_found = {}
         unrecognized = []
@@ -794,3 +758,70 @@ class CDISCTerminologyValidator:
                 })
 
         return results
+
+
+class CodedFieldVisitor(TreeVisitor):
+    """
+    Collects code/decode pairs during a walk() of extraction data.
+
+    Produces the same (path, field_name, value_dict, inferred_domain)
+    tuples, in the same order, as CDISCTerminologyValidator._find_coded_fields.
+    State per container: (parent_key, context).
+    """
+
+    # Metadata subtrees that never hold coded fields
+    SKIPPED_KEYS = ("provenance", "extensionAttributes", "_metadata")
+
+    # Decode-only fields (like blindingType)
+    DECODE_ONLY_FIELDS = ("blindingType", "interventionModel", "interventionType")
+
+    def __init__(
+        self,
+        validator: CDISCTerminologyValidator,
+        parent_key: Optional[str] = None,
+        context: Optional[str] = None,
+    ):
+        self.validator = validator
+        self.root_state = (parent_key, context)
+        self.coded_fields: List[Tuple[str, str, Dict[str, Any], Optional[str]]] = []
+
+    def initial_state(self) -> Tuple[Optional[str], Optional[str]]:
+        return self.root_state
+
+    def enter(self, node: Any, path: str, state: Any) -> Any:
+        if isinstance(node, dict):
+            parent_key, context = state
+            # Check if this dict has code/decode pair
+            if "code" in node and isinstance(node.get("code"), str):
+                domain = self.validator._infer_domain(parent_key, path, context)
+                self.coded_fields.append((path, parent_key or "unknown", node, domain))
+
+            for key in self.DECODE_ONLY_FIELDS:
+                if key in node and isinstance(node[key], str):
+                    domain = self.validator.FIELD_TO_DOMAIN.get(key)
+                    if domain:
+                        self.coded_fields.append((f"{path}.{key}", key, {"decode": node[key]}, domain))
+        return state
+
+    def visit_child(self, parent: Any, key: Any, value: Any, path: str, scope: Any) -> Any:
+        if not isinstance(parent, dict):
+            # List items: only dicts are searched, with the list's own context
+            return scope if isinstance(value, dict) else SKIP
+
+        if key in self.SKIPPED_KEYS or not isinstance(value, (dict, list)):
+            return SKIP
+
+        # Update context based on key
+        new_context = scope[1]
+        key_lower = key.lower()
+        if "endpoint" in key_lower:
+            new_context = "endpoint"
+        elif "objective" in key_lower:
+            new_context = "objective"
+        elif "arm" in key_lower:
+            new_context = "arm"
+        elif "epoch" in key_lower:
+            new_context = "epoch"
+        elif "estimand" in key_lower:
+            new_context = "estimand"
+        return key, new_context
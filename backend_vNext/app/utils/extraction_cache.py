@@ -31,6 +31,12 @@ CACHE_DIR = Path(__file__).parent.parent.parent / ".cache"
 
 def _compute_file_hash(file_path: str, max_bytes: int = 1024 * 1024) -> str:
     """Compute SHA256 hash of a file (first max_bytes for large files)."""
+    # PDFs from the shared store are named by their full content hash
+    from app.utils.pdf_store import content_hash_for_path
+    known_hash = content_hash_for_path(file_path)
+    if known_hash:
+        return known_hash[:16]
+
     hasher = hashlib.sha256()
     try:
         with open(file_path, 'rb') as f:
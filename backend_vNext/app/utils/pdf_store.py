@@ -0,0 +1,323 @@
+"""
+Content-addressed on-disk store for protocol PDFs.
+
+Workers need a filesystem path for each protocol PDF, but the binary lives
+in Protocol.file_data. Instead of writing a fresh temp file per job (and
+having every cache layer re-hash it), PDFs are materialized once under
+their SHA-256 (Protocol.file_hash) and shared by all jobs and processes:
+
+    <root>/<file_hash>/<original filename>
+
+Handles:
+- Lookup by hash without loading the BYTEA column (a hit costs one stat)
+- Atomic, read-only materialization safe across API and worker processes
+- Extra filenames for the same content as hard links (no rewrite)
+- LRU eviction by total bytes, skipping recently used entries so paths
+  handed to running jobs stay valid
+- content_hash_for_path() so SOACache, ExtractionCache and
+  GeminiFileService reuse the known hash instead of reading the file
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Marker file identifying a store root (see content_hash_for_path)
+STORE_MARKER = ".content-addressed"
+
+DEFAULT_STORE_DIR = Path(tempfile.gettempdir()) / "protocol_pdfs"
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+# Entries used within this window are never evicted (longest job runtime)
+DEFAULT_MIN_IDLE_SECONDS = 6 * 60 * 60
+
+_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w.\- ]")
+
+
+def _safe_filename(filename: Optional[str]) -> str:
+    """Strip directory components and unsafe characters from a filename."""
+    name = Path(filename or "protocol.pdf").name
+    name = _UNSAFE_FILENAME_RE.sub("_", name).strip() or "protocol.pdf"
+    if not name.lower().endswith(".pdf"):
+        name += ".pdf"
+    return name
+
+
+def content_hash_for_path(path: Union[str, Path]) -> Optional[str]:
+    """
+    Return the SHA-256 of a PDF served from a PDF store, without reading it.
+
+    Args:
+        path: Any file path
+
+    Returns:
+        Full hex digest if the path lies in a store, otherwise None
+    """
+    try:
+        entry_dir = Path(path).parent
+        if _HASH_RE.match(entry_dir.name) and (entry_dir.parent / STORE_MARKER).exists():
+            return entry_dir.name
+    except OSError:
+        pass
+    return None
+
+
+class PDFStore:
+    """Shared content-addressed PDF files with LRU eviction by size."""
+
+    def __init__(
+        self,
+        root: Union[str, Path] = DEFAULT_STORE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        min_idle_seconds: float = DEFAULT_MIN_IDLE_SECONDS,
+    ):
+        """
+        Initialize store.
+
+        Args:
+            root: Store directory (shared by all processes on the host)
+            max_bytes: Total size above which least recently used PDFs are evicted
+            min_idle_seconds: Entries used more recently than this are kept
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.min_idle_seconds = min_idle_seconds
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / STORE_MARKER).touch(exist_ok=True)
+
+    def _entry_dir(self, file_hash: str) -> Path:
+        if not _HASH_RE.match(file_hash or ""):
+            raise ValueError(f"Invalid content hash: {file_hash!r}")
+        return self.root / file_hash
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Record use for LRU ordering (mtime on the entry directory)."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _any_file(self, entry_dir: Path) -> Optional[Path]:
+        try:
+            for path in entry_dir.iterdir():
+                if path.suffix == ".pdf" and not path.name.startswith("."):
+                    return path
+        except FileNotFoundError:
+            pass
+        return None
+
+    def get_path(self, file_hash: str, filename: Optional[str] = None) -> Optional[Path]:
+        """
+        Get the stored path for a PDF if it has been materialized.
+
+        Args:
+            file_hash: SHA-256 of the PDF content
+            filename: Desired filename; linked to the existing content if new
+
+        Returns:
+            Read-only path, or None if the PDF is not in the store
+        """
+        entry_dir = self._entry_dir(file_hash)
+        existing = self._any_file(entry_dir)
+        if existing is None:
+            with self._lock:
+                self._misses += 1
+            return None
+
+        path = existing
+        if filename is not None:
+            path = entry_dir / _safe_filename(filename)
+            if not path.exists():
+                try:
+                    os.link(existing, path)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    shutil.copyfile(existing, path)
+                    os.chmod(path, 0o444)
+
+        self._touch(entry_dir)
+        with self._lock:
+            self._hits += 1
+        return path
+
+    def put(self, data: bytes, file_hash: Optional[str] = None, filename: Optional[str] = None) -> Path:
+        """
+        Materialize a PDF (no-op if the content is already stored).
+
+        Args:
+            data: PDF bytes
+            file_hash: Known SHA-256 of data (computed if omitted)
+            filename: Filename to expose the content under
+
+        Returns:
+            Read-only path to the PDF
+        """
+        file_hash = file_hash or hashlib.sha256(data).hexdigest()
+        path = self.get_path(file_hash, filename)
+        if path is not None:
+            return path
+
+        entry_dir = self._entry_dir(file_hash)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        path = entry_dir / _safe_filename(filename)
+
+        # Write under a private name and rename so readers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=entry_dir, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(tmp_name, 0o444)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        self._touch(entry_dir)
+        logger.info(f"Stored PDF {file_hash[:12]} ({len(data)} bytes) at {path}")
+        self.evict(keep=file_hash)
+        return path
+
+    def open_mmap(self, file_hash: str) -> Optional[mmap.mmap]:
+        """
+        Memory-map a stored PDF read-only.
+
+        Returns:
+            mmap object (caller closes), or None if not stored
+        """
+        path = self.get_path(file_hash)
+        if path is None:
+            return None
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _entry_size(self, entry_dir: Path) -> int:
+        """Bytes used by an entry (hard links counted once)."""
+        inodes = {}
+        for path in entry_dir.iterdir():
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            inodes[st.st_ino] = st.st_size
+        return sum(inodes.values())
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Remove least recently used PDFs until the store fits max_bytes.
+
+        Args:
+            keep: Hash that must not be evicted (e.g. just stored)
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        total = 0
+        for entry_dir in self.root.iterdir():
+            if not entry_dir.is_dir() or not _HASH_RE.match(entry_dir.name):
+                continue
+            try:
+                size = self._entry_size(entry_dir)
+                last_used = entry_dir.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            entries.append((last_used, entry_dir, size))
+            total += size
+
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        now = time.time()
+        for last_used, entry_dir, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry_dir.name == keep or now - last_used < self.min_idle_seconds:
+                continue
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            removed += 1
+            logger.info(f"Evicted PDF {entry_dir.name[:12]} ({size} bytes) from store")
+
+        with self._lock:
+            self._evictions += removed
+        return removed
+
+    def stats(self) -> dict:
+        """Get store statistics for this process."""
+        with self._lock:
+            return {
+                "root": str(self.root),
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
+# Singleton instance
+_store_instance: Optional[PDFStore] = None
+_store_lock = threading.Lock()
+
+
+def get_pdf_store() -> PDFStore:
+    """Get the singleton PDF store instance."""
+    global _store_instance
+    if _store_instance is None:
+        with _store_lock:
+            if _store_instance is None:
+                from app.config import settings
+                _store_instance = PDFStore(
+                    root=settings.pdf_store_dir or DEFAULT_STORE_DIR,
+                    max_bytes=settings.pdf_store_max_bytes,
+                )
+    return _store_instance
+
+
+def get_protocol_pdf_path(protocol) -> str:
+    """
+    Get a filesystem path for a protocol's PDF, materializing it if needed.
+
+    The BYTEA column is only loaded when the PDF is not already stored.
+
+    Args:
+        protocol: Protocol ORM instance (file_data may be deferred)
+
+    Returns:
+        Path to the PDF
+
+    Raises:
+        ValueError: If the protocol has neither stored data nor a file path
+    """
+    store = get_pdf_store()
+    if protocol.file_hash:
+        path = store.get_path(protocol.file_hash, protocol.filename)
+        if path is not None:
+            return str(path)
+
+    if protocol.file_data:
+        return str(store.put(protocol.file_data, protocol.file_hash, protocol.filename))
+
+    if protocol.file_path:
+        return protocol.file_path
+
+    raise ValueError(f"Protocol {protocol.id} has no PDF data or file path")
@@ -0,0 +1,195 @@
+"""
+Chunked PDF delivery from BYTEA columns with HTTP Range and ETag support.
+
+Loading Protocol.file_data / ExtractionOutput.file_data into memory and
+returning it as a single Response stalled the viewer for seconds on large
+protocols. This module reads the column in slices with substring() so
+the first bytes reach the browser immediately, serves 206 Partial Content
+for pdf.js range requests, and answers If-None-Match revalidation with 304.
+
+PostgreSQL can only slice a BYTEA value without reading all of it when the
+value is stored uncompressed (STORAGE EXTERNAL); see
+migrations/007_pdf_bytea_storage_external.sql.
+"""
+
+import hashlib
+import logging
+from typing import Iterator, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import func
+
+from app.db import get_session_factory
+
+logger = logging.getLogger(__name__)
+
+# Bytes fetched per database round-trip
+STREAM_CHUNK_SIZE = 512 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when a Range header cannot be served for the resource size."""
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a strong ETag from identifying parts (e.g. file_hash).
+
+    Returns:
+        Quoted ETag value
+    """
+    if len(parts) == 1 and isinstance(parts[0], str) and len(parts[0]) == 64:
+        # Already a SHA-256 content hash
+        return f'"{parts[0]}"'
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+
+def parse_range_header(range_header: Optional[str], total_size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range "bytes=" header.
+
+    Multi-range requests are answered with the full body (allowed by RFC 9110).
+
+    Args:
+        range_header: Value of the Range header
+        total_size: Size of the resource in bytes
+
+    Returns:
+        Inclusive (start, end) byte range, or None to serve the full body
+
+    Raises:
+        RangeNotSatisfiable: If the range lies outside the resource
+    """
+    if not range_header or not range_header.startswith("bytes="):
+        return None
+
+    spec = range_header[len("bytes="):].strip()
+    if "," in spec:
+        return None
+
+    start_str, _, end_str = spec.partition("-")
+    try:
+        if start_str == "":
+            # Suffix range: last N bytes
+            suffix = int(end_str)
+            if suffix <= 0:
+                raise RangeNotSatisfiable(range_header)
+            start = max(total_size - suffix, 0)
+            end = total_size - 1
+        else:
+            start = int(start_str)
+            end = int(end_str) if end_str else total_size - 1
+    except ValueError:
+        return None
+
+    if start >= total_size or start > end:
+        raise RangeNotSatisfiable(range_header)
+
+    return start, min(end, total_size - 1)
+
+
+def iter_bytea(
+    column,
+    row_filter,
+    start: int,
+    end: int,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Yield bytes [start, end] of a BYTEA column in chunks.
+
+    Uses its own short-lived session so the request-scoped session is not
+    held open (or shared across threads) while the response streams.
+
+    Args:
+        column: Mapped BYTEA column (e.g. Protocol.file_data)
+        row_filter: SQL expression selecting exactly one row
+        start: First byte (0-based, inclusive)
+        end: Last byte (inclusive)
+        chunk_size: Bytes per query
+    """
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+    try:
+        offset = start
+        while offset <= end:
+            length = min(chunk_size, end - offset + 1)
+            # substring() is 1-based in SQL
+            chunk = db.query(func.substring(column, offset + 1, length)).filter(row_filter).scalar()
+            if not chunk:
+                break
+            yield bytes(chunk)
+            offset += len(chunk)
+    finally:
+        db.close()
+
+
+def bytea_length(db, column, row_filter) -> int:
+    """Get the stored length of a BYTEA column without fetching it."""
+    return db.query(func.octet_length(column)).filter(row_filter).scalar() or 0
+
+
+def build_pdf_response(
+    request: Request,
+    column,
+    row_filter,
+    total_size: int,
+    etag: str,
+    filename: str,
+) -> Response:
+    """
+    Build a streaming PDF response honouring Range, If-Range and If-None-Match.
+
+    Args:
+        request: Incoming request (for conditional/range headers)
+        column: Mapped BYTEA column holding the PDF
+        row_filter: SQL expression selecting the row
+        total_size: PDF size in bytes
+        etag: Quoted ETag for the PDF content
+        filename: Filename for Content-Disposition
+
+    Returns:
+        200 streaming, 206 partial, 304 not modified or 416 response
+    """
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        # Allow browser caching but always revalidate via ETag
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": f'inline; filename="{filename}"',
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range.strip() != etag:
+        # Resource changed since the client's partial copy: send it whole
+        range_header = None
+
+    try:
+        byte_range = parse_range_header(range_header, total_size)
+    except RangeNotSatisfiable:
+        return Response(
+            status_code=416,
+            headers={**headers, "Content-Range": f"bytes */{total_size}"},
+        )
+
+    if byte_range is None:
+        start, end, status_code = 0, total_size - 1, 200
+    else:
+        (start, end), status_code = byte_range, 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{total_size}"
+
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        iter_bytea(column, row_filter, start, end),
+        status_code=status_code,
+        media_type="application/pdf",
+        headers=headers,
+    )
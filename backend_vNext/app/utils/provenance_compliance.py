@@ -9,6 +9,8 @@ Ensures every extracted field has proper provenance with:
 import logging
 from typing import Any, Dict, List, Tuple, Optional
 
+from app.utils.usdm_visitor import SKIP, TreeVisitor, child_path, walk
+
 logger = logging.getLogger(__name__)
 
 
@@ -133,79 +135,11 @@ class ProvenanceCompliance:
         Returns:
             Tuple of (coverage_percentage, list_of_missing_fields)
         """
-        total_fields = 0
-        covered_fields = 0
-        missing_fields = []
-
-        def traverse(
-            obj: Any,
-            current_path: str,
-            parent_has_provenance: bool = False,
-            parent_obj: Optional[Dict[str, Any]] = None,
-            field_key: Optional[str] = None,
-        ):
-            nonlocal total_fields, covered_fields, missing_fields
-
-            if isinstance(obj, dict):
-                # Check for provenance in this object (nested pattern)
-                has_provenance = self._has_valid_provenance(obj)
-
-                for key, value in obj.items():
-                    # Skip exempt fields and provenance sibling fields
-                    if key in self.EXEMPT_FIELDS or key.endswith("Provenance"):
-                        continue
-
-                    field_path = f"{current_path}.{key}"
-
-                    if isinstance(value, (dict, list)):
-                        traverse(value, field_path, has_provenance or parent_has_provenance, obj, key)
-                    elif value is not None:
-                        total_fields += 1
-                        # Check nested provenance, parent provenance, OR sibling provenance
-                        has_sibling = self._has_sibling_provenance(obj, key)
-                        if has_provenance or parent_has_provenance or has_sibling:
-                            covered_fields += 1
-                        else:
-                            missing_fields.append({
-                                "path": field_path,
-                                "value": str(value)[:100],
-                            })
-
-            elif isinstance(obj, list):
-                # Check for array-level provenance coverage:
-                # 1. Sibling provenance pattern (e.g., regionsProvenance)
-                # 2. Parent object provenance (e.g., geographic_requirements.provenance)
-                array_provenance = False
-                if parent_obj and field_key:
-                    # Check sibling provenance pattern first (e.g., countriesProvenance)
-                    array_provenance = self._has_sibling_provenance(parent_obj, field_key)
-                    # Also check if parent object has valid provenance (covers scalar arrays)
-                    if not array_provenance:
-                        array_provenance = self._has_valid_provenance(parent_obj)
-
-                for i, item in enumerate(obj):
-                    item_path = f"{current_path}[{i}]"
-                    if isinstance(item, dict):
-                        # Dict array items must have their OWN valid provenance
-                        # They do NOT inherit from parent - each item needs explicit provenance
-                        traverse(item, item_path, False, obj, None)
-                    elif item is not None:
-                        # Scalar array items (strings, numbers) CAN inherit provenance from:
-                        # 1. Sibling provenance pattern (regionsProvenance)
-                        # 2. Parent object provenance (geographic_requirements.provenance)
-                        total_fields += 1
-                        if array_provenance:
-                            covered_fields += 1
-                        else:
-                            missing_fields.append({
-                                "path": item_path,
-                                "value": str(item)[:100],
-                            })
-
-        traverse(data, path)
-
-        coverage = covered_fields / total_fields if total_fields > 0 else 1.0
-        return coverage, missing_fields
+        visitor = ProvenanceCoverageVisitor(self)
+        walk(data, [visitor], path)
+        if visitor.error is not None:
+            raise visitor.error
+        return visitor.result()
 
     def _has_valid_provenance(self, obj: Dict[str, Any]) -> bool:
         """
@@ -421,3 +355,73 @@ class ProvenanceCompliance:
                 )
 
         return recommendations
+
+
+class ProvenanceCoverageVisitor(TreeVisitor):
+    """
+    Collects provenance coverage during a walk() of extraction data.
+
+    Scalars are covered by their object's own provenance, an ancestor's
+    provenance, or a sibling "*Provenance" object. Scalar array items are
+    covered by the array's sibling provenance or the owning object's
+    provenance; dict array items must carry their own.
+
+    State per container: (parent_has_provenance, parent_obj, field_key).
+    """
+
+    def __init__(self, compliance: ProvenanceCompliance):
+        self.compliance = compliance
+        self.total_fields = 0
+        self.covered_fields = 0
+        self.missing_fields: List[Dict[str, Any]] = []
+
+    def initial_state(self) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+        return False, None, None
+
+    def enter(self, node: Any, path: str, state: Any) -> bool:
+        parent_has_provenance, parent_obj, field_key = state
+        if isinstance(node, dict):
+            # Check for provenance in this object (nested pattern)
+            return self.compliance._has_valid_provenance(node) or parent_has_provenance
+
+        # Array-level provenance: sibling pattern (e.g., regionsProvenance),
+        # then the owning object's provenance (covers scalar arrays)
+        array_provenance = False
+        if parent_obj and field_key:
+            array_provenance = self.compliance._has_sibling_provenance(parent_obj, field_key)
+            if not array_provenance:
+                array_provenance = self.compliance._has_valid_provenance(parent_obj)
+        return array_provenance
+
+    def visit_child(self, parent: Any, key: Any, value: Any, path: str, scope: bool) -> Any:
+        if isinstance(parent, dict):
+            # Skip exempt fields and provenance sibling fields
+            if key in self.compliance.EXEMPT_FIELDS or key.endswith("Provenance"):
+                return SKIP
+            if isinstance(value, (dict, list)):
+                return scope, parent, key
+            if value is not None:
+                self.total_fields += 1
+                has_sibling = self.compliance._has_sibling_provenance(parent, key)
+                if scope or has_sibling:
+                    self.covered_fields += 1
+                else:
+                    self.missing_fields.append({"path": child_path(path, key), "value": str(value)[:100]})
+            return SKIP
+
+        if isinstance(value, dict):
+            # Dict array items must have their OWN valid provenance
+            return False, parent, None
+        if value is not None:
+            # Scalar array items inherit array-level provenance
+            self.total_fields += 1
+            if scope:
+                self.covered_fields += 1
+            else:
+                self.missing_fields.append({"path": child_path(path, key), "value": str(value)[:100]})
+        return SKIP
+
+    def result(self) -> Tuple[float, List[Dict[str, Any]]]:
+        """Coverage fraction and missing fields."""
+        coverage = self.covered_fields / self.total_fields if self.total_fields > 0 else 1.0
+        return coverage, self.missing_fields
@@ -15,12 +15,13 @@ import json
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.config import settings
 from app.utils.schema_validator import SchemaValidator
-from app.utils.provenance_compliance import ProvenanceCompliance
-from app.utils.cdisc_validator import CDISCTerminologyValidator
+from app.utils.provenance_compliance import ProvenanceCompliance, ProvenanceCoverageVisitor
+from app.utils.cdisc_validator import CDISCTerminologyValidator, CodedFieldVisitor
+from app.utils.usdm_visitor import SKIP, TreeVisitor, child_path, walk
 
 logger = logging.getLogger(__name__)
 
@@ -171,6 +172,10 @@ class QualityChecker:
         7. Convert string fields to arrays where schema expects arrays
         8. Auto-generate missing required IDs
 
+        All fixes are applied in a single walk. data is not modified: changed
+        objects (and their ancestors) are copied, unchanged subtrees are
+        shared with the result.
+
         Args:
             data: Extracted data to post-process
             module_id: Module ID for context
@@ -178,122 +183,33 @@ class QualityChecker:
         Returns:
             Post-processed data with auto-corrections applied
         """
-        import copy
-        data = copy.deepcopy(data)
-
-        # 1. Truncate long snippets
-        self._truncate_snippets(data)
-
-        # 2. Auto-correct CDISC codes based on decode
-        self._auto_correct_terminology(data, module_id)
-
-        # 3. Normalize enum case (e.g., 'Approved' -> 'approved')
-        self._normalize_enum_case(data, module_id)
-
-        # 4. Map invalid enum values to valid ones
-        self._map_enum_values(data, module_id)
-
-        # 5. Remove disallowed properties from specific objects
-        self._remove_disallowed_properties(data, module_id)
-
-        # 6. Convert string fields to arrays where schema expects arrays
-        self._convert_string_to_array(data, module_id)
-
-        # 7. Auto-generate missing required IDs
-        self._auto_generate_missing_ids(data, module_id)
-
+        visitor = PostProcessVisitor(self)
+        data = walk(data, [visitor])
+        if visitor.error is not None:
+            raise visitor.error
         return data
 
-    def _truncate_snippets(self, data: Any, path: str = "$") -> None:
+    def _truncate_snippet(self, value: str) -> str:
         """
-        Recursively truncate text_snippet fields to schema max length.
+        Truncate a text_snippet to schema max length.
 
         Truncates at sentence boundary if possible, otherwise at word boundary.
         """
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key == "text_snippet" and isinstance(value, str):
-                    if len(value) > self.MAX_SNIPPET_LENGTH:
-                        # Try to truncate at sentence boundary
-                        truncated = value[:self.MAX_SNIPPET_LENGTH]
-                        last_period = truncated.rfind('. ')
-                        last_newline = truncated.rfind('\\n')
-                        break_point = max(last_period, last_newline)
-
-                        if break_point > self.MAX_SNIPPET_LENGTH * 0.6:
-                            # Good sentence break found
-                            data[key] = truncated[:break_point + 1].strip()
-                        else:
-                            # Truncate at word boundary
-                            last_space = truncated.rfind(' ')
-                            if last_space > self.MAX_SNIPPET_LENGTH * 0.8:
-                                data[key] = truncated[:last_space].strip()
-                            else:
-                                data[key] = truncated.strip()
-
-                        logger.debug(f"Truncated snippet at {path}.{key}: {len(value)} -> {len(data[key])} chars")
-                elif isinstance(value, (dict, list)):
-                    self._truncate_snippets(value, f"{path}.{key}")
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                self._truncate_snippets(item, f"{path}[{i}]")
-
-    def _auto_correct_terminology(self, data: Any, module_id: str, path: str = "$") -> None:
-        """
-        Auto-correct CDISC codes based on decode values.
-
-        If a decode is valid but the code is wrong, replace with correct code.
-        Also ensures codeSystem and codeSystemVersion are present for Code objects.
-        This handles common LLM errors like using wrong NCI codes or missing fields.
-        """
-        # CDISC Code System constants
-        CDISC_CODE_SYSTEM = "http://ncicb.nci.nih.gov/xml/owl/EVS/Thesaurus.owl"
-        CDISC_CODE_SYSTEM_VERSION = "24.03e"
-
-        if isinstance(data, dict):
-            # Check if this dict has code/decode pair (is a Code object)
-            if "code" in data and "decode" in data:
-                code = data.get("code")
-                decode = data.get("decode")
-
-                if code and decode:
-                    # Infer domain from path
-                    domain = self._infer_domain_from_path(path)
-                    if domain:
-                        # Check if code matches decode
-                        is_valid, error = self.terminology_validator.validate_code_decode_pair(
-                            code, decode, domain
-                        )
-                        if not is_valid:
-                            # Try to find correct code for this decode
-                            correct_code = self.terminology_validator.get_code_for_decode(decode, domain)
-                            if correct_code and correct_code != code:
-                                logger.info(
-                                    f"Auto-correcting code at {path}: "
-                                    f"'{code}' -> '{correct_code}' for decode '{decode}'"
-                                )
-                                data["code"] = correct_code
-
-                    # Ensure codeSystem and codeSystemVersion are present for Code objects
-                    # This is required by schema for studyPhase, studyType, etc.
-                    if "codeSystem" not in data or not data["codeSystem"]:
-                        data["codeSystem"] = CDISC_CODE_SYSTEM
-                        logger.debug(f"Added missing codeSystem at {path}")
-
-                    if "codeSystemVersion" not in data or not data["codeSystemVersion"]:
-                        data["codeSystemVersion"] = CDISC_CODE_SYSTEM_VERSION
-                        logger.debug(f"Added missing codeSystemVersion at {path}")
-
-            # Recurse into nested structures
-            for key, value in data.items():
-                if isinstance(value, (dict, list)):
-                    self._auto_correct_terminology(value, module_id, f"{path}.{key}")
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                if isinstance(item, (dict, list)):
-                    self._auto_correct_terminology(item, module_id, f"{path}[{i}]")
+        # Try to truncate at sentence boundary
+        truncated = value[:self.MAX_SNIPPET_LENGTH]
+        last_period = truncated.rfind('. ')
+        last_newline = truncated.rfind('\\n')
+        break_point = max(last_period, last_newline)
+
+        if break_point > self.MAX_SNIPPET_LENGTH * 0.6:
+            # Good sentence break found
+            return truncated[:break_point + 1].strip()
+
+        # Truncate at word boundary
+        last_space = truncated.rfind(' ')
+        if last_space > self.MAX_SNIPPET_LENGTH * 0.8:
+            return truncated[:last_space].strip()
+        return truncated.strip()
 
     def _infer_domain_from_path(self, path: str) -> str | None:
         """Infer CDISC domain from JSON path."""
@@ -338,205 +254,6 @@ class QualityChecker:
 
         return None
 
-    def _normalize_enum_case(self, data: Any, module_id: str, path: str = "$") -> None:
-        """
-        Normalize enum values to lowercase where the schema expects lowercase.
-
-        Common fixes:
-        - 'Approved' -> 'approved'
-        - 'Pending' -> 'pending'
-        - 'Submitted' -> 'submitted'
-        """
-        # Fields that should have lowercase enum values
-        LOWERCASE_ENUM_FIELDS = {
-            "approval_status": True,
-            "consent_type": True,
-            "monitoring_approach": True,
-            "blinding_requirements": True,
-            "distribution_model": True,
-            "destruction_method": True,
-            "accountability_method": True,
-            "kit_design": True,
-            "format": True,  # training format
-            "visit_type": True,
-            "collection_frequency": True,
-            "storage_phase": True,
-        }
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key in LOWERCASE_ENUM_FIELDS and isinstance(value, str):
-                    lowered = value.lower()
-                    if lowered != value:
-                        data[key] = lowered
-                        logger.debug(f"Normalized enum case at {path}.{key}: '{value}' -> '{lowered}'")
-                elif isinstance(value, (dict, list)):
-                    self._normalize_enum_case(value, module_id, f"{path}.{key}")
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                if isinstance(item, (dict, list)):
-                    self._normalize_enum_case(item, module_id, f"{path}[{i}]")
-
-    def _map_enum_values(self, data: Any, module_id: str, path: str = "$") -> None:
-        """
-        Map invalid enum values to valid schema-compliant values.
-
-        Common mappings:
-        - device_type: 'provisioned_device' -> 'provisioned_tablet', 'handheld' -> 'provisioned_tablet', 'tablet' -> 'provisioned_tablet'
-        - vendor_type: 'Logistics' -> 'logistics'
-        - service_type: 'biobanking' -> 'biorepository'
-        - source: 'sponsor_supplied' -> 'sponsor_provided'
-        - scopeId: 'sponsor_protocol_id' -> 'sponsor'
-        """
-        # Mapping tables: field_name -> {invalid_value: valid_value}
-        ENUM_MAPPINGS = {
-            "device_type": {
-                "provisioned_device": "provisioned_tablet",
-                "handheld": "provisioned_tablet",
-                "tablet": "provisioned_tablet",
-                "BYOD": "patient_smartphone",
-                "byod": "patient_smartphone",
-            },
-            "vendor_type": {
-                "Logistics": "logistics",
-                "Safety": "safety",
-                "Regulatory": "regulatory",
-                "Drug_supply": "drug_supply",
-            },
-            "service_type": {
-                "biobanking": "biorepository",
-                "Biobanking": "biorepository",
-            },
-            "source": {
-                "sponsor_supplied": "sponsor_provided",
-                "Sponsor_supplied": "sponsor_provided",
-            },
-            "scopeId": {
-                "sponsor_protocol_id": "sponsor",
-                "Sponsor_protocol_id": "sponsor",
-                "SPONSOR": "sponsor",
-            },
-        }
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key in ENUM_MAPPINGS and isinstance(value, str):
-                    mapping = ENUM_MAPPINGS[key]
-                    if value in mapping:
-                        new_value = mapping[value]
-                        data[key] = new_value
-                        logger.debug(f"Mapped enum value at {path}.{key}: '{value}' -> '{new_value}'")
-                elif isinstance(value, (dict, list)):
-                    self._map_enum_values(value, module_id, f"{path}.{key}")
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                if isinstance(item, (dict, list)):
-                    self._map_enum_values(item, module_id, f"{path}[{i}]")
-
-    def _remove_disallowed_properties(self, data: Any, module_id: str, path: str = "$") -> None:
-        """
-        Remove properties that are disallowed by schema in specific contexts.
-
-        Key fixes:
-        - Remove codeSystem/codeSystemVersion from sex.allowed items
-          (sexCode schema has additionalProperties: false and only allows code, decode, provenance)
-        """
-        if isinstance(data, dict):
-            # Check if we're in studyPopulation.sex.allowed array context
-            if "studyPopulation" in data and isinstance(data["studyPopulation"], dict):
-                study_pop = data["studyPopulation"]
-                if "sex" in study_pop and isinstance(study_pop["sex"], dict):
-                    sex_obj = study_pop["sex"]
-                    if "allowed" in sex_obj and isinstance(sex_obj["allowed"], list):
-                        for sex_code in sex_obj["allowed"]:
-                            if isinstance(sex_code, dict):
-                                # Remove disallowed properties from sex code objects
-                                for prop in ["codeSystem", "codeSystemVersion", "instanceType"]:
-                                    if prop in sex_code:
-                                        del sex_code[prop]
-                                        logger.debug(f"Removed disallowed property '{prop}' from sex.allowed item")
-
-            # Recurse into nested structures
-            for key, value in data.items():
-                if isinstance(value, (dict, list)):
-                    self._remove_disallowed_properties(value, module_id, f"{path}.{key}")
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                if isinstance(item, (dict, list)):
-                    self._remove_disallowed_properties(item, module_id, f"{path}[{i}]")
-
-    def _convert_string_to_array(self, data: Any, module_id: str, path: str = "$") -> None:
-        """
-        Convert string fields to arrays where schema expects arrays.
-
-        Common fixes:
-        - safety_committees.*.responsibilities: string -> [string]
-        - site_personnel.other_personnel.*.responsibilities: string -> [string]
-        """
-        # Fields that should be arrays of strings
-        ARRAY_FIELDS = {
-            "responsibilities",
-        }
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key in ARRAY_FIELDS and isinstance(value, str):
-                    # Convert string to single-element array
-                    data[key] = [value]
-                    logger.debug(f"Converted string to array at {path}.{key}")
-                elif isinstance(value, (dict, list)):
-                    self._convert_string_to_array(value, module_id, f"{path}.{key}")
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                if isinstance(item, (dict, list)):
-                    self._convert_string_to_array(item, module_id, f"{path}[{i}]")
-
-    def _auto_generate_missing_ids(self, data: Any, module_id: str, path: str = "$") -> None:
-        """
-        Auto-generate missing required IDs for array items.
-
-        Generates IDs for:
-        - discovered_specimen_types[].specimen_id -> SPEC-001, SPEC-002, ...
-        - processing_requirements[].processing_id -> PROC-001, PROC-002, ...
-        - collection_containers[].container_id -> TUBE-001, TUBE-002, ...
-        - storage_requirements[].storage_id -> STOR-001, STOR-002, ...
-        - shipping_requirements[].shipping_id -> SHIP-001, SHIP-002, ...
-        - collection_schedule[].schedule_id -> COL-001, COL-002, ...
-        - site_personnel.other_personnel[].id -> PERS-001, PERS-002, ...
-        """
-        # Mapping of array path patterns to (id_field, prefix)
-        ID_GENERATORS = {
-            "discovered_specimen_types": ("specimen_id", "SPEC"),
-            "processing_requirements": ("processing_id", "PROC"),
-            "collection_containers": ("container_id", "TUBE"),
-            "storage_requirements": ("storage_id", "STOR"),
-            "shipping_requirements": ("shipping_id", "SHIP"),
-            "collection_schedule": ("schedule_id", "COL"),
-            "other_personnel": ("id", "PERS"),
-        }
-
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key in ID_GENERATORS and isinstance(value, list):
-                    id_field, prefix = ID_GENERATORS[key]
-                    for i, item in enumerate(value):
-                        if isinstance(item, dict):
-                            if id_field not in item or not item[id_field]:
-                                generated_id = f"{prefix}-{i + 1:03d}"
-                                item[id_field] = generated_id
-                                logger.debug(f"Generated missing ID at {path}.{key}[{i}].{id_field}: {generated_id}")
-                elif isinstance(value, (dict, list)):
-                    self._auto_generate_missing_ids(value, module_id, f"{path}.{key}")
-
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                if isinstance(item, (dict, list)):
-                    self._auto_generate_missing_ids(item, module_id, f"{path}[{i}]")
-
     def evaluate(
         self,
         data: Dict[str, Any],
@@ -556,8 +273,14 @@ class QualityChecker:
         """
         logger.debug(f"Evaluating quality for {module_id} ({pass_type})")
 
+        # Accuracy, provenance and terminology metrics share one walk over the data
+        accuracy_visitor = AccuracyVisitor(self.PLACEHOLDER_PATTERNS)
+        provenance_visitor = ProvenanceCoverageVisitor(self.provenance_compliance)
+        coded_field_visitor = CodedFieldVisitor(self.terminology_validator)
+        walk(data, [accuracy_visitor, provenance_visitor, coded_field_visitor])
+
         # 1. Accuracy check
-        accuracy, accuracy_issues = self._check_accuracy(data, module_id)
+        accuracy, accuracy_issues = self._check_accuracy(data, module_id, accuracy_visitor)
 
         # 2. Completeness check
         completeness, completeness_issues = self._check_completeness(data, module_id)
@@ -566,10 +289,12 @@ class QualityChecker:
         usdm_adherence, usdm_adherence_issues = self._check_usdm_adherence(data, module_id)
 
         # 4. Provenance check
-        provenance, provenance_issues = self._check_provenance(data, module_id)
+        provenance, provenance_issues = self._check_provenance(data, module_id, provenance_visitor)
 
         # 5. Terminology check (CDISC CT / NCI Thesaurus)
-        terminology, terminology_issues = self._check_terminology_compliance(data, module_id)
+        terminology, terminology_issues = self._check_terminology_compliance(
+            data, module_id, coded_field_visitor
+        )
 
         score = QualityScore(
             accuracy=accuracy,
@@ -621,7 +346,10 @@ class QualityChecker:
         )
 
     def _check_accuracy(
-        self, data: Dict[str, Any], module_id: str
+        self,
+        data: Dict[str, Any],
+        module_id: str,
+        visitor: Optional["AccuracyVisitor"] = None,
     ) -> Tuple[float, List[Dict[str, Any]]]:
         """
         Check accuracy: values match expected patterns, no obvious hallucinations.
@@ -632,88 +360,18 @@ class QualityChecker:
         - Required enums match allowed values
         - No placeholder text ("TBD", "TODO", "PLACEHOLDER")
         - No empty strings for required fields
+
+        Args:
+            data: Extracted data to check
+            module_id: Module ID for context
+            visitor: AccuracyVisitor already walked over data, if any
         """
-        issues = []
-        total_checks = 0
-        passed_checks = 0
-
-        def traverse(obj: Any, path: str = "$"):
-            nonlocal total_checks, passed_checks, issues
-
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    field_path = f"{path}.{key}"
-
-                    # Check date format
-                    if "date" in key.lower() and isinstance(value, str) and value:
-                        total_checks += 1
-                        # Accept YYYY-MM-DD or partial dates
-                        if re.match(r"^\d{4}(-\d{2}(-\d{2})?)?$", value):
-                            passed_checks += 1
-                        else:
-                            issues.append({
-                                "path": field_path,
-                                "issue": "invalid_date_format",
-                                "value": value,
-                                "expected": "YYYY-MM-DD format",
-                            })
-
-                    # Check page numbers
-                    if key == "page_number":
-                        total_checks += 1
-                        if isinstance(value, int) and value >= 1:
-                            passed_checks += 1
-                        elif value is None:
-                            # Null page numbers are sometimes valid
-                            passed_checks += 1
-                        else:
-                            issues.append({
-                                "path": field_path,
-                                "issue": "invalid_page_number",
-                                "value": value,
-                                "expected": "positive integer",
-                            })
-
-                    # Check for placeholder text
-                    if isinstance(value, str) and value:
-                        total_checks += 1
-                        value_upper = value.upper()
-                        has_placeholder = any(
-                            p in value_upper for p in self.PLACEHOLDER_PATTERNS
-                        )
-                        if not has_placeholder:
-                            passed_checks += 1
-                        else:
-                            issues.append({
-                                "path": field_path,
-                                "issue": "placeholder_text",
-                                "value": value[:100],
-                            })
-
-                    # Check for suspiciously short snippets in provenance
-                    if key == "text_snippet" and isinstance(value, str):
-                        total_checks += 1
-                        if len(value.strip()) >= 15:  # Aligned with provenance_compliance.py
-                            passed_checks += 1
-                        else:
-                            issues.append({
-                                "path": field_path,
-                                "issue": "snippet_too_short",
-                                "value": value,
-                                "expected": "at least 15 characters",
-                            })
-
-                    # Recurse into nested structures
-                    if isinstance(value, (dict, list)):
-                        traverse(value, field_path)
-
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    traverse(item, f"{path}[{i}]")
-
-        traverse(data)
-        accuracy = passed_checks / total_checks if total_checks > 0 else 1.0
-        return accuracy, issues
+        if visitor is None:
+            visitor = AccuracyVisitor(self.PLACEHOLDER_PATTERNS)
+            walk(data, [visitor])
+        if visitor.error is not None:
+            raise visitor.error
+        return visitor.result()
 
     def _check_completeness(
         self, data: Dict[str, Any], module_id: str
@@ -778,13 +436,23 @@ class QualityChecker:
         return usdm_adherence, errors
 
     def _check_provenance(
-        self, data: Dict[str, Any], module_id: str
+        self,
+        data: Dict[str, Any],
+        module_id: str,
+        visitor: Optional[ProvenanceCoverageVisitor] = None,
     ) -> Tuple[float, List[Dict[str, Any]]]:
         """
         Check provenance: every extracted value has source citation.
+
+        Uses visitor's coverage when evaluate() already walked the data.
         """
         try:
-            coverage, missing = self.provenance_compliance.calculate_coverage(data)
+            if visitor is None:
+                coverage, missing = self.provenance_compliance.calculate_coverage(data)
+            elif visitor.error is not None:
+                raise visitor.error
+            else:
+                coverage, missing = visitor.result()
         except Exception as e:
             logger.warning(f"Provenance check failed for {module_id}: {e}")
             return 0.0, [{"error": str(e)}]
@@ -792,7 +460,10 @@ class QualityChecker:
         return coverage, missing
 
     def _check_terminology_compliance(
-        self, data: Dict[str, Any], module_id: str
+        self,
+        data: Dict[str, Any],
+        module_id: str,
+        visitor: Optional[CodedFieldVisitor] = None,
     ) -> Tuple[float, List[Dict[str, Any]]]:
         """
         Check terminology compliance: CDISC CT / NCI Thesaurus codes are valid.
@@ -804,10 +475,19 @@ class QualityChecker:
         - arm types, endpoint levels, objective levels
         - population types, epoch types, routes
         - ICE strategies, summary measures (estimands)
+
+        Coded fields are found once (by visitor when evaluate() already
+        walked the data) and shared by validation and stats.
         """
         try:
-            issues = self.terminology_validator.validate_extraction_data(data)
-            stats = self.terminology_validator.get_validation_stats(data)
+            if visitor is None:
+                coded_fields = self.terminology_validator._find_coded_fields(data)
+            elif visitor.error is not None:
+                raise visitor.error
+            else:
+                coded_fields = visitor.coded_fields
+            issues = self.terminology_validator.validate_extraction_data(data, coded_fields)
+            stats = self.terminology_validator.get_validation_stats(data, coded_fields)
         except Exception as e:
             logger.error(f"Terminology check failed for {module_id}: {e}")
             return 0.0, [{"error": str(e), "issue": "terminology_validation_failed"}]
@@ -1028,3 +708,328 @@ class QualityChecker:
         lines.append("4. page_number must be a positive integer")
 
         return "\n".join(lines)
+
+
+class PostProcessVisitor(TreeVisitor):
+    """
+    Applies QualityChecker.post_process auto-corrections during a walk().
+
+    Each dict gets the fixes in post_process order. Fixes only touch keys of
+    the dict being fixed (ID generation also fills items of its own arrays),
+    so one top-down walk gives the same result as one walk per fix.
+
+    State per container: (sex_allowed_depth, generate_ids).
+    """
+
+    # CDISC Code System constants
+    CDISC_CODE_SYSTEM = "http://ncicb.nci.nih.gov/xml/owl/EVS/Thesaurus.owl"
+    CDISC_CODE_SYSTEM_VERSION = "24.03e"
+
+    # Fields that should have lowercase enum values
+    LOWERCASE_ENUM_FIELDS = {
+        "approval_status",
+        "consent_type",
+        "monitoring_approach",
+        "blinding_requirements",
+        "distribution_model",
+        "destruction_method",
+        "accountability_method",
+        "kit_design",
+        "format",  # training format
+        "visit_type",
+        "collection_frequency",
+        "storage_phase",
+    }
+
+    # Mapping tables: field_name -> {invalid_value: valid_value}
+    ENUM_MAPPINGS = {
+        "device_type": {
+            "provisioned_device": "provisioned_tablet",
+            "handheld": "provisioned_tablet",
+            "tablet": "provisioned_tablet",
+            "BYOD": "patient_smartphone",
+            "byod": "patient_smartphone",
+        },
+        "vendor_type": {
+            "Logistics": "logistics",
+            "Safety": "safety",
+            "Regulatory": "regulatory",
+            "Drug_supply": "drug_supply",
+        },
+        "service_type": {
+            "biobanking": "biorepository",
+            "Biobanking": "biorepository",
+        },
+        "source": {
+            "sponsor_supplied": "sponsor_provided",
+            "Sponsor_supplied": "sponsor_provided",
+        },
+        "scopeId": {
+            "sponsor_protocol_id": "sponsor",
+            "Sponsor_protocol_id": "sponsor",
+            "SPONSOR": "sponsor",
+        },
+    }
+
+    # Fields that should be arrays of strings
+    ARRAY_FIELDS = {
+        "responsibilities",
+    }
+
+    # Mapping of array keys to (id_field, prefix)
+    ID_GENERATORS = {
+        "discovered_specimen_types": ("specimen_id", "SPEC"),
+        "processing_requirements": ("processing_id", "PROC"),
+        "collection_containers": ("container_id", "TUBE"),
+        "storage_requirements": ("storage_id", "STOR"),
+        "shipping_requirements": ("shipping_id", "SHIP"),
+        "collection_schedule": ("schedule_id", "COL"),
+        "other_personnel": ("id", "PERS"),
+    }
+
+    # sexCode schema has additionalProperties: false and only allows code, decode, provenance
+    SEX_CODE_DISALLOWED_PROPERTIES = ("codeSystem", "codeSystemVersion", "instanceType")
+
+    # sex_allowed_depth values along studyPopulation.sex.allowed[*]
+    IN_STUDY_POPULATION = 1
+    IN_SEX = 2
+    IN_ALLOWED = 3
+    IN_SEX_CODE = 4
+
+    def __init__(self, checker: QualityChecker):
+        self.checker = checker
+
+    def initial_state(self) -> Tuple[int, bool]:
+        return 0, True
+
+    def visit_child(self, parent: Any, key: Any, value: Any, path: str, scope: Any) -> Any:
+        if not isinstance(value, (dict, list)):
+            return SKIP
+
+        sex_allowed_depth, generate_ids = scope
+        if not isinstance(parent, dict):
+            in_sex_code = sex_allowed_depth == self.IN_ALLOWED and isinstance(value, dict)
+            return (self.IN_SEX_CODE if in_sex_code else 0), generate_ids
+
+        if key == "studyPopulation" and isinstance(value, dict):
+            depth = self.IN_STUDY_POPULATION
+        elif sex_allowed_depth == self.IN_STUDY_POPULATION and key == "sex" and isinstance(value, dict):
+            depth = self.IN_SEX
+        elif sex_allowed_depth == self.IN_SEX and key == "allowed" and isinstance(value, list):
+            depth = self.IN_ALLOWED
+        else:
+            depth = 0
+
+        # Arrays that get generated IDs are not searched for further ID arrays
+        if key in self.ID_GENERATORS and isinstance(value, list):
+            generate_ids = False
+        return depth, generate_ids
+
+    def fix(self, node: Dict[str, Any], path: str, state: Any) -> Dict[str, Any]:
+        sex_allowed_depth, generate_ids = state
+        fixed = node
+
+        # 1. Truncate long snippets
+        snippet = node.get("text_snippet")
+        if isinstance(snippet, str) and len(snippet) > self.checker.MAX_SNIPPET_LENGTH:
+            fixed = self._set(node, fixed, "text_snippet", self.checker._truncate_snippet(snippet))
+            logger.debug(
+                f"Truncated snippet at {path}.text_snippet: {len(snippet)} -> {len(fixed['text_snippet'])} chars"
+            )
+
+        # 2. Auto-correct CDISC codes based on decode (also adds codeSystem / codeSystemVersion)
+        if "code" in fixed and "decode" in fixed and fixed["code"] and fixed["decode"]:
+            fixed = self._fix_code_object(node, fixed, path)
+
+        # 5. Remove disallowed properties from studyPopulation.sex.allowed items
+        if sex_allowed_depth == self.IN_SEX_CODE:
+            for prop in self.SEX_CODE_DISALLOWED_PROPERTIES:
+                if prop in fixed:
+                    if fixed is node:
+                        fixed = dict(node)
+                    del fixed[prop]
+                    logger.debug(f"Removed disallowed property '{prop}' from sex.allowed item")
+
+        # 3, 4, 6, 7: per-field fixes (none of these fields is touched above)
+        for key, value in node.items():
+            if isinstance(value, str):
+                if key in self.LOWERCASE_ENUM_FIELDS:
+                    # 3. Normalize enum case (e.g., 'Approved' -> 'approved')
+                    lowered = value.lower()
+                    if lowered != value:
+                        fixed = self._set(node, fixed, key, lowered)
+                        logger.debug(f"Normalized enum case at {path}.{key}: '{value}' -> '{lowered}'")
+                elif key in self.ENUM_MAPPINGS:
+                    # 4. Map invalid enum values to valid ones
+                    new_value = self.ENUM_MAPPINGS[key].get(value)
+                    if new_value is not None:
+                        fixed = self._set(node, fixed, key, new_value)
+                        logger.debug(f"Mapped enum value at {path}.{key}: '{value}' -> '{new_value}'")
+                elif key in self.ARRAY_FIELDS:
+                    # 6. Convert string to single-element array
+                    fixed = self._set(node, fixed, key, [value])
+                    logger.debug(f"Converted string to array at {path}.{key}")
+            elif generate_ids and isinstance(value, list) and key in self.ID_GENERATORS:
+                # 7. Auto-generate missing required IDs
+                items = self._generate_missing_ids(value, key, f"{path}.{key}")
+                if items is not value:
+                    fixed = self._set(node, fixed, key, items)
+
+        return fixed
+
+    @staticmethod
+    def _set(node: Dict[str, Any], fixed: Dict[str, Any], key: str, value: Any) -> Dict[str, Any]:
+        """Set key on the copy of node, copying node on first write."""
+        if fixed is node:
+            fixed = dict(node)
+        fixed[key] = value
+        return fixed
+
+    def _fix_code_object(self, node: Dict[str, Any], fixed: Dict[str, Any], path: str) -> Dict[str, Any]:
+        """
+        Auto-correct a Code object's code from its decode.
+
+        If a decode is valid but the code is wrong, replace with correct code.
+        Also ensures codeSystem and codeSystemVersion are present, as required
+        by schema for studyPhase, studyType, etc.
+        """
+        code = fixed["code"]
+        decode = fixed["decode"]
+
+        domain = self.checker._infer_domain_from_path(path)
+        if domain:
+            validator = self.checker.terminology_validator
+            is_valid, error = validator.validate_code_decode_pair(code, decode, domain)
+            if not is_valid:
+                # Try to find correct code for this decode
+                correct_code = validator.get_code_for_decode(decode, domain)
+                if correct_code and correct_code != code:
+                    logger.info(
+                        f"Auto-correcting code at {path}: "
+                        f"'{code}' -> '{correct_code}' for decode '{decode}'"
+                    )
+                    fixed = self._set(node, fixed, "code", correct_code)
+
+        if not fixed.get("codeSystem"):
+            fixed = self._set(node, fixed, "codeSystem", self.CDISC_CODE_SYSTEM)
+            logger.debug(f"Added missing codeSystem at {path}")
+
+        if not fixed.get("codeSystemVersion"):
+            fixed = self._set(node, fixed, "codeSystemVersion", self.CDISC_CODE_SYSTEM_VERSION)
+            logger.debug(f"Added missing codeSystemVersion at {path}")
+
+        return fixed
+
+    def _generate_missing_ids(self, items: List[Any], key: str, path: str) -> List[Any]:
+        """
+        Fill missing IDs of dict items (e.g. other_personnel[].id -> PERS-001, PERS-002, ...).
+
+        Returns:
+            items itself when no ID is missing, otherwise a copy with new item dicts
+        """
+        id_field, prefix = self.ID_GENERATORS[key]
+        generated = items
+        for i, item in enumerate(items):
+            if isinstance(item, dict) and not item.get(id_field):
+                if generated is items:
+                    generated = list(items)
+                generated_id = f"{prefix}-{i + 1:03d}"
+                generated[i] = {**item, id_field: generated_id}
+                logger.debug(f"Generated missing ID at {path}[{i}].{id_field}: {generated_id}")
+        return generated
+
+
+class AccuracyVisitor(TreeVisitor):
+    """
+    Collects QualityChecker accuracy checks during a walk().
+
+    Checks every dict field: date format, page numbers, placeholder text and
+    snippet length.
+    """
+
+    # Accept YYYY-MM-DD or partial dates
+    DATE_PATTERN = re.compile(r"^\d{4}(-\d{2}(-\d{2})?)?$")
+
+    def __init__(self, placeholder_patterns: List[str]):
+        # A value containing "[TBD]" also contains "TBD": only the patterns that
+        # don't contain another pattern need to be searched for
+        self.placeholder_patterns = [
+            p for p in placeholder_patterns
+            if not any(other != p and other in p for other in placeholder_patterns)
+        ]
+        self.total_checks = 0
+        self.passed_checks = 0
+        self.issues: List[Dict[str, Any]] = []
+
+    def visit_child(self, parent: Any, key: Any, value: Any, path: str, scope: Any) -> Any:
+        if not isinstance(parent, dict):
+            return scope
+
+        if not isinstance(value, str):
+            if key == "page_number":
+                self._check_page_number(value, child_path(path, key))
+            return scope
+
+        # Check date format
+        if value and "date" in key.lower():
+            self.total_checks += 1
+            if self.DATE_PATTERN.match(value):
+                self.passed_checks += 1
+            else:
+                self.issues.append({
+                    "path": child_path(path, key),
+                    "issue": "invalid_date_format",
+                    "value": value,
+                    "expected": "YYYY-MM-DD format",
+                })
+
+        if key == "page_number":
+            self._check_page_number(value, child_path(path, key))
+
+        # Check for placeholder text
+        if value:
+            self.total_checks += 1
+            value_upper = value.upper()
+            if not any(p in value_upper for p in self.placeholder_patterns):
+                self.passed_checks += 1
+            else:
+                self.issues.append({
+                    "path": child_path(path, key),
+                    "issue": "placeholder_text",
+                    "value": value[:100],
+                })
+
+        # Check for suspiciously short snippets in provenance
+        if key == "text_snippet":
+            self.total_checks += 1
+            if len(value.strip()) >= 15:  # Aligned with provenance_compliance.py
+                self.passed_checks += 1
+            else:
+                self.issues.append({
+                    "path": child_path(path, key),
+                    "issue": "snippet_too_short",
+                    "value": value,
+                    "expected": "at least 15 characters",
+                })
+
+        return scope
+
+    def _check_page_number(self, value: Any, path: str) -> None:
+        self.total_checks += 1
+        if isinstance(value, int) and value >= 1:
+            self.passed_checks += 1
+        elif value is None:
+            # Null page numbers are sometimes valid
+            self.passed_checks += 1
+        else:
+            self.issues.append({
+                "path": path,
+                "issue": "invalid_page_number",
+                "value": value,
+                "expected": "positive integer",
+            })
+
+    def result(self) -> Tuple[float, List[Dict[str, Any]]]:
+        """Accuracy fraction and issues."""
+        accuracy = self.passed_checks / self.total_checks if self.total_checks > 0 else 1.0
+        return accuracy, self.issues
@@ -3,15 +3,23 @@ JSON Schema validation for extracted data.
 
 Validates extraction output against module-specific schemas
 for USDM 4.0 compliance.
+
+Compiled validators are cached per schema file for the whole process
+(see CompiledSchemaCache), so the quality-feedback loop does not rebuild
+validator state on every check.
 """
 
 import json
 import logging
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import jsonschema
 from jsonschema import Draft7Validator, ValidationError
+from referencing import Registry, Resource
+from referencing.jsonschema import DRAFT7
 
 from app.config import settings
 from app.module_registry import get_module
@@ -19,6 +27,143 @@ from app.module_registry import get_module
 logger = logging.getLogger(__name__)
 
 
+def count_required_fields(schema: Dict[str, Any]) -> int:
+    """Count required fields in schema (properties and items, recursively)."""
+    count = 0
+
+    def traverse(s):
+        nonlocal count
+        if isinstance(s, dict):
+            required = s.get("required", [])
+            count += len(required)
+
+            properties = s.get("properties", {})
+            for prop in properties.values():
+                traverse(prop)
+
+            items = s.get("items")
+            if items:
+                traverse(items)
+
+    traverse(schema)
+    return max(count, 1)  # At least 1 to avoid division by zero
+
+
+@dataclass
+class CompiledSchema:
+    """A module schema with the state derived from it, built once."""
+
+    schema: Dict[str, Any]
+    validator: Draft7Validator
+    required_fields: int
+
+
+class CompiledSchemaCache:
+    """
+    Process-wide cache of compiled module schemas, keyed by schema file.
+
+    A SchemaValidator is created for every QualityChecker, so per-instance
+    caching rebuilt the validator (and re-read the schema) for nearly every
+    quality check. Entries here are rebuilt only when the schema file's
+    mtime changes.
+
+    Schemas under schemas/shared are registered once, by file name and
+    $id, so cross-file $refs resolve from memory instead of being
+    retrieved during validation.
+    """
+
+    def __init__(self, shared_dir: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            shared_dir: Directory of shared schemas to register for $ref
+                resolution (None for none)
+        """
+        self.shared_dir = Path(shared_dir) if shared_dir else None
+        self._lock = threading.Lock()
+        self._entries: Dict[Path, Tuple[int, CompiledSchema]] = {}
+        self._registry: Optional[Registry] = None
+        self.builds = 0
+
+    def get(self, schema_path: Path) -> CompiledSchema:
+        """
+        Get the compiled schema for a schema file, building it if needed.
+
+        Args:
+            schema_path: Path to the module's JSON schema
+
+        Returns:
+            CompiledSchema (shared; callers must not modify schema)
+        """
+        mtime_ns = schema_path.stat().st_mtime_ns
+        entry = self._entries.get(schema_path)
+        if entry is None or entry[0] != mtime_ns:
+            with self._lock:
+                entry = self._entries.get(schema_path)
+                if entry is None or entry[0] != mtime_ns:
+                    entry = (mtime_ns, self._compile(schema_path))
+                    self._entries[schema_path] = entry
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop all compiled schemas and the shared-schema registry."""
+        with self._lock:
+            self._entries.clear()
+            self._registry = None
+
+    def _compile(self, schema_path: Path) -> CompiledSchema:
+        with open(schema_path) as f:
+            schema = json.load(f)
+
+        compiled = CompiledSchema(
+            schema=schema,
+            validator=Draft7Validator(schema, registry=self._shared_registry()),
+            required_fields=count_required_fields(schema),
+        )
+        self.builds += 1
+        logger.debug(f"Compiled schema validator for {schema_path.name}")
+        return compiled
+
+    def _shared_registry(self) -> Registry:
+        """Registry of the shared schemas, crawled once so lookups need no further indexing."""
+        if self._registry is None:
+            resources = []
+            if self.shared_dir is not None and self.shared_dir.is_dir():
+                for path in sorted(self.shared_dir.glob("*.json")):
+                    with open(path) as f:
+                        contents = json.load(f)
+                    resource = Resource.from_contents(contents, default_specification=DRAFT7)
+                    uris = {path.name, f"shared/{path.name}"}
+                    if isinstance(contents.get("$id"), str):
+                        uris.add(contents["$id"])
+                    resources.extend((uri, resource) for uri in sorted(uris))
+            self._registry = Registry().with_resources(resources).crawl()
+        return self._registry
+
+
+# Singleton instance
+_compiled_cache_instance: Optional[CompiledSchemaCache] = None
+_compiled_cache_lock = threading.Lock()
+
+
+def get_compiled_schema_cache() -> CompiledSchemaCache:
+    """Get the singleton compiled schema cache."""
+    global _compiled_cache_instance
+    if _compiled_cache_instance is None:
+        with _compiled_cache_lock:
+            if _compiled_cache_instance is None:
+                _compiled_cache_instance = CompiledSchemaCache(shared_dir=settings.schemas_dir / "shared")
+    return _compiled_cache_instance
+
+
+def reset_compiled_schema_cache() -> None:
+    """Reset the singleton cache (useful for testing)."""
+    global _compiled_cache_instance
+    with _compiled_cache_lock:
+        _compiled_cache_instance = None
+
+
 class SchemaValidator:
     """
     Validates extracted data against JSON schemas.
@@ -26,23 +171,25 @@ class SchemaValidator:
     Provides detailed validation reports for compliance checking.
     """
 
-    def __init__(self):
-        """Initialize validator with schema cache."""
-        self._schema_cache: Dict[str, Dict] = {}
+    def __init__(self, compiled_cache: Optional[CompiledSchemaCache] = None):
+        """
+        Initialize validator.
 
-    def load_schema(self, module_id: str) -> Dict[str, Any]:
+        Args:
+            compiled_cache: Compiled schema cache (default: process-wide cache)
         """
-        Load JSON schema for a module.
+        self._compiled_cache = compiled_cache or get_compiled_schema_cache()
+
+    def get_compiled_schema(self, module_id: str) -> CompiledSchema:
+        """
+        Get the compiled schema (schema, validator, required-field count) for a module.
 
         Args:
             module_id: Module identifier
 
         Returns:
-            JSON schema dictionary
+            CompiledSchema for the module's schema file
         """
-        if module_id in self._schema_cache:
-            return self._schema_cache[module_id]
-
         module = get_module(module_id)
         if not module:
             raise ValueError(f"Unknown module: {module_id}")
@@ -51,11 +198,19 @@ class SchemaValidator:
         if not schema_path.exists():
             raise FileNotFoundError(f"Schema not found: {schema_path}")
 
-        with open(schema_path) as f:
-            schema = json.load(f)
+        return self._compiled_cache.get(schema_path)
 
-        self._schema_cache[module_id] = schema
-        return schema
+    def load_schema(self, module_id: str) -> Dict[str, Any]:
+        """
+        Load JSON schema for a module.
+
+        Args:
+            module_id: Module identifier
+
+        Returns:
+            JSON schema dictionary (shared; do not modify)
+        """
+        return self.get_compiled_schema(module_id).schema
 
     def validate(
         self,
@@ -72,10 +227,7 @@ class SchemaValidator:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        schema = self.load_schema(module_id)
-
-        # Create validator
-        validator = Draft7Validator(schema)
+        validator = self.get_compiled_schema(module_id).validator
 
         # Collect all errors
         errors = []
@@ -215,9 +367,8 @@ class SchemaValidator:
         """
         is_valid, errors = self.validate(data, module_id)
 
-        # Count total expected fields from schema
-        schema = self.load_schema(module_id)
-        expected_fields = self._count_required_fields(schema)
+        # Count total expected fields from schema (memoized with the compiled schema)
+        expected_fields = self.get_compiled_schema(module_id).required_fields
 
         # Calculate score based on errors
         if expected_fields == 0:
@@ -235,27 +386,6 @@ class SchemaValidator:
             "errors": errors[:10],  # First 10 only
         }
 
-    def _count_required_fields(self, schema: Dict[str, Any]) -> int:
-        """Count required fields in schema."""
-        count = 0
-
-        def traverse(s):
-            nonlocal count
-            if isinstance(s, dict):
-                required = s.get("required", [])
-                count += len(required)
-
-                properties = s.get("properties", {})
-                for prop in properties.values():
-                    traverse(prop)
-
-                items = s.get("items")
-                if items:
-                    traverse(items)
-
-        traverse(schema)
-        return max(count, 1)  # At least 1 to avoid division by zero
-
     def generate_validation_report(
         self,
         data: Dict[str, Any],
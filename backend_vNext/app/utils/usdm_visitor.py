@@ -0,0 +1,160 @@
+"""
+Single-pass visitor framework for extraction outputs.
+
+Post-processing fixers and quality-dimension collectors used to walk the
+whole module output once each. walk() drives any number of visitors over
+the tree in one depth-first traversal: every dict and list is reached once,
+children in the same key / index order as a plain recursive traversal, and
+each visitor carries its own per-subtree state (or opts out of a subtree).
+
+Fixers change a dict by returning a modified copy from fix(). The walk then
+copies only the containers on the path from the root to each change
+(copy-on-write), so the input is never modified and unchanged subtrees are
+shared with the result instead of being deep-copied up front.
+
+Usage:
+    from app.utils.usdm_visitor import walk
+
+    fixed = walk(data, [fixer])
+    walk(fixed, [accuracy_visitor, provenance_visitor])
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Returned by TreeVisitor.visit_child to leave a child's subtree unvisited
+SKIP = object()
+
+
+class TreeVisitor:
+    """
+    Base class for a fixer or collector driven by walk().
+
+    For every container a visitor reaches, the hooks run in order:
+    fix() (dicts only), enter(), then visit_child() for each dict value or
+    list item. A visitor that raises stops being applied (its results are
+    incomplete) and the first exception is kept on ``error`` for the caller
+    to report or re-raise.
+    """
+
+    error: Optional[Exception] = None
+
+    def initial_state(self) -> Any:
+        """State for the root container."""
+        return None
+
+    def fix(self, node: Dict[str, Any], path: str, state: Any) -> Dict[str, Any]:
+        """
+        Apply fixes to a dict.
+
+        Returns:
+            node itself when nothing changes, otherwise a modified copy.
+            node must never be modified in place.
+        """
+        return node
+
+    def enter(self, node: Any, path: str, state: Any) -> Any:
+        """
+        Called for every dict or list the visitor reaches, after fixes.
+
+        Returns:
+            Scope passed to visit_child for this container's children
+        """
+        return state
+
+    def visit_child(self, parent: Any, key: Any, value: Any, path: str, scope: Any) -> Any:
+        """
+        Visit one dict value (key is the dict key) or list item (key is the index).
+
+        path is the parent's path; child_path(path, key) gives the child's.
+
+        Returns:
+            State for the child's subtree, or SKIP to leave it unvisited.
+            Ignored for scalar children.
+        """
+        return scope
+
+
+def walk(data: Any, visitors: Sequence[TreeVisitor], path: str = "$") -> Any:
+    """
+    Run visitors over data in a single traversal.
+
+    Args:
+        data: Extraction output (dict or list; scalars are returned as-is)
+        visitors: Fixers and collectors, applied in order at every node
+        path: JSON path of data, used as the prefix of every reported path
+
+    Returns:
+        data with every fixer's changes applied. Containers with no change
+        at or below them are the input objects themselves.
+    """
+    if not isinstance(data, (dict, list)):
+        return data
+    return _walk(data, path, [(visitor, visitor.initial_state()) for visitor in visitors])
+
+
+def child_path(path: str, key: Any) -> str:
+    """JSON path of a dict value (str key) or list item (int index) under path."""
+    return f"{path}[{key}]" if isinstance(key, int) else f"{path}.{key}"
+
+
+def _fail(visitor: TreeVisitor, error: Exception, path: str) -> None:
+    # Keep the first error; a failed visitor gets no further fix() / enter() calls
+    if visitor.error is None:
+        logger.debug(f"{type(visitor).__name__} stopped at {path}: {error}")
+        visitor.error = error
+
+
+def _walk(node: Any, path: str, active: List[Tuple[TreeVisitor, Any]]) -> Any:
+    is_dict = isinstance(node, dict)
+    result = node
+
+    if is_dict:
+        for visitor, state in active:
+            if visitor.error is None:
+                try:
+                    result = visitor.fix(result, path, state)
+                except Exception as e:
+                    _fail(visitor, e, path)
+
+    scopes = []
+    for visitor, state in active:
+        if visitor.error is None:
+            try:
+                scopes.append((visitor, visitor.visit_child, visitor.enter(result, path, state)))
+            except Exception as e:
+                _fail(visitor, e, path)
+
+    owned = result is not node
+    parent = result
+    for key, value in (parent.items() if is_dict else enumerate(parent)):
+        if not isinstance(value, (dict, list)):
+            for visitor, visit_child, scope in scopes:
+                try:
+                    visit_child(parent, key, value, path, scope)
+                except Exception as e:
+                    _fail(visitor, e, child_path(path, key))
+            continue
+
+        child_active = []
+        for visitor, visit_child, scope in scopes:
+            try:
+                child_state = visit_child(parent, key, value, path, scope)
+            except Exception as e:
+                _fail(visitor, e, child_path(path, key))
+                continue
+            if child_state is not SKIP:
+                child_active.append((visitor, child_state))
+
+        if child_active:
+            value_path = f"{path}.{key}" if is_dict else f"{path}[{key}]"
+            new_value = _walk(value, value_path, child_active)
+            if new_value is not value:
+                if not owned:
+                    result = dict(result) if is_dict else list(result)
+                    owned = True
+                result[key] = new_value
+
+    return result
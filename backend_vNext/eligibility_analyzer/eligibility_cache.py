@@ -125,7 +125,18 @@ def compute_file_hash(file_path: str, max_bytes: int = 2 * 1024 * 1024) -> str:
 
     Uses SHA256 for better collision resistance than MD5.
     Includes file size for additional uniqueness.
+
+    PDFs served from the backend's content-addressed store already carry
+    their full SHA256 in the path, so the file is not read.
     """
+    try:
+        from app.utils.pdf_store import content_hash_for_path
+        known_hash = content_hash_for_path(file_path)
+        if known_hash:
+            return known_hash[:16]
+    except ImportError:
+        pass
+
     hasher = hashlib.sha256()
     try:
         with open(file_path, 'rb') as f:
@@ -456,6 +456,8 @@ class EligibilityCriteriaExtractor:
             )
 
         try:
+            from app.services.gemini_file_cache import get_gemini_file
+
             # Use existing Gemini file from detection result, or upload if not available
             uploaded_file = None
 
@@ -463,7 +465,9 @@ class EligibilityCriteriaExtractor:
             if detection_result.gemini_file_uri:
                 try:
                     logger.info(f"Reusing Gemini file from detection: {detection_result.gemini_file_uri}")
-                    uploaded_file = genai.get_file(detection_result.gemini_file_uri)
+                    uploaded_file = get_gemini_file(
+                        detection_result.gemini_file_uri, resolver=genai.get_file
+                    )
                 except Exception as e:
                     logger.warning(f"Failed to get cached Gemini file: {e}, will re-upload")
 
@@ -471,7 +475,7 @@ class EligibilityCriteriaExtractor:
             if not uploaded_file and gemini_file_uri:
                 try:
                     logger.info(f"Using provided Gemini file URI: {gemini_file_uri}")
-                    uploaded_file = genai.get_file(gemini_file_uri)
+                    uploaded_file = get_gemini_file(gemini_file_uri, resolver=genai.get_file)
                 except Exception as e:
                     logger.warning(f"Failed to get provided Gemini file: {e}, will re-upload")
 
@@ -8,6 +8,8 @@ patient cohort filtering results.
 Key Components:
 - funnel_executor: Core execution logic for running QEBs through funnel stages
 - database_adapters: Mock and real database adapters for patient filtering
+- cohort: Compact bitmap cohort representation
+- omop_sql: Set-based SQL compilation of funnel stages for OMOP CDM
 """
 
 from .funnel_executor import (
@@ -17,10 +19,28 @@ from .funnel_executor import (
 from .database_adapters import (
     DatabaseAdapter,
     MockDatabaseAdapter,
+    OMOPDatabaseAdapter,
+)
+
+from .cohort import (
+    Cohort,
+    CohortLike,
+)
+
+from .omop_sql import (
+    SQLCohort,
+    StageSQLCompiler,
+    StageStep,
 )
 
 __all__ = [
     "FunnelExecutor",
     "DatabaseAdapter",
     "MockDatabaseAdapter",
+    "OMOPDatabaseAdapter",
+    "Cohort",
+    "CohortLike",
+    "SQLCohort",
+    "StageSQLCompiler",
+    "StageStep",
 ]
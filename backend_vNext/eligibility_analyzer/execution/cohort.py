@@ -0,0 +1,279 @@
+"""
+Compact Bitmap Cohorts for Funnel Execution
+
+Represents a patient cohort as a bitmap over patient IDs instead of a
+Python Set[int]. Bit i is set when patient i is in the cohort, so a
+10M-patient population takes ~1.2 MB instead of several hundred MB, and
+INTERSECT / EXCEPT are single word-wise AND / AND-NOT operations.
+
+Key Design Decisions:
+- Backed by a Python int (arbitrary-precision bitset): AND, OR, AND-NOT
+  and popcount run in C without any extra dependency
+- NumPy is optional and only used to convert between bitmaps and ID
+  arrays (the one operation that is O(patients) in pure Python)
+- Set-compatible API (len, in, iteration, intersection, -, &, |) so
+  FunnelExecutor works unchanged with either representation
+- Operations accept plain sets/iterables of IDs on the right-hand side
+"""
+
+import logging
+import random
+import sys
+from typing import Iterable, Iterator, List, Optional, Set, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Binary digits of precision for random_mask() match rates
+MASK_RATE_BITS = 16
+
+
+class Cohort:
+    """
+    Immutable patient cohort stored as a bitmap.
+
+    Patient IDs are non-negative integers used directly as bit positions,
+    which suits dense OMOP person_id ranges and the mock population (1..N).
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, bits: int = 0):
+        """
+        Initialize cohort from a raw bitmap.
+
+        Args:
+            bits: Integer whose set bits are the patient IDs.
+        """
+        if bits < 0:
+            raise ValueError("Cohort bitmap must be non-negative")
+        self._bits = bits
+
+    # -------------------------------------------------------------------------
+    # Construction
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> "Cohort":
+        """
+        Build a cohort from patient IDs.
+
+        Args:
+            ids: Patient IDs (set, list, NumPy array or any iterable).
+
+        Returns:
+            Cohort containing exactly those IDs.
+        """
+        if isinstance(ids, Cohort):
+            return ids
+
+        if np is not None:
+            if isinstance(ids, np.ndarray):
+                arr = ids.astype(np.int64, copy=False)
+            else:
+                arr = np.fromiter(ids, dtype=np.int64)
+            if arr.size == 0:
+                return cls(0)
+            if arr.min() < 0:
+                raise ValueError("Patient IDs must be non-negative")
+            flags = np.zeros(int(arr.max()) + 1, dtype=np.uint8)
+            flags[arr] = 1
+            packed = np.packbits(flags, bitorder="little")
+            return cls(int.from_bytes(packed.tobytes(), "little"))
+
+        buf = bytearray()
+        for pid in ids:
+            if pid < 0:
+                raise ValueError("Patient IDs must be non-negative")
+            byte = pid >> 3
+            if byte >= len(buf):
+                buf.extend(bytes(byte + 1 - len(buf)))
+            buf[byte] |= 1 << (pid & 7)
+        return cls(int.from_bytes(bytes(buf), "little"))
+
+    @classmethod
+    def range(cls, start: int, stop: int) -> "Cohort":
+        """
+        Build a cohort containing IDs start..stop-1 without iterating them.
+
+        Args:
+            start: First patient ID (inclusive).
+            stop: Last patient ID (exclusive).
+        """
+        if stop <= start:
+            return cls(0)
+        return cls(((1 << (stop - start)) - 1) << start)
+
+    @classmethod
+    def random_mask(cls, universe: "Cohort", rate: float, rng: random.Random) -> "Cohort":
+        """
+        Select each member of a universe independently with probability rate.
+
+        Builds the mask from MASK_RATE_BITS random words instead of drawing one
+        float per patient: for rate = 0.b1b2...bk (binary), folding
+        M = R | M for 1-bits and M = R & M for 0-bits (least significant first)
+        sets every bit of M with probability rate.
+
+        Args:
+            universe: Cohort whose members may be selected.
+            rate: Selection probability (0.0-1.0).
+            rng: Seeded random generator (deterministic masks).
+
+        Returns:
+            Random subset of universe.
+        """
+        if rate <= 0 or not universe:
+            return cls(0)
+        if rate >= 1:
+            return universe
+
+        scaled = int(round(rate * (1 << MASK_RATE_BITS)))
+        if scaled == 0:
+            return cls(0)
+        if scaled >= 1 << MASK_RATE_BITS:
+            return universe
+
+        width = universe._bits.bit_length()
+        mask = 0
+        for bit in range(MASK_RATE_BITS):
+            word = rng.getrandbits(width)
+            mask = (word | mask) if (scaled >> bit) & 1 else (word & mask)
+        return cls(mask & universe._bits)
+
+    # -------------------------------------------------------------------------
+    # Set-compatible API
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _coerce(other: Union["Cohort", Iterable[int]]) -> "Cohort":
+        return other if isinstance(other, Cohort) else Cohort.from_ids(other)
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self._bits != 0
+
+    def __contains__(self, pid: object) -> bool:
+        return isinstance(pid, int) and pid >= 0 and bool((self._bits >> pid) & 1)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Cohort):
+            return self._bits == other._bits
+        if isinstance(other, (set, frozenset)):
+            return self.to_set() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._bits)
+
+    def __and__(self, other: Union["Cohort", Iterable[int]]) -> "Cohort":
+        return Cohort(self._bits & self._coerce(other)._bits)
+
+    def __or__(self, other: Union["Cohort", Iterable[int]]) -> "Cohort":
+        return Cohort(self._bits | self._coerce(other)._bits)
+
+    def __sub__(self, other: Union["Cohort", Iterable[int]]) -> "Cohort":
+        return Cohort(self._bits & ~self._coerce(other)._bits)
+
+    def intersection(self, other: Union["Cohort", Iterable[int]]) -> "Cohort":
+        """INTERSECT: patients in both cohorts."""
+        return self & other
+
+    def difference(self, other: Union["Cohort", Iterable[int]]) -> "Cohort":
+        """EXCEPT: patients in this cohort but not in other."""
+        return self - other
+
+    def union(self, other: Union["Cohort", Iterable[int]]) -> "Cohort":
+        """UNION: patients in either cohort."""
+        return self | other
+
+    def copy(self) -> "Cohort":
+        """Cohorts are immutable; returns self for Set API compatibility."""
+        return self
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.to_list())
+
+    def __repr__(self) -> str:
+        return f"Cohort({len(self):,} patients)"
+
+    # -------------------------------------------------------------------------
+    # Conversion
+    # -------------------------------------------------------------------------
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the bitmap payload."""
+        return (self._bits.bit_length() + 7) // 8
+
+    def to_bytes(self) -> bytes:
+        """Little-endian bitmap bytes (bit i of the stream = patient i)."""
+        return self._bits.to_bytes(self.nbytes, "little")
+
+    def to_list(self) -> List[int]:
+        """Sorted patient IDs."""
+        if not self._bits:
+            return []
+        if np is not None:
+            flags = np.unpackbits(np.frombuffer(self.to_bytes(), dtype=np.uint8), bitorder="little")
+            return np.flatnonzero(flags).tolist()
+
+        ids = []
+        for byte_index, byte in enumerate(self.to_bytes()):
+            if byte:
+                base = byte_index << 3
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        ids.append(base + bit)
+        return ids
+
+    def to_set(self) -> Set[int]:
+        """Patient IDs as a Python set."""
+        return set(self.to_list())
+
+    def head(self, count: int) -> "Cohort":
+        """
+        Keep the count lowest patient IDs.
+
+        Binary-searches the cut-off bit using popcounts of prefix masks,
+        so no IDs are materialized.
+
+        Args:
+            count: Number of patients to keep.
+        """
+        if count <= 0:
+            return Cohort(0)
+        if count >= len(self):
+            return self
+
+        low, high = 0, self._bits.bit_length()
+        while low < high:
+            mid = (low + high) // 2
+            if (self._bits & ((1 << mid) - 1)).bit_count() >= count:
+                high = mid
+            else:
+                low = mid + 1
+        return Cohort(self._bits & ((1 << low) - 1))
+
+
+CohortLike = Union[Set[int], Cohort]
+
+
+def empty_like(cohort: CohortLike) -> CohortLike:
+    """Empty cohort in the same representation as cohort."""
+    return Cohort() if isinstance(cohort, Cohort) else set()
+
+
+def cohort_size_bytes(cohort: Optional[CohortLike]) -> int:
+    """Approximate memory held by a cohort (for benchmarks and logging)."""
+    if cohort is None:
+        return 0
+    if isinstance(cohort, Cohort):
+        return sys.getsizeof(cohort._bits)
+    # Set hash table plus one int object (28 bytes) per member
+    return sys.getsizeof(cohort) + 28 * len(cohort)
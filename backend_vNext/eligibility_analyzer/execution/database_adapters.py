@@ -11,12 +11,19 @@ Key Design Decision:
 - Provides realistic elimination patterns
 - Is configurable via match_rates dictionary
 - Uses seeded random for reproducible results
+- Adapters accept either Set[int] or bitmap Cohort (see cohort.py) and
+  return the same representation they were given
+- OMOPDatabaseAdapter runs each funnel stage as one set-based SQL
+  statement (see omop_sql.py) and only returns counts
 """
 
 import logging
 import random
 from abc import ABC, abstractmethod
-from typing import Dict, List, Set, Optional
+from typing import Any, Dict, List, Set, Optional
+
+from .cohort import Cohort, CohortLike, empty_like
+from .omop_sql import SQLCohort, StageExecution, StageSQLCompiler, StageStep
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +31,10 @@ logger = logging.getLogger(__name__)
 class DatabaseAdapter(ABC):
     """Abstract adapter for mock or real OMOP CDM."""
 
+    # Adapters that execute a whole stage server-side (get_base_cohort_ref /
+    # execute_stage) set this; FunnelExecutor then skips the per-QEB path
+    supports_stage_execution: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -35,24 +46,32 @@ class DatabaseAdapter(ABC):
         """Get the full base population of patient IDs."""
         ...
 
+    def get_base_cohort(self) -> Cohort:
+        """
+        Get the full base population as a bitmap cohort.
+
+        Adapters that can build the bitmap directly should override this.
+        """
+        return Cohort.from_ids(self.get_base_population())
+
     @abstractmethod
     def filter_cohort_by_concepts(
         self,
-        cohort: Set[int],
+        cohort: CohortLike,
         concept_ids: List[int],
         is_inclusion: bool,
-    ) -> Set[int]:
+    ) -> CohortLike:
         """
         Filter cohort by OMOP concept IDs.
 
         Args:
-            cohort: Current patient cohort (set of patient IDs).
+            cohort: Current patient cohort (set of patient IDs or Cohort bitmap).
             concept_ids: OMOP concept IDs to filter by.
             is_inclusion: If True, return patients WITH concepts.
                          If False, return patients WITHOUT concepts.
 
         Returns:
-            Set of patient IDs matching the filter.
+            Patients matching the filter (same representation as cohort).
         """
         ...
 
@@ -98,7 +117,8 @@ class MockDatabaseAdapter(DatabaseAdapter):
             match_rates: Optional custom match rates by domain.
         """
         self.patient_count = patient_count
-        self._base_population = set(range(1, patient_count + 1))
+        self._base_population: Optional[Set[int]] = None
+        self._base_cohort = Cohort.range(1, patient_count + 1)
         self._seed = seed
         self._rng = random.Random(seed)
 
@@ -119,14 +139,42 @@ class MockDatabaseAdapter(DatabaseAdapter):
 
     def get_base_population(self) -> Set[int]:
         """Get the full base population of patient IDs."""
+        if self._base_population is None:
+            self._base_population = set(range(1, self.patient_count + 1))
         return self._base_population.copy()
 
+    def get_base_cohort(self) -> Cohort:
+        """Get the full base population as a bitmap (no per-patient objects)."""
+        return self._base_cohort
+
+    def _sample(self, cohort: CohortLike, concept_ids: List[int], rate: float) -> CohortLike:
+        """
+        Deterministically select cohort members with the given match rate.
+
+        Sets draw one random() per patient (original behaviour). Bitmap
+        cohorts draw a random mask over the whole population per concept
+        list, so a patient's match does not depend on who else is in the
+        cohort and no per-patient Python work is done.
+        """
+        # Create deterministic but varied matching based on concept IDs
+        # This ensures same concept always matches same patients
+        concept_hash = sum(concept_ids) % 1000
+        concept_rng = random.Random(self._seed + concept_hash)
+
+        if isinstance(cohort, Cohort):
+            return cohort & Cohort.random_mask(self._base_cohort, rate, concept_rng)
+
+        return {
+            pid for pid in cohort
+            if concept_rng.random() < rate
+        }
+
     def filter_cohort_by_concepts(
         self,
-        cohort: Set[int],
+        cohort: CohortLike,
         concept_ids: List[int],
         is_inclusion: bool,
-    ) -> Set[int]:
+    ) -> CohortLike:
         """
         Probabilistic filtering based on number of concepts.
 
@@ -135,17 +183,17 @@ class MockDatabaseAdapter(DatabaseAdapter):
         broader recall when more related codes are included.
 
         Args:
-            cohort: Current patient cohort (set of patient IDs).
+            cohort: Current patient cohort (set of patient IDs or Cohort bitmap).
             concept_ids: OMOP concept IDs to filter by.
             is_inclusion: If True, return patients WITH concepts.
                          If False, return patients WITHOUT concepts.
 
         Returns:
-            Set of patient IDs matching the filter.
+            Patients matching the filter (same representation as cohort).
         """
         if not concept_ids:
             # No concepts to filter by
-            return cohort if is_inclusion else set()
+            return cohort if is_inclusion else empty_like(cohort)
 
         # Base match rate - slightly higher for multiple concepts (OR effect)
         # This approximates the recall-oriented SQL philosophy
@@ -153,16 +201,8 @@ class MockDatabaseAdapter(DatabaseAdapter):
         or_bonus = 0.1 * (len(concept_ids) - 1)  # +10% per additional concept
         adjusted_rate = min(base_rate * (1 + or_bonus), 0.95)
 
-        # Create deterministic but varied matching based on concept IDs
-        # This ensures same concept always matches same patients
-        concept_hash = sum(concept_ids) % 1000
-        concept_rng = random.Random(self._seed + concept_hash)
-
         # Return subset of cohort based on adjusted match rate
-        matching = {
-            pid for pid in cohort
-            if concept_rng.random() < adjusted_rate
-        }
+        matching = self._sample(cohort, concept_ids, adjusted_rate)
 
         logger.debug(
             f"MockDB filter: {len(concept_ids)} concepts, "
@@ -173,10 +213,10 @@ class MockDatabaseAdapter(DatabaseAdapter):
 
     def filter_cohort_by_domain(
         self,
-        cohort: Set[int],
+        cohort: CohortLike,
         domain: str,
         concept_ids: List[int],
-    ) -> Set[int]:
+    ) -> CohortLike:
         """
         Filter cohort using domain-specific match rates.
 
@@ -186,10 +226,10 @@ class MockDatabaseAdapter(DatabaseAdapter):
             concept_ids: OMOP concept IDs to filter by.
 
         Returns:
-            Set of patient IDs matching the domain filter.
+            Patients matching the domain filter (same representation as cohort).
         """
         if not concept_ids:
-            return set()
+            return empty_like(cohort)
 
         # Get domain-specific base rate
         domain_key = {
@@ -206,13 +246,7 @@ class MockDatabaseAdapter(DatabaseAdapter):
         adjusted_rate = min(base_rate * (1 + or_bonus), 0.95)
 
         # Deterministic matching
-        concept_hash = sum(concept_ids) % 1000
-        concept_rng = random.Random(self._seed + concept_hash)
-
-        matching = {
-            pid for pid in cohort
-            if concept_rng.random() < adjusted_rate
-        }
+        matching = self._sample(cohort, concept_ids, adjusted_rate)
 
         logger.debug(
             f"MockDB domain filter [{domain}]: {len(concept_ids)} concepts, "
@@ -223,9 +257,9 @@ class MockDatabaseAdapter(DatabaseAdapter):
 
     def simulate_killer_criterion(
         self,
-        cohort: Set[int],
+        cohort: CohortLike,
         elimination_rate: float,
-    ) -> Set[int]:
+    ) -> CohortLike:
         """
         Simulate a killer criterion with specific elimination rate.
 
@@ -237,14 +271,16 @@ class MockDatabaseAdapter(DatabaseAdapter):
             elimination_rate: Target elimination rate (0.0-1.0).
 
         Returns:
-            Set of patient IDs remaining after elimination.
+            Patients remaining after elimination (same representation as cohort).
         """
         survival_rate = 1.0 - elimination_rate
+        keep_count = int(len(cohort) * survival_rate)
 
-        # Deterministic selection
-        sorted_cohort = sorted(cohort)
-        keep_count = int(len(sorted_cohort) * survival_rate)
-        remaining = set(sorted_cohort[:keep_count])
+        # Deterministic selection (lowest patient IDs)
+        if isinstance(cohort, Cohort):
+            remaining = cohort.head(keep_count)
+        else:
+            remaining = set(sorted(cohort)[:keep_count])
 
         logger.debug(
             f"MockDB killer criterion: elimination={elimination_rate:.2%}, "
@@ -261,47 +297,158 @@ class MockDatabaseAdapter(DatabaseAdapter):
 
 class OMOPDatabaseAdapter(DatabaseAdapter):
     """
-    Real OMOP CDM database adapter (stub for future implementation).
+    OMOP CDM database adapter with set-based stage execution.
 
-    This adapter will connect to actual OMOP CDM databases
-    and execute real SQL queries for patient filtering.
+    Each funnel stage is compiled into one statement (see omop_sql.py):
+    QEBs become concept_ancestor-expanded event sets over
+    condition_occurrence, measurement and drug_exposure, combined with
+    INTERSECT / EXCEPT. Only per-step counts come back to Python; the
+    surviving cohort is kept in a temp table for the next stage.
 
-    NOT IMPLEMENTED IN MVP - use MockDatabaseAdapter instead.
+    Supports SQLite (sqlite:///path), DuckDB (duckdb:///path) and
+    PostgreSQL (postgresql://...) URLs, or an existing DB-API connection.
+    Drivers are imported only when used.
     """
 
     def __init__(
         self,
-        connection_string: str,
-        schema: str = "cdm",
+        connection_string: Optional[str] = None,
+        schema: Optional[str] = "cdm",
+        connection: Any = None,
+        set_based: bool = True,
     ):
         """
         Initialize OMOP CDM database adapter.
 
         Args:
-            connection_string: Database connection string.
-            schema: OMOP CDM schema name.
+            connection_string: Database URL (sqlite:///, duckdb:///, postgresql://).
+            schema: OMOP CDM schema name (None for unqualified tables, e.g. SQLite).
+            connection: Existing DB-API connection (takes precedence over the URL).
+            set_based: Execute whole stages as one statement (False = one query per QEB).
         """
+        if connection is None and not connection_string:
+            raise ValueError("OMOPDatabaseAdapter needs a connection_string or connection")
+
         self.connection_string = connection_string
         self.schema = schema
-        raise NotImplementedError(
-            "OMOPDatabaseAdapter is not yet implemented. "
-            "Use MockDatabaseAdapter for development and testing."
-        )
+        self.compiler = StageSQLCompiler(schema)
+        self.supports_stage_execution = set_based
+        self._connection = connection
+        self._stage_tables: List[str] = []
 
     @property
     def name(self) -> str:
         """Human-readable database name."""
-        return f"OMOP CDM ({self.schema})"
+        return f"OMOP CDM ({self.schema or 'default schema'})"
+
+    def _connect(self) -> Any:
+        """Open the DB-API connection on first use."""
+        if self._connection is not None:
+            return self._connection
+
+        url = self.connection_string
+        if url.startswith("sqlite://"):
+            import sqlite3
+            self._connection = sqlite3.connect(url[len("sqlite:///"):] or ":memory:")
+        elif url.startswith("duckdb://"):
+            import duckdb
+            self._connection = duckdb.connect(url[len("duckdb:///"):] or ":memory:")
+        elif url.startswith(("postgresql", "postgres")):
+            import psycopg2
+            self._connection = psycopg2.connect(url.replace("postgresql+psycopg2://", "postgresql://", 1))
+        else:
+            raise ValueError(f"Unsupported OMOP connection string: {url}")
+
+        logger.info(f"OMOPDatabaseAdapter connected ({url.split('://', 1)[0]})")
+        return self._connection
+
+    def _fetchall(self, sql: str) -> List[tuple]:
+        """Run a query and return all rows."""
+        cursor = self._connect().cursor()
+        try:
+            cursor.execute(sql)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    def _execute(self, sql: str) -> None:
+        """Run a statement without results."""
+        cursor = self._connect().cursor()
+        try:
+            cursor.execute(sql)
+        finally:
+            cursor.close()
 
     def get_base_population(self) -> Set[int]:
         """Get the full base population of patient IDs."""
-        raise NotImplementedError("Real OMOP CDM support coming in future release")
+        rows = self._fetchall(f"SELECT person_id FROM {self.compiler.table('person')}")
+        return {row[0] for row in rows}
+
+    def get_base_cohort_ref(self) -> SQLCohort:
+        """Full base population as a server-side cohort (no IDs fetched)."""
+        person = self.compiler.table("person")
+        (count,) = self._fetchall(f"SELECT COUNT(*) FROM {person}")[0]
+        return SQLCohort(source=person, size=count)
 
     def filter_cohort_by_concepts(
         self,
-        cohort: Set[int],
+        cohort: CohortLike,
         concept_ids: List[int],
         is_inclusion: bool,
-    ) -> Set[int]:
-        """Filter cohort by OMOP concept IDs using real SQL."""
-        raise NotImplementedError("Real OMOP CDM support coming in future release")
+    ) -> CohortLike:
+        """
+        Per-QEB path: fetch persons with the concepts and intersect in Python.
+
+        Args:
+            cohort: Current patient cohort (set of patient IDs or Cohort bitmap).
+            concept_ids: OMOP concept IDs to filter by.
+            is_inclusion: If True, return patients WITH concepts.
+                         If False, return patients WITHOUT concepts.
+
+        Returns:
+            Patients in cohort with any event in the concept set (same
+            representation as cohort); FunnelExecutor applies INTERSECT/EXCEPT.
+        """
+        if not concept_ids:
+            return cohort if is_inclusion else empty_like(cohort)
+
+        rows = self._fetchall(self.compiler.events_sql(concept_ids))
+        return cohort.intersection({row[0] for row in rows})
+
+    def execute_stage(self, cohort: SQLCohort, steps: List[StageStep]) -> StageExecution:
+        """
+        Execute one funnel stage as a single set-based statement.
+
+        Args:
+            cohort: Server-side cohort entering the stage.
+            steps: Inclusion steps followed by exclusion steps.
+
+        Returns:
+            StageExecution with per-step counts and the surviving cohort.
+        """
+        compiled = self.compiler.compile_stage(cohort, steps)
+        table = f"funnel_stage_{len(self._stage_tables) + 1}"
+        self._execute(f"DROP TABLE IF EXISTS {table}")
+        self._execute(compiled.materialize_sql(table))
+        self._stage_tables.append(table)
+
+        counts = compiled.counts_from_exits(self._fetchall(compiled.exit_counts_sql(table)))
+        remaining = SQLCohort(source=table, size=counts[-1], where="exit_step = 0")
+        return StageExecution(counts=counts, remaining=remaining, compiled=compiled)
+
+    def fetch_ids(self, cohort: SQLCohort) -> Set[int]:
+        """Patient IDs of a server-side cohort."""
+        return {row[0] for row in self._fetchall(cohort.select_sql())}
+
+    def close(self) -> None:
+        """Drop stage temp tables and close the connection."""
+        if self._connection is None:
+            return
+        for table in self._stage_tables:
+            try:
+                self._execute(f"DROP TABLE IF EXISTS {table}")
+            except Exception as e:
+                logger.debug(f"Could not drop {table}: {e}")
+        self._stage_tables.clear()
+        self._connection.close()
+        self._connection = None
@@ -11,11 +11,14 @@ Key Design Principles:
 - INTERSECTION for inclusion criteria
 - EXCEPT (set difference) for exclusion criteria
 - Skips non-queryable QEBs (SCREENING_ONLY, NOT_APPLICABLE)
+- Optional bitmap cohorts (use_bitmap) for million-patient populations
+- Adapters with supports_stage_execution run each stage as one set-based
+  SQL statement; only counts come back (no per-QEB patient IDs)
 """
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Set, Any, TYPE_CHECKING
+from typing import Dict, List, Any, Optional, Tuple, TYPE_CHECKING
 
 from ..review.qeb_validation_models import (
     ValidationSession,
@@ -24,7 +27,9 @@ from ..review.qeb_validation_models import (
     QEBExecutionResult,
     FunnelExecutionResult,
 )
+from .cohort import CohortLike, empty_like
 from .database_adapters import DatabaseAdapter
+from .omop_sql import StageStep
 
 if TYPE_CHECKING:
     from ..review.qeb_validation_service import QEBValidationService
@@ -48,6 +53,7 @@ class FunnelExecutor:
         self,
         database_adapter: DatabaseAdapter,
         validation_service: "QEBValidationService",
+        use_bitmap: bool = False,
     ):
         """
         Initialize funnel executor.
@@ -55,9 +61,27 @@ class FunnelExecutor:
         Args:
             database_adapter: Database adapter for patient filtering.
             validation_service: Validation service for checking overrides/corrections.
+            use_bitmap: Carry cohorts as bitmap Cohorts instead of Set[int]
+                        (compact and vectorized; recommended for large populations).
         """
         self.db = database_adapter
         self.validation_service = validation_service
+        self.use_bitmap = use_bitmap
+
+    def _base_cohort(self, server_side: bool = True) -> CohortLike:
+        """
+        Full base population in the configured representation.
+
+        Args:
+            server_side: Return a server-side cohort reference when the adapter
+                         executes whole stages. Pass False for the per-QEB path,
+                         which needs materialized patient IDs.
+        """
+        if server_side and self.db.supports_stage_execution:
+            return self.db.get_base_cohort_ref()
+        if self.use_bitmap:
+            return self.db.get_base_cohort()
+        return self.db.get_base_population()
 
     def execute_funnel(
         self,
@@ -76,7 +100,7 @@ class FunnelExecutor:
         """
         logger.info(f"Starting funnel execution for session {session.session_id}")
 
-        current_cohort = self.db.get_base_population()
+        current_cohort = self._base_cohort()
         base_population = len(current_cohort)
         stage_results: List[FunnelStageResult] = []
 
@@ -124,7 +148,7 @@ class FunnelExecutor:
     def _execute_stage(
         self,
         stage_config: FunnelStageConfig,
-        cohort: Set[int],
+        cohort: CohortLike,
         qeb_lookup: Dict[str, Dict[str, Any]],
         session: ValidationSession,
     ) -> FunnelStageResult:
@@ -140,6 +164,9 @@ class FunnelExecutor:
         Returns:
             FunnelStageResult with QEB results.
         """
+        if self.db.supports_stage_execution:
+            return self._execute_stage_set_based(stage_config, cohort, qeb_lookup, session)
+
         before_count = len(cohort)
         qeb_results: List[QEBExecutionResult] = []
 
@@ -202,11 +229,122 @@ class FunnelExecutor:
             remaining_patient_ids=cohort,
         )
 
+    def _execute_stage_set_based(
+        self,
+        stage_config: FunnelStageConfig,
+        cohort: Any,
+        qeb_lookup: Dict[str, Dict[str, Any]],
+        session: ValidationSession,
+    ) -> FunnelStageResult:
+        """
+        Execute single stage as one set-based statement on the database.
+
+        Same order and semantics as _execute_stage; the adapter returns the
+        count after each QEB, so matching_patient_ids are left empty.
+
+        Args:
+            stage_config: Stage configuration.
+            cohort: Server-side cohort (from get_base_cohort_ref / previous stage).
+            qeb_lookup: Dictionary mapping qeb_id -> QEB data.
+            session: ValidationSession with overrides.
+
+        Returns:
+            FunnelStageResult with QEB results.
+        """
+        # (qeb_id, qeb_data, step); step is None for skipped QEBs
+        planned: List[Tuple[str, Dict[str, Any], Optional[StageStep]]] = []
+        for qeb_ids, is_inclusion in (
+            (stage_config.inclusion_qeb_ids, True),
+            (stage_config.exclusion_qeb_ids, False),
+        ):
+            for qeb_id in qeb_ids:
+                qeb_data = qeb_lookup.get(qeb_id)
+                if not qeb_data:
+                    logger.warning(f"QEB {qeb_id} not found in lookup, skipping")
+                    continue
+
+                effective_queryable = self.validation_service.get_effective_queryable_count(
+                    qeb_id=qeb_id,
+                    qeb_data=qeb_data,
+                    session=session,
+                )
+                if effective_queryable == 0:
+                    planned.append((qeb_id, qeb_data, None))
+                    continue
+
+                concept_ids = self.validation_service.extract_concept_ids_from_qeb(
+                    qeb_data=qeb_data,
+                    session=session,
+                )
+                planned.append((qeb_id, qeb_data, StageStep(qeb_id, concept_ids, is_inclusion)))
+
+        steps = [step for _, _, step in planned if step is not None]
+        execution = self.db.execute_stage(cohort, steps)
+
+        qeb_results: List[QEBExecutionResult] = []
+        current = execution.counts[0]
+        step_index = 0
+        for qeb_id, qeb_data, step in planned:
+            if step is None:
+                logger.debug(f"  {qeb_id}: SKIPPED (no queryable atomics)")
+                qeb_results.append(self._skipped_result(qeb_id, qeb_data, current, set()))
+                continue
+
+            step_index += 1
+            patients_after = execution.counts[step_index]
+            qeb_results.append(QEBExecutionResult(
+                qeb_id=qeb_id,
+                criterion_text=qeb_data.get("criterionText", ""),
+                patients_before=current,
+                patients_after=patients_after,
+                sql_executed=execution.compiled.step_sql[step_index - 1] or qeb_data.get("sqlQuery", ""),
+                was_skipped=False,
+                matching_patient_ids=set(),
+            ))
+            logger.debug(
+                f"  {'INC' if step.is_inclusion else 'EXC'} {qeb_id}: {current:,} -> {patients_after:,}"
+            )
+            current = patients_after
+
+        before_count = execution.counts[0]
+        after_count = execution.counts[-1]
+        elimination_rate = 1 - (after_count / before_count) if before_count > 0 else 0
+
+        return FunnelStageResult(
+            stage_number=stage_config.stage_number,
+            stage_name=stage_config.stage_name,
+            patients_entering=before_count,
+            patients_exiting=after_count,
+            elimination_rate=elimination_rate,
+            qeb_results=qeb_results,
+            remaining_patient_ids=execution.remaining,
+        )
+
+    @staticmethod
+    def _skipped_result(
+        qeb_id: str,
+        qeb_data: Dict[str, Any],
+        cohort_size: int,
+        empty: CohortLike,
+    ) -> QEBExecutionResult:
+        """Result for a QEB with no queryable atomics (cohort unchanged)."""
+        return QEBExecutionResult(
+            qeb_id=qeb_id,
+            criterion_text=qeb_data.get("criterionText", ""),
+            patients_before=cohort_size,
+            patients_after=cohort_size,
+            sql_executed="-- SKIPPED (no queryable atomics)",
+            was_skipped=True,
+            # For skipped inclusion: return empty (would filter everyone out)
+            # For skipped exclusion: return empty (no one to exclude)
+            matching_patient_ids=empty,
+        )
+
     def _execute_qeb(
         self,
         qeb_id: str,
         qeb_data: Dict[str, Any],
-        cohort: Set[int],
+        cohort: CohortLike,
         session: ValidationSession,
         is_inclusion: bool,
     ) -> QEBExecutionResult:
@@ -236,17 +374,7 @@ class FunnelExecutor:
         if effective_queryable == 0:
             # All atomics are SCREENING_ONLY or NOT_APPLICABLE - skip
             logger.debug(f"  {qeb_id}: SKIPPED (no queryable atomics)")
-            return QEBExecutionResult(
-                qeb_id=qeb_id,
-                criterion_text=criterion_text,
-                patients_before=len(cohort),
-                patients_after=len(cohort),
-                sql_executed="-- SKIPPED (no queryable atomics)",
-                was_skipped=True,
-                # For skipped inclusion: return empty (would filter everyone out)
-                # For skipped exclusion: return empty (no one to exclude)
-                matching_patient_ids=set(),
-            )
+            return self._skipped_result(qeb_id, qeb_data, len(cohort), empty_like(cohort))
 
         # Execute against database (mock or real)
         sql = qeb_data.get("sqlQuery", "")
@@ -299,7 +427,7 @@ class FunnelExecutor:
         Returns:
             QEBExecutionResult with matching patients.
         """
-        cohort = self.db.get_base_population()
+        cohort = self._base_cohort(server_side=False)
         return self._execute_qeb(
             qeb_id=qeb_id,
             qeb_data=qeb_data,
@@ -314,6 +442,7 @@ def execute_validation_funnel(
     qeb_output_path: str,
     database_adapter: DatabaseAdapter,
     validation_service: "QEBValidationService",
+    use_bitmap: bool = False,
 ) -> FunnelExecutionResult:
     """
     Convenience function to execute funnel from validation session.
@@ -323,6 +452,7 @@ def execute_validation_funnel(
         qeb_output_path: Path to eligibility_funnel_v2.json.
         database_adapter: Database adapter for patient filtering.
         validation_service: Validation service instance.
+        use_bitmap: Carry cohorts as bitmap Cohorts instead of Set[int].
 
     Returns:
         FunnelExecutionResult with all stage results.
@@ -344,6 +474,7 @@ def execute_validation_funnel(
     executor = FunnelExecutor(
         database_adapter=database_adapter,
         validation_service=validation_service,
+        use_bitmap=use_bitmap,
     )
 
     return executor.execute_funnel(
@@ -0,0 +1,110 @@
+"""
+Synthetic OMOP CDM Fixture (SQLite)
+
+Creates a small OMOP CDM subset - person, concept, concept_ancestor,
+condition_occurrence, measurement and drug_exposure - filled with
+seeded random events. Used by the OMOPDatabaseAdapter tests and the
+set-based vs per-QEB benchmark; not intended for clinical use.
+
+Concept hierarchy: each root concept has children_per_root descendants.
+Events reference roots or children, so QEBs on root concepts only match
+through concept_ancestor expansion.
+"""
+
+import logging
+import random
+import sqlite3
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Root concept r has ID ROOT_CONCEPT_BASE + r * ROOT_CONCEPT_STRIDE
+ROOT_CONCEPT_BASE = 1_000_000
+ROOT_CONCEPT_STRIDE = 100
+
+_DOMAIN_TABLES = (
+    ("condition_occurrence", "condition_concept_id"),
+    ("measurement", "measurement_concept_id"),
+    ("drug_exposure", "drug_concept_id"),
+)
+
+
+def create_omop_fixture(
+    path: str = ":memory:",
+    person_count: int = 10000,
+    root_concepts: int = 30,
+    children_per_root: int = 4,
+    events_per_person: int = 6,
+    seed: int = 42,
+) -> Tuple[sqlite3.Connection, List[int]]:
+    """
+    Create and populate a synthetic OMOP CDM SQLite database.
+
+    Args:
+        path: SQLite database path (":memory:" for in-memory).
+        person_count: Number of persons (IDs 1..person_count).
+        root_concepts: Number of root concepts (split across domains).
+        children_per_root: Descendant concepts per root.
+        events_per_person: Events drawn per person.
+        seed: Random seed for reproducible data.
+
+    Returns:
+        Tuple of (open connection, root concept IDs).
+    """
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+
+    cursor.executescript("""
+        DROP TABLE IF EXISTS person;
+        DROP TABLE IF EXISTS concept;
+        DROP TABLE IF EXISTS concept_ancestor;
+        DROP TABLE IF EXISTS condition_occurrence;
+        DROP TABLE IF EXISTS measurement;
+        DROP TABLE IF EXISTS drug_exposure;
+
+        CREATE TABLE person (person_id INTEGER PRIMARY KEY);
+        CREATE TABLE concept (concept_id INTEGER PRIMARY KEY, domain_id TEXT);
+        CREATE TABLE concept_ancestor (
+            ancestor_concept_id INTEGER,
+            descendant_concept_id INTEGER
+        );
+        CREATE TABLE condition_occurrence (person_id INTEGER, condition_concept_id INTEGER);
+        CREATE TABLE measurement (person_id INTEGER, measurement_concept_id INTEGER);
+        CREATE TABLE drug_exposure (person_id INTEGER, drug_concept_id INTEGER);
+    """)
+
+    roots = [ROOT_CONCEPT_BASE + r * ROOT_CONCEPT_STRIDE for r in range(root_concepts)]
+    concepts = []
+    ancestors = []
+    concept_domain = {}
+    for index, root in enumerate(roots):
+        table, _ = _DOMAIN_TABLES[index % len(_DOMAIN_TABLES)]
+        family = [root] + [root + child for child in range(1, children_per_root + 1)]
+        for concept_id in family:
+            concepts.append((concept_id, table))
+            concept_domain[concept_id] = table
+            ancestors.append((root, concept_id))
+            ancestors.append((concept_id, concept_id))
+
+    cursor.executemany("INSERT INTO person VALUES (?)", ((pid,) for pid in range(1, person_count + 1)))
+    cursor.executemany("INSERT INTO concept VALUES (?, ?)", concepts)
+    cursor.executemany("INSERT OR IGNORE INTO concept_ancestor VALUES (?, ?)", ancestors)
+
+    concept_ids = [c[0] for c in concepts]
+    events = {table: [] for table, _ in _DOMAIN_TABLES}
+    for pid in range(1, person_count + 1):
+        for concept_id in rng.sample(concept_ids, min(events_per_person, len(concept_ids))):
+            events[concept_domain[concept_id]].append((pid, concept_id))
+
+    for table, column in _DOMAIN_TABLES:
+        cursor.executemany(f"INSERT INTO {table} VALUES (?, ?)", events[table])
+        cursor.execute(f"CREATE INDEX idx_{table}_concept ON {table} ({column}, person_id)")
+    cursor.execute("CREATE INDEX idx_concept_ancestor ON concept_ancestor (ancestor_concept_id, descendant_concept_id)")
+
+    conn.commit()
+    logger.info(
+        f"OMOP fixture created at {path}: {person_count:,} persons, "
+        f"{len(concepts)} concepts, {sum(len(e) for e in events.values()):,} events"
+    )
+    return conn, roots
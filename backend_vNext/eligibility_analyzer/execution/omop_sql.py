@@ -0,0 +1,182 @@
+"""
+Set-Based SQL Compilation of Funnel Stages for OMOP CDM
+
+Compiles a funnel stage (ordered inclusion and exclusion QEBs) into a
+single statement of CTEs: each QEB becomes the set of persons with any
+condition, measurement or drug event whose concept descends from the
+QEB's concepts (via concept_ancestor). The stage is materialized once
+into a temp table recording, for every entering person, the step at
+which they were eliminated (0 = survived): inclusions act as INTERSECT
+(drop persons NOT IN the QEB set), exclusions as EXCEPT (drop persons
+IN it), in funnel order. Per-step counts are a GROUP BY on that table
+and the next stage reads the survivors from it.
+
+Key Design Decisions:
+- One statement per stage (plus a GROUP BY over the temp table) instead
+  of one query per QEB with patient IDs shipped to Python
+- INTERSECT / EXCEPT are written as semi/anti-joins inside one CASE so
+  each QEB set is built once and persons stop probing at their first
+  failed step; a chain of INTERSECT/EXCEPT CTEs needs every step twice
+  (survivors and per-step counts) and measured slower on SQLite
+- Concept IDs are validated as integers and inlined, so the same SQL
+  runs on SQLite, DuckDB and PostgreSQL without paramstyle differences
+- Same semantics as FunnelExecutor: inclusion QEBs without concepts do
+  not filter, exclusion QEBs without concepts exclude nobody
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# OMOP event tables searched for each QEB: (table, concept column)
+EVENT_TABLES: Tuple[Tuple[str, str], ...] = (
+    ("condition_occurrence", "condition_concept_id"),
+    ("measurement", "measurement_concept_id"),
+    ("drug_exposure", "drug_concept_id"),
+)
+
+
+@dataclass
+class StageStep:
+    """One QEB applied within a stage."""
+    qeb_id: str
+    concept_ids: List[int]
+    is_inclusion: bool
+
+
+@dataclass
+class CompiledStage:
+    """SQL for one funnel stage."""
+    with_clause: str
+    outcome_sql: str  # SELECT person_id, exit_step for every entering person
+    step_count: int
+    step_sql: List[str] = field(default_factory=list)  # Per-QEB event CTE body
+
+    def materialize_sql(self, table_name: str) -> str:
+        """Statement creating a temp table of (person_id, exit_step)."""
+        return f"CREATE TEMP TABLE {table_name} AS {self.with_clause}\n{self.outcome_sql}"
+
+    @staticmethod
+    def exit_counts_sql(table_name: str) -> str:
+        """Number of persons eliminated at each step (0 = survived)."""
+        return f"SELECT exit_step, COUNT(*) FROM {table_name} GROUP BY exit_step"
+
+    def counts_from_exits(self, exits: Sequence[Tuple[int, int]]) -> List[int]:
+        """
+        Convert exit_step counts into funnel counts.
+
+        Returns:
+            [entering, after step 1, ..., after step n]
+        """
+        by_step = {int(step): int(count) for step, count in exits}
+        counts = [sum(by_step.values())]
+        for step in range(1, self.step_count + 1):
+            counts.append(counts[-1] - by_step.get(step, 0))
+        return counts
+
+
+@dataclass
+class StageExecution:
+    """Result of executing a compiled stage."""
+    counts: List[int]  # Entering count, then count after each step
+    remaining: "SQLCohort"
+    compiled: CompiledStage
+
+
+@dataclass
+class SQLCohort:
+    """
+    Server-side cohort: a relation of person_id values plus its size.
+
+    Used by OMOPDatabaseAdapter in place of Set[int] so patient IDs never
+    leave the database while the funnel runs.
+    """
+    source: str  # Table name
+    size: int
+    where: str = ""  # Optional filter on the source rows
+
+    def __len__(self) -> int:
+        return self.size
+
+    def select_sql(self) -> str:
+        """SELECT producing the cohort's person IDs."""
+        where = f" WHERE {self.where}" if self.where else ""
+        return f"SELECT person_id FROM {self.source}{where}"
+
+
+class StageSQLCompiler:
+    """Builds set-based SQL for funnel stages against an OMOP CDM schema."""
+
+    def __init__(self, schema: Optional[str] = "cdm"):
+        """
+        Initialize compiler.
+
+        Args:
+            schema: OMOP CDM schema name (None for unqualified tables, e.g. SQLite).
+        """
+        self.schema = schema
+
+    def table(self, name: str) -> str:
+        """Schema-qualified table name."""
+        return f"{self.schema}.{name}" if self.schema else name
+
+    @staticmethod
+    def _id_list(concept_ids: Sequence[int]) -> str:
+        return ", ".join(str(int(cid)) for cid in sorted(set(concept_ids)))
+
+    def concept_set_sql(self, concept_ids: Sequence[int]) -> str:
+        """Concepts plus all their descendants."""
+        ids = self._id_list(concept_ids)
+        return (
+            f"SELECT descendant_concept_id FROM {self.table('concept_ancestor')} "
+            f"WHERE ancestor_concept_id IN ({ids}) "
+            f"UNION SELECT concept_id FROM {self.table('concept')} WHERE concept_id IN ({ids})"
+        )
+
+    def events_sql(self, concept_ids: Sequence[int]) -> str:
+        """Persons with any event in the concept set."""
+        concept_set = self.concept_set_sql(concept_ids)
+        return " UNION ".join(
+            f"SELECT person_id FROM {self.table(table)} WHERE {column} IN ({concept_set})"
+            for table, column in EVENT_TABLES
+        )
+
+    def compile_stage(self, cohort: SQLCohort, steps: Sequence[StageStep]) -> CompiledStage:
+        """
+        Compile a stage into CTEs applying QEBs in order.
+
+        Args:
+            cohort: Cohort entering the stage.
+            steps: Inclusion steps first, then exclusion steps.
+
+        Returns:
+            CompiledStage whose outcome_sql yields (person_id, exit_step)
+            for every entering person: the first step that eliminates
+            them, or 0 if they survive the stage.
+        """
+        ctes = [f"stage_in AS ({cohort.select_sql()})"]
+        step_sql = []
+        exits = []
+
+        for index, step in enumerate(steps, start=1):
+            if not step.concept_ids:
+                # No concepts: inclusion keeps everyone, exclusion removes nobody
+                step_sql.append("")
+                continue
+            events = self.events_sql(step.concept_ids)
+            ctes.append(f"qeb_{index} AS ({events})")
+            # Inclusion drops persons NOT IN the QEB set (INTERSECT),
+            # exclusion drops persons IN it (EXCEPT)
+            operator = "NOT IN" if step.is_inclusion else "IN"
+            exits.append(f"WHEN person_id {operator} (SELECT person_id FROM qeb_{index}) THEN {index}")
+            step_sql.append(events)
+
+        exit_step = f"CASE {' '.join(exits)} ELSE 0 END" if exits else "0"
+        return CompiledStage(
+            with_clause="WITH " + ",\n".join(ctes),
+            outcome_sql=f"SELECT person_id, {exit_step} AS exit_step FROM stage_in",
+            step_count=len(steps),
+            step_sql=step_sql,
+        )
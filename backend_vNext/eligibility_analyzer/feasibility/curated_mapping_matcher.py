@@ -0,0 +1,150 @@
+"""
+Curated Mapping Matcher - Multi-pattern lookup for curated OMOP mappings.
+
+EligibilityFunnelBuilder checks every atomic criterion against the
+patterns in reference_data/curated_concept_mappings.json. Matching each
+pattern separately (a regex compiled per short pattern, a substring test
+for the rest) costs O(patterns x text) per criterion; this matcher builds
+all patterns into one Aho-Corasick automaton when the mappings are loaded,
+so a lookup is a single pass over the text.
+
+Matching rules are unchanged:
+- Text and patterns are compared lower-cased
+- Patterns of up to 4 characters must sit on regex word boundaries
+  (\\b...\\b), so "anc" does not match "cancer"
+- Longer patterns match as plain substrings
+- When several mappings match, the first one in category order (and file
+  order within a category) wins
+"""
+
+import re
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+# Category priority for curated mappings (first match wins)
+CURATED_CATEGORY_ORDER: Tuple[str, ...] = (
+    "lab_mappings",
+    "biomarker_mappings",
+    "functional_status_mappings",
+    "condition_mappings",
+    "demographic_mappings",
+    "organ_function_mappings",
+    "comorbidity_mappings",
+    "prior_treatment_mappings",
+    "medication_mappings",
+    "clinical_findings_mappings",
+    "procedure_mappings",
+    "allergy_hypersensitivity_mappings",
+)
+
+# Patterns up to this length require word boundaries
+SHORT_PATTERN_MAX_LENGTH = 4
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+class CuratedMappingMatcher:
+    """
+    Aho-Corasick automaton over all curated mapping patterns.
+
+    Each pattern output carries the rank of its mapping entry; a lookup
+    returns the lowest-ranked entry with a (boundary-checked) occurrence.
+    """
+
+    def __init__(self, curated_mappings: Dict[str, Any]):
+        """
+        Build the automaton.
+
+        Args:
+            curated_mappings: Parsed curated_concept_mappings.json
+        """
+        # Mapping entries in priority order: (term, mapping_info)
+        self._entries: List[Tuple[str, Dict[str, Any]]] = []
+        # Trie transitions, failure links and outputs per state;
+        # an output is (entry_rank, pattern_length, needs_word_boundary)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[int, int, bool]]] = [[]]
+
+        for category in CURATED_CATEGORY_ORDER:
+            for term, mapping_info in curated_mappings.get(category, {}).items():
+                rank = len(self._entries)
+                self._entries.append((term, mapping_info))
+                for pattern in mapping_info.get("patterns", []):
+                    self._add_pattern(pattern.lower(), rank)
+
+        self._build_failure_links()
+
+    @property
+    def pattern_count(self) -> int:
+        """Number of pattern outputs in the automaton."""
+        return sum(len(outputs) for outputs in self._outputs)
+
+    def _add_pattern(self, pattern: str, rank: int) -> None:
+        if not pattern:
+            return
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append((rank, len(pattern), len(pattern) <= SHORT_PATTERN_MAX_LENGTH))
+
+    def _build_failure_links(self) -> None:
+        """Breadth-first failure links; outputs are merged along the links."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    @staticmethod
+    def _is_word_boundary(text: str, index: int) -> bool:
+        """Same test as regex \\b at a position between text[index - 1] and text[index]."""
+        before = index > 0 and _WORD_CHAR.match(text[index - 1]) is not None
+        after = index < len(text) and _WORD_CHAR.match(text[index]) is not None
+        return before != after
+
+    def find(self, text: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Find the highest-priority curated mapping whose patterns occur in text.
+
+        Args:
+            text: Atomic criterion text (any case)
+
+        Returns:
+            (term, mapping_info) of the winning mapping, or None
+        """
+        text = text.lower()
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        best: Optional[int] = None
+        state = 0
+
+        for index, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            for rank, length, needs_boundary in outputs[state]:
+                if best is not None and rank >= best:
+                    continue
+                end = index + 1
+                if needs_boundary and not (
+                    self._is_word_boundary(text, end - length) and self._is_word_boundary(text, end)
+                ):
+                    continue
+                best = rank
+                if best == 0:
+                    return self._entries[0]
+
+        return self._entries[best] if best is not None else None
@@ -25,6 +25,7 @@ from enum import Enum
 
 from .omop_fhir_bridge import OmopFhirBridge, FhirQuerySpec, FhirCode
 from .llm_atomic_matcher import LLMAtomicMatcher
+from .curated_mapping_matcher import CuratedMappingMatcher
 from ..services.llm_reflection import LLMReflectionService, TABLES_WITH_VALUE_COLUMN
 from ..config import load_config
 
@@ -380,6 +381,7 @@ class EligibilityFunnelBuilder:
 
         # Load curated lab concept mappings for common clinical values
         self._curated_mappings = self._load_curated_mappings()
+        self._curated_matcher = CuratedMappingMatcher(self._curated_mappings)
 
     def _get_category_to_stage(self) -> Dict[str, Tuple[str, str, int]]:
         """
@@ -778,112 +780,26 @@ class EligibilityFunnelBuilder:
         Returns curated OMOP concept and FHIR codes if found, None otherwise.
         This bypasses the database lookup for well-known clinical values.
 
-        Uses word-boundary matching to avoid false positives (e.g., "anc" matching "cancer").
+        Uses word-boundary matching for short patterns to avoid false positives
+        (e.g., "anc" matching "cancer"); see CuratedMappingMatcher.
         """
-        import re
-
         if not self._curated_mappings:
             return None
 
-        text_lower = atomic_text.lower()
-
-        # Helper to build curated result with FHIR codes
-        def build_result(mapping_info: Dict, term: str) -> Dict[str, Any]:
-            concept = mapping_info.get("omop_concept", {})
-            return {
-                "source": "curated",
-                "term": term,
-                "concepts": [concept],
-                "sql_template": mapping_info.get("sql_template", ""),
-                "fhir_codes": mapping_info.get("fhir_codes", []),
-                "fhir_resource_type": mapping_info.get("fhir_resource_type", ""),
-            }
-
-        def pattern_matches(pattern: str, text: str) -> bool:
-            """Check if pattern matches text using word boundaries for short patterns."""
-            pattern_lower = pattern.lower()
-            # For short patterns (<=4 chars), use word boundary matching to avoid false positives
-            if len(pattern_lower) <= 4:
-                # Match only as a whole word or at word boundaries
-                word_pattern = r'\b' + re.escape(pattern_lower) + r'\b'
-                return bool(re.search(word_pattern, text))
-            else:
-                # Longer patterns are less likely to cause false positives
-                return pattern_lower in text
-
-        # Check lab mappings
-        for lab_key, lab_info in self._curated_mappings.get("lab_mappings", {}).items():
-            patterns = lab_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(lab_info, lab_key)
-
-        # Check biomarker mappings
-        for bio_key, bio_info in self._curated_mappings.get("biomarker_mappings", {}).items():
-            patterns = bio_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(bio_info, bio_key)
-
-        # Check functional status mappings
-        for func_key, func_info in self._curated_mappings.get("functional_status_mappings", {}).items():
-            patterns = func_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(func_info, func_key)
-
-        # Check condition mappings
-        for cond_key, cond_info in self._curated_mappings.get("condition_mappings", {}).items():
-            patterns = cond_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(cond_info, cond_key)
-
-        # Check demographic mappings
-        for demo_key, demo_info in self._curated_mappings.get("demographic_mappings", {}).items():
-            patterns = demo_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(demo_info, demo_key)
-
-        # Check organ function mappings
-        for organ_key, organ_info in self._curated_mappings.get("organ_function_mappings", {}).items():
-            patterns = organ_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(organ_info, organ_key)
-
-        # Check comorbidity mappings
-        for comorb_key, comorb_info in self._curated_mappings.get("comorbidity_mappings", {}).items():
-            patterns = comorb_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(comorb_info, comorb_key)
-
-        # Check prior treatment mappings
-        for treat_key, treat_info in self._curated_mappings.get("prior_treatment_mappings", {}).items():
-            patterns = treat_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(treat_info, treat_key)
-
-        # Check medication mappings
-        for med_key, med_info in self._curated_mappings.get("medication_mappings", {}).items():
-            patterns = med_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(med_info, med_key)
-
-        # Check clinical findings mappings
-        for finding_key, finding_info in self._curated_mappings.get("clinical_findings_mappings", {}).items():
-            patterns = finding_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(finding_info, finding_key)
-
-        # Check procedure mappings (imaging, etc.)
-        for proc_key, proc_info in self._curated_mappings.get("procedure_mappings", {}).items():
-            patterns = proc_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(proc_info, proc_key)
-
-        # Check allergy/hypersensitivity mappings
-        for allergy_key, allergy_info in self._curated_mappings.get("allergy_hypersensitivity_mappings", {}).items():
-            patterns = allergy_info.get("patterns", [])
-            if any(pattern_matches(p, text_lower) for p in patterns):
-                return build_result(allergy_info, allergy_key)
+        match = self._curated_matcher.find(atomic_text)
+        if match is None:
+            return None
 
-        return None
+        term, mapping_info = match
+        concept = mapping_info.get("omop_concept", {})
+        return {
+            "source": "curated",
+            "term": term,
+            "concepts": [concept],
+            "sql_template": mapping_info.get("sql_template", ""),
+            "fhir_codes": mapping_info.get("fhir_codes", []),
+            "fhir_resource_type": mapping_info.get("fhir_resource_type", ""),
+        }
 
     def _apply_curated_mapping(self, atomic: AtomicCriterion, curated: Dict[str, Any]) -> None:
         """Apply a curated mapping to an atomic criterion (both OMOP and FHIR)."""
@@ -997,11 +913,13 @@ class EligibilityFunnelBuilder:
             logger.debug("No ATHENA database available for OMOP search")
             return []
 
+        if not Path(self.fhir_bridge.db_path).exists():
+            return []
+
         try:
-            conn = self.fhir_bridge._get_connection()
-            if not conn:
-                return []
+            from ..interpretation.athena_connection_pool import get_athena_pool
 
+            conn = get_athena_pool(self.fhir_bridge.db_path).get_connection()
             cursor = conn.cursor()
             # Search for standard concepts matching the term
             search_term = f"%{term}%"
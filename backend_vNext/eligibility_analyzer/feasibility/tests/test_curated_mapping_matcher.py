@@ -0,0 +1,93 @@
+"""
+Unit tests for the curated mapping matcher.
+"""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from ..curated_mapping_matcher import CURATED_CATEGORY_ORDER, CuratedMappingMatcher
+
+MAPPINGS_PATH = Path(__file__).parent.parent / "reference_data" / "curated_concept_mappings.json"
+
+
+def find_by_scanning(curated_mappings, text):
+    """Reference implementation: test every pattern of every mapping in priority order."""
+    text_lower = text.lower()
+    for category in CURATED_CATEGORY_ORDER:
+        for term, info in curated_mappings.get(category, {}).items():
+            for pattern in info.get("patterns", []):
+                pattern_lower = pattern.lower()
+                if len(pattern_lower) <= 4:
+                    matched = re.search(r"\b" + re.escape(pattern_lower) + r"\b", text_lower)
+                else:
+                    matched = pattern_lower in text_lower
+                if matched:
+                    return term
+    return None
+
+
+@pytest.fixture(scope="module")
+def curated_mappings():
+    with open(MAPPINGS_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class TestCuratedMappingMatcher:
+    """Tests for CuratedMappingMatcher."""
+
+    def test_short_patterns_need_word_boundaries(self):
+        matcher = CuratedMappingMatcher({
+            "lab_mappings": {"anc": {"patterns": ["ANC"]}, "potassium": {"patterns": ["k+"]}},
+            "condition_mappings": {"cancer": {"patterns": ["cancer"]}},
+        })
+        assert matcher.find("ANC >= 1500/uL")[0] == "anc"
+        assert matcher.find("History of cancer")[0] == "cancer"
+        assert matcher.find("Serum K+ within normal limits") is None  # \b after "+" needs a word char
+        assert matcher.find("k+5") is not None
+
+    def test_category_priority_wins_over_text_position(self):
+        matcher = CuratedMappingMatcher({
+            "biomarker_mappings": {"her2": {"patterns": ["her2"]}},
+            "lab_mappings": {"creatinine": {"patterns": ["creatinine"]}},
+        })
+        assert matcher.find("HER2 positive with creatinine < 1.5")[0] == "creatinine"
+
+    def test_overlapping_patterns(self):
+        matcher = CuratedMappingMatcher({
+            "lab_mappings": {
+                "bilirubin": {"patterns": ["total bilirubin"]},
+                "ast": {"patterns": ["ast"]},
+            },
+        })
+        assert matcher.find("total bilirubin <= 1.5 x ULN")[0] == "bilirubin"
+        assert matcher.find("AST/ALT <= 3 x ULN")[0] == "ast"
+        assert matcher.find("fast") is None
+
+    def test_matches_reference_scan(self, curated_mappings):
+        matcher = CuratedMappingMatcher(curated_mappings)
+        texts = [
+            "Absolute neutrophil count (ANC) >= 1.5 x 10^9/L",
+            "Patients with cancer of the pancreas",
+            "ECOG performance status 0-1",
+            "Hb >= 9 g/dL",
+            "Serum creatinine <= 1.5 x ULN or creatinine clearance >= 60 mL/min",
+            "Age >= 18 years",
+            "Known hypersensitivity to any excipient",
+            "Prior treatment with a PD-1 inhibitor",
+            "Brain MRI within 28 days",
+            "HIV infection",
+            "no matching terms at all",
+            "",
+        ]
+        # Every pattern, standalone and embedded in text, must resolve like the scan
+        for category in CURATED_CATEGORY_ORDER:
+            for info in curated_mappings.get(category, {}).values():
+                for pattern in info.get("patterns", []):
+                    texts.extend([pattern, f"x{pattern}x", f"Patient has {pattern.upper()}, confirmed."])
+
+        for text in texts:
+            match = matcher.find(text)
+            assert (match[0] if match else None) == find_by_scanning(curated_mappings, text), text
@@ -0,0 +1,175 @@
+"""
+ATHENA Connection Pool
+
+Read-only, thread-local SQLite connections to the ATHENA vocabulary
+database, shared by every OMOP concept lookup in the eligibility
+analyzer (Stage 5, Stage 5.5, funnel UNMAPPED recovery and QEB review
+concept search).
+
+Stage 5 used to open a fresh sqlite3 connection for every term and close
+it afterwards, which threw away SQLite's page cache for a multi-GB
+vocabulary on each lookup. Pooled connections are opened once per
+thread with:
+- URI mode=ro&immutable=1: no locking or change detection (ATHENA is
+  never written while the pipeline runs)
+- PRAGMA mmap_size: pages are read through the OS page cache via mmap
+- PRAGMA cache_size: a larger per-connection page cache
+
+Usage:
+    from eligibility_analyzer.interpretation.athena_connection_pool import get_athena_pool
+
+    conn = get_athena_pool(db_path).get_connection()
+    cursor = conn.execute("SELECT ... FROM concept WHERE ...")
+
+Connections are owned by the pool: callers must not close them.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Memory-map up to 1 GiB of the database per connection (ATHENA_MMAP_MB)
+DEFAULT_MMAP_MB = 1024
+
+# Page cache per connection, in KiB (ATHENA_CACHE_SIZE_KB)
+DEFAULT_CACHE_SIZE_KB = 64 * 1024
+
+
+class AthenaConnectionPool:
+    """
+    Thread-local pool of read-only connections to one ATHENA database.
+
+    Each thread gets its own connection on first use and keeps it for the
+    life of the thread; connections of threads that have exited are closed
+    the next time a connection is opened.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        mmap_mb: Optional[int] = None,
+        cache_size_kb: Optional[int] = None,
+        immutable: bool = True,
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            db_path: Path to the ATHENA SQLite database
+            mmap_mb: mmap_size per connection in MiB (default: ATHENA_MMAP_MB or 1024)
+            cache_size_kb: Page cache per connection in KiB (default:
+                ATHENA_CACHE_SIZE_KB or 65536)
+            immutable: Open with immutable=1 (the file must not change while open)
+        """
+        self.db_path = str(db_path)
+        self.mmap_size = int(mmap_mb if mmap_mb is not None else os.getenv("ATHENA_MMAP_MB", DEFAULT_MMAP_MB)) * 1024 * 1024
+        self.cache_size_kb = int(
+            cache_size_kb if cache_size_kb is not None else os.getenv("ATHENA_CACHE_SIZE_KB", DEFAULT_CACHE_SIZE_KB)
+        )
+        self.immutable = immutable
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._stats = {"connections_opened": 0, "connections_closed": 0, "checkouts": 0}
+
+    @property
+    def uri(self) -> str:
+        """SQLite URI for read-only (and optionally immutable) access."""
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        if self.immutable:
+            uri += "&immutable=1"
+        return uri
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection (rows as sqlite3.Row).
+
+        Returns:
+            Pooled read-only connection; do not close it
+
+        Raises:
+            sqlite3.OperationalError: If the database cannot be opened
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        with self._lock:
+            self._stats["checkouts"] += 1
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        # check_same_thread=False only so close_all() can close other threads'
+        # connections; each connection is otherwise used by its owner thread
+        conn = sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        conn.execute(f"PRAGMA cache_size=-{self.cache_size_kb}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+        with self._lock:
+            self._prune_dead_threads()
+            self._connections[threading.current_thread()] = conn
+            self._stats["connections_opened"] += 1
+        logger.debug(f"Opened pooled ATHENA connection for {threading.current_thread().name}")
+        return conn
+
+    def _prune_dead_threads(self) -> None:
+        """Close connections owned by threads that have exited (caller holds the lock)."""
+        for thread in [t for t in self._connections if not t.is_alive()]:
+            self._connections.pop(thread).close()
+            self._stats["connections_closed"] += 1
+
+    def close_all(self) -> None:
+        """Close every pooled connection (threads reconnect on next use)."""
+        with self._lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._stats["connections_closed"] += len(self._connections)
+            self._connections.clear()
+        self._local = threading.local()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        with self._lock:
+            return {**self._stats, "open_connections": len(self._connections), "db_path": self.db_path}
+
+
+# Singleton pools, one per resolved database path
+_pools: Dict[str, AthenaConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_athena_pool(db_path: str) -> AthenaConnectionPool:
+    """
+    Get the shared connection pool for an ATHENA database.
+
+    Args:
+        db_path: Path to the ATHENA SQLite database
+
+    Returns:
+        AthenaConnectionPool singleton for the path
+    """
+    key = str(Path(db_path).resolve())
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = AthenaConnectionPool(key)
+                _pools[key] = pool
+    return pool
+
+
+def reset_athena_pools() -> None:
+    """Close and drop all pools (useful for testing)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close_all()
+        _pools.clear()
@@ -2,10 +2,11 @@
 Concept Expansion Cache
 
 Persistent cache for LLM concept expansions with TTL-based expiration.
-Stores term-level expansions for reuse across protocols.
+Stores term-level expansions for reuse across protocols, in the
+"concept_expansions" namespace of the shared LLM response cache
+(app.services.llm_response_cache).
 """
 
-import json
 import hashlib
 import logging
 from pathlib import Path
@@ -67,6 +68,7 @@ class ConceptExpansionCache:
         self.ttl_days = ttl_days
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._dirty = False
+        self._view = None  # Scope of the shared LLM response cache
         self._ensure_cache_dir()
         self._load_cache()
 
@@ -95,30 +97,32 @@ class ConceptExpansionCache:
         """Check if cache entry was created with different prompt version."""
         return entry.get("prompt_version") != PROMPT_VERSION
 
+    def _get_view(self):
+        """Get the concept expansion scope of the shared LLM response cache."""
+        if self._view is None:
+            from app.services.llm_response_cache import get_cache_view
+            self._view = get_cache_view("concept_expansions", prompt=PROMPT_VERSION)
+        return self._view
+
     def _load_cache(self) -> None:
-        """Load cache from disk."""
-        if CACHE_FILE.exists():
-            try:
-                with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                    self._cache = json.load(f)
-                logger.info(f"Loaded {len(self._cache)} cached concept expansions")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load cache: {e}. Starting fresh.")
-                self._cache = {}
-        else:
+        """Load cache from the shared LLM response cache."""
+        try:
+            self._cache = self._get_view().load(legacy_file=CACHE_FILE)
+            logger.info(f"Loaded {len(self._cache)} cached concept expansions")
+        except Exception as e:
+            logger.warning(f"Failed to load cache: {e}. Starting fresh.")
             self._cache = {}
 
     def _save_cache(self) -> None:
-        """Save cache to disk."""
+        """Save new, changed and removed entries to the shared LLM response cache."""
         if not self._dirty:
             return
 
         try:
-            with open(CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump(self._cache, f, indent=2, ensure_ascii=False)
+            written = self._get_view().save(self._cache)
             self._dirty = False
-            logger.debug(f"Saved {len(self._cache)} cached concept expansions")
-        except IOError as e:
+            logger.debug(f"Saved {written} of {len(self._cache)} cached concept expansions")
+        except Exception as e:
             logger.error(f"Failed to save cache: {e}")
 
     def get(self, term: str) -> Optional[ConceptExpansion]:
@@ -133,22 +137,14 @@ class ConceptExpansionCache:
         """
         key = self._normalize_key(term)
         entry = self._cache.get(key)
-
-        if entry is None:
-            return None
-
-        # Check expiration
-        if self._is_expired(entry):
-            logger.debug(f"Cache entry expired for term: {term}")
+        if entry is not None and (self._is_expired(entry) or self._is_version_mismatch(entry)):
+            logger.debug(f"Cache entry expired or from another prompt version for term: {term}")
             del self._cache[key]
             self._dirty = True
-            return None
+            entry = None
 
-        # Check prompt version
-        if self._is_version_mismatch(entry):
-            logger.debug(f"Cache entry version mismatch for term: {term}")
-            del self._cache[key]
-            self._dirty = True
+        self._get_view().record_lookup(key, entry is not None)
+        if entry is None:
             return None
 
         # Return cached expansion with source set to "cache"
@@ -279,7 +275,7 @@ class ConceptExpansionCache:
             "valid_entries": total - expired - version_mismatch,
             "expired_entries": expired,
             "version_mismatch_entries": version_mismatch,
-            "cache_file": str(CACHE_FILE),
+            "cache_file": str(self._get_view().cache.path),
             "prompt_version": PROMPT_VERSION,
             "ttl_days": self.ttl_days,
         }
@@ -42,6 +42,7 @@ from eligibility_analyzer.interpretation.omop_query_cache import (
     OMOPQueryCache,
     get_omop_cache,
 )
+from eligibility_analyzer.interpretation.athena_connection_pool import get_athena_pool
 
 # Parallel processing configuration for OMOP mapping
 OMOP_PARALLEL_WORKERS = 10  # Number of parallel database query threads
@@ -823,7 +824,7 @@ class InterpretationPipeline:
         5. Synonym lookup via concept_synonym table
 
         OPTIMIZATION: Uses ThreadPoolExecutor for parallel database queries.
-        Each worker thread gets its own SQLite connection for concurrent reads.
+        Each worker thread reuses its pooled read-only ATHENA connection.
 
         LLM-FIRST: Uses per-term vocabulary hints from LLM instead of hardcoded mappings.
         """
@@ -875,67 +876,64 @@ class InterpretationPipeline:
 
         llm_expanded_count = sum(1 for t in terms_to_process if t.get("llmSource") == "llm")
         logger.info(f"Stage 5: Processing {total_terms} terms ({llm_expanded_count} LLM-expanded) with {OMOP_PARALLEL_WORKERS} workers")
+        athena_pool = get_athena_pool(db_path)
 
         def search_single_term(term_info: Dict[str, Any]) -> Dict[str, Any]:
             """Worker function to search for a single term (runs in thread pool)."""
-            # Each thread gets its own connection for thread safety
-            thread_conn = sqlite3.connect(db_path)
-            thread_conn.row_factory = sqlite3.Row
+            # Each thread reuses its own pooled connection (kept open across terms)
+            thread_conn = athena_pool.get_connection()
 
-            try:
-                primary_term = term_info["primaryTerm"]
-                omop_table = term_info["omopTable"]
-
-                # Use LLM-provided domain/vocab hints (falls back to hardcoded if unavailable)
-                domain, vocab_priority = self._get_domain_and_vocab_priority_with_llm(
-                    omop_table,
-                    term_info.get("llmDomainHint"),
-                    term_info.get("llmVocabHints"),
-                )
+            primary_term = term_info["primaryTerm"]
+            omop_table = term_info["omopTable"]
 
-                # Build search terms list from LLM expansion
-                search_terms = [primary_term]
-                if term_info.get("llmAbbreviationExpansion"):
-                    search_terms.insert(0, term_info["llmAbbreviationExpansion"])
-                if term_info.get("llmPrimary") and term_info["llmPrimary"] != primary_term:
-                    search_terms.append(term_info["llmPrimary"])
-                for variant in (term_info.get("llmVariants") or [])[:5]:
-                    if variant and variant not in search_terms:
-                        search_terms.append(variant)
-
-                concepts = self._search_omop_concepts_with_variants(
-                    thread_conn, search_terms, domain, vocab_priority
-                )
+            # Use LLM-provided domain/vocab hints (falls back to hardcoded if unavailable)
+            domain, vocab_priority = self._get_domain_and_vocab_priority_with_llm(
+                omop_table,
+                term_info.get("llmDomainHint"),
+                term_info.get("llmVocabHints"),
+            )
 
-                if concepts:
-                    return {
-                        "mapped": True,
-                        "result": {
-                            "criterionId": term_info["criterionId"],
-                            "atomicId": term_info["atomicId"],
-                            "term": primary_term,
-                            "domain": domain,
-                            "concepts": concepts,
-                            "confidence": self._calculate_confidence(concepts, primary_term),
-                            "llmSource": term_info.get("llmSource", "fallback"),
-                            "searchTermsUsed": len(search_terms),
-                        }
+            # Build search terms list from LLM expansion
+            search_terms = [primary_term]
+            if term_info.get("llmAbbreviationExpansion"):
+                search_terms.insert(0, term_info["llmAbbreviationExpansion"])
+            if term_info.get("llmPrimary") and term_info["llmPrimary"] != primary_term:
+                search_terms.append(term_info["llmPrimary"])
+            for variant in (term_info.get("llmVariants") or [])[:5]:
+                if variant and variant not in search_terms:
+                    search_terms.append(variant)
+
+            concepts = self._search_omop_concepts_with_variants(
+                thread_conn, search_terms, domain, vocab_priority
+            )
+
+            if concepts:
+                return {
+                    "mapped": True,
+                    "result": {
+                        "criterionId": term_info["criterionId"],
+                        "atomicId": term_info["atomicId"],
+                        "term": primary_term,
+                        "domain": domain,
+                        "concepts": concepts,
+                        "confidence": self._calculate_confidence(concepts, primary_term),
+                        "llmSource": term_info.get("llmSource", "fallback"),
+                        "searchTermsUsed": len(search_terms),
                     }
-                else:
-                    return {
-                        "mapped": False,
-                        "result": {
-                            "criterionId": term_info["criterionId"],
-                            "atomicId": term_info["atomicId"],
-                            "term": primary_term,
-                            "domain": domain,
-                            "reason": "No matching OMOP concept found",
-                            "llmSource": term_info.get("llmSource", "fallback"),
-                            "searchTermsUsed": len(search_terms),
-                        }
+                }
+            else:
+                return {
+                    "mapped": False,
+                    "result": {
+                        "criterionId": term_info["criterionId"],
+                        "atomicId": term_info["atomicId"],
+                        "term": primary_term,
+                        "domain": domain,
+                        "reason": "No matching OMOP concept found",
+                        "llmSource": term_info.get("llmSource", "fallback"),
+                        "searchTermsUsed": len(search_terms),
                     }
-            finally:
-                thread_conn.close()
+                }
 
         mapped_count = 0
         unmapped_count = 0
@@ -1078,10 +1076,9 @@ class InterpretationPipeline:
             result["still_unmapped"] = unmapped_terms
             return result
 
-        # Open database connection for re-querying
+        # Re-query through this thread's pooled ATHENA connection
         try:
-            conn = sqlite3.connect(db_path)
-            conn.row_factory = sqlite3.Row
+            conn = get_athena_pool(db_path).get_connection()
 
             for unmapped in unmapped_terms:
                 term = unmapped.get("term", "")
@@ -1153,8 +1150,6 @@ class InterpretationPipeline:
                     }
                     result["still_unmapped"].append(unmapped)
 
-            conn.close()
-
         except Exception as e:
             logger.error(f"Stage 5.5 database error: {e}")
             result["still_unmapped"] = unmapped_terms
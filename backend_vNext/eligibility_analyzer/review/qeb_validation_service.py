@@ -9,7 +9,6 @@ and funnel execution readiness checks.
 import json
 import logging
 import os
-import sqlite3
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -443,8 +442,9 @@ class QEBValidationService:
             return []
 
         try:
-            conn = sqlite3.connect(self.athena_db_path)
-            conn.row_factory = sqlite3.Row
+            from ..interpretation.athena_connection_pool import get_athena_pool
+
+            conn = get_athena_pool(self.athena_db_path).get_connection()
             cursor = conn.cursor()
 
             # Build search query
@@ -489,7 +489,6 @@ class QEBValidationService:
                     "isStandard": row["standard_concept"] == "S",
                 })
 
-            conn.close()
             return results
 
         except Exception as e:
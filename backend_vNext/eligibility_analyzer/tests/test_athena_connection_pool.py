@@ -0,0 +1,81 @@
+"""
+Unit tests for the read-only ATHENA connection pool.
+
+Tests cover:
+- One connection per thread, reused across lookups
+- Read-only access (writes rejected)
+- Connections of finished threads closed on the next open
+- Singleton pool per database path
+"""
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pool_module = pytest.importorskip("eligibility_analyzer.interpretation.athena_connection_pool")
+AthenaConnectionPool = pool_module.AthenaConnectionPool
+
+
+@pytest.fixture
+def athena_db(tmp_path):
+    path = tmp_path / "athena.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE concept (concept_id INTEGER PRIMARY KEY, concept_name TEXT)")
+    conn.executemany(
+        "INSERT INTO concept VALUES (?, ?)",
+        [(1, "Hypertension"), (2, "Type 2 diabetes mellitus"), (3, "Hemoglobin A1c")],
+    )
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def test_connection_reused_per_thread(athena_db):
+    pool = AthenaConnectionPool(athena_db)
+
+    def lookup(concept_id):
+        conn = pool.get_connection()
+        row = conn.execute("SELECT concept_name FROM concept WHERE concept_id = ?", (concept_id,)).fetchone()
+        return id(conn), row["concept_name"]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(lookup, [1, 2, 3] * 10))
+
+    assert [name for _, name in results[:3]] == ["Hypertension", "Type 2 diabetes mellitus", "Hemoglobin A1c"]
+    assert len({conn_id for conn_id, _ in results}) <= 3
+    stats = pool.get_stats()
+    assert stats["checkouts"] == 30
+    assert stats["connections_opened"] <= 3
+    pool.close_all()
+
+
+def test_connections_are_read_only(athena_db):
+    pool = AthenaConnectionPool(athena_db)
+    with pytest.raises(sqlite3.OperationalError):
+        pool.get_connection().execute("INSERT INTO concept VALUES (4, 'Asthma')")
+    pool.close_all()
+
+
+def test_dead_thread_connections_closed(athena_db):
+    pool = AthenaConnectionPool(athena_db)
+    worker = threading.Thread(target=pool.get_connection)
+    worker.start()
+    worker.join()
+    assert pool.get_stats()["open_connections"] == 1
+
+    pool.get_connection()  # opening a new connection prunes the finished thread's
+
+    stats = pool.get_stats()
+    assert stats["open_connections"] == 1
+    assert stats["connections_closed"] == 1
+    pool.close_all()
+
+
+def test_singleton_per_path(athena_db, tmp_path):
+    try:
+        assert pool_module.get_athena_pool(athena_db) is pool_module.get_athena_pool(athena_db)
+        assert pool_module.get_athena_pool(athena_db) is not pool_module.get_athena_pool(str(tmp_path / "other.db"))
+    finally:
+        pool_module.reset_athena_pools()
@@ -0,0 +1,150 @@
+"""
+Unit tests for bitmap cohorts used by funnel execution.
+
+Tests cover:
+- Round-trips between patient ID sets and Cohort bitmaps
+- INTERSECT / EXCEPT / UNION parity with Python sets
+- Lowest-ID selection (killer criterion simulation)
+- Deterministic random masks and their match rate
+- MockDatabaseAdapter returning the representation it was given
+"""
+
+import random
+
+import pytest
+
+from eligibility_analyzer.execution.cohort import Cohort, empty_like
+from eligibility_analyzer.execution.database_adapters import MockDatabaseAdapter
+
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def left_ids():
+    return {1, 2, 3, 8, 9, 64, 65, 1000}
+
+
+@pytest.fixture
+def right_ids():
+    return {2, 3, 4, 9, 65, 999}
+
+
+# =============================================================================
+# SET PARITY
+# =============================================================================
+
+class TestCohortSetParity:
+    """Cohort operations match Python set semantics."""
+
+    def test_round_trip(self, left_ids):
+        cohort = Cohort.from_ids(left_ids)
+        assert cohort.to_set() == left_ids
+        assert cohort.to_list() == sorted(left_ids)
+        assert len(cohort) == len(left_ids)
+
+    def test_membership(self, left_ids):
+        cohort = Cohort.from_ids(left_ids)
+        assert 64 in cohort
+        assert 63 not in cohort
+        assert -1 not in cohort
+
+    def test_intersection(self, left_ids, right_ids):
+        result = Cohort.from_ids(left_ids).intersection(Cohort.from_ids(right_ids))
+        assert result.to_set() == left_ids & right_ids
+
+    def test_difference(self, left_ids, right_ids):
+        result = Cohort.from_ids(left_ids) - Cohort.from_ids(right_ids)
+        assert result.to_set() == left_ids - right_ids
+
+    def test_union(self, left_ids, right_ids):
+        result = Cohort.from_ids(left_ids) | Cohort.from_ids(right_ids)
+        assert result.to_set() == left_ids | right_ids
+
+    def test_operations_accept_sets(self, left_ids, right_ids):
+        cohort = Cohort.from_ids(left_ids)
+        assert (cohort - right_ids).to_set() == left_ids - right_ids
+        assert cohort.intersection(right_ids).to_set() == left_ids & right_ids
+        assert (cohort - set()) == cohort
+
+    def test_range(self):
+        assert Cohort.range(1, 11).to_set() == set(range(1, 11))
+        assert len(Cohort.range(5, 5)) == 0
+
+    def test_empty_like(self, left_ids):
+        assert empty_like(Cohort.from_ids(left_ids)) == Cohort()
+        assert empty_like(left_ids) == set()
+
+    def test_negative_ids_rejected(self):
+        with pytest.raises(ValueError):
+            Cohort.from_ids([1, -2])
+
+
+# =============================================================================
+# SELECTION
+# =============================================================================
+
+class TestCohortSelection:
+    """Lowest-ID selection and random masks."""
+
+    @pytest.mark.parametrize("count", [0, 1, 4, 7, 8, 20])
+    def test_head_matches_sorted_prefix(self, left_ids, count):
+        cohort = Cohort.from_ids(left_ids)
+        assert cohort.head(count).to_set() == set(sorted(left_ids)[:count])
+
+    def test_random_mask_is_deterministic(self):
+        universe = Cohort.range(1, 5001)
+        first = Cohort.random_mask(universe, 0.2, random.Random(7))
+        second = Cohort.random_mask(universe, 0.2, random.Random(7))
+        assert first == second
+
+    def test_random_mask_rate(self):
+        universe = Cohort.range(1, 100001)
+        mask = Cohort.random_mask(universe, 0.15, random.Random(42))
+        assert len(mask - universe) == 0
+        assert 0.14 < len(mask) / len(universe) < 0.16
+
+    def test_random_mask_bounds(self):
+        universe = Cohort.range(1, 101)
+        assert len(Cohort.random_mask(universe, 0.0, random.Random(1))) == 0
+        assert Cohort.random_mask(universe, 1.0, random.Random(1)) == universe
+
+
+# =============================================================================
+# MOCK ADAPTER
+# =============================================================================
+
+class TestMockAdapterBitmap:
+    """MockDatabaseAdapter works on bitmap cohorts."""
+
+    def test_base_cohort_matches_population(self):
+        adapter = MockDatabaseAdapter(patient_count=1000)
+        assert adapter.get_base_cohort().to_set() == adapter.get_base_population()
+
+    def test_filter_returns_subset_of_cohort(self):
+        adapter = MockDatabaseAdapter(patient_count=20000)
+        cohort = adapter.get_base_cohort().head(15000)
+        matching = adapter.filter_cohort_by_concepts(cohort, [201826], is_inclusion=True)
+        assert isinstance(matching, Cohort)
+        assert len(matching - cohort) == 0
+        assert 0.17 < len(matching) / len(cohort) < 0.23
+
+    def test_filter_keeps_set_representation(self):
+        adapter = MockDatabaseAdapter(patient_count=500)
+        matching = adapter.filter_cohort_by_concepts(
+            adapter.get_base_population(), [201826], is_inclusion=True
+        )
+        assert isinstance(matching, set)
+
+    def test_no_concepts(self):
+        adapter = MockDatabaseAdapter(patient_count=100)
+        cohort = adapter.get_base_cohort()
+        assert adapter.filter_cohort_by_concepts(cohort, [], is_inclusion=True) == cohort
+        assert len(adapter.filter_cohort_by_concepts(cohort, [], is_inclusion=False)) == 0
+
+    def test_killer_criterion_parity(self):
+        adapter = MockDatabaseAdapter(patient_count=1000)
+        from_set = adapter.simulate_killer_criterion(adapter.get_base_population(), 0.8)
+        from_bitmap = adapter.simulate_killer_criterion(adapter.get_base_cohort(), 0.8)
+        assert from_bitmap.to_set() == from_set
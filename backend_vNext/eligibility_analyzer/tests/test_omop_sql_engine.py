@@ -0,0 +1,245 @@
+"""
+Unit tests for set-based OMOP CDM funnel execution.
+
+Tests cover:
+- Stage compilation (inclusion / exclusion order, concept_ancestor expansion)
+- OMOPDatabaseAdapter against a synthetic SQLite OMOP fixture
+- Parity between set-based stages, per-QEB execution and plain Python sets
+- Skipped QEBs and QEBs without concepts
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from eligibility_analyzer.execution.database_adapters import OMOPDatabaseAdapter
+from eligibility_analyzer.execution.funnel_executor import FunnelExecutor
+from eligibility_analyzer.execution.omop_fixture import create_omop_fixture
+from eligibility_analyzer.execution.omop_sql import SQLCohort, StageSQLCompiler, StageStep
+from eligibility_analyzer.review.qeb_validation_models import FunnelStageConfig, ValidationSession
+
+
+class FixtureValidationService:
+    """Reads concept IDs from the QEB dict; QEBs flagged 'skip' are not queryable."""
+
+    def get_effective_queryable_count(self, qeb_id: str, qeb_data: Dict[str, Any], session) -> int:
+        return 0 if qeb_data.get("skip") else 1
+
+    def extract_concept_ids_from_qeb(self, qeb_data: Dict[str, Any], session) -> List[int]:
+        return qeb_data["conceptIds"]
+
+
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def omop_db():
+    conn, roots = create_omop_fixture(person_count=2000, root_concepts=12, seed=7)
+    yield conn, roots
+    conn.close()
+
+
+@pytest.fixture
+def funnel(omop_db):
+    _, roots = omop_db
+    qeb_lookup = {
+        "INC_1": {"criterionText": "inc 1", "conceptIds": roots[0:6]},
+        "INC_2": {"criterionText": "inc 2", "conceptIds": roots[3:9]},
+        "EXC_1": {"criterionText": "exc 1", "conceptIds": [roots[9]]},
+        "SKIP_1": {"criterionText": "screening only", "conceptIds": [roots[1]], "skip": True},
+        "NONE_1": {"criterionText": "no concepts", "conceptIds": []},
+        "INC_3": {"criterionText": "inc 3", "conceptIds": roots[6:12]},
+        "EXC_2": {"criterionText": "exc 2", "conceptIds": [roots[10], roots[11]]},
+        "EXC_3": {"criterionText": "exc 3 (child concept)", "conceptIds": [roots[2] + 1]},
+    }
+    stages = [
+        FunnelStageConfig(
+            stage_number=1,
+            stage_name="Stage 1",
+            inclusion_qeb_ids=["INC_1", "SKIP_1", "INC_2"],
+            exclusion_qeb_ids=["EXC_1", "NONE_1", "MISSING"],
+        ),
+        FunnelStageConfig(stage_number=2, stage_name="Empty"),
+        FunnelStageConfig(
+            stage_number=3,
+            stage_name="Stage 3",
+            inclusion_qeb_ids=["INC_3"],
+            exclusion_qeb_ids=["EXC_2", "EXC_3"],
+        ),
+    ]
+    session = ValidationSession(
+        session_id="test",
+        protocol_id="test",
+        protocol_name="test",
+        qeb_output_path="",
+        funnel_stages=stages,
+    )
+    return session, qeb_lookup
+
+
+def persons_with(conn, concept_ids: List[int]) -> set:
+    """Reference matcher: persons with an event on a concept or descendant."""
+    concepts = set(concept_ids)
+    for ancestor, descendant in conn.execute("SELECT * FROM concept_ancestor"):
+        if ancestor in concept_ids:
+            concepts.add(descendant)
+    persons = set()
+    for table, column in (
+        ("condition_occurrence", "condition_concept_id"),
+        ("measurement", "measurement_concept_id"),
+        ("drug_exposure", "drug_concept_id"),
+    ):
+        for pid, concept_id in conn.execute(f"SELECT person_id, {column} FROM {table}"):
+            if concept_id in concepts:
+                persons.add(pid)
+    return persons
+
+
+def stage_counts(result) -> List[tuple]:
+    return [
+        (stage.stage_number, stage.patients_entering, stage.patients_exiting,
+         [(q.qeb_id, q.patients_before, q.patients_after, q.was_skipped) for q in stage.qeb_results])
+        for stage in result.stage_results
+    ]
+
+
+# =============================================================================
+# COMPILER
+# =============================================================================
+
+class TestStageSQLCompiler:
+    """SQL generation for a stage."""
+
+    def test_operators_in_funnel_order(self):
+        compiled = StageSQLCompiler("cdm").compile_stage(
+            SQLCohort("cdm.person", 10),
+            [StageStep("A", [1], True), StageStep("B", [2], False)],
+        )
+        sql = compiled.materialize_sql("t")
+        assert "FROM cdm.concept_ancestor" in sql
+        # Inclusion eliminates persons without events, exclusion those with events
+        assert sql.index("NOT IN (SELECT person_id FROM qeb_1) THEN 1") < sql.index(
+            "WHEN person_id IN (SELECT person_id FROM qeb_2) THEN 2"
+        )
+        assert compiled.step_count == 2
+        assert len(compiled.step_sql) == 2
+
+    def test_unqualified_tables(self):
+        compiler = StageSQLCompiler(None)
+        assert compiler.table("person") == "person"
+        assert "cdm." not in compiler.events_sql([5])
+
+    def test_concept_ids_must_be_integers(self):
+        with pytest.raises(ValueError):
+            StageSQLCompiler().events_sql(["1); DROP TABLE person; --"])
+
+
+# =============================================================================
+# ADAPTER
+# =============================================================================
+
+class TestOMOPDatabaseAdapter:
+    """OMOPDatabaseAdapter against the SQLite fixture."""
+
+    def test_requires_connection(self):
+        with pytest.raises(ValueError):
+            OMOPDatabaseAdapter()
+
+    def test_sqlite_url(self, tmp_path):
+        path = tmp_path / "omop.db"
+        create_omop_fixture(str(path), person_count=50)[0].close()
+        adapter = OMOPDatabaseAdapter(f"sqlite:///{path}", schema=None)
+        assert adapter.get_base_population() == set(range(1, 51))
+        adapter.close()
+
+    def test_filter_matches_reference(self, omop_db):
+        conn, roots = omop_db
+        adapter = OMOPDatabaseAdapter(connection=conn, schema=None)
+        cohort = set(range(1, 1001))
+        matching = adapter.filter_cohort_by_concepts(cohort, roots[:2], is_inclusion=True)
+        assert matching == cohort & persons_with(conn, roots[:2])
+
+    def test_execute_stage_counts(self, omop_db):
+        conn, roots = omop_db
+        adapter = OMOPDatabaseAdapter(connection=conn, schema=None)
+        base = adapter.get_base_cohort_ref()
+        steps = [StageStep("A", roots[:6], True), StageStep("B", [roots[6]], False)]
+        execution = adapter.execute_stage(base, steps)
+
+        included = set(range(1, 2001)) & persons_with(conn, roots[:6])
+        remaining = included - persons_with(conn, [roots[6]])
+        assert execution.counts == [2000, len(included), len(remaining)]
+        assert adapter.fetch_ids(execution.remaining) == remaining
+
+
+# =============================================================================
+# FUNNEL PARITY
+# =============================================================================
+
+class TestSetBasedFunnel:
+    """Set-based stages give the same funnel as per-QEB execution."""
+
+    def test_parity_with_per_qeb(self, omop_db, funnel):
+        conn, _ = omop_db
+        session, qeb_lookup = funnel
+
+        set_based = FunnelExecutor(
+            OMOPDatabaseAdapter(connection=conn, schema=None), FixtureValidationService()
+        ).execute_funnel(session, qeb_lookup)
+        per_qeb = FunnelExecutor(
+            OMOPDatabaseAdapter(connection=conn, schema=None, set_based=False),
+            FixtureValidationService(),
+        ).execute_funnel(session, qeb_lookup)
+
+        assert stage_counts(set_based) == stage_counts(per_qeb)
+        assert set_based.final_population == per_qeb.final_population
+
+    def test_matches_python_reference(self, omop_db, funnel):
+        conn, _ = omop_db
+        session, qeb_lookup = funnel
+        adapter = OMOPDatabaseAdapter(connection=conn, schema=None)
+        result = FunnelExecutor(adapter, FixtureValidationService()).execute_funnel(session, qeb_lookup)
+
+        cohort = set(range(1, 2001))
+        for qeb_id in ("INC_1", "INC_2", "INC_3"):
+            cohort &= persons_with(conn, qeb_lookup[qeb_id]["conceptIds"])
+            if qeb_id == "INC_2":
+                cohort -= persons_with(conn, qeb_lookup["EXC_1"]["conceptIds"])
+        cohort -= persons_with(conn, qeb_lookup["EXC_2"]["conceptIds"])
+        cohort -= persons_with(conn, qeb_lookup["EXC_3"]["conceptIds"])
+
+        assert result.final_population == len(cohort)
+        assert adapter.fetch_ids(result.stage_results[-1].remaining_patient_ids) == cohort
+
+    def test_skipped_and_empty_qebs(self, omop_db, funnel):
+        conn, _ = omop_db
+        session, qeb_lookup = funnel
+        result = FunnelExecutor(
+            OMOPDatabaseAdapter(connection=conn, schema=None), FixtureValidationService()
+        ).execute_funnel(session, qeb_lookup)
+
+        by_id = {q.qeb_id: q for q in result.stage_results[0].qeb_results}
+        assert "MISSING" not in by_id
+        assert by_id["SKIP_1"].was_skipped
+        assert by_id["SKIP_1"].patients_before == by_id["SKIP_1"].patients_after
+        assert by_id["NONE_1"].patients_before == by_id["NONE_1"].patients_after
+
+    def test_execute_single_qeb(self, omop_db, funnel):
+        conn, _ = omop_db
+        session, qeb_lookup = funnel
+        executor = FunnelExecutor(
+            OMOPDatabaseAdapter(connection=conn, schema=None), FixtureValidationService()
+        )
+
+        inclusion = executor.execute_single_qeb("INC_1", qeb_lookup["INC_1"], session)
+        expected = set(range(1, 2001)) & persons_with(conn, qeb_lookup["INC_1"]["conceptIds"])
+        assert inclusion.patients_before == 2000
+        assert inclusion.patients_after == len(expected)
+        assert inclusion.matching_patient_ids == expected
+
+        exclusion = executor.execute_single_qeb(
+            "EXC_1", qeb_lookup["EXC_1"], session, is_inclusion=False
+        )
+        excluded = persons_with(conn, qeb_lookup["EXC_1"]["conceptIds"])
+        assert exclusion.patients_after == 2000 - len(excluded)
@@ -0,0 +1,10 @@
+-- Migration: Store PDF BYTEA columns uncompressed out-of-line
+-- Purpose: Let substring() slice PDFs without detoasting the whole value,
+--          so the PDF endpoints can stream chunks and serve Range requests cheaply.
+--          PDFs are already compressed, so TOAST compression gains nothing.
+-- Date: 2026-10-16
+
+-- Applies to newly written values; existing rows keep their current storage
+-- until rewritten (re-upload, or UPDATE ... SET file_data = file_data).
+ALTER TABLE public.protocols ALTER COLUMN file_data SET STORAGE EXTERNAL;
+ALTER TABLE public.extraction_outputs ALTER COLUMN file_data SET STORAGE EXTERNAL;
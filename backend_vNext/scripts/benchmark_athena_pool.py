@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark pooled read-only ATHENA connections vs a connection per term.
+
+Runs the Stage 5 lookup pattern (exact name match per vocabulary, then a
+LIKE pattern match) for a batch of terms on OMOP_PARALLEL_WORKERS threads,
+once opening a new sqlite3 connection per term (the old Stage 5
+behaviour) and once through AthenaConnectionPool. Reports terms/second.
+
+Without --db a synthetic ATHENA-like database (concept, concept_synonym)
+is generated; pass --db $ATHENA_DB_PATH to measure against the real
+vocabulary.
+
+Usage:
+    cd backend_vNext
+    python scripts/benchmark_athena_pool.py
+    python scripts/benchmark_athena_pool.py --db $ATHENA_DB_PATH --terms 2000
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from eligibility_analyzer.interpretation.athena_connection_pool import AthenaConnectionPool
+from eligibility_analyzer.interpretation.interpretation_pipeline import OMOP_PARALLEL_WORKERS
+
+VOCABULARIES = ["SNOMED", "LOINC", "RxNorm", "ICD10CM", "NCIt"]
+DOMAINS = ["Condition", "Measurement", "Drug", "Procedure", "Observation"]
+WORDS = [
+    "acute", "chronic", "renal", "hepatic", "cardiac", "pulmonary", "neoplasm", "carcinoma",
+    "infection", "failure", "disease", "syndrome", "deficiency", "disorder", "lesion", "injury",
+    "serum", "plasma", "level", "count", "measurement", "tablet", "injection", "oral",
+    "left", "right", "primary", "secondary", "malignant", "benign", "metastatic", "stage",
+]
+
+EXACT_QUERY = """
+    SELECT concept_id, concept_code, concept_name, vocabulary_id,
+           domain_id, concept_class_id, standard_concept
+    FROM concept
+    WHERE LOWER(concept_name) = LOWER(?)
+      AND vocabulary_id = ?
+      AND (standard_concept = 'S' OR vocabulary_id IN ('NCIt', 'CIViC', 'ICD10CM', 'ICD9CM'))
+    LIMIT ?
+"""
+
+PATTERN_QUERY = """
+    SELECT concept_id, concept_code, concept_name, vocabulary_id,
+           domain_id, concept_class_id, standard_concept
+    FROM concept
+    WHERE LOWER(concept_name) LIKE ?
+      AND vocabulary_id = ?
+      AND (standard_concept = 'S' OR vocabulary_id IN ('NCIt', 'CIViC', 'ICD10CM', 'ICD9CM'))
+    ORDER BY LENGTH(concept_name) ASC
+    LIMIT ?
+"""
+
+
+def create_athena_fixture(path: str, concepts: int, seed: int = 7):
+    """Write a synthetic ATHENA-like database."""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE concept (
+            concept_id INTEGER PRIMARY KEY, concept_name TEXT, domain_id TEXT,
+            vocabulary_id TEXT, concept_class_id TEXT, standard_concept TEXT,
+            concept_code TEXT, invalid_reason TEXT
+        );
+        CREATE TABLE concept_synonym (concept_id INTEGER, concept_synonym_name TEXT);
+    """)
+    rows = []
+    for concept_id in range(1, concepts + 1):
+        name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))) + f" {concept_id % 997}"
+        rows.append((
+            concept_id, name, rng.choice(DOMAINS), rng.choice(VOCABULARIES), "Clinical Finding",
+            "S" if rng.random() < 0.7 else None, f"C{concept_id}", None,
+        ))
+    conn.executemany("INSERT INTO concept VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.executemany(
+        "INSERT INTO concept_synonym VALUES (?, ?)",
+        [(row[0], row[1].upper()) for row in rows[::3]],
+    )
+    conn.execute("CREATE INDEX idx_concept_vocab ON concept (vocabulary_id)")
+    conn.commit()
+    conn.close()
+
+
+def sample_terms(db_path: str, count: int, seed: int = 11):
+    """Pick concept names (and fragments of them) to search for."""
+    conn = sqlite3.connect(db_path)
+    names = [row[0] for row in conn.execute(
+        "SELECT concept_name FROM concept WHERE concept_id % 97 = 0 LIMIT 5000"
+    )]
+    conn.close()
+    rng = random.Random(seed)
+    terms = []
+    for _ in range(count):
+        name = rng.choice(names)
+        terms.append(name if rng.random() < 0.5 else " ".join(name.split()[:2]))
+    return terms
+
+
+def search_term(conn: sqlite3.Connection, term: str, limit: int = 5) -> int:
+    """Stage 5 style lookup: exact match per vocabulary, then one pattern search."""
+    found = 0
+    for vocab in VOCABULARIES:
+        found += len(conn.execute(EXACT_QUERY, (term, vocab, limit)).fetchall())
+    if found < limit:
+        found += len(conn.execute(PATTERN_QUERY, (f"%{term.lower()}%", VOCABULARIES[0], limit)).fetchall())
+    return found
+
+
+def run_per_term(db_path: str, terms, workers: int) -> float:
+    def worker(term):
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            return search_term(conn, term)
+        finally:
+            conn.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(worker, terms))
+    return time.perf_counter() - start
+
+
+def run_pooled(pool: AthenaConnectionPool, terms, workers: int) -> float:
+    def worker(term):
+        return search_term(pool.get_connection(), term)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(worker, terms))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pooled vs per-term ATHENA connection benchmark")
+    parser.add_argument("--db", help="ATHENA database (default: synthetic fixture)")
+    parser.add_argument("--concepts", type=int, default=50_000, help="Synthetic fixture size")
+    parser.add_argument("--terms", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=OMOP_PARALLEL_WORKERS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db
+        if not db_path:
+            db_path = str(Path(tmp) / "athena_fixture.db")
+            start = time.perf_counter()
+            create_athena_fixture(db_path, args.concepts)
+            print(f"Fixture: {args.concepts:,} concepts ({time.perf_counter() - start:.1f}s to build)")
+
+        terms = sample_terms(db_path, args.terms)
+        print(f"Workload: {len(terms)} terms on {args.workers} threads\n")
+        print(f"{'Connections':<12}  {'Best':>9}  {'Terms/s':>9}")
+        print("-" * 34)
+
+        per_term = min(run_per_term(db_path, terms, args.workers) for _ in range(args.repeat))
+        print(f"{'per term':<12}  {per_term:>8.3f}s  {len(terms) / per_term:>9,.0f}")
+
+        pool = AthenaConnectionPool(db_path)
+        pooled = min(run_pooled(pool, terms, args.workers) for _ in range(args.repeat))
+        print(f"{'pooled':<12}  {pooled:>8.3f}s  {len(terms) / pooled:>9,.0f}")
+        stats = pool.get_stats()
+        pool.close_all()
+
+        print(f"\nSpeedup: {per_term / pooled:.2f}x "
+              f"({stats['connections_opened']} pooled connections for {stats['checkouts']:,} lookups)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark Set[int] vs bitmap cohorts in FunnelExecutor.
+
+Runs the same synthetic funnel (MockDatabaseAdapter, 4 stages with
+inclusion and exclusion QEBs) with use_bitmap=False and use_bitmap=True
+at several population sizes and reports wall time and the memory held by
+the base cohort.
+
+The set engine is skipped above --max-set-patients (10M patients as a
+Python set needs several GB and minutes per run).
+
+Usage:
+    cd backend_vNext
+    python scripts/benchmark_cohort_engine.py
+    python scripts/benchmark_cohort_engine.py --sizes 10000 1000000 --max-set-patients 10000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from eligibility_analyzer.execution.cohort import cohort_size_bytes
+from eligibility_analyzer.execution.database_adapters import MockDatabaseAdapter
+from eligibility_analyzer.execution.funnel_executor import FunnelExecutor
+from eligibility_analyzer.review.qeb_validation_models import FunnelStageConfig, ValidationSession
+
+
+class BenchmarkValidationService:
+    """Treats every QEB as queryable and reads concept IDs from the QEB dict."""
+
+    def get_effective_queryable_count(self, qeb_id: str, qeb_data: Dict[str, Any], session) -> int:
+        return 1
+
+    def extract_concept_ids_from_qeb(self, qeb_data: Dict[str, Any], session) -> List[int]:
+        return qeb_data["conceptIds"]
+
+
+def build_funnel(stages: int, per_stage: int):
+    """Synthetic session and QEB lookup (deterministic concept IDs)."""
+    qeb_lookup: Dict[str, Dict[str, Any]] = {}
+    funnel_stages = []
+    # The mock seeds each QEB's draw from sum(concept_ids) % 1000; a running
+    # offset keeps those seeds distinct so QEBs filter independently
+    offset = 0
+    for stage in range(1, stages + 1):
+        inclusion, exclusion = [], []
+        for i in range(per_stage):
+            for kind, bucket in (("INC", inclusion), ("EXC", exclusion)):
+                qeb_id = f"QEB_{kind}_{stage}_{i}"
+                concept_base = 100000 + offset
+                offset += 1
+                qeb_lookup[qeb_id] = {
+                    "criterionText": qeb_id,
+                    "sqlQuery": "",
+                    # Inclusions use many concepts (high match rate) so the cohort survives
+                    "conceptIds": list(range(concept_base, concept_base + (30 if kind == "INC" else 1))),
+                }
+                bucket.append(qeb_id)
+        funnel_stages.append(FunnelStageConfig(
+            stage_number=stage,
+            stage_name=f"Stage {stage}",
+            inclusion_qeb_ids=inclusion,
+            exclusion_qeb_ids=exclusion,
+        ))
+
+    session = ValidationSession(
+        session_id="benchmark",
+        protocol_id="benchmark",
+        protocol_name="benchmark",
+        qeb_output_path="",
+        funnel_stages=funnel_stages,
+    )
+    return session, qeb_lookup
+
+
+def run(patients: int, use_bitmap: bool, session, qeb_lookup):
+    adapter = MockDatabaseAdapter(patient_count=patients)
+    executor = FunnelExecutor(adapter, BenchmarkValidationService(), use_bitmap=use_bitmap)
+
+    start = time.perf_counter()
+    base = executor._base_cohort()
+    base_bytes = cohort_size_bytes(base)
+    result = executor.execute_funnel(session, qeb_lookup)
+    elapsed = time.perf_counter() - start
+    return elapsed, base_bytes, result.final_population
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Set vs bitmap cohort funnel benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--stages", type=int, default=4)
+    parser.add_argument("--qebs-per-stage", type=int, default=3, help="Inclusion and exclusion QEBs per stage")
+    parser.add_argument("--max-set-patients", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    session, qeb_lookup = build_funnel(args.stages, args.qebs_per_stage)
+    qeb_count = len(qeb_lookup)
+    print(f"Funnel: {args.stages} stages, {qeb_count} QEBs\n")
+    print(f"{'Patients':>12}  {'Engine':<7}  {'Time':>9}  {'Base cohort':>12}  {'Final':>10}")
+    print("-" * 58)
+
+    for patients in args.sizes:
+        for use_bitmap in (False, True):
+            engine = "bitmap" if use_bitmap else "set"
+            if not use_bitmap and patients > args.max_set_patients:
+                print(f"{patients:>12,}  {engine:<7}  {'skipped':>9}")
+                continue
+            elapsed, base_bytes, final = run(patients, use_bitmap, session, qeb_lookup)
+            print(
+                f"{patients:>12,}  {engine:<7}  {elapsed:>8.3f}s  "
+                f"{base_bytes / 1024 / 1024:>9.1f} MB  {final:>10,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
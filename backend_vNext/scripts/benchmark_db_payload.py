@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Measure bytes transferred from Postgres per endpoint, before and after
+deferred column loading.
+
+For each read path, sums octet_length(column::text) over the columns the
+query loads. With psycopg2's text protocol this is the payload size on the
+wire (BYTEA is sent hex-encoded, JSONB as text). "Before" loads every
+mapped column (the pre-deferral behaviour); "after" loads what the
+endpoint loads now.
+
+Usage:
+    cd backend_vNext
+    python scripts/benchmark_db_payload.py
+    python scripts/benchmark_db_payload.py --samples 20
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import Text, cast, func, inspect, literal
+
+from app.db import (
+    get_session_factory,
+    EligibilityJob,
+    ExtractionOutput,
+    Protocol,
+    SOAJob,
+    SOATableResult,
+)
+from app.routers.protocol import STUDY_SUMMARY_FIELDS
+
+
+def all_columns(model) -> List:
+    """Every mapped column (pre-deferral load)."""
+    return [prop.columns[0] for prop in inspect(model).column_attrs]
+
+
+def eager_columns(model) -> List:
+    """Columns loaded by a plain query now that payloads are deferred."""
+    return [prop.columns[0] for prop in inspect(model).column_attrs if not prop.deferred]
+
+
+def payload_bytes(db, columns, *criteria, limit=None) -> int:
+    """Total text-protocol bytes for the given columns over matching rows."""
+    size = literal(0)
+    for column in columns:
+        size = size + func.coalesce(func.octet_length(cast(column, Text)), 0)
+    query = db.query(size.label("row_bytes")).filter(*criteria)
+    if limit:
+        query = query.limit(limit)
+    return sum(row.row_bytes for row in query.all())
+
+
+def fmt(num_bytes: float) -> str:
+    """Human-readable byte count."""
+    for unit in ("B", "KB", "MB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:,.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:,.1f} GB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-endpoint Postgres payload before/after deferral")
+    parser.add_argument("--samples", type=int, default=10, help="Rows sampled for per-job endpoints")
+    args = parser.parse_args()
+
+    SessionLocal = get_session_factory()
+    db = SessionLocal()
+
+    try:
+        rows = []
+
+        # GET /protocols (list) - projection, with and without USDM
+        list_columns = [
+            Protocol.id, Protocol.filename, Protocol.file_hash, Protocol.file_size,
+            Protocol.extraction_status, Protocol.created_at,
+        ]
+        summary_columns = [Protocol.usdm_json[("study", field)] for field in STUDY_SUMMARY_FIELDS]
+        rows.append((
+            "GET /protocols",
+            payload_bytes(db, all_columns(Protocol)),
+            payload_bytes(db, list_columns + summary_columns),
+        ))
+        rows.append((
+            "GET /protocols?include_usdm=true",
+            payload_bytes(db, all_columns(Protocol)),
+            payload_bytes(db, list_columns + [Protocol.usdm_json]),
+        ))
+
+        # GET /protocols/{id} - one protocol row
+        protocol_ids = [p.id for p in db.query(Protocol.id).limit(args.samples).all()]
+        if protocol_ids:
+            rows.append((
+                f"GET /protocols/{{id}} (x{len(protocol_ids)})",
+                payload_bytes(db, all_columns(Protocol), Protocol.id.in_(protocol_ids)),
+                payload_bytes(db, eager_columns(Protocol), Protocol.id.in_(protocol_ids)),
+            ))
+
+        # GET /soa/jobs/{id} and each SOA SSE wake-up - one SOA job row
+        soa_ids = [j.id for j in db.query(SOAJob.id).order_by(SOAJob.created_at.desc()).limit(args.samples).all()]
+        if soa_ids:
+            rows.append((
+                f"GET /soa/jobs/{{id}} + SSE read (x{len(soa_ids)})",
+                payload_bytes(db, all_columns(SOAJob), SOAJob.id.in_(soa_ids)),
+                payload_bytes(db, eager_columns(SOAJob), SOAJob.id.in_(soa_ids)),
+            ))
+            rows.append((
+                f"GET /soa/jobs/{{id}}/tables?include_usdm=false (x{len(soa_ids)})",
+                payload_bytes(db, all_columns(SOATableResult), SOATableResult.soa_job_id.in_(soa_ids)),
+                payload_bytes(db, eager_columns(SOATableResult), SOATableResult.soa_job_id.in_(soa_ids)),
+            ))
+
+        # GET /eligibility/jobs/{id} and each eligibility SSE wake-up
+        elig_ids = [
+            j.id for j in db.query(EligibilityJob.id).order_by(EligibilityJob.created_at.desc()).limit(args.samples).all()
+        ]
+        if elig_ids:
+            rows.append((
+                f"GET /eligibility/jobs/{{id}} + SSE read (x{len(elig_ids)})",
+                payload_bytes(db, all_columns(EligibilityJob), EligibilityJob.id.in_(elig_ids)),
+                payload_bytes(db, eager_columns(EligibilityJob), EligibilityJob.id.in_(elig_ids)),
+            ))
+
+        # GET /jobs/{id}/outputs (listing) - extraction output rows
+        rows.append((
+            "GET /jobs/{id}/outputs (all rows)",
+            payload_bytes(db, all_columns(ExtractionOutput)),
+            payload_bytes(db, eager_columns(ExtractionOutput)),
+        ))
+
+        name_width = max(len(r[0]) for r in rows)
+        print(f"{'Endpoint':<{name_width}}  {'Before':>12}  {'After':>12}  {'Reduction':>9}")
+        print("-" * (name_width + 41))
+        for name, before, after in rows:
+            reduction = (1 - after / before) if before else 0.0
+            print(f"{name:<{name_width}}  {fmt(before):>12}  {fmt(after):>12}  {reduction:>9.1%}")
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Fake-provider harness for measuring LLM gateway wave speedup.
+
+Runs N simulated modules in one wave (pass 1 + pass 2 per module) through
+GeminiFileService.generate_content with the Gemini SDK replaced by a fake
+provider that blocks for a fixed latency. The same wave is timed with the
+old inline behaviour (blocking call inside the coroutine) and with the
+gateway, so the wall-clock difference isolates event-loop blocking.
+
+No API key or network access is needed.
+
+Usage:
+    cd backend_vNext
+    python scripts/benchmark_llm_gateway.py
+    python scripts/benchmark_llm_gateway.py --modules 16 --latency 0.5
+    python scripts/benchmark_llm_gateway.py --duplicate-prompts   # exercise coalescing
+"""
+
+import argparse
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.services import gemini_file_service
+from app.services.gemini_file_service import GeminiFileService
+from app.services.llm_gateway import LLMGateway
+
+
+class FakeGenAI:
+    """Stand-in for the google.generativeai module."""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def configure(self, **kwargs):
+        pass
+
+    def get_file(self, name):
+        return SimpleNamespace(name=name, uri=f"https://fake/files/{name}")
+
+    def GenerationConfig(self, **kwargs):
+        return SimpleNamespace(**kwargs)
+
+
+class FakeModel:
+    """Fake GenerativeModel that blocks like a real SDK call."""
+
+    def __init__(self, genai: FakeGenAI, latency: float):
+        self.genai = genai
+        self.latency = latency
+
+    def generate_content(self, contents, generation_config=None):
+        with self.genai._lock:
+            self.genai.calls += 1
+        time.sleep(self.latency)
+        part = SimpleNamespace(text='{"ok": true}')
+        return SimpleNamespace(
+            candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))]
+        )
+
+
+async def _inline_generate(service: GeminiFileService, uri: str, prompt: str) -> str:
+    """Previous behaviour: blocking SDK call executed on the event loop."""
+    response = service._generate_content_sync(uri, prompt, settings.gemini_max_output_tokens)
+    return response.candidates[0].content.parts[0].text
+
+
+async def run_wave(
+    service: GeminiFileService,
+    modules: int,
+    duplicate_prompts: bool,
+    use_gateway: bool,
+) -> float:
+    """Run one wave of fake modules and return wall-clock seconds."""
+    semaphore = asyncio.Semaphore(settings.max_parallel_agents)
+    uri = "https://fake/files/protocol-pdf"
+
+    async def extract(module_idx: int):
+        async with semaphore:
+            for pass_name in ("pass1", "pass2"):
+                key = 0 if duplicate_prompts else module_idx
+                prompt = f"module-{key}-{pass_name}"
+                if use_gateway:
+                    await service.generate_content(uri, prompt)
+                else:
+                    await _inline_generate(service, uri, prompt)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(extract(i) for i in range(modules)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the LLM gateway with a fake provider")
+    parser.add_argument("--modules", type=int, default=8, help="Modules in the wave")
+    parser.add_argument("--latency", type=float, default=0.25, help="Fake call latency (seconds)")
+    parser.add_argument(
+        "--duplicate-prompts",
+        action="store_true",
+        help="Give every module the same prompt to exercise request coalescing",
+    )
+    args = parser.parse_args()
+
+    fake_genai = FakeGenAI()
+    gemini_file_service.genai = fake_genai
+
+    service = GeminiFileService()
+    service._model = FakeModel(fake_genai, args.latency)
+    service.gateway = LLMGateway(limits={"gemini": settings.gemini_max_concurrency})
+
+    print(
+        f"Wave: {args.modules} modules x 2 passes, latency {args.latency}s, "
+        f"max_parallel_agents={settings.max_parallel_agents}, "
+        f"gemini_max_concurrency={settings.gemini_max_concurrency}"
+    )
+
+    fake_genai.calls = 0
+    inline = asyncio.run(run_wave(service, args.modules, args.duplicate_prompts, False))
+    inline_calls = fake_genai.calls
+
+    fake_genai.calls = 0
+    gateway = asyncio.run(run_wave(service, args.modules, args.duplicate_prompts, True))
+    gateway_calls = fake_genai.calls
+
+    print(f"  inline (blocking):  {inline:7.2f}s  provider calls={inline_calls}")
+    print(f"  gateway:            {gateway:7.2f}s  provider calls={gateway_calls}")
+    print(f"  speedup:            {inline / gateway:7.2f}x")
+    print(f"  gateway stats:      {service.gateway.get_stats()}")
+
+    service.gateway.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark set-based stage SQL vs per-QEB queries in OMOPDatabaseAdapter.
+
+Builds a synthetic OMOP CDM fixture in SQLite (person, concept,
+concept_ancestor, condition_occurrence, measurement, drug_exposure), then
+runs the same funnel with set_based=True (one statement per stage, counts
+only) and set_based=False (one query per QEB, patient IDs fetched and
+intersected in Python). Reports wall time and checks both give the same
+funnel.
+
+Usage:
+    cd backend_vNext
+    python scripts/benchmark_omop_engine.py
+    python scripts/benchmark_omop_engine.py --persons 200000 --db /tmp/omop_bench.db
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from eligibility_analyzer.execution.database_adapters import OMOPDatabaseAdapter
+from eligibility_analyzer.execution.funnel_executor import FunnelExecutor
+from eligibility_analyzer.execution.omop_fixture import create_omop_fixture
+from eligibility_analyzer.review.qeb_validation_models import FunnelStageConfig, ValidationSession
+
+from benchmark_cohort_engine import BenchmarkValidationService
+
+
+def build_funnel(roots, stages: int, per_stage: int):
+    """Funnel whose inclusions cover many roots and exclusions one root each."""
+    qeb_lookup = {}
+    funnel_stages = []
+    for stage in range(1, stages + 1):
+        inclusion, exclusion = [], []
+        for i in range(per_stage):
+            offset = (stage * per_stage + i) % len(roots)
+            inc_id, exc_id = f"QEB_INC_{stage}_{i}", f"QEB_EXC_{stage}_{i}"
+            qeb_lookup[inc_id] = {
+                "criterionText": inc_id,
+                "conceptIds": [roots[(offset + k) % len(roots)] for k in range(len(roots) // 2)],
+            }
+            qeb_lookup[exc_id] = {
+                "criterionText": exc_id,
+                "conceptIds": [roots[(offset + len(roots) // 2) % len(roots)]],
+            }
+            inclusion.append(inc_id)
+            exclusion.append(exc_id)
+        funnel_stages.append(FunnelStageConfig(
+            stage_number=stage,
+            stage_name=f"Stage {stage}",
+            inclusion_qeb_ids=inclusion,
+            exclusion_qeb_ids=exclusion,
+        ))
+
+    session = ValidationSession(
+        session_id="benchmark",
+        protocol_id="benchmark",
+        protocol_name="benchmark",
+        qeb_output_path="",
+        funnel_stages=funnel_stages,
+    )
+    return session, qeb_lookup
+
+
+def run(db_path: str, set_based: bool, session, qeb_lookup):
+    adapter = OMOPDatabaseAdapter(f"sqlite:///{db_path}", schema=None, set_based=set_based)
+    executor = FunnelExecutor(adapter, BenchmarkValidationService())
+    start = time.perf_counter()
+    result = executor.execute_funnel(session, qeb_lookup)
+    elapsed = time.perf_counter() - start
+    adapter.close()
+    counts = [(s.patients_entering, s.patients_exiting) for s in result.stage_results]
+    return elapsed, counts, result.final_population
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Set-based vs per-QEB OMOP funnel benchmark")
+    parser.add_argument("--persons", type=int, default=100_000)
+    parser.add_argument("--stages", type=int, default=4)
+    parser.add_argument("--qebs-per-stage", type=int, default=3, help="Inclusion and exclusion QEBs per stage")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--db", help="Fixture path (default: temporary file)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or str(Path(tmp) / "omop_fixture.db")
+        start = time.perf_counter()
+        conn, roots = create_omop_fixture(db_path, person_count=args.persons)
+        conn.close()
+        print(f"Fixture: {args.persons:,} persons, {len(roots)} root concepts "
+              f"({time.perf_counter() - start:.1f}s to build)")
+
+        session, qeb_lookup = build_funnel(roots, args.stages, args.qebs_per_stage)
+        print(f"Funnel: {args.stages} stages, {len(qeb_lookup)} QEBs\n")
+        print(f"{'Engine':<10}  {'Best':>9}  {'Final':>10}")
+        print("-" * 33)
+
+        results = {}
+        for set_based in (False, True):
+            engine = "set-based" if set_based else "per-QEB"
+            timings = []
+            for _ in range(args.repeat):
+                elapsed, counts, final = run(db_path, set_based, session, qeb_lookup)
+                timings.append(elapsed)
+            results[engine] = counts
+            print(f"{engine:<10}  {min(timings):>8.3f}s  {final:>10,}")
+
+        if results["set-based"] != results["per-QEB"]:
+            print("\nWARNING: engines disagree on stage counts")
+            sys.exit(1)
+        print("\nStage counts identical across engines")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark QualityChecker.post_process and evaluate on a synthetic module output.
+
+Builds a study-metadata-like extraction output (Code objects, explicit and
+derived provenance, enum fields, ID arrays, sex.allowed codes, long
+snippets) with --objects top-level entries, then times the post-process +
+evaluate sequence that runs after every pass and retry of every module.
+copy.deepcopy of the same output is timed for reference.
+
+Usage:
+    cd backend_vNext
+    python scripts/benchmark_quality_checker.py
+    python scripts/benchmark_quality_checker.py --objects 2000 --repeat 10
+"""
+
+import argparse
+import copy
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils.quality_checker import QualityChecker
+
+PHASES = [("C15600", "PHASE I TRIAL"), ("C15601", "PHASE II TRIAL"), ("C99999", "PHASE III TRIAL")]
+
+
+def make_provenance(rng: random.Random) -> Dict[str, Any]:
+    if rng.random() < 0.2:
+        return {
+            "kind": "derived",
+            "derived": {"reasoning": "Inferred from the schedule of assessments " * 2, "confidence": "high"},
+        }
+    words = rng.randint(8, 120)
+    return {
+        "page_number": rng.randint(1, 200),
+        "section_number": f"{rng.randint(1, 12)}.{rng.randint(1, 9)}",
+        "text_snippet": " ".join(rng.choice(["The", "study", "drug", "is", "given", "daily."]) for _ in range(words)),
+    }
+
+
+def make_module_output(objects: int, seed: int = 7) -> Dict[str, Any]:
+    """Synthetic extraction output with roughly 40 values per object."""
+    rng = random.Random(seed)
+    code, decode = rng.choice(PHASES)
+    items = []
+    for i in range(objects):
+        items.append({
+            "id": f"OBJ-{i}",
+            "name": f"Object {i}",
+            "description": "Participants receive the study drug once daily",
+            "approval_status": rng.choice(["Approved", "approved", "Pending"]),
+            "device_type": rng.choice(["tablet", "provisioned_tablet"]),
+            "startDate": rng.choice(["2024-01-15", "15 Jan 2024"]),
+            "responsibilities": rng.choice(["Review safety data", ["Review", "Report"]]),
+            "studyPhase": {"code": code, "decode": decode, "provenance": make_provenance(rng)},
+            "route": {"code": "C38288", "decode": "ORAL", "codeSystem": "", "provenance": make_provenance(rng)},
+            "other_personnel": [
+                {"role": "Coordinator", "name": f"Person {j}", "provenance": make_provenance(rng)}
+                for j in range(rng.randint(0, 3))
+            ],
+            "regions": ["North America", "Europe"],
+            "regionsProvenance": make_provenance(rng),
+            "provenance": make_provenance(rng),
+        })
+    return {
+        "studyPhase": {"code": code, "decode": decode, "provenance": make_provenance(rng)},
+        "studyPopulation": {
+            "sex": {
+                "allowed": [
+                    {"code": "C20197", "decode": "Male", "codeSystem": "x", "instanceType": "Code"},
+                    {"code": "C16576", "decode": "Female", "codeSystem": "x", "instanceType": "Code"},
+                ],
+            },
+            "provenance": make_provenance(rng),
+        },
+        "objects": items,
+    }
+
+
+def time_best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QualityChecker post-process / evaluate benchmark")
+    parser.add_argument("--objects", type=int, default=500, help="Top-level objects in the synthetic output")
+    parser.add_argument("--module", default="study_metadata", help="Module ID for schema lookups")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = make_module_output(args.objects)
+    checker = QualityChecker()
+    fixed = checker.post_process(data, args.module)
+
+    deepcopy_time = time_best(lambda: copy.deepcopy(data), args.repeat)
+    post_process_time = time_best(lambda: checker.post_process(data, args.module), args.repeat)
+    evaluate_time = time_best(lambda: checker.evaluate(fixed, args.module), args.repeat)
+
+    print(f"Synthetic output: {args.objects:,} objects\n")
+    print(f"{'Step':<16}  {'Best':>9}")
+    print("-" * 27)
+    print(f"{'deepcopy':<16}  {deepcopy_time:>8.3f}s")
+    print(f"{'post_process':<16}  {post_process_time:>8.3f}s")
+    print(f"{'evaluate':<16}  {evaluate_time:>8.3f}s")
+    print(f"\nQuality: {checker.evaluate(fixed, args.module)}")
+
+
+if __name__ == "__main__":
+    main()
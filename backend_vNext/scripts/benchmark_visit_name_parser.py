@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark VisitNameParser over a column of visit names.
+
+Collects visit / encounter names from the JSON outputs under protocols/
+(encounter "name", "visitName", "encounterName" and "originalName"
+fields). Protocols with only eligibility outputs contribute none; when no
+names are found, a built-in set of visit names covering every pattern type
+is used. The names are repeated to --size, the way a visit header row
+recurs across SOA tables and pages, and parsed:
+- one parse() call per name
+- one parse_all() call over the whole column (repeated names reuse the
+  pattern matched for their first occurrence)
+
+Usage:
+    cd backend_vNext
+    python scripts/benchmark_visit_name_parser.py
+    python scripts/benchmark_visit_name_parser.py --protocols-dir protocols --size 50000
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from soa_analyzer.utils.visit_name_parser import VisitNameParser
+
+NAME_KEYS = ("visitName", "encounterName", "originalName")
+
+FALLBACK_NAMES = [
+    "SCR", "Screening", "Baseline", "Randomization", "Cycle 1 Day −2", "Cycle 1 Day 1",
+    "Cycle 1 Day 8", "Cycle 1 Day 15", "Cycle 2 – 6 Day 1 *", "Cycles 7-12 Day 1", "C1D1",
+    "C2D8", "C3D15", "Day 1", "Day 8", "Day 15", "D28", "Day -7", "Week 4", "Week 12 ± 3 days",
+    "Wk 8", "Final Visit", "EOT", "End of Study", "30-day FU Visit", "Week 4 Follow-up",
+    "3-month Follow-up", "Safety Follow-up", "Follow-up", "Long-term Follow-up",
+    "Maintenance Therapy", "Post-Treatment Visits", "Survival Period", "Unscheduled",
+    "Days", "Visit Schedule", "-2", "6 - 19", "Procedure", "Visit 3", "Day 1 (predose)",
+]
+
+
+def collect_visit_names(protocols_dir: Path) -> List[str]:
+    """Visit names from every JSON output under protocols_dir."""
+    names: List[str] = []
+
+    def walk(node: Any, in_encounters: bool = False) -> None:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, str) and (key in NAME_KEYS or (in_encounters and key == "name")):
+                    names.append(value)
+                else:
+                    walk(value, key in ("encounters", "visits"))
+        elif isinstance(node, list):
+            for item in node:
+                walk(item, in_encounters)
+
+    for path in sorted(protocols_dir.rglob("*.json")):
+        try:
+            with open(path, encoding="utf-8") as f:
+                walk(json.load(f))
+        except (OSError, ValueError):
+            continue
+    return names
+
+
+def time_best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VisitNameParser benchmark")
+    parser.add_argument("--protocols-dir", default=str(Path(__file__).parent.parent / "protocols"))
+    parser.add_argument("--size", type=int, default=20_000, help="Names in the benchmark column")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    names = collect_visit_names(Path(args.protocols_dir))
+    source = args.protocols_dir
+    if not names:
+        names = FALLBACK_NAMES
+        source = "built-in visit names (no visit names found under protocols dir)"
+
+    rng = random.Random(13)
+    column = [rng.choice(names) for _ in range(args.size)]
+    print(f"Source: {source}")
+    print(f"Column: {len(column):,} names ({len(set(column))} distinct)\n")
+
+    visit_parser = VisitNameParser()
+    per_name = time_best(lambda: [visit_parser.parse(name) for name in column], args.repeat)
+    column_parse = time_best(lambda: visit_parser.parse_all(column), args.repeat)
+
+    print(f"{'Mode':<12}  {'Best':>9}  {'Names/s':>11}")
+    print("-" * 36)
+    print(f"{'parse()':<12}  {per_name:>8.3f}s  {len(column) / per_name:>11,.0f}")
+    print(f"{'parse_all()':<12}  {column_parse:>8.3f}s  {len(column) / column_parse:>11,.0f}")
+
+    types = Counter(visit_parser.parse(name).pattern_type for name in set(column))
+    _, protocol_type = visit_parser.parse_all(column)
+    print(f"\nDistinct names by pattern: {dict(types)}")
+    print(f"Detected protocol type: {protocol_type.value}")
+
+
+if __name__ == "__main__":
+    main()
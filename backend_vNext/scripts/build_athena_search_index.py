@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed ATHENA search index used by TerminologyMapper.
+
+Writes <athena stem>_search_index.db next to the ATHENA database (or
+--output). Run it once after installing or refreshing the vocabulary;
+the mapper falls back to direct ATHENA queries while the index is missing
+or stale.
+
+Usage:
+    cd backend_vNext
+    python scripts/build_athena_search_index.py
+    python scripts/build_athena_search_index.py --db $ATHENA_DB_PATH --force
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from soa_analyzer.terminology.athena_search_index import build_search_index
+from soa_analyzer.terminology.terminology_mapper import DEFAULT_ATHENA_DB
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the ATHENA search index for terminology mapping")
+    parser.add_argument("--db", default=str(DEFAULT_ATHENA_DB), help="ATHENA database")
+    parser.add_argument("--output", help="Index database (default: <db stem>_search_index.db)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the index is current")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    index_path = build_search_index(
+        Path(args.db),
+        Path(args.output) if args.output else None,
+        force=args.force,
+    )
+    print(f"Search index: {index_path} ({index_path.stat().st_size / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
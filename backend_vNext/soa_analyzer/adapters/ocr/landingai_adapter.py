@@ -11,6 +11,9 @@ import io
 class LandingAIOCRAdapter:
     """Adapter for LandingAI Table Extraction API"""
 
+    # Bump when request parameters or output handling change (invalidates cached page OCR)
+    ADAPTER_VERSION = "1"
+
     def __init__(self, api_key: Optional[str] = None, endpoint: Optional[str] = None):
         self.api_key = api_key or os.getenv("LANDINGAI_API_KEY")
         if not self.api_key:
@@ -22,6 +22,7 @@ import json
 import logging
 import os
 import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -37,6 +38,26 @@ logger = logging.getLogger(__name__)
 CONFIG_DIR = Path(__file__).parent.parent / "config"
 BACKEND_CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
 PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+NCI_CONCEPTS_PATH = BACKEND_CONFIG_DIR / "cdisc_concepts.json"
+
+_PARENTHETICAL_RE = re.compile(r'\s*\([^)]*\)\s*')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize an activity or concept name for matching."""
+    if not name:
+        return ""
+    # Lowercase
+    normalized = name.lower().strip()
+    # Remove parenthetical notes
+    normalized = _PARENTHETICAL_RE.sub(' ', normalized)
+    # Remove special characters
+    normalized = _SPECIAL_CHARS_RE.sub(' ', normalized)
+    # Collapse whitespace
+    normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
+    return normalized
 
 
 @dataclass
@@ -58,6 +79,142 @@ class CDISCCode:
         }
 
 
+class NCIConceptIndex:
+    """
+    Lookup index over NCI EVS concepts (cdisc_concepts.json).
+
+    Built once from the concept map and shared process-wide (see
+    get_nci_concept_index), so activity lookups no longer normalize and
+    compare every concept name and synonym. Results are the same as a
+    scan of the concepts in file order:
+    - nci_exact / nci_synonym: first concept whose normalized name (or a
+      synonym) equals the activity name
+    - nci_fuzzy: concept name containing, or contained in, the activity
+      name, scored len(activity) / len(concept) (> 0.5, earliest concept
+      wins ties)
+
+    Partial matches are plain substring tests, so candidates come from a
+    character trigram index rather than whole words.
+    """
+
+    def __init__(self, concepts: Dict[str, Any]):
+        """
+        Build the index.
+
+        Args:
+            concepts: NCI concept map {code: {"name": ..., "synonyms": [...]}}
+        """
+        # (code, name, normalized name) in file order
+        self._entries: List[Tuple[str, str, str]] = []
+        # Normalized name / synonym -> (entry rank, match type) of its first occurrence
+        self._exact: Dict[str, Tuple[int, str]] = {}
+        # Normalized name -> first entry rank, and the name lengths present
+        self._first_by_name: Dict[str, int] = {}
+        self._name_lengths: List[int] = []
+        # Trigram -> entry ranks whose normalized name contains it
+        self._trigrams: Dict[str, List[int]] = {}
+        # Name length -> entry ranks, for activity names too short for trigrams
+        self._by_length: Dict[int, List[int]] = {}
+
+        for concept_code, concept_data in concepts.items():
+            if not isinstance(concept_data, dict):
+                continue
+            rank = len(self._entries)
+            concept_name = concept_data.get("name", "")
+            concept_normalized = _normalize_name(concept_name)
+            self._entries.append((concept_code, concept_name, concept_normalized))
+
+            self._exact.setdefault(concept_normalized, (rank, "nci_exact"))
+            for synonym in concept_data.get("synonyms", []):
+                self._exact.setdefault(_normalize_name(synonym), (rank, "nci_synonym"))
+
+            self._first_by_name.setdefault(concept_normalized, rank)
+            self._by_length.setdefault(len(concept_normalized), []).append(rank)
+            for trigram in {concept_normalized[i:i + 3] for i in range(len(concept_normalized) - 2)}:
+                self._trigrams.setdefault(trigram, []).append(rank)
+
+        self._name_lengths = sorted(self._by_length)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, normalized: str) -> Optional[CDISCCode]:
+        """
+        Find the best NCI concept for a normalized activity name.
+
+        Args:
+            normalized: Activity name passed through _normalize_name
+
+        Returns:
+            CDISCCode (nci_exact, nci_synonym or nci_fuzzy), or None
+        """
+        exact = self._exact.get(normalized)
+        if exact is not None:
+            rank, match_type = exact
+            concept_code, concept_name, _ = self._entries[rank]
+            return CDISCCode(
+                code=concept_code,
+                decode=concept_name,
+                match_type=match_type,
+                match_score=0.95 if match_type == "nci_exact" else 0.90,
+            )
+
+        best_rank = None
+        best_score = 0.0
+        for rank in self._partial_candidates(normalized):
+            concept_normalized = self._entries[rank][2]
+            if normalized in concept_normalized or concept_normalized in normalized:
+                score = len(normalized) / max(len(concept_normalized), 1)
+                if score > 0.5 and (score > best_score or (score == best_score and rank < best_rank)):
+                    best_rank, best_score = rank, score
+
+        if best_rank is None:
+            return None
+        concept_code, concept_name, _ = self._entries[best_rank]
+        return CDISCCode(
+            code=concept_code,
+            decode=concept_name,
+            match_type="nci_fuzzy",
+            match_score=0.80 * best_score,
+        )
+
+    def _partial_candidates(self, normalized: str) -> List[int]:
+        """Entry ranks that may contain, or be contained in, the activity name with score > 0.5."""
+        length = len(normalized)
+        candidates: List[int] = []
+
+        # Concept names inside the activity name: shorter names score higher,
+        # so stop at the first length that cannot beat a hit already found
+        best_score = 0.0
+        for name_length in self._name_lengths:
+            if name_length >= length:
+                break
+            score = length / max(name_length, 1)
+            if score < best_score:
+                break
+            for start in range(length - name_length + 1):
+                rank = self._first_by_name.get(normalized[start:start + name_length])
+                if rank is not None:
+                    candidates.append(rank)
+                    best_score = score
+
+        # Activity name inside longer concept names (score > 0.5 caps their length)
+        if length >= 3:
+            postings = min(
+                (self._trigrams.get(normalized[i:i + 3], []) for i in range(length - 2)),
+                key=len,
+            )
+            candidates.extend(
+                rank for rank in postings
+                if length < len(self._entries[rank][2]) < 2 * length
+            )
+        elif length:
+            for name_length in range(length + 1, 2 * length):
+                candidates.extend(self._by_length.get(name_length, []))
+
+        return candidates
+
+
 class CDISCCodeEnricher:
     """
     Multi-tier CDISC code enrichment service.
@@ -82,7 +239,7 @@ class CDISCCodeEnricher:
         self._activity_examples: Dict[str, Dict] = {}
         self._domain_codes: Dict[str, str] = {}
         self._domain_keywords: Dict[str, List[str]] = {}
-        self._nci_concepts: Optional[Dict[str, Dict]] = None  # Lazy loaded
+        self._nci_index: Optional[NCIConceptIndex] = None  # Lazy loaded, shared
         self._synonym_index: Dict[str, str] = {}  # Normalized name → code
 
         # Load configs
@@ -114,13 +271,15 @@ class CDISCCodeEnricher:
                 if not isinstance(mapping, dict):
                     continue
 
+                normalized = self._normalize_name(activity_name)
                 self._activity_examples[activity_name.lower()] = {
                     "domain": mapping.get("domain"),
                     "code": mapping.get("code"),
                     "decode": mapping.get("decode"),
+                    "normalized": normalized,
                 }
                 # Index by normalized name
-                self._synonym_index[self._normalize_name(activity_name)] = mapping.get("code", "")
+                self._synonym_index[normalized] = mapping.get("code", "")
 
             logger.info(
                 f"Loaded {len(self._activity_examples)} activity examples, "
@@ -158,24 +317,9 @@ class CDISCCodeEnricher:
             logger.warning(f"Failed to load cdisc_codelists.json: {e}")
 
     def _load_nci_concepts(self) -> None:
-        """Lazy load NCI EVS concepts (large file)."""
-        if self._nci_concepts is not None:
-            return
-
-        concepts_path = BACKEND_CONFIG_DIR / "cdisc_concepts.json"
-        if not concepts_path.exists():
-            logger.warning("cdisc_concepts.json not found")
-            self._nci_concepts = {}
-            return
-
-        try:
-            logger.info("Loading NCI EVS concepts (this may take a moment)...")
-            with open(concepts_path) as f:
-                self._nci_concepts = json.load(f)
-            logger.info(f"Loaded {len(self._nci_concepts)} NCI concepts")
-        except Exception as e:
-            logger.error(f"Failed to load NCI concepts: {e}")
-            self._nci_concepts = {}
+        """Lazy load the shared NCI EVS concept index (large file)."""
+        if self._nci_index is None:
+            self._nci_index = get_nci_concept_index()
 
     def _init_gemini(self) -> None:
         """Initialize Gemini model for LLM fallback."""
@@ -193,17 +337,7 @@ class CDISCCodeEnricher:
 
     def _normalize_name(self, name: str) -> str:
         """Normalize activity name for matching."""
-        if not name:
-            return ""
-        # Lowercase
-        normalized = name.lower().strip()
-        # Remove parenthetical notes
-        normalized = re.sub(r'\s*\([^)]*\)\s*', ' ', normalized)
-        # Remove special characters
-        normalized = re.sub(r'[^\w\s]', ' ', normalized)
-        # Collapse whitespace
-        normalized = re.sub(r'\s+', ' ', normalized).strip()
-        return normalized
+        return _normalize_name(name)
 
     def _lookup_from_config(
         self,
@@ -233,7 +367,7 @@ class CDISCCodeEnricher:
 
         # 2. Normalized match in activity examples
         for example_name, example in self._activity_examples.items():
-            if self._normalize_name(example_name) == normalized:
+            if example["normalized"] == normalized:
                 if example.get("code"):
                     return CDISCCode(
                         code=example["code"],
@@ -244,7 +378,7 @@ class CDISCCodeEnricher:
 
         # 3. Partial match (activity name contains example or vice versa)
         for example_name, example in self._activity_examples.items():
-            example_normalized = self._normalize_name(example_name)
+            example_normalized = example["normalized"]
             if example_normalized in normalized or normalized in example_normalized:
                 if example.get("code"):
                     return CDISCCode(
@@ -323,58 +457,14 @@ class CDISCCodeEnricher:
         """
         Tier 2: Search NCI EVS concepts for matching codes.
 
-        Searches the cdisc_concepts.json file for relevant concepts.
+        Searches the cdisc_concepts.json concepts through the shared NCIConceptIndex.
         """
         self._load_nci_concepts()
 
-        if not self._nci_concepts:
+        if not self._nci_index:
             return None
 
-        normalized = self._normalize_name(activity_name)
-        best_match = None
-        best_score = 0.0
-
-        # Search through concepts
-        for concept_code, concept_data in self._nci_concepts.items():
-            if not isinstance(concept_data, dict):
-                continue
-
-            concept_name = concept_data.get("name", "")
-            concept_normalized = self._normalize_name(concept_name)
-
-            # Exact match
-            if concept_normalized == normalized:
-                return CDISCCode(
-                    code=concept_code,
-                    decode=concept_name,
-                    match_type="nci_exact",
-                    match_score=0.95,
-                )
-
-            # Partial match
-            if normalized in concept_normalized or concept_normalized in normalized:
-                score = len(normalized) / max(len(concept_normalized), 1)
-                if score > best_score and score > 0.5:
-                    best_score = score
-                    best_match = CDISCCode(
-                        code=concept_code,
-                        decode=concept_name,
-                        match_type="nci_fuzzy",
-                        match_score=0.80 * score,
-                    )
-
-            # Check synonyms
-            for synonym in concept_data.get("synonyms", []):
-                syn_normalized = self._normalize_name(synonym)
-                if syn_normalized == normalized:
-                    return CDISCCode(
-                        code=concept_code,
-                        decode=concept_name,
-                        match_type="nci_synonym",
-                        match_score=0.90,
-                    )
-
-        return best_match
+        return self._nci_index.search(self._normalize_name(activity_name))
 
     def _infer_with_llm(
         self,
@@ -562,6 +652,44 @@ JSON response:"""
         return results
 
 
+# Shared NCI concept index (built on first NCI search)
+_nci_index_instance: Optional[NCIConceptIndex] = None
+_nci_index_lock = threading.Lock()
+
+
+def get_nci_concept_index() -> NCIConceptIndex:
+    """Get the process-wide NCI concept index, loading cdisc_concepts.json once."""
+    global _nci_index_instance
+    if _nci_index_instance is None:
+        with _nci_index_lock:
+            if _nci_index_instance is None:
+                _nci_index_instance = _build_nci_concept_index(NCI_CONCEPTS_PATH)
+    return _nci_index_instance
+
+
+def reset_nci_concept_index():
+    """Reset the shared NCI concept index (useful for testing)."""
+    global _nci_index_instance
+    _nci_index_instance = None
+
+
+def _build_nci_concept_index(concepts_path: Path) -> NCIConceptIndex:
+    if not concepts_path.exists():
+        logger.warning("cdisc_concepts.json not found")
+        return NCIConceptIndex({})
+
+    try:
+        logger.info("Loading NCI EVS concepts (this may take a moment)...")
+        with open(concepts_path) as f:
+            concepts = json.load(f)
+        index = NCIConceptIndex(concepts)
+        logger.info(f"Loaded {len(concepts)} NCI concepts ({len(index)} indexed)")
+        return index
+    except Exception as e:
+        logger.error(f"Failed to load NCI concepts: {e}")
+        return NCIConceptIndex({})
+
+
 def enrich_stage1_with_cdisc_codes(
     stage1_result: Dict[str, Any],
     use_llm_fallback: bool = True,
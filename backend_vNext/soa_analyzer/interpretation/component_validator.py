@@ -28,7 +28,6 @@ Usage:
     # result.rejected_components = [{"name": "per Table 2", ...}]
 """
 
-import asyncio
 import json
 import logging
 import os
@@ -37,6 +36,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from ..llm_client_registry import get_llm_client_registry
+
 logger = logging.getLogger(__name__)
 
 # Cache directory
@@ -153,6 +154,7 @@ class ComponentValidator:
         # In-memory cache
         self._cache: Dict[str, ValidatedComponent] = {}
         self._cache_loaded = False
+        self._cache_view = None  # Scope of the shared LLM response cache
 
         # LLM clients (lazy loaded)
         self._llm_client = None
@@ -166,35 +168,43 @@ class ComponentValidator:
         if self.use_cache:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+    def _get_cache_view(self):
+        """Get this validator's scope of the shared LLM response cache."""
+        if self._cache_view is None:
+            from app.services.llm_response_cache import get_cache_view
+            self._cache_view = get_cache_view(
+                "component_validation",
+                model=self.model,
+                cache_dir=None if self.cache_dir == CACHE_DIR else self.cache_dir,
+            )
+        return self._cache_view
+
     def _load_cache(self) -> None:
-        """Load cache from disk."""
+        """Load cache from the shared LLM response cache."""
         if self._cache_loaded:
             return
 
-        cache_file = self.cache_dir / "component_validation_cache.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                    for key, comp_data in data.items():
-                        self._cache[key] = ValidatedComponent(**comp_data)
-                logger.info(f"Loaded {len(self._cache)} cached component validations")
-            except Exception as e:
-                logger.warning(f"Failed to load component validation cache: {e}")
+        try:
+            data = self._get_cache_view().load(
+                legacy_file=self.cache_dir / "component_validation_cache.json"
+            )
+            for key, comp_data in data.items():
+                self._cache[key] = ValidatedComponent(**comp_data)
+            logger.info(f"Loaded {len(self._cache)} cached component validations")
+        except Exception as e:
+            logger.warning(f"Failed to load component validation cache: {e}")
 
         self._cache_loaded = True
 
     def _save_cache(self) -> None:
-        """Save cache to disk."""
+        """Save new and changed validations to the shared LLM response cache."""
         if not self.use_cache:
             return
 
-        cache_file = self.cache_dir / "component_validation_cache.json"
         try:
             data = {key: comp.to_dict() for key, comp in self._cache.items()}
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Saved {len(self._cache)} component validations to cache")
+            written = self._get_cache_view().save(data)
+            logger.debug(f"Saved {written} of {len(self._cache)} component validations to cache")
         except Exception as e:
             logger.warning(f"Failed to save component validation cache: {e}")
 
@@ -230,55 +240,32 @@ Return JSON format:
 {{"validated_components": [...], "deduplication_groups": []}}"""
 
     def _get_llm_client(self):
-        """Lazy load Gemini client."""
+        """Get the shared Gemini model from the client registry."""
         if self._llm_client is None:
             try:
-                import google.generativeai as genai
                 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
-                api_key = os.getenv("GEMINI_API_KEY")
-                if api_key:
-                    genai.configure(api_key=api_key)
-
-                    # Disable safety filters for clinical terminology
-                    safety_settings = {
-                        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-                    }
-
-                    self._llm_client = genai.GenerativeModel(
-                        self.model,
-                        safety_settings=safety_settings
-                    )
-                    logger.info(f"Initialized Gemini client: {self.model}")
+                # Disable safety filters for clinical terminology
+                safety_settings = {
+                    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+                }
+
+                self._llm_client = get_llm_client_registry().gemini_model(
+                    self.model,
+                    safety_settings=safety_settings
+                )
             except Exception as e:
                 logger.warning(f"Failed to initialize Gemini client: {e}")
         return self._llm_client
 
     def _get_azure_client(self):
-        """Lazy load Azure OpenAI client (fallback)."""
+        """Get the shared Azure OpenAI client (fallback)."""
         if self._azure_client is None:
-            try:
-                from openai import AzureOpenAI
-
-                api_key = os.getenv("AZURE_OPENAI_API_KEY")
-                endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-                deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o-mini")
-                api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-10-01-preview")
-
-                if api_key and endpoint:
-                    self._azure_client = AzureOpenAI(
-                        api_key=api_key,
-                        api_version=api_version,
-                        azure_endpoint=endpoint,
-                        timeout=120.0
-                    )
-                    self._azure_deployment = deployment
-                    logger.info(f"Initialized Azure OpenAI fallback: {deployment}")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Azure OpenAI client: {e}")
+            self._azure_client = get_llm_client_registry().azure_client(timeout=120.0)
+            self._azure_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o-mini")
         return self._azure_client
 
     def _normalize_name(self, name: str) -> str:
@@ -306,8 +293,10 @@ Return JSON format:
         for candidate in candidates:
             name = candidate.get("name", "")
             key = self._normalize_name(name)
+            hit = key in self._cache
+            self._get_cache_view().record_lookup(key, hit)
 
-            if key in self._cache:
+            if hit:
                 cached_comp = self._cache[key]
                 # Update source to indicate cache hit
                 cached.append(ValidatedComponent(
@@ -430,7 +419,8 @@ Return JSON format:
                 HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
             }
 
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "gemini",
                 client.generate_content,
                 prompt,
                 generation_config={
@@ -456,7 +446,8 @@ Return JSON format:
             return None
 
         try:
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "azure",
                 client.chat.completions.create,
                 model=self._azure_deployment,
                 messages=[
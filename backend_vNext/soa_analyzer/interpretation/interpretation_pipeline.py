@@ -36,6 +36,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from ..llm_client_registry import get_llm_client_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -108,6 +110,9 @@ class PipelineResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
 
+    # LLM calls / tokens / latency per provider during the run (shared client registry)
+    llm_usage: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
     def get_summary(self) -> str:
         """Get summary string."""
         return (
@@ -130,6 +135,7 @@ class PipelineResult:
             "stageStatuses": self.stage_statuses,
             "errors": self.errors,
             "warnings": self.warnings,
+            "llmUsage": self.llm_usage,
         }
 
 
@@ -258,6 +264,8 @@ class InterpretationPipeline:
         start_time = time.time()
         config = config or PipelineConfig()
         result = PipelineResult()
+        llm_registry = get_llm_client_registry()
+        llm_snapshot = llm_registry.get_stats()
 
         # Ensure visits/encounters compatibility
         working_usdm = self._normalize_input(soa_output)
@@ -394,6 +402,7 @@ class InterpretationPipeline:
         # Finalize result
         result.total_duration_seconds = time.time() - start_time
         result.final_usdm = working_usdm
+        result.llm_usage = llm_registry.usage_since(llm_snapshot)
 
         # Check if Stage 11 produced a draft
         stage11_result = result.stage_results.get(11)
@@ -448,7 +457,7 @@ class InterpretationPipeline:
 
         elif stage == 2:
             # Activity Expansion (v2.0: protocol-driven with extraction data + PDF)
-            result = self._run_sync(
+            result = await self._run_sync(
                 handler.expand_activities,
                 usdm,
                 extraction_outputs=config.extraction_outputs,
@@ -465,7 +474,7 @@ class InterpretationPipeline:
             stage2_result = prior_results.get(2)
             # Convert Stage2Result object to dict for build_hierarchy
             stage2_dict = stage2_result.to_dict() if stage2_result and hasattr(stage2_result, 'to_dict') else stage2_result
-            return self._run_sync(handler.build_hierarchy, usdm, stage2_dict)
+            return await self._run_sync(handler.build_hierarchy, usdm, stage2_dict)
 
         elif stage == 4:
             # Alternative Resolution
@@ -546,9 +555,15 @@ class InterpretationPipeline:
         else:
             return method(*args, **kwargs)
 
-    def _run_sync(self, method: Any, *args, **kwargs) -> Any:
-        """Run a synchronous method."""
-        return method(*args, **kwargs)
+    async def _run_sync(self, method: Any, *args, **kwargs) -> Any:
+        """
+        Run a synchronous method in a worker thread.
+
+        Stages 2 and 3 make blocking LLM round-trips; running them off the
+        event loop lets other pipelines sharing the loop (concurrent merge
+        groups) keep making progress.
+        """
+        return await asyncio.to_thread(method, *args, **kwargs)
 
     # =========================================================================
     # RESULT EXTRACTION
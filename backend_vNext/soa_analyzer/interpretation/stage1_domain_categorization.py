@@ -19,15 +19,14 @@ Usage:
     result = await categorizer.categorize_activities(activities)
 """
 
-import asyncio
 import hashlib
 import json
 import logging
-import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..llm_client_registry import get_llm_client_registry
 from .cdisc_code_enricher import CDISCCodeEnricher
 
 logger = logging.getLogger(__name__)
@@ -205,6 +204,7 @@ class DomainCategorizer:
         # In-memory cache
         self._cache: Dict[str, DomainMapping] = {}
         self._cache_loaded = False
+        self._cache_view = None  # Scope of the shared LLM response cache
 
         # LLM clients (lazy loaded)
         self._gemini_client = None
@@ -218,18 +218,27 @@ class DomainCategorizer:
         if self.use_cache:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+    def _get_cache_view(self):
+        """Get this stage's scope of the shared LLM response cache."""
+        if self._cache_view is None:
+            from app.services.llm_response_cache import get_cache_view
+            self._cache_view = get_cache_view(
+                "domain_categorization",
+                model=self.model,
+                cache_dir=None if self.cache_dir == CACHE_DIR else self.cache_dir,
+            )
+        return self._cache_view
+
     def _load_cache(self) -> None:
-        """Load cache from disk."""
+        """Load cache from the shared LLM response cache."""
         if self._cache_loaded:
             return
 
-        cache_file = self.cache_dir / "domain_cache.json"
-        if cache_file.exists():
+        if self.use_cache:
             try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                    for key, mapping_data in data.items():
-                        self._cache[key] = DomainMapping(**mapping_data)
+                entries = self._get_cache_view().load(legacy_file=self.cache_dir / "domain_cache.json")
+                for key, mapping_data in entries.items():
+                    self._cache[key] = DomainMapping(**mapping_data)
                 logger.info(f"Loaded {len(self._cache)} cached domain mappings")
             except Exception as e:
                 logger.warning(f"Failed to load domain cache: {e}")
@@ -241,7 +250,6 @@ class DomainCategorizer:
         if not self.use_cache:
             return
 
-        cache_file = self.cache_dir / "domain_cache.json"
         try:
             data = {}
             for key, mapping in self._cache.items():
@@ -258,8 +266,7 @@ class DomainCategorizer:
                     "specimen": mapping.specimen,
                     "method": mapping.method,
                 }
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self._get_cache_view().save(data)
         except Exception as e:
             logger.warning(f"Failed to save domain cache: {e}")
 
@@ -272,68 +279,38 @@ class DomainCategorizer:
         return hashlib.md5(self._normalize_name(activity_name).encode()).hexdigest()
 
     def _get_gemini_client(self):
-        """Lazy load Gemini client."""
+        """Get the shared Gemini model from the client registry."""
         if self._gemini_client is None:
             try:
-                import google.generativeai as genai
                 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
-                api_key = os.getenv("GEMINI_API_KEY")
-                if api_key:
-                    genai.configure(api_key=api_key)
-
-                    safety_settings = {
-                        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-                    }
+                safety_settings = {
+                    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+                }
 
-                    self._gemini_client = genai.GenerativeModel(
-                        self.model,
-                        safety_settings=safety_settings,
-                    )
-                    logger.info(f"Initialized Gemini client: {self.model}")
+                self._gemini_client = get_llm_client_registry().gemini_model(
+                    self.model,
+                    safety_settings=safety_settings,
+                )
             except Exception as e:
                 logger.warning(f"Failed to initialize Gemini client: {e}")
         return self._gemini_client
 
     def _get_claude_client(self):
-        """Lazy load Anthropic Claude client (fallback)."""
+        """Get the shared Anthropic Claude client (fallback)."""
         if self._claude_client is None:
-            try:
-                import anthropic
-
-                api_key = os.getenv("ANTHROPIC_API_KEY")
-                if api_key:
-                    self._claude_client = anthropic.Anthropic(api_key=api_key)
-                    logger.info("Initialized Anthropic Claude client: claude-sonnet-4-20250514")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Anthropic Claude client: {e}")
+            self._claude_client = get_llm_client_registry().claude_client()
         return self._claude_client
 
     def _get_azure_client(self):
-        """Lazy load Azure OpenAI client (fallback)."""
+        """Get the shared Azure OpenAI client (fallback)."""
         if self._azure_client is None:
-            try:
-                from openai import AzureOpenAI
-
-                api_key = os.getenv("AZURE_OPENAI_API_KEY")
-                endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-                deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-5-mini")
-                api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-10-01-preview")
-
-                if api_key and endpoint:
-                    self._azure_client = AzureOpenAI(
-                        api_key=api_key,
-                        api_version=api_version,
-                        azure_endpoint=endpoint,
-                        timeout=180.0,
-                    )
-                    self._azure_deployment = deployment
-                    logger.info(f"Initialized Azure OpenAI fallback: {deployment}")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Azure OpenAI client: {e}")
+            registry = get_llm_client_registry()
+            self._azure_client = registry.azure_client(timeout=180.0)
+            self._azure_deployment = registry.azure_deployment
         return self._azure_client
 
     def _get_cdisc_enricher(self) -> CDISCCodeEnricher:
@@ -387,7 +364,8 @@ class DomainCategorizer:
                 HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
             }
 
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "gemini",
                 client.generate_content,
                 prompt,
                 generation_config={
@@ -424,7 +402,8 @@ class DomainCategorizer:
             return None
 
         try:
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "claude",
                 client.messages.create,
                 model="claude-sonnet-4-20250514",
                 max_tokens=8192,
@@ -455,7 +434,8 @@ class DomainCategorizer:
             return None
 
         try:
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "azure",
                 client.chat.completions.create,
                 model=self._azure_deployment,
                 messages=[{"role": "user", "content": prompt}],
@@ -560,8 +540,11 @@ class DomainCategorizer:
             activity_id = activity.get("id", "")
             activity_name = activity.get("name", "")
             cache_key = self._get_cache_key(activity_name)
+            hit = cache_key in self._cache
+            if self.use_cache:
+                self._get_cache_view().record_lookup(cache_key, hit)
 
-            if cache_key in self._cache:
+            if hit:
                 cached = self._cache[cache_key]
                 # Update with current activity ID
                 mapping = DomainMapping(
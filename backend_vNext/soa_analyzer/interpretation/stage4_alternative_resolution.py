@@ -51,6 +51,7 @@ from ..models.alternative_expansion import (
     generate_assignment_id,
 )
 from ..models.code_object import CodeObject, NCI_EVS_CODE_SYSTEM, NCI_EVS_VERSION
+from ..llm_client_registry import get_llm_client_registry
 
 logger = logging.getLogger(__name__)
 
@@ -200,6 +201,7 @@ class AlternativeResolver:
         self.config = config or AlternativeResolutionConfig()
         self._registry = AlternativePatternRegistry()
         self._cache: Dict[str, AlternativeDecision] = {}
+        self._cache_view = None  # Scope of the shared LLM response cache
         self._gemini_client = None
         self._azure_client = None
         self._prompt_template: str = ""
@@ -534,15 +536,13 @@ class AlternativeResolver:
         try:
             import google.generativeai as genai
 
-            api_key = os.environ.get("GEMINI_API_KEY")
-            if not api_key:
+            model = get_llm_client_registry().gemini_model(self.config.model_name)
+            if not model:
                 raise ValueError("GEMINI_API_KEY not set")
 
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel(self.config.model_name)
-
             response = await asyncio.wait_for(
-                asyncio.to_thread(
+                get_llm_client_registry().run(
+                    "gemini",
                     model.generate_content,
                     prompt,
                     generation_config=genai.GenerationConfig(
@@ -561,16 +561,13 @@ class AlternativeResolver:
     async def _call_claude(self, prompt: str) -> Optional[str]:
         """Call Anthropic Claude API."""
         try:
-            import anthropic
-
-            api_key = os.environ.get("ANTHROPIC_API_KEY")
-            if not api_key:
+            client = get_llm_client_registry().claude_client()
+            if not client:
                 raise ValueError("ANTHROPIC_API_KEY not set")
 
-            client = anthropic.Anthropic(api_key=api_key)
-
             response = await asyncio.wait_for(
-                asyncio.to_thread(
+                get_llm_client_registry().run(
+                    "claude",
                     client.messages.create,
                     model="claude-sonnet-4-20250514",
                     max_tokens=8192,
@@ -590,16 +587,15 @@ class AlternativeResolver:
     async def _call_azure(self, prompt: str) -> Optional[str]:
         """Call Azure OpenAI API."""
         try:
-            from openai import AzureOpenAI
-
-            client = AzureOpenAI(
-                api_key=os.environ.get("AZURE_OPENAI_API_KEY"),
+            client = get_llm_client_registry().azure_client(
                 api_version=os.environ.get("AZURE_OPENAI_API_VERSION", "2024-02-15-preview"),
-                azure_endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT"),
             )
+            if not client:
+                raise ValueError("AZURE_OPENAI_API_KEY / AZURE_OPENAI_ENDPOINT not set")
 
             response = await asyncio.wait_for(
-                asyncio.to_thread(
+                get_llm_client_registry().run(
+                    "azure",
                     client.chat.completions.create,
                     model=os.environ.get("AZURE_OPENAI_DEPLOYMENT", self.config.azure_model_name),
                     messages=[
@@ -1038,19 +1034,33 @@ class AlternativeResolver:
         key_source = f"{normalized}:{self.config.model_name}"
         return hashlib.md5(key_source.encode()).hexdigest()
 
+    def _get_cache_view(self):
+        """Get this stage's scope of the shared LLM response cache."""
+        if self._cache_view is None:
+            from app.services.llm_response_cache import get_cache_view
+            self._cache_view = get_cache_view(
+                "alternative_resolution",
+                model=self.config.model_name,
+                prompt=self._prompt_template,
+            )
+        return self._cache_view
+
     def _check_cache(self, cache_key: str) -> Optional[AlternativeDecision]:
-        """Check in-memory and disk cache."""
+        """Check in-memory cache, then the shared LLM response cache."""
         # Check in-memory first
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        # Check disk cache
-        cache_file = CACHE_DIR / f"{cache_key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-
+        try:
+            data = self._get_cache_view().get(cache_key)
+            if data is None:
+                # Entry written by the per-key JSON cache before the shared store
+                cache_file = CACHE_DIR / f"{cache_key}.json"
+                if cache_file.exists():
+                    with open(cache_file) as f:
+                        data = json.load(f)
+
+            if data is not None:
                 # Reconstruct AlternativeDecision
                 decision = AlternativeDecision(
                     activity_id=data.get("activityId", ""),
@@ -1077,8 +1087,8 @@ class AlternativeResolver:
                 self._cache[cache_key] = decision
                 return decision
 
-            except Exception as e:
-                logger.warning(f"Failed to load cache file {cache_file}: {e}")
+        except Exception as e:
+            logger.warning(f"Failed to load cached decision {cache_key}: {e}")
 
         return None
 
@@ -1087,14 +1097,14 @@ class AlternativeResolver:
         self._cache[cache_key] = decision
 
     def _save_cache(self) -> None:
-        """Save in-memory cache to disk."""
-        for cache_key, decision in self._cache.items():
-            cache_file = CACHE_DIR / f"{cache_key}.json"
-            try:
-                with open(cache_file, "w") as f:
-                    json.dump(decision.to_dict(), f, indent=2)
-            except Exception as e:
-                logger.warning(f"Failed to save cache file {cache_file}: {e}")
+        """Save new and changed decisions to the shared LLM response cache."""
+        try:
+            self._get_cache_view().save(
+                {cache_key: decision.to_dict() for cache_key, decision in self._cache.items()},
+                remove_missing=False,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save alternative resolution cache: {e}")
 
 
 # =========== Convenience Functions ===========
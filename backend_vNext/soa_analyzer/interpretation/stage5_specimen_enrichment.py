@@ -66,6 +66,7 @@ from ..models.code_object import (
     NCI_EVS_VERSION,
 )
 from ..utils.athena_lookup import AthenaLookupService
+from ..llm_client_registry import get_llm_client_registry
 
 logger = logging.getLogger(__name__)
 
@@ -258,6 +259,7 @@ class SpecimenEnricher:
         # In-memory cache: activity_name -> SpecimenDecision
         self._cache: Dict[str, SpecimenDecision] = {}
         self._cache_loaded = False
+        self._cache_view = None  # Scope of the shared LLM response cache
 
         # LLM clients (lazy loaded)
         self._gemini_client = None
@@ -377,21 +379,29 @@ class SpecimenEnricher:
         normalized = f"{activity_name.lower().strip()}:{self.config.model_name}"
         return hashlib.md5(normalized.encode()).hexdigest()
 
+    def _get_cache_view(self):
+        """Get this stage's scope of the shared LLM response cache."""
+        if self._cache_view is None:
+            from app.services.llm_response_cache import get_cache_view
+            self._cache_view = get_cache_view(
+                "specimen_enrichment",
+                model=self.config.model_name,
+                cache_dir=None if self.cache_dir == CACHE_DIR else self.cache_dir,
+            )
+        return self._cache_view
+
     def _load_cache(self) -> None:
-        """Load cache from disk into memory."""
+        """Load cache from the shared LLM response cache into memory."""
         if self._cache_loaded:
             return
 
-        cache_file = self.cache_dir / "decisions_cache.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                for key, value in data.items():
-                    self._cache[key] = SpecimenDecision.from_dict(value)
-                logger.info(f"Loaded {len(self._cache)} cached specimen decisions")
-            except Exception as e:
-                logger.warning(f"Error loading cache: {e}")
+        try:
+            data = self._get_cache_view().load(legacy_file=self.cache_dir / "decisions_cache.json")
+            for key, value in data.items():
+                self._cache[key] = SpecimenDecision.from_dict(value)
+            logger.info(f"Loaded {len(self._cache)} cached specimen decisions")
+        except Exception as e:
+            logger.warning(f"Error loading cache: {e}")
 
         self._cache_loaded = True
 
@@ -404,7 +414,9 @@ class SpecimenEnricher:
             self._load_cache()
 
         cache_key = self._get_cache_key(activity_name)
-        if cache_key in self._cache:
+        hit = cache_key in self._cache
+        self._get_cache_view().record_lookup(cache_key, hit)
+        if hit:
             decision = self._cache[cache_key]
             decision.source = "cache"
             return decision
@@ -425,14 +437,12 @@ class SpecimenEnricher:
         if not self.use_cache:
             return
 
-        cache_file = self.cache_dir / "decisions_cache.json"
         try:
             data = {}
             for key, decision in self._cache.items():
                 data[key] = decision.to_dict()
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Saved {len(data)} decisions to cache")
+            written = self._get_cache_view().save(data)
+            logger.debug(f"Saved {written} of {len(data)} decisions to cache")
         except Exception as e:
             logger.warning(f"Failed to save cache: {e}")
 
@@ -441,56 +451,34 @@ class SpecimenEnricher:
     # =========================================================================
 
     def _init_gemini_client(self) -> None:
-        """Initialize Gemini client."""
+        """Get the shared Gemini model from the client registry."""
         if self._gemini_client is not None:
             return
 
-        try:
-            import google.generativeai as genai
-
-            api_key = os.getenv("GEMINI_API_KEY")
-            if not api_key:
-                logger.warning("GEMINI_API_KEY not set")
-                return
-
-            genai.configure(api_key=api_key)
-            self._gemini_client = genai.GenerativeModel(
-                model_name=self.config.model_name,
-                generation_config={
-                    "temperature": self.config.temperature,
-                    "max_output_tokens": self.config.max_output_tokens,
-                },
-            )
-            logger.info(f"Initialized Gemini client: {self.config.model_name}")
-        except Exception as e:
-            logger.warning(f"Failed to initialize Gemini client: {e}")
+        self._gemini_client = get_llm_client_registry().gemini_model(
+            self.config.model_name,
+            generation_config={
+                "temperature": self.config.temperature,
+                "max_output_tokens": self.config.max_output_tokens,
+            },
+        )
+        if self._gemini_client is None:
+            logger.warning("Gemini client not available (GEMINI_API_KEY not set?)")
 
     def _init_azure_client(self) -> None:
-        """Initialize Azure OpenAI client."""
+        """Get the shared Azure OpenAI client from the client registry."""
         if self._azure_client is not None:
             return
 
-        try:
-            from openai import AzureOpenAI
-
-            api_key = os.getenv("AZURE_OPENAI_API_KEY")
-            endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-            deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT")
-            api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
-
-            if not all([api_key, endpoint, deployment]):
-                logger.warning("Azure OpenAI credentials not fully configured")
-                return
-
-            self._azure_client = AzureOpenAI(
-                api_key=api_key,
-                api_version=api_version,
-                azure_endpoint=endpoint,
+        deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT")
+        if deployment:
+            self._azure_client = get_llm_client_registry().azure_client(
+                api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview"),
             )
-            self._azure_deployment = deployment
-            logger.info(f"Initialized Azure OpenAI client: {deployment}")
-        except Exception as e:
-            logger.warning(f"Failed to initialize Azure client: {e}")
+        if not self._azure_client:
+            logger.warning("Azure OpenAI credentials not fully configured")
+            return
+        self._azure_deployment = deployment
 
     async def _call_gemini(self, prompt: str, gemini_file_uri: Optional[str] = None) -> Optional[str]:
         """
@@ -512,18 +500,19 @@ class SpecimenEnricher:
             if gemini_file_uri:
                 try:
                     import google.generativeai as genai
-                    # Extract file name from URI (e.g., "files/abc123" -> "abc123")
-                    file_name = gemini_file_uri.split("/")[-1]
-                    gemini_file = genai.get_file(file_name)
+                    from app.services.gemini_file_cache import get_gemini_file
+                    # Resolved once per process and shared with other stages
+                    gemini_file = get_gemini_file(gemini_file_uri, resolver=genai.get_file)
                     content = [gemini_file, prompt]  # Multimodal: PDF + text
-                    logger.info(f"Using multimodal content with PDF: {file_name}")
+                    logger.info(f"Using multimodal content with PDF: {gemini_file_uri}")
                 except Exception as e:
                     logger.warning(f"Failed to get Gemini file '{gemini_file_uri}': {e}, falling back to text-only")
                     content = prompt
             else:
                 content = prompt
 
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "gemini",
                 self._gemini_client.generate_content, content
             )
             if response and response.text:
@@ -540,7 +529,8 @@ class SpecimenEnricher:
             return None
 
         try:
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "azure",
                 self._azure_client.chat.completions.create,
                 model=self._azure_deployment,
                 messages=[
@@ -560,16 +550,13 @@ class SpecimenEnricher:
     async def _call_claude(self, prompt: str) -> Optional[str]:
         """Call Anthropic Claude API (text-only fallback)."""
         try:
-            import anthropic
-
-            api_key = os.environ.get("ANTHROPIC_API_KEY")
-            if not api_key:
+            client = get_llm_client_registry().claude_client()
+            if not client:
                 logger.warning("ANTHROPIC_API_KEY not set")
                 return None
 
-            client = anthropic.Anthropic(api_key=api_key)
-
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "claude",
                 client.messages.create,
                 model="claude-sonnet-4-20250514",
                 max_tokens=self.config.max_output_tokens,
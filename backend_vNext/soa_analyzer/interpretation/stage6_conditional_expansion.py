@@ -32,6 +32,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from ..llm_client_registry import get_llm_client_registry
 from ..models.condition import (
     Condition,
     ConditionAssignment,
@@ -251,6 +252,7 @@ class ConditionalExpander:
         self.config = config or ConditionalExpansionConfig()
         self._cache: Dict[str, ConditionExtraction] = {}
         self._cache_loaded = False
+        self._cache_view = None  # Scope of the shared LLM response cache
         self._pattern_registry = ConditionPatternRegistry()
 
         # LLM clients (lazy loaded)
@@ -267,38 +269,20 @@ class ConditionalExpander:
             self._load_cache()
 
     async def _get_azure_client(self):
-        """Lazy load Azure OpenAI client as fallback."""
+        """Get the shared Azure OpenAI client as fallback."""
         if self._azure_client is None:
-            try:
-                from openai import AzureOpenAI
-                api_key = os.getenv("AZURE_OPENAI_API_KEY")
-                endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-                deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT")
-                api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
-
-                if api_key and endpoint and deployment:
-                    self._azure_client = AzureOpenAI(
-                        api_key=api_key,
-                        api_version=api_version,
-                        azure_endpoint=endpoint,
-                    )
-                    self._azure_deployment = deployment
-                    logger.info(f"Initialized Azure OpenAI client: {deployment}")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Azure OpenAI: {e}")
+            deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT")
+            if deployment:
+                self._azure_client = get_llm_client_registry().azure_client(
+                    api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview"),
+                )
+                self._azure_deployment = deployment
         return self._azure_client
 
     async def _get_claude_client(self):
-        """Lazy load Anthropic Claude client as fallback."""
+        """Get the shared Anthropic Claude client as fallback."""
         if self._claude_client is None:
-            try:
-                import anthropic
-                api_key = os.getenv("ANTHROPIC_API_KEY")
-                if api_key:
-                    self._claude_client = anthropic.Anthropic(api_key=api_key)
-                    logger.info("Initialized Anthropic Claude client: claude-sonnet-4-20250514")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Anthropic Claude: {e}")
+            self._claude_client = get_llm_client_registry().claude_client()
         return self._claude_client
 
     def _load_prompt(self) -> str:
@@ -310,35 +294,42 @@ class ConditionalExpander:
             logger.warning(f"Prompt file not found: {PROMPT_PATH}")
             return ""
 
+    def _get_cache_view(self):
+        """Get this stage's scope of the shared LLM response cache."""
+        if self._cache_view is None:
+            from app.services.llm_response_cache import get_cache_view
+            self._cache_view = get_cache_view(
+                "conditional_expansion",
+                model=self.config.model_name,
+                prompt=self._prompt_template,
+            )
+        return self._cache_view
+
     def _load_cache(self) -> None:
-        """Load cache from disk."""
-        cache_file = CACHE_DIR / "extractions_cache.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                # Convert dict to ConditionExtraction objects
-                for key, value in data.items():
-                    self._cache[key] = ConditionExtraction(
-                        footnote_marker=value.get("footnote_marker", ""),
-                        footnote_text=value.get("footnote_text", ""),
-                        has_condition=value.get("has_condition", False),
-                        condition_type=value.get("condition_type"),
-                        condition_name=value.get("condition_name"),
-                        condition_text=value.get("condition_text"),
-                        criterion=value.get("criterion"),
-                        confidence=value.get("confidence", 0.0),
-                        rationale=value.get("rationale"),
-                        source="cached",
-                    )
-                logger.info(f"Loaded {len(self._cache)} cached extractions")
-            except Exception as e:
-                logger.warning(f"Error loading cache: {e}")
+        """Load cache from the shared LLM response cache."""
+        try:
+            data = self._get_cache_view().load(legacy_file=CACHE_DIR / "extractions_cache.json")
+            # Convert dict to ConditionExtraction objects
+            for key, value in data.items():
+                self._cache[key] = ConditionExtraction(
+                    footnote_marker=value.get("footnote_marker", ""),
+                    footnote_text=value.get("footnote_text", ""),
+                    has_condition=value.get("has_condition", False),
+                    condition_type=value.get("condition_type"),
+                    condition_name=value.get("condition_name"),
+                    condition_text=value.get("condition_text"),
+                    criterion=value.get("criterion"),
+                    confidence=value.get("confidence", 0.0),
+                    rationale=value.get("rationale"),
+                    source="cached",
+                )
+            logger.info(f"Loaded {len(self._cache)} cached extractions")
+        except Exception as e:
+            logger.warning(f"Error loading cache: {e}")
         self._cache_loaded = True
 
     def _save_cache(self) -> None:
-        """Save cache to disk."""
-        cache_file = CACHE_DIR / "extractions_cache.json"
+        """Save new and changed extractions to the shared LLM response cache."""
         try:
             data = {}
             for key, extraction in self._cache.items():
@@ -353,9 +344,8 @@ class ConditionalExpander:
                     "confidence": extraction.confidence,
                     "rationale": extraction.rationale,
                 }
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
-            logger.debug(f"Saved {len(data)} extractions to cache")
+            written = self._get_cache_view().save(data)
+            logger.debug(f"Saved {written} of {len(data)} extractions to cache")
         except Exception as e:
             logger.warning(f"Error saving cache: {e}")
 
@@ -369,7 +359,10 @@ class ConditionalExpander:
     def _check_cache(self, footnote_text: str) -> Optional[ConditionExtraction]:
         """Check if footnote is in cache."""
         key = self._get_cache_key(footnote_text)
-        return self._cache.get(key)
+        cached = self._cache.get(key)
+        if self.config.use_cache:
+            self._get_cache_view().record_lookup(key, cached is not None)
+        return cached
 
     def _update_cache(self, footnote_text: str, extraction: ConditionExtraction) -> None:
         """Update cache with extraction result."""
@@ -377,17 +370,9 @@ class ConditionalExpander:
         self._cache[key] = extraction
 
     async def _get_gemini_client(self):
-        """Lazy load Gemini client."""
+        """Get the shared Gemini model from the client registry."""
         if self._gemini_client is None:
-            try:
-                import google.generativeai as genai
-                api_key = os.getenv("GEMINI_API_KEY")
-                if api_key:
-                    genai.configure(api_key=api_key)
-                    self._gemini_client = genai.GenerativeModel(self.config.model_name)
-                    logger.info(f"Initialized Gemini client: {self.config.model_name}")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Gemini: {e}")
+            self._gemini_client = get_llm_client_registry().gemini_model(self.config.model_name)
         return self._gemini_client
 
     async def expand_conditions(self, usdm_output: Dict[str, Any]) -> Stage6Result:
@@ -613,7 +598,8 @@ class ConditionalExpander:
             gemini_client = await self._get_gemini_client()
             if gemini_client:
                 try:
-                    response = await asyncio.to_thread(
+                    response = await get_llm_client_registry().run(
+                        "gemini",
                         gemini_client.generate_content,
                         prompt,
                         generation_config={
@@ -635,7 +621,8 @@ class ConditionalExpander:
             claude_client = await self._get_claude_client()
             if claude_client:
                 try:
-                    response = await asyncio.to_thread(
+                    response = await get_llm_client_registry().run(
+                        "claude",
                         claude_client.messages.create,
                         model="claude-sonnet-4-20250514",
                         max_tokens=8192,
@@ -657,7 +644,8 @@ class ConditionalExpander:
             azure_client = await self._get_azure_client()
             if azure_client:
                 try:
-                    response = await asyncio.to_thread(
+                    response = await get_llm_client_registry().run(
+                        "azure",
                         azure_client.chat.completions.create,
                         model=self._azure_deployment,
                         messages=[{"role": "user", "content": prompt}],
@@ -25,7 +25,6 @@ Usage:
     updated_output = expander.apply_expansions_to_usdm(usdm_output, result)
 """
 
-import asyncio
 import hashlib
 import json
 import logging
@@ -35,6 +34,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from ..llm_client_registry import get_llm_client_registry
 from ..models.cycle_expansion import (
     CycleDecision,
     CycleExpansion,
@@ -227,6 +227,7 @@ class CycleExpander:
         # In-memory cache: cache_key -> CycleDecision
         self._cache: Dict[str, CycleDecision] = {}
         self._cache_loaded = False
+        self._cache_view = None  # Scope of the shared LLM response cache
 
         # LLM clients (lazy loaded)
         self._gemini_client = None
@@ -425,18 +426,36 @@ class CycleExpander:
 
     # =========== Caching ===========
 
+    def _get_cache_view(self):
+        """Get this stage's scope of the shared LLM response cache."""
+        if self._cache_view is None:
+            from app.services.llm_response_cache import get_cache_view
+            self._cache_view = get_cache_view(
+                "cycle_expansion",
+                model=self.config.model_name,
+                cache_dir=None if self.cache_dir == CACHE_DIR else self.cache_dir,
+            )
+        return self._cache_view
+
+    def _legacy_decisions(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        """Decisions from the old decisions_cache.json, if written for this model."""
+        if document.get("metadata", {}).get("model_name") != self.config.model_name:
+            return {}
+        return document.get("decisions", {})
+
     def _load_cache(self) -> None:
-        """Load cache from disk."""
+        """Load cache from the shared LLM response cache."""
         if self._cache_loaded:
             return
 
-        cache_file = self.cache_dir / "decisions_cache.json"
-        if cache_file.exists():
+        if self.use_cache:
             try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                    for key, decision_data in data.get("decisions", {}).items():
-                        self._cache[key] = CycleDecision.from_dict(decision_data)
+                data = self._get_cache_view().load(
+                    legacy_file=self.cache_dir / "decisions_cache.json",
+                    legacy_entries=self._legacy_decisions,
+                )
+                for key, decision_data in data.items():
+                    self._cache[key] = CycleDecision.from_dict(decision_data)
                 logger.info(f"Loaded {len(self._cache)} cached cycle decisions")
             except Exception as e:
                 logger.warning(f"Failed to load cycle cache: {e}")
@@ -444,22 +463,14 @@ class CycleExpander:
         self._cache_loaded = True
 
     def _save_cache(self) -> None:
-        """Save cache to disk."""
+        """Save new and changed decisions to the shared LLM response cache."""
         if not self.use_cache:
             return
 
-        cache_file = self.cache_dir / "decisions_cache.json"
         try:
-            data = {
-                "metadata": {
-                    "model_name": self.config.model_name,
-                    "version": "1.0.0",
-                    "updated": datetime.utcnow().isoformat() + "Z",
-                },
-                "decisions": {key: decision.to_dict() for key, decision in self._cache.items()},
-            }
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self._get_cache_view().save(
+                {key: decision.to_dict() for key, decision in self._cache.items()}
+            )
         except Exception as e:
             logger.warning(f"Failed to save cycle cache: {e}")
 
@@ -471,7 +482,10 @@ class CycleExpander:
     def _check_cache(self, encounter_name: str, recurrence_key: str) -> Optional[CycleDecision]:
         """Return cached decision if exists."""
         cache_key = self._get_cache_key(encounter_name, recurrence_key)
-        if cache_key in self._cache:
+        hit = cache_key in self._cache
+        if self.use_cache:
+            self._get_cache_view().record_lookup(cache_key, hit)
+        if hit:
             decision = self._cache[cache_key]
             decision.source = "cache"
             return decision
@@ -485,68 +499,37 @@ class CycleExpander:
     # =========== LLM Clients ===========
 
     def _get_gemini_client(self):
-        """Lazy load Gemini client."""
+        """Get the shared Gemini model from the client registry."""
         if self._gemini_client is None:
             try:
-                import google.generativeai as genai
                 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
-                api_key = os.getenv("GEMINI_API_KEY")
-                if api_key:
-                    genai.configure(api_key=api_key)
-
-                    safety_settings = {
-                        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-                    }
+                safety_settings = {
+                    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+                    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+                }
 
-                    self._gemini_client = genai.GenerativeModel(
-                        self.config.model_name,
-                        safety_settings=safety_settings,
-                    )
-                    logger.info(f"Initialized Gemini client: {self.config.model_name}")
+                self._gemini_client = get_llm_client_registry().gemini_model(
+                    self.config.model_name,
+                    safety_settings=safety_settings,
+                )
             except Exception as e:
                 logger.warning(f"Failed to initialize Gemini client: {e}")
         return self._gemini_client
 
     def _get_azure_client(self):
-        """Lazy load Azure OpenAI client (fallback)."""
+        """Get the shared Azure OpenAI client (fallback)."""
         if self._azure_client is None:
-            try:
-                from openai import AzureOpenAI
-
-                api_key = os.getenv("AZURE_OPENAI_API_KEY")
-                endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-                deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", self.config.fallback_model)
-                api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-10-01-preview")
-
-                if api_key and endpoint:
-                    self._azure_client = AzureOpenAI(
-                        api_key=api_key,
-                        api_version=api_version,
-                        azure_endpoint=endpoint,
-                        timeout=180.0,
-                    )
-                    self._azure_deployment = deployment
-                    logger.info(f"Initialized Azure OpenAI fallback: {deployment}")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Azure OpenAI client: {e}")
+            self._azure_client = get_llm_client_registry().azure_client(timeout=180.0)
+            self._azure_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", self.config.fallback_model)
         return self._azure_client
 
     def _get_claude_client(self):
-        """Lazy load Anthropic Claude client (fallback)."""
+        """Get the shared Anthropic Claude client (fallback)."""
         if self._claude_client is None:
-            try:
-                import anthropic
-
-                api_key = os.getenv("ANTHROPIC_API_KEY")
-                if api_key:
-                    self._claude_client = anthropic.Anthropic(api_key=api_key)
-                    logger.info("Initialized Anthropic Claude client: claude-sonnet-4-20250514")
-            except Exception as e:
-                logger.warning(f"Failed to initialize Anthropic Claude client: {e}")
+            self._claude_client = get_llm_client_registry().claude_client()
         return self._claude_client
 
     # =========== LLM Analysis ===========
@@ -583,7 +566,8 @@ class CycleExpander:
                 HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
             }
 
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "gemini",
                 client.generate_content,
                 prompt,
                 generation_config={
@@ -616,7 +600,8 @@ class CycleExpander:
             return None
 
         try:
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "azure",
                 client.chat.completions.create,
                 model=self._azure_deployment,
                 messages=[{"role": "user", "content": prompt}],
@@ -644,7 +629,8 @@ class CycleExpander:
             return None
 
         try:
-            response = await asyncio.to_thread(
+            response = await get_llm_client_registry().run(
+                "claude",
                 client.messages.create,
                 model="claude-sonnet-4-20250514",
                 max_tokens=self.config.max_output_tokens,
@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import uuid
 
+from ..llm_client_registry import get_llm_client_registry
 from ..models.protocol_mining import (
     BiospecimenEnrichment,
     DoseModificationEnrichment,
@@ -390,7 +391,14 @@ class ProtocolMiner:
         available_modules: List[str],
         extraction_outputs: Dict[str, Dict[str, Any]],
     ) -> Dict[str, MiningDecision]:
-        """Match activities to modules using cache and LLM"""
+        """
+        Match activities to modules using cache and LLM.
+
+        Uncached activities are split into batch_size chunks that run
+        concurrently (at most max_concurrent_batches in flight). Each batch's
+        decisions go into the cache as soon as it completes; decisions are
+        merged in batch order once all batches are done.
+        """
         decisions = {}
         uncached_activities = []
 
@@ -410,17 +418,36 @@ class ProtocolMiner:
             # Generate module summaries for LLM
             module_summaries = self._generate_module_summaries(extraction_outputs)
 
-            # Process in batches
-            for i in range(0, len(uncached_activities), self.config.batch_size):
-                batch = uncached_activities[i:i + self.config.batch_size]
-                batch_decisions = await self._match_activities_batch(
-                    batch, available_modules, module_summaries
-                )
-                decisions.update(batch_decisions)
+            batches = [
+                uncached_activities[i:i + self.config.batch_size]
+                for i in range(0, len(uncached_activities), self.config.batch_size)
+            ]
+            max_concurrent = max(1, self.config.max_concurrent_batches)
+            logger.info(f"Matching {len(batches)} batches (max {max_concurrent} concurrent)")
+            semaphore = asyncio.Semaphore(max_concurrent)
+
+            async def run(batch: List[Dict[str, Any]]) -> Dict[str, MiningDecision]:
+                async with semaphore:
+                    batch_decisions = await self._match_activities_batch(
+                        batch, available_modules, module_summaries
+                    )
 
-                # Update cache
+                # Update cache as each batch lands, so a later failure keeps it
                 for decision in batch_decisions.values():
                     self._update_cache(decision.cache_key, decision)
+                if self.config.use_cache:
+                    self._save_cache()
+                return batch_decisions
+
+            batch_results = await asyncio.gather(
+                *(run(batch) for batch in batches), return_exceptions=True
+            )
+
+            # Merge in batch order; surface the first failure as before
+            for batch_result in batch_results:
+                if isinstance(batch_result, BaseException):
+                    raise batch_result
+                decisions.update(batch_result)
 
         return decisions
 
@@ -541,14 +568,22 @@ class ProtocolMiner:
         return self._parse_match_response(response_text, activities, model_used)
 
     async def _call_llm_with_fallback(self, prompt: str) -> Tuple[str, str]:
-        """Call LLM with Gemini → Claude → Azure fallback"""
+        """
+        Call LLM with Gemini → Claude → Azure fallback.
+
+        SDK calls run off the event loop through the shared client registry,
+        so concurrent batches overlap within the provider limits.
+        """
         last_error = None
+        registry = get_llm_client_registry()
 
         # Try Gemini first
         if self._gemini_client:
             for attempt in range(self.config.max_retries):
                 try:
-                    response = self._gemini_client.generate_content(
+                    response = await registry.run(
+                        "gemini",
+                        self._gemini_client.generate_content,
                         prompt,
                         generation_config={
                             "temperature": self.config.temperature,
@@ -566,7 +601,9 @@ class ProtocolMiner:
         if self._claude_client:
             for attempt in range(self.config.max_retries):
                 try:
-                    response = self._claude_client.messages.create(
+                    response = await registry.run(
+                        "claude",
+                        self._claude_client.messages.create,
                         model="claude-sonnet-4-20250514",
                         max_tokens=self.config.max_output_tokens,
                         messages=[{"role": "user", "content": prompt}],
@@ -586,7 +623,9 @@ class ProtocolMiner:
             for attempt in range(self.config.max_retries):
                 try:
                     deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "gpt-4o")
-                    response = self._azure_client.chat.completions.create(
+                    response = await registry.run(
+                        "azure",
+                        self._azure_client.chat.completions.create,
                         model=deployment,
                         messages=[{"role": "user", "content": prompt}],
                         temperature=self.config.temperature,
@@ -0,0 +1,355 @@
+"""
+Shared LLM Client Registry for the SOA Pipeline
+
+Process-wide home for the Gemini, Anthropic and Azure OpenAI clients used
+by the interpretation stages, the component validator and the HTML
+interpreter. Previously every stage instance built its own clients (and
+call_llm re-ran genai.configure and built a GenerativeModel per call), so
+a full InterpretationPipeline.run paid client setup and fresh TLS
+connections several times over.
+
+Handles:
+- Client reuse: one Anthropic client, one AzureOpenAI client per
+  (api_version, timeout) and one GenerativeModel per (model, options);
+  the SDK clients keep their HTTP connection pools between calls
+- genai.configure called once per API key instead of per stage / call
+- Calls run on the app LLMGateway, so stages share its per-provider
+  concurrency limits with every other LLM caller in the process
+- Per-provider counters: clients created, input / output tokens (call,
+  error and latency counters come from the gateway)
+
+Usage:
+    from soa_analyzer.llm_client_registry import get_llm_client_registry
+
+    registry = get_llm_client_registry()
+    model = registry.gemini_model("gemini-2.5-pro")
+    response = await registry.run("gemini", model.generate_content, prompt)
+"""
+
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from app.services.llm_gateway import LLMGateway
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_AZURE_API_VERSION = "2024-10-01-preview"
+DEFAULT_AZURE_DEPLOYMENT = "gpt-5-mini"
+
+
+def _usage_tokens(provider: str, response: Any) -> Tuple[int, int]:
+    """Extract (input, output) token counts from an SDK response, if reported."""
+    try:
+        if provider == "gemini":
+            usage = getattr(response, "usage_metadata", None)
+            return (
+                int(getattr(usage, "prompt_token_count", 0) or 0),
+                int(getattr(usage, "candidates_token_count", 0) or 0),
+            )
+        usage = getattr(response, "usage", None)
+        if provider == "claude":
+            return (
+                int(getattr(usage, "input_tokens", 0) or 0),
+                int(getattr(usage, "output_tokens", 0) or 0),
+            )
+        if provider == "azure":
+            return (
+                int(getattr(usage, "prompt_tokens", 0) or 0),
+                int(getattr(usage, "completion_tokens", 0) or 0),
+            )
+    except (TypeError, ValueError):
+        pass
+    return 0, 0
+
+
+class LLMClientRegistry:
+    """
+    Process-wide registry of pooled LLM SDK clients.
+
+    Clients are created lazily on first use and shared by every caller.
+    Calls made through call() / run() are executed on the LLMGateway's
+    per-provider pools, so the pipeline stages and the app services draw
+    from the same gemini/claude/azure_max_concurrency limits.
+    """
+
+    def __init__(self, gateway: Optional["LLMGateway"] = None):
+        """
+        Initialize registry.
+
+        Args:
+            gateway: Gateway running the calls (default: the process-wide
+                app.services.llm_gateway instance)
+        """
+        self._gateway = gateway
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+        self._gemini_configured_key: Optional[str] = None
+        self._gemini_models: Dict[Tuple[str, str], Any] = {}
+        self._claude_client = None
+        self._azure_clients: Dict[Tuple[str, Optional[float]], Any] = {}
+
+    @property
+    def gateway(self) -> "LLMGateway":
+        """Gateway whose per-provider pools run the calls."""
+        if self._gateway is None:
+            from app.services.llm_gateway import get_llm_gateway
+            self._gateway = get_llm_gateway()
+        return self._gateway
+
+    def get_limit(self, provider: str) -> int:
+        """Get the concurrency limit for a provider."""
+        return self.gateway.get_limit(provider)
+
+    def _provider_stats(self, provider: str) -> Dict[str, float]:
+        """Get or create the counters for a provider (caller holds the lock)."""
+        stats = self._stats.get(provider)
+        if stats is None:
+            stats = {
+                "clients_created": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+            }
+            self._stats[provider] = stats
+        return stats
+
+    def _record_usage(self, provider: str, response: Any) -> Any:
+        """Add the response's token counts to the provider's counters."""
+        input_tokens, output_tokens = _usage_tokens(provider, response)
+        with self._lock:
+            stats = self._provider_stats(provider)
+            stats["input_tokens"] += input_tokens
+            stats["output_tokens"] += output_tokens
+        return response
+
+    # ========================================================================
+    # CLIENTS
+    # ========================================================================
+
+    def gemini_model(self, model_name: str, **model_kwargs) -> Optional[Any]:
+        """
+        Get a shared GenerativeModel.
+
+        Args:
+            model_name: Gemini model name
+            **model_kwargs: GenerativeModel options (safety_settings,
+                generation_config, ...); part of the cache key
+
+        Returns:
+            GenerativeModel, or None if GEMINI_API_KEY is not set or the
+            SDK is not installed
+        """
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            return None
+
+        key = (model_name, repr(sorted(model_kwargs.items(), key=lambda item: item[0])))
+        with self._lock:
+            model = self._gemini_models.get(key)
+            if model is not None:
+                return model
+            try:
+                import google.generativeai as genai
+
+                if self._gemini_configured_key != api_key:
+                    genai.configure(api_key=api_key)
+                    self._gemini_configured_key = api_key
+                    self._gemini_models.clear()
+
+                model = genai.GenerativeModel(model_name, **model_kwargs)
+            except Exception as e:
+                logger.warning(f"Failed to initialize Gemini model {model_name}: {e}")
+                return None
+
+            self._gemini_models[key] = model
+            self._provider_stats("gemini")["clients_created"] += 1
+            logger.info(f"Initialized shared Gemini model: {model_name}")
+            return model
+
+    def claude_client(self) -> Optional[Any]:
+        """
+        Get the shared Anthropic client.
+
+        Returns:
+            anthropic.Anthropic, or None if ANTHROPIC_API_KEY is not set or
+            the SDK is not installed
+        """
+        with self._lock:
+            if self._claude_client is not None:
+                return self._claude_client
+            api_key = os.getenv("ANTHROPIC_API_KEY")
+            if not api_key:
+                return None
+            try:
+                import anthropic
+                self._claude_client = anthropic.Anthropic(api_key=api_key)
+            except Exception as e:
+                logger.warning(f"Failed to initialize Anthropic client: {e}")
+                return None
+
+            self._provider_stats("claude")["clients_created"] += 1
+            logger.info("Initialized shared Anthropic client")
+            return self._claude_client
+
+    def azure_client(
+        self,
+        timeout: Optional[float] = None,
+        api_version: Optional[str] = None,
+    ) -> Optional[Any]:
+        """
+        Get a shared AzureOpenAI client.
+
+        Args:
+            timeout: Request timeout in seconds (None = SDK default)
+            api_version: API version (default: AZURE_OPENAI_API_VERSION env)
+
+        Returns:
+            AzureOpenAI, or None if the key / endpoint are not set or the
+            SDK is not installed
+        """
+        api_key = os.getenv("AZURE_OPENAI_API_KEY")
+        endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+        if not api_key or not endpoint:
+            return None
+
+        api_version = api_version or os.getenv("AZURE_OPENAI_API_VERSION", DEFAULT_AZURE_API_VERSION)
+        key = (api_version, timeout)
+        with self._lock:
+            client = self._azure_clients.get(key)
+            if client is not None:
+                return client
+            try:
+                from openai import AzureOpenAI
+
+                kwargs = {"timeout": timeout} if timeout is not None else {}
+                client = AzureOpenAI(
+                    api_key=api_key,
+                    api_version=api_version,
+                    azure_endpoint=endpoint,
+                    **kwargs,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to initialize Azure OpenAI client: {e}")
+                return None
+
+            self._azure_clients[key] = client
+            self._provider_stats("azure")["clients_created"] += 1
+            logger.info(f"Initialized shared Azure OpenAI client (api_version={api_version})")
+            return client
+
+    @property
+    def azure_deployment(self) -> str:
+        """Azure OpenAI deployment name."""
+        return os.getenv("AZURE_OPENAI_DEPLOYMENT", DEFAULT_AZURE_DEPLOYMENT)
+
+    # ========================================================================
+    # CALLS
+    # ========================================================================
+
+    def call(self, provider: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking SDK call within the provider's limit, blocking the
+        calling thread until the gateway's pool has run it.
+
+        Args:
+            provider: Provider name ("gemini", "claude", "azure")
+            fn: Blocking SDK callable (e.g. model.generate_content)
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's return value
+        """
+        response = self.gateway.submit(provider, fn, *args, **kwargs).result()
+        return self._record_usage(provider, response)
+
+    async def run(self, provider: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Await a blocking SDK call without blocking the event loop.
+
+        Args:
+            provider: Provider name ("gemini", "claude", "azure")
+            fn: Blocking SDK callable
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's return value
+        """
+        response = await self.gateway.run(provider, fn, *args, **kwargs)
+        return self._record_usage(provider, response)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get a snapshot of per-provider counters.
+
+        Client and token counters are the registry's; calls, errors,
+        in_flight, latency and limit are the gateway's (and so also count
+        LLM calls made by the app services).
+        """
+        gateway_stats = self.gateway.get_stats()
+        with self._lock:
+            providers = set(self._stats) | set(gateway_stats)
+            return {
+                provider: {
+                    "clients_created": 0,
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "calls": 0,
+                    "errors": 0,
+                    "in_flight": 0,
+                    "total_latency_seconds": 0.0,
+                    "limit": self.get_limit(provider),
+                    **self._stats.get(provider, {}),
+                    **gateway_stats.get(provider, {}),
+                }
+                for provider in providers
+            }
+
+    def usage_since(self, snapshot: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+        """
+        Counter deltas since an earlier get_stats() snapshot.
+
+        Args:
+            snapshot: Result of a previous get_stats() call
+
+        Returns:
+            Per-provider deltas of the cumulative counters (providers
+            without activity are omitted). Counters are process-wide, so
+            deltas include calls made concurrently by other callers.
+        """
+        usage = {}
+        for provider, stats in self.get_stats().items():
+            before = snapshot.get(provider, {})
+            delta = {
+                key: round(stats[key] - before.get(key, 0), 3)
+                for key in ("clients_created", "calls", "errors", "total_latency_seconds",
+                            "input_tokens", "output_tokens")
+            }
+            if any(delta.values()):
+                usage[provider] = delta
+        return usage
+
+
+# Singleton instance
+_registry_instance: Optional[LLMClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    """Get the singleton client registry."""
+    global _registry_instance
+    if _registry_instance is None:
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = LLMClientRegistry()
+    return _registry_instance
+
+
+def reset_llm_client_registry():
+    """Reset the singleton registry (useful for testing)."""
+    global _registry_instance
+    _registry_instance = None
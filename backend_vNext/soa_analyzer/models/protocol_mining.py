@@ -639,6 +639,7 @@ class Stage9Config:
     confidence_threshold_auto: float = 0.90
     confidence_threshold_review: float = 0.70
     batch_size: int = 25
+    max_concurrent_batches: int = 4
     max_retries: int = 3
     retry_delay_seconds: float = 1.0
     model_name: str = "gemini-2.5-pro"
@@ -653,6 +654,7 @@ class Stage9Config:
             "confidenceThresholdAuto": self.confidence_threshold_auto,
             "confidenceThresholdReview": self.confidence_threshold_review,
             "batchSize": self.batch_size,
+            "maxConcurrentBatches": self.max_concurrent_batches,
             "maxRetries": self.max_retries,
             "retryDelaySeconds": self.retry_delay_seconds,
             "modelName": self.model_name,
@@ -669,6 +671,7 @@ class Stage9Config:
             confidence_threshold_auto=data.get("confidenceThresholdAuto", 0.90),
             confidence_threshold_review=data.get("confidenceThresholdReview", 0.70),
             batch_size=data.get("batchSize", 25),
+            max_concurrent_batches=data.get("maxConcurrentBatches", 4),
             max_retries=data.get("maxRetries", 3),
             retry_delay_seconds=data.get("retryDelaySeconds", 1.0),
             model_name=data.get("modelName", "gemini-2.5-pro"),
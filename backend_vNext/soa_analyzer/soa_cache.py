@@ -100,7 +100,18 @@ def compute_file_hash(file_path: str, max_bytes: int = 2 * 1024 * 1024) -> str:
 
     Uses SHA256 for better collision resistance than MD5.
     Includes file size for additional uniqueness.
+
+    PDFs served from the backend's content-addressed store already carry
+    their full SHA256 in the path, so the file is not read.
     """
+    try:
+        from app.utils.pdf_store import content_hash_for_path
+        known_hash = content_hash_for_path(file_path)
+        if known_hash:
+            return known_hash[:16]
+    except ImportError:
+        pass
+
     hasher = hashlib.sha256()
     try:
         with open(file_path, 'rb') as f:
@@ -304,6 +315,50 @@ class SOACache:
             logger.warning(f"Cache write error for {cache_key}: {e}")
             return cache_key
 
+    def get_page(
+        self,
+        pdf_path: str,
+        stage: str,
+        page_num: int,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached per-page result (e.g. OCR output for one PDF page).
+
+        Args:
+            pdf_path: Path to protocol PDF
+            stage: Pipeline stage name
+            page_num: 1-based page number
+            config: Settings that affect the page result (zoom, adapter, ...)
+
+        Returns:
+            Cached result dict with 'data' and 'metadata', or None if cache miss.
+        """
+        return self.get(pdf_path, stage, config={**(config or {}), "page": page_num})
+
+    def set_page(
+        self,
+        pdf_path: str,
+        stage: str,
+        page_num: int,
+        data: Any,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Store a per-page result so single pages can be reused or retried.
+
+        Args:
+            pdf_path: Path to protocol PDF
+            stage: Pipeline stage name
+            page_num: 1-based page number
+            data: The page result to cache
+            config: Settings that affect the page result (zoom, adapter, ...)
+
+        Returns:
+            The cache key used.
+        """
+        return self.set(pdf_path, stage, data, config={**(config or {}), "page": page_num})
+
     def invalidate_protocol(self, pdf_path: str) -> int:
         """
         Invalidate all cache entries for a specific protocol.
@@ -31,14 +31,16 @@ import argparse
 import asyncio
 import json
 import logging
+import multiprocessing
 import os
 import re
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Add parent directory to path for direct script execution
 # This allows running: python soa_analyzer/soa_extraction_pipeline.py ...
@@ -112,6 +114,36 @@ def count_html_table_rows(html: str) -> int:
     return max(0, all_rows - header_rows)
 
 
+# =============================================================================
+# PAGE RENDERING (process pool worker)
+# =============================================================================
+
+# Documents opened by this (worker) process, reused across pages
+_render_docs: Dict[str, Any] = {}
+
+
+def _render_page_rgb(pdf_path: str, page_num: int, zoom: float) -> Tuple[int, int, bytes]:
+    """
+    Render one PDF page to raw RGB samples.
+
+    Runs in the pipelined extraction's render pool, so it must stay a
+    picklable module-level function.
+
+    Args:
+        pdf_path: Path to protocol PDF
+        page_num: 1-based page number
+        zoom: Render zoom factor
+
+    Returns:
+        Tuple of (width, height, RGB bytes)
+    """
+    pdf_doc = _render_docs.get(pdf_path)
+    if pdf_doc is None:
+        pdf_doc = _render_docs[pdf_path] = fitz.open(pdf_path)
+    pix = pdf_doc[page_num - 1].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+    return pix.width, pix.height, bytes(pix.samples)
+
+
 # =============================================================================
 # HTML SANITIZER - Fix Malformed LandingAI Output
 # =============================================================================
@@ -572,16 +604,36 @@ class SOAExtractionPipeline:
     # Minimum expected rows per page - if fewer, trigger Gemini fallback
     MIN_EXPECTED_ROWS_PER_PAGE = 5
 
-    def __init__(self, use_cache: bool = True, use_gemini_fallback: bool = True):
+    # Pipelined extraction: processes rendering pages, concurrent OCR requests
+    RENDER_WORKERS = 2
+    OCR_CONCURRENCY = 4
+
+    # SOACache stage for per-page OCR results
+    PAGE_CACHE_STAGE = "extraction_page"
+
+    def __init__(
+        self,
+        use_cache: bool = True,
+        use_gemini_fallback: bool = True,
+        pipelined_extraction: bool = True,
+        render_workers: int = RENDER_WORKERS,
+        ocr_concurrency: int = OCR_CONCURRENCY,
+    ):
         """
         Initialize the extraction pipeline.
 
         Args:
             use_cache: Whether to use caching for detection and extraction
             use_gemini_fallback: Whether to use Gemini as fallback when LandingAI extraction is incomplete
+            pipelined_extraction: Render and OCR pages concurrently (False: one page at a time)
+            render_workers: Processes rendering page images in pipelined mode
+            ocr_concurrency: Max concurrent OCR requests in pipelined mode
         """
         self.use_cache = use_cache
         self.use_gemini_fallback = use_gemini_fallback
+        self.pipelined_extraction = pipelined_extraction
+        self.render_workers = max(1, render_workers)
+        self.ocr_concurrency = max(1, ocr_concurrency)
         self.cache = get_soa_cache() if use_cache else None
         self.quality_checker = get_quality_checker()
 
@@ -844,77 +896,61 @@ class SOAExtractionPipeline:
         logger.info("\n[Phase 2] EXTRACTION - PDF → HTML tables (LandingAI, 7x zoom)...")
 
         try:
-            # Check cache (use different key for hybrid vs non-hybrid)
-            cache_key = "extraction_html_v3_hybrid" if self.use_gemini_fallback else "extraction_html_v2"
+            # Check cache (use different key for hybrid vs non-hybrid). Entries hold
+            # raw OCR HTML per page; tables are sanitized and assembled on read.
+            cache_key = "extraction_html_v4_hybrid" if self.use_gemini_fallback else "extraction_html_v3"
+            tables = detection_result.get("mergedTables", [])
+
+            # Whole-result cache is only valid for the same table/page layout;
+            # edited page ranges fall through to the per-page OCR cache
+            layout_config = {
+                "tables": [
+                    [t.get("id"), t.get("pageStart"), t.get("pageEnd"), t.get("tableCategory")]
+                    for t in tables
+                ],
+                "page_cache": self._page_cache_config(),
+            }
             if self.cache:
-                cached = self.cache.get(pdf_path, cache_key)
+                cached = self.cache.get(pdf_path, cache_key, config=layout_config)
                 if cached:
                     logger.info("  Cache HIT")
+                    raw_page_html = {
+                        int(page_num): html for page_num, html in cached["data"]["pages"].items()
+                    }
+                    page_html = await asyncio.to_thread(self._sanitize_pages, raw_page_html)
                     return PhaseResult(
                         phase="extraction",
                         success=True,
-                        data=cached["data"],
+                        data=self._assemble_tables(tables, page_html),
                         duration=time.time() - start,
                         from_cache=True,
                     )
 
-            pdf_doc = fitz.open(pdf_path)
-            extracted_tables = []
-
-            for table_info in detection_result.get("mergedTables", []):
-                table_id = table_info.get("id", "SOA-1")
-                page_start = table_info.get("pageStart", 1)
-                page_end = table_info.get("pageEnd", page_start)
-                category = table_info.get("tableCategory", "MAIN_SOA")
-
-                logger.info(f"  Extracting {table_id}: pages {page_start}-{page_end}")
-
-                html_parts = []
-
-                for page_num in range(page_start, page_end + 1):
-                    page = pdf_doc[page_num - 1]
-                    pix = page.get_pixmap(matrix=fitz.Matrix(self.ZOOM_FACTOR, self.ZOOM_FACTOR))
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-
-                    logger.info(f"    Page {page_num}: {pix.width}x{pix.height}")
-
-                    # Step 1: Try LandingAI extraction
-                    ocr_result = self.ocr.extract_table(img)
-                    html = ocr_result.get("html", "")
-                    row_count = count_html_table_rows(html) if html else 0
-
-                    logger.info(f"    Page {page_num}: LandingAI extracted {len(html)} chars, {row_count} data rows")
-
-                    if html:
-                        # Step 3: Sanitize malformed HTML structure
-                        original_html = html
-                        html = sanitize_landingai_html(html)
-                        if html != original_html:
-                            logger.info(f"    Page {page_num}: HTML structure sanitized")
-                            row_count = count_html_table_rows(html)
-
-                        html_with_marker = f"<!-- Page {page_num} -->\n{html}"
-                        html_parts.append(html_with_marker)
-                        logger.info(f"    Page {page_num}: Final extraction: {len(html)} chars, {row_count} data rows")
-                    else:
-                        logger.warning(f"    Page {page_num}: no HTML extracted from LandingAI")
-
-                combined_html = "\n\n".join(html_parts)
-
-                extracted_tables.append({
-                    "id": table_id,
-                    "html": combined_html,
-                    "pages": list(range(page_start, page_end + 1)),
-                    "pageStart": page_start,
-                    "pageEnd": page_end,
-                    "category": category,
-                })
+            # OCR each page once, even if it belongs to several tables
+            pages = sorted({
+                page_num
+                for table_info in tables
+                for page_num in range(
+                    table_info.get("pageStart", 1),
+                    table_info.get("pageEnd", table_info.get("pageStart", 1)) + 1,
+                )
+            })
+            if self.pipelined_extraction:
+                raw_page_html = await self._extract_pages_pipelined(pdf_path, pages)
+            else:
+                raw_page_html = await self._extract_pages_serial(pdf_path, pages)
 
-            pdf_doc.close()
+            page_html = await asyncio.to_thread(self._sanitize_pages, raw_page_html)
+            extracted_tables = self._assemble_tables(tables, page_html)
 
             # Cache result
             if self.cache:
-                self.cache.set(pdf_path, cache_key, extracted_tables)
+                self.cache.set(
+                    pdf_path,
+                    cache_key,
+                    {"pages": {str(page_num): html for page_num, html in raw_page_html.items()}},
+                    config=layout_config,
+                )
 
             logger.info(f"  Extracted {len(extracted_tables)} table(s)")
 
@@ -936,6 +972,212 @@ class SOAExtractionPipeline:
                 duration=time.time() - start,
             )
 
+    def _assemble_tables(
+        self,
+        tables: List[Dict[str, Any]],
+        page_html: Dict[int, str],
+    ) -> List[Dict[str, Any]]:
+        """Combine sanitized page HTML into one entry per detected table."""
+        extracted_tables = []
+
+        for table_info in tables:
+            table_id = table_info.get("id", "SOA-1")
+            page_start = table_info.get("pageStart", 1)
+            page_end = table_info.get("pageEnd", page_start)
+            category = table_info.get("tableCategory", "MAIN_SOA")
+
+            logger.info(f"  Assembling {table_id}: pages {page_start}-{page_end}")
+
+            # Reassemble in page order
+            html_parts = []
+            for page_num in range(page_start, page_end + 1):
+                html = page_html.get(page_num, "")
+                if html:
+                    html_parts.append(f"<!-- Page {page_num} -->\n{html}")
+
+            combined_html = "\n\n".join(html_parts)
+
+            extracted_tables.append({
+                "id": table_id,
+                "html": combined_html,
+                "pages": list(range(page_start, page_end + 1)),
+                "pageStart": page_start,
+                "pageEnd": page_end,
+                "category": category,
+            })
+
+        return extracted_tables
+
+    def _page_cache_config(self) -> Dict[str, Any]:
+        """
+        Settings that change a page's OCR output.
+
+        Together with the PDF hash and page number (added by SOACache) these
+        form the page cache key, so edited page ranges reuse every page
+        that was already OCR'd.
+        """
+        return {
+            "zoom": self.ZOOM_FACTOR,
+            "adapter": type(self.ocr).__name__,
+            "adapter_version": getattr(self.ocr, "ADAPTER_VERSION", "0"),
+        }
+
+    def _get_cached_page(self, pdf_path: str, page_num: int) -> Optional[str]:
+        """Get cached raw OCR HTML for one page, or None on cache miss."""
+        if not self.cache:
+            return None
+        cached = self.cache.get_page(pdf_path, self.PAGE_CACHE_STAGE, page_num, self._page_cache_config())
+        if cached:
+            logger.info(f"    Page {page_num}: OCR cache HIT")
+            return cached["data"]["html"]
+        return None
+
+    def _set_cached_page(self, pdf_path: str, page_num: int, html: str) -> None:
+        """Cache a page's raw OCR HTML (empty results are not cached so they are retried)."""
+        if self.cache and html:
+            self.cache.set_page(
+                pdf_path, self.PAGE_CACHE_STAGE, page_num, {"html": html}, self._page_cache_config()
+            )
+
+    def _ocr_page(self, img: Image.Image, page_num: int) -> str:
+        """
+        OCR one rendered page with LandingAI.
+
+        Blocking; the pipelined mode runs it in a worker thread.
+
+        Returns:
+            Raw HTML ("" if nothing was extracted)
+        """
+        ocr_result = self.ocr.extract_table(img)
+        html = ocr_result.get("html", "")
+        row_count = count_html_table_rows(html) if html else 0
+
+        logger.info(f"    Page {page_num}: LandingAI extracted {len(html)} chars, {row_count} data rows")
+        return html
+
+    def _sanitize_page_html(self, html: str, page_num: int) -> str:
+        """Repair malformed LandingAI HTML for one page."""
+        if not html:
+            logger.warning(f"    Page {page_num}: no HTML extracted from LandingAI")
+            return ""
+
+        original_html = html
+        html = sanitize_landingai_html(html)
+        row_count = count_html_table_rows(html)
+        if html != original_html:
+            logger.info(f"    Page {page_num}: HTML structure sanitized")
+
+        logger.info(f"    Page {page_num}: Final extraction: {len(html)} chars, {row_count} data rows")
+        return html
+
+    def _sanitize_pages(self, raw_page_html: Dict[int, str]) -> Dict[int, str]:
+        """Sanitize raw OCR HTML for every page."""
+        return {
+            page_num: self._sanitize_page_html(html, page_num)
+            for page_num, html in raw_page_html.items()
+        }
+
+    async def _extract_pages_serial(self, pdf_path: str, pages: List[int]) -> Dict[int, str]:
+        """Render and OCR pages one after another, returning raw HTML per page."""
+        page_html: Dict[int, str] = {}
+        pdf_doc = fitz.open(pdf_path)
+        try:
+            for page_num in pages:
+                html = self._get_cached_page(pdf_path, page_num)
+                if html is None:
+                    page = pdf_doc[page_num - 1]
+                    pix = page.get_pixmap(matrix=fitz.Matrix(self.ZOOM_FACTOR, self.ZOOM_FACTOR))
+                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+
+                    logger.info(f"    Page {page_num}: {pix.width}x{pix.height}")
+
+                    html = self._ocr_page(img, page_num)
+                    self._set_cached_page(pdf_path, page_num, html)
+
+                page_html[page_num] = html
+        finally:
+            pdf_doc.close()
+        return page_html
+
+    async def _extract_pages_pipelined(self, pdf_path: str, pages: List[int]) -> Dict[int, str]:
+        """
+        Render pages in a process pool while OCR requests run concurrently.
+
+        Returns raw OCR HTML per page (sanitized by the caller), keyed in the
+        order of ``pages``.
+
+        Each page is cached as soon as it completes, so if one page fails
+        the others are not OCR'd again when the extraction is retried.
+
+        Raises:
+            RuntimeError: If any page failed (after all other pages finished)
+        """
+        page_html: Dict[int, str] = {}
+        pending = []
+        for page_num in pages:
+            cached = self._get_cached_page(pdf_path, page_num)
+            if cached is not None:
+                page_html[page_num] = cached
+            else:
+                pending.append(page_num)
+
+        logger.info(f"  {len(pages) - len(pending)}/{len(pages)} page(s) from OCR cache")
+
+        if not pending:
+            return page_html
+
+        logger.info(
+            f"  Pipelined extraction: {len(pending)} page(s), "
+            f"{self.render_workers} render worker(s), {self.ocr_concurrency} concurrent OCR request(s)"
+        )
+
+        loop = asyncio.get_running_loop()
+        ocr_slots = asyncio.Semaphore(self.ocr_concurrency)
+        # Bounds rendered images held in memory (being rendered or waiting for OCR)
+        in_flight = asyncio.Semaphore(self.ocr_concurrency + self.render_workers)
+        render_pool = ProcessPoolExecutor(
+            max_workers=min(self.render_workers, len(pending)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+        async def process_page(page_num: int) -> str:
+            async with in_flight:
+                width, height, samples = await loop.run_in_executor(
+                    render_pool, _render_page_rgb, pdf_path, page_num, self.ZOOM_FACTOR
+                )
+                img = Image.frombytes("RGB", [width, height], samples)
+                logger.info(f"    Page {page_num}: {width}x{height}")
+
+                async with ocr_slots:
+                    html = await asyncio.to_thread(self._ocr_page, img, page_num)
+
+            self._set_cached_page(pdf_path, page_num, html)
+            return html
+
+        try:
+            outcomes = await asyncio.gather(
+                *(process_page(page_num) for page_num in pending),
+                return_exceptions=True,
+            )
+        finally:
+            render_pool.shutdown(wait=False, cancel_futures=True)
+
+        failed = []
+        for page_num, outcome in zip(pending, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"    Page {page_num}: extraction failed: {outcome}")
+                failed.append((page_num, outcome))
+            else:
+                page_html[page_num] = outcome
+
+        if failed:
+            failed_pages = [page_num for page_num, _ in failed]
+            raise RuntimeError(
+                f"Extraction failed for page(s) {failed_pages}: {failed[0][1]}"
+            ) from failed[0][1]
+
+        return {page_num: page_html[page_num] for page_num in pages}
+
     # =========================================================================
     # PHASE 3: INTERPRETATION (12-Stage Pipeline)
     # =========================================================================
@@ -23,17 +23,20 @@ Usage:
     result = await interpreter.interpret(html_tables, protocol_id)
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from anthropic import Anthropic
 from dotenv import load_dotenv
 import google.generativeai as genai
 
+from soa_analyzer.llm_client_registry import get_llm_client_registry
+
 logger = logging.getLogger(__name__)
 
 # Prompt directory
@@ -423,25 +426,22 @@ def call_llm(
         import google.generativeai as genai
 
         load_dotenv()
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.error("GEMINI_API_KEY not found in environment")
-            return None
-
-        genai.configure(api_key=api_key)
-
-        model = genai.GenerativeModel(
-            model_name=os.getenv("GEMINI_MODEL", "gemini-2.5-pro"),
+        # Shared model per (name, max_tokens): no configure / model setup per call
+        model = get_llm_client_registry().gemini_model(
+            os.getenv("GEMINI_MODEL", "gemini-2.5-pro"),
             generation_config={
                 "temperature": 0.1,
                 "max_output_tokens": max_tokens,
             }
         )
+        if not model:
+            logger.error("GEMINI_API_KEY not found in environment")
+            return None
 
         if gemini_file_uri:
             try:
-                file_name = gemini_file_uri.split("/")[-1]
-                gemini_file = genai.get_file(file_name)
+                from app.services.gemini_file_cache import get_gemini_file
+                gemini_file = get_gemini_file(gemini_file_uri, resolver=genai.get_file)
                 content = [gemini_file, prompt]
             except Exception as e:
                 logger.warning(f"Failed to get Gemini file '{gemini_file_uri}': {e}. Falling back to text-only.")
@@ -449,7 +449,7 @@ def call_llm(
         else:
             content = prompt
 
-        response = model.generate_content(content)
+        response = get_llm_client_registry().call("gemini", model.generate_content, content)
 
         if response and response.text:
             return _clean_json(response.text)
@@ -481,31 +481,44 @@ class SOAHTMLInterpreter:
     - Phase 1: Extract structure (visits with timepoints, activities, footnotes)
     - Phase 2: Extract compact matrix (activity->visits) - simplified format
     - Phase 3: Expand to full SAIs (Python, deterministic) - timing from visits
+
+    Timeline mode interprets merge groups concurrently (each group's LLM
+    calls run in worker threads) and assembles timelines in merge-plan order.
     """
 
-    def __init__(self, model: str = "claude-sonnet-4-20250514"):
-        """Initialize the interpreter."""
+    # Max merge groups interpreted concurrently in timeline mode
+    MAX_CONCURRENT_GROUPS = 4
+
+    def __init__(
+        self,
+        model: str = "claude-sonnet-4-20250514",
+        max_concurrent_groups: Optional[int] = None,
+    ):
+        """
+        Initialize the interpreter.
+
+        Args:
+            model: Claude model for structure and matrix extraction
+            max_concurrent_groups: Max merge groups interpreted concurrently
+                (default: MAX_CONCURRENT_GROUPS; 1 = sequential)
+        """
         load_dotenv()
 
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
+        self.max_concurrent_groups = max(1, max_concurrent_groups or self.MAX_CONCURRENT_GROUPS)
+
+        registry = get_llm_client_registry()
+        self.client = registry.claude_client()
+        if not self.client:
             logger.warning("ANTHROPIC_API_KEY not found - will use Gemini only")
-            self.client = None
-        else:
-            self.client = Anthropic(api_key=api_key)
 
         self.model = model
 
-        gemini_api_key = os.getenv("GEMINI_API_KEY")
-        if gemini_api_key:
-            genai.configure(api_key=gemini_api_key)
-            gemini_model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-pro")
-            self.gemini_model = genai.GenerativeModel(gemini_model_name)
-            self.gemini_available = True
+        gemini_model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-pro")
+        self.gemini_model = registry.gemini_model(gemini_model_name)
+        self.gemini_available = self.gemini_model is not None
+        if self.gemini_available:
             logger.info(f"Gemini fallback initialized (model: {gemini_model_name})")
         else:
-            self.gemini_model = None
-            self.gemini_available = False
             logger.warning("GEMINI_API_KEY not found - no fallback available")
 
         self.structure_prompt = _load_prompt("html_interpretation.txt")
@@ -587,16 +600,15 @@ class SOAHTMLInterpreter:
         all_activities = []
         encounter_cross_reference = {}
 
+        # Resolve groups up front so default IDs / names only count groups with
+        # tables, exactly as when groups were interpreted one after another
+        planned = []
         for group in merge_groups:
-            group_id = group.get("id", f"TIMELINE-{len(schedule_timelines)+1:03d}")
+            group_id = group.get("id", f"TIMELINE-{len(planned)+1:03d}")
             table_ids = group.get("tableIds", [])
-            decision = group.get("decision", "merge")
-            timeline_name = group.get("timelineName", f"Schedule {len(schedule_timelines)+1}")
-            timeline_description = group.get("timelineDescription", "")
-            metadata = group.get("metadata", {})
-            shared_encounters = group.get("sharedEncounters", [])
+            timeline_name = group.get("timelineName", f"Schedule {len(planned)+1}")
 
-            logger.info(f"  Processing {group_id}: tables {table_ids}, decision={decision}")
+            logger.info(f"  Processing {group_id}: tables {table_ids}, decision={group.get('decision', 'merge')}")
 
             group_tables = [table_lookup[tid] for tid in table_ids if tid in table_lookup]
 
@@ -604,7 +616,39 @@ class SOAHTMLInterpreter:
                 logger.warning(f"  No tables found for group {group_id}")
                 continue
 
-            group_structure = await self._interpret_group(group_tables, protocol_id, group_id)
+            planned.append((group, group_id, timeline_name, group_tables))
+
+        # Groups are independent until assembly: interpret them concurrently
+        semaphore = asyncio.Semaphore(self.max_concurrent_groups)
+        wall_start = time.perf_counter()
+
+        async def interpret_planned(group_id: str, group_tables: List[Dict[str, Any]]):
+            async with semaphore:
+                timings: Dict[str, float] = {}
+                start = time.perf_counter()
+                structure = await self._interpret_group(group_tables, protocol_id, group_id, timings)
+                timings["totalSeconds"] = time.perf_counter() - start
+                return structure, timings
+
+        interpreted = await asyncio.gather(*[
+            interpret_planned(group_id, group_tables)
+            for _, group_id, _, group_tables in planned
+        ])
+        wall_clock = time.perf_counter() - wall_start
+
+        group_latency = []
+        for (group, group_id, timeline_name, group_tables), (group_structure, timings) in zip(planned, interpreted):
+            table_ids = group.get("tableIds", [])
+            decision = group.get("decision", "merge")
+            timeline_description = group.get("timelineDescription", "")
+            metadata = group.get("metadata", {})
+            shared_encounters = group.get("sharedEncounters", [])
+
+            group_latency.append({
+                "timelineId": group_id,
+                "tableCount": len(group_tables),
+                **{key: round(value, 3) for key, value in timings.items()},
+            })
 
             timeline_visits = group_structure.get("visits", [])
             timeline_activities = group_structure.get("activities", [])
@@ -696,13 +740,20 @@ class SOAHTMLInterpreter:
             "footnotes": self._flatten_footnotes(schedule_timelines),
             "visitGroups": self._flatten_visit_groups(schedule_timelines),
             "qualityMetrics": self._aggregate_quality_metrics(schedule_timelines),
+            "timelineLatency": {
+                "wallClockSeconds": round(wall_clock, 3),
+                "maxConcurrentGroups": self.max_concurrent_groups,
+                "groups": group_latency,
+            },
         }
 
         logger.info(
             f"Timeline interpretation complete: "
             f"{len(schedule_timelines)} timelines, "
             f"{len(all_activities)} activities, "
-            f"{len(result['visits'])} total encounters"
+            f"{len(result['visits'])} total encounters "
+            f"({wall_clock:.1f}s wall clock, "
+            f"{sum(g.get('totalSeconds', 0) for g in group_latency):.1f}s summed over groups)"
         )
 
         return result
@@ -712,22 +763,43 @@ class SOAHTMLInterpreter:
         group_tables: List[Dict[str, Any]],
         protocol_id: str,
         group_id: str,
+        timings: Optional[Dict[str, float]] = None,
     ) -> Dict[str, Any]:
-        """Interpret a single group of tables."""
+        """
+        Interpret a single group of tables.
+
+        Args:
+            group_tables: HTML tables of the merge group
+            protocol_id: Protocol identifier
+            group_id: Timeline ID stamped on visits and SAIs
+            timings: Optional dict receiving per-phase seconds
+                (structureSeconds, matrixSeconds, postProcessSeconds)
+
+        Returns:
+            Post-processed structure for the group
+        """
+        timings = timings if timings is not None else {}
         logger.info(f"    Interpreting group {group_id} ({len(group_tables)} tables)")
 
+        start = time.perf_counter()
         structure = await self._extract_structure(group_tables, protocol_id)
+        timings["structureSeconds"] = time.perf_counter() - start
 
         visits = structure.get("visits", [])
         activities = structure.get("activities", [])
         logger.info(f"    Group {group_id} Phase 1: {len(visits)} visits, {len(activities)} activities")
 
+        start = time.perf_counter()
         matrix = await self._extract_matrix(group_tables, protocol_id, visits, activities)
+        timings["matrixSeconds"] = time.perf_counter() - start
+
+        start = time.perf_counter()
         sais = self._expand_matrix_to_sais(matrix, structure, group_tables)
         logger.info(f"    Group {group_id} Phase 3: {len(sais)} SAIs")
 
         structure["scheduledActivityInstances"] = sais
         structure = self._post_process(structure, group_tables)
+        timings["postProcessSeconds"] = time.perf_counter() - start
 
         for visit in structure.get("visits", []):
             visit["timelineId"] = group_id
@@ -917,6 +989,18 @@ class SOAHTMLInterpreter:
     # LLM CALL WITH FALLBACK
     # ========================================================================
 
+    def _stream_claude(self, prompt: str, max_tokens: int) -> str:
+        """Stream a Claude response and return the collected text."""
+        collected_text = []
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            for text in stream.text_stream:
+                collected_text.append(text)
+        return "".join(collected_text)
+
     def _call_llm_with_fallback(
         self,
         prompt: str,
@@ -931,15 +1015,9 @@ class SOAHTMLInterpreter:
 
         if self.client:
             try:
-                collected_text = []
-                with self.client.messages.stream(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    messages=[{"role": "user", "content": prompt}]
-                ) as stream:
-                    for text in stream.text_stream:
-                        collected_text.append(text)
-                result = "".join(collected_text)
+                result = get_llm_client_registry().call(
+                    "claude", self._stream_claude, prompt, max_tokens
+                )
 
                 if len(result) < 10:
                     logger.warning(f"{phase_name}: Anthropic response suspiciously short ({len(result)} chars)")
@@ -953,7 +1031,9 @@ class SOAHTMLInterpreter:
             try:
                 gemini_model_name = os.getenv("GEMINI_MODEL", "gemini-2.5-pro")
                 logger.info(f"{phase_name}: Using Gemini fallback ({gemini_model_name})")
-                response = self.gemini_model.generate_content(
+                response = get_llm_client_registry().call(
+                    "gemini",
+                    self.gemini_model.generate_content,
                     prompt,
                     generation_config=genai.types.GenerationConfig(
                         max_output_tokens=max_tokens,
@@ -1008,7 +1088,8 @@ class SOAHTMLInterpreter:
 
         # First LLM attempt
         try:
-            raw_text = self._call_llm_with_fallback(
+            raw_text = await asyncio.to_thread(
+                self._call_llm_with_fallback,
                 prompt=prompt,
                 phase_name="Phase 1 (structure extraction)"
             )
@@ -1040,7 +1121,8 @@ Expected total footnotes: {len(expected_markers)} (markers: {', '.join(sorted(ex
 """
 
             try:
-                retry_text = self._call_llm_with_fallback(
+                retry_text = await asyncio.to_thread(
+                    self._call_llm_with_fallback,
                     prompt=retry_prompt,
                     phase_name="Phase 1 retry (footnote correction)"
                 )
@@ -1121,7 +1203,8 @@ Expected total footnotes: {len(expected_markers)} (markers: {', '.join(sorted(ex
         )
 
         try:
-            raw_text = self._call_llm_with_fallback(
+            raw_text = await asyncio.to_thread(
+                self._call_llm_with_fallback,
                 prompt=prompt,
                 phase_name="Phase 2 (matrix extraction)"
             )
@@ -1141,7 +1224,9 @@ Expected total footnotes: {len(expected_markers)} (markers: {', '.join(sorted(ex
             if self.gemini_available and self.gemini_model:
                 try:
                     max_tokens = int(os.getenv("GEMINI_MAX_OUTPUT_TOKENS", "16000"))
-                    response = self.gemini_model.generate_content(
+                    response = await get_llm_client_registry().run(
+                        "gemini",
+                        self.gemini_model.generate_content,
                         prompt,
                         generation_config=genai.types.GenerationConfig(
                             max_output_tokens=max_tokens,
@@ -1457,8 +1542,6 @@ Pages: {page_start}-{page_end}
 # ============================================================================
 
 if __name__ == "__main__":
-    import asyncio
-
     logging.basicConfig(level=logging.INFO)
 
     sample_html = """
@@ -120,6 +120,7 @@ class LLMTerminologyMapper:
         # In-memory cache (loaded from disk)
         self._cache: Dict[str, TerminologyMapping] = {}
         self._cache_loaded = False
+        self._cache_view = None  # Scope of the shared LLM response cache
 
         # Deterministic mapper (lazy loaded)
         self._deterministic_mapper = None
@@ -133,18 +134,29 @@ class LLMTerminologyMapper:
         if self.use_cache:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+    def _get_cache_view(self):
+        """Get this mapper's scope of the shared LLM response cache."""
+        if self._cache_view is None:
+            from app.services.llm_response_cache import get_cache_view
+            self._cache_view = get_cache_view(
+                "terminology",
+                model=self.model,
+                cache_dir=None if self.cache_dir == CACHE_DIR else self.cache_dir,
+            )
+        return self._cache_view
+
     def _load_cache(self) -> None:
-        """Load cache from disk."""
+        """Load cache from the shared LLM response cache."""
         if self._cache_loaded:
             return
 
-        cache_file = self.cache_dir / "llm_terminology_cache.json"
-        if cache_file.exists():
+        if self.use_cache:
             try:
-                with open(cache_file) as f:
-                    data = json.load(f)
-                    for key, mapping_data in data.items():
-                        self._cache[key] = TerminologyMapping(**mapping_data)
+                data = self._get_cache_view().load(
+                    legacy_file=self.cache_dir / "llm_terminology_cache.json"
+                )
+                for key, mapping_data in data.items():
+                    self._cache[key] = TerminologyMapping(**mapping_data)
                 logger.info(f"Loaded {len(self._cache)} cached terminology mappings")
             except Exception as e:
                 logger.warning(f"Failed to load terminology cache: {e}")
@@ -152,11 +164,10 @@ class LLMTerminologyMapper:
         self._cache_loaded = True
 
     def _save_cache(self) -> None:
-        """Save cache to disk."""
+        """Save new and changed mappings to the shared LLM response cache."""
         if not self.use_cache:
             return
 
-        cache_file = self.cache_dir / "llm_terminology_cache.json"
         try:
             data = {}
             for key, mapping in self._cache.items():
@@ -168,8 +179,7 @@ class LLMTerminologyMapper:
                     "confidence": mapping.confidence,
                     "source": mapping.source,
                 }
-            with open(cache_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self._get_cache_view().save(data)
         except Exception as e:
             logger.warning(f"Failed to save terminology cache: {e}")
 
@@ -562,7 +572,10 @@ Map ALL {len(terms)} terms. Return ONLY valid JSON, no markdown or explanation."
             key = self._normalize_term(term)
 
             # 1. Check cache
-            if key in self._cache:
+            hit = key in self._cache
+            if self.use_cache:
+                self._get_cache_view().record_lookup(key, hit)
+            if hit:
                 result.mappings[key] = self._cache[key]
                 result.cache_hits += 1
                 continue
@@ -31,6 +31,7 @@ import json
 import logging
 import os
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -182,6 +183,7 @@ class MergeDecision:
     level_results: List[LevelResult] = field(default_factory=list)
     confidence: float = 0.0
     reasoning: str = ""
+    level_timings: Dict[str, float] = field(default_factory=dict)  # "level1" / "levels2_4" / "levels5_8" -> seconds
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -572,14 +574,29 @@ class TableMergeAnalyzer:
     Uses an 8-level decision tree with hybrid LLM strategy:
     - Levels 1-4: Gemini (simpler semantic analysis)
     - Levels 5-8: Claude (complex reasoning)
+
+    Level 1 (rule-based) runs for every adjacent pair first; only pairs it
+    leaves undecided go to the LLM levels, which run concurrently (up to
+    max_concurrent_pairs). Merge group IDs are assigned in page order after
+    all pairs finish, so results do not depend on completion order.
     """
 
-    def __init__(self):
-        """Initialize the analyzer with LLM clients."""
+    # Adjacent pairs analyzed concurrently at LLM levels 2-8
+    MAX_CONCURRENT_PAIRS = 4
+
+    def __init__(self, max_concurrent_pairs: Optional[int] = None):
+        """
+        Initialize the analyzer with LLM clients.
+
+        Args:
+            max_concurrent_pairs: Max pairs in flight at LLM levels
+                                  (default MAX_CONCURRENT_PAIRS, 1 = sequential)
+        """
         self.feature_extractor = FeatureExtractor()
         self._gemini_client = None
         self._claude_client = None
         self._merge_group_counter = 0
+        self.max_concurrent_pairs = max(1, max_concurrent_pairs or self.MAX_CONCURRENT_PAIRS)
 
         # Load prompts
         self.prompts_dir = Path(__file__).parent / "prompts"
@@ -627,6 +644,7 @@ class TableMergeAnalyzer:
 
         # Reset counter for new analysis
         self._merge_group_counter = 0
+        analysis_start = time.perf_counter()
 
         # Extract features from each table
         table_features: Dict[str, TableFeatures] = {}
@@ -662,13 +680,11 @@ class TableMergeAnalyzer:
         )
 
         # Analyze pairwise relationships
-        pairwise_decisions: List[MergeDecision] = []
-        for i in range(len(sorted_tables) - 1):
-            table_a_id, features_a = sorted_tables[i]
-            table_b_id, features_b = sorted_tables[i + 1]
-
-            decision = await self._analyze_pair(features_a, features_b)
-            pairwise_decisions.append(decision)
+        pairwise_decisions = await self._analyze_pairs(sorted_tables)
+        for decision in pairwise_decisions:
+            # Assign IDs in page order (pairs may finish in any order)
+            decision.merge_group_id = self._next_merge_group_id()
+            table_a_id, table_b_id = decision.table_ids
             logger.info(
                 f"  {table_a_id} + {table_b_id}: {decision.decision.value} "
                 f"(Level {decision.level_reached}, conf={decision.confidence:.2f})"
@@ -679,6 +695,8 @@ class TableMergeAnalyzer:
 
         # Calculate analysis summary
         analysis_summary = self._build_analysis_summary(pairwise_decisions)
+        analysis_summary["wallClockSeconds"] = round(time.perf_counter() - analysis_start, 3)
+        analysis_summary["maxConcurrentPairs"] = self.max_concurrent_pairs
 
         # Identify standalone tables
         merged_table_ids = set()
@@ -708,49 +726,105 @@ class TableMergeAnalyzer:
             analysis_summary=analysis_summary,
         )
 
-    async def _analyze_pair(
+    async def _analyze_pairs(
+        self,
+        sorted_tables: List[Tuple[str, TableFeatures]],
+    ) -> List[MergeDecision]:
+        """
+        Analyze all adjacent pairs, returning decisions in page order.
+
+        Level 1 is evaluated for every pair up front; pairs it decides never
+        reach the LLM levels. The remaining pairs run concurrently under a
+        semaphore of max_concurrent_pairs.
+        """
+        pairs = [
+            (sorted_tables[i][1], sorted_tables[i + 1][1])
+            for i in range(len(sorted_tables) - 1)
+        ]
+        decisions: List[Optional[MergeDecision]] = [None] * len(pairs)
+        pending: List[Tuple[int, LevelResult, float]] = []
+
+        for index, (features_a, features_b) in enumerate(pairs):
+            level1_start = time.perf_counter()
+            level1_result = self._level1_physical_continuation(features_a, features_b)
+            level1_seconds = time.perf_counter() - level1_start
+
+            if level1_result.decision != MergeDecisionType.CONTINUE:
+                decisions[index] = MergeDecision(
+                    table_ids=[features_a.table_id, features_b.table_id],
+                    decision=level1_result.decision,
+                    merge_group_id="",
+                    level_reached=1,
+                    level_results=[level1_result],
+                    confidence=level1_result.confidence,
+                    reasoning=level1_result.reasoning,
+                    level_timings={"level1": level1_seconds},
+                )
+            else:
+                pending.append((index, level1_result, level1_seconds))
+
+        if pending:
+            logger.info(
+                f"Level 1 decided {len(pairs) - len(pending)}/{len(pairs)} pairs; "
+                f"analyzing {len(pending)} at LLM levels "
+                f"(max {self.max_concurrent_pairs} concurrent)"
+            )
+            semaphore = asyncio.Semaphore(self.max_concurrent_pairs)
+
+            async def run(index: int, level1_result: LevelResult, level1_seconds: float) -> None:
+                features_a, features_b = pairs[index]
+                async with semaphore:
+                    decision = await self._analyze_pair_llm_levels(
+                        features_a, features_b, [level1_result]
+                    )
+                decision.level_timings["level1"] = level1_seconds
+                decisions[index] = decision
+
+            await asyncio.gather(*(run(*item) for item in pending))
+
+        return decisions
+
+    async def _analyze_pair_llm_levels(
         self,
         features_a: TableFeatures,
         features_b: TableFeatures,
+        level_results: List[LevelResult],
     ) -> MergeDecision:
         """
-        Analyze a pair of tables through the 8-level decision tree.
+        Levels 2-8 for a pair that level 1 left undecided.
 
-        Returns as soon as a definitive decision is reached.
-        """
-        level_results: List[LevelResult] = []
+        Args:
+            features_a: Earlier table in page order
+            features_b: Later table in page order
+            level_results: Results so far (level 1), extended in place
 
-        # Level 1: Physical continuation (rule-based)
-        level1_result = self._level1_physical_continuation(features_a, features_b)
-        level_results.append(level1_result)
+        Returns:
+            MergeDecision with per-level timings (merge_group_id unassigned)
+        """
+        timings: Dict[str, float] = {}
 
-        if level1_result.decision != MergeDecisionType.CONTINUE:
+        def decided(result: LevelResult) -> MergeDecision:
             return MergeDecision(
                 table_ids=[features_a.table_id, features_b.table_id],
-                decision=level1_result.decision,
-                merge_group_id=self._next_merge_group_id(),
-                level_reached=1,
+                decision=result.decision,
+                merge_group_id="",
+                level_reached=result.level,
                 level_results=level_results,
-                confidence=level1_result.confidence,
-                reasoning=level1_result.reasoning,
+                confidence=result.confidence,
+                reasoning=result.reasoning,
+                level_timings=timings,
             )
 
         # Levels 2-4: Gemini analysis
+        gemini_start = time.perf_counter()
         try:
             levels_2_4_results = await self._levels_2_4_gemini_analysis(features_a, features_b)
             level_results.extend(levels_2_4_results)
 
             for result in levels_2_4_results:
                 if result.decision != MergeDecisionType.CONTINUE:
-                    return MergeDecision(
-                        table_ids=[features_a.table_id, features_b.table_id],
-                        decision=result.decision,
-                        merge_group_id=self._next_merge_group_id(),
-                        level_reached=result.level,
-                        level_results=level_results,
-                        confidence=result.confidence,
-                        reasoning=result.reasoning,
-                    )
+                    timings["levels2_4"] = time.perf_counter() - gemini_start
+                    return decided(result)
         except Exception as e:
             logger.warning(f"Gemini analysis failed: {e}, falling back to heuristics")
             # Add placeholder results
@@ -762,37 +836,37 @@ class TableMergeAnalyzer:
                     confidence=0.5,
                     reasoning=f"Analysis skipped due to error: {e}",
                 ))
+        timings["levels2_4"] = time.perf_counter() - gemini_start
 
         # Levels 5-8: Claude analysis
+        claude_start = time.perf_counter()
         try:
             levels_5_8_results = await self._levels_5_8_claude_analysis(features_a, features_b)
             level_results.extend(levels_5_8_results)
 
             for result in levels_5_8_results:
                 if result.decision != MergeDecisionType.CONTINUE:
-                    return MergeDecision(
-                        table_ids=[features_a.table_id, features_b.table_id],
-                        decision=result.decision,
-                        merge_group_id=self._next_merge_group_id(),
-                        level_reached=result.level,
-                        level_results=level_results,
-                        confidence=result.confidence,
-                        reasoning=result.reasoning,
-                    )
+                    timings["levels5_8"] = time.perf_counter() - claude_start
+                    return decided(result)
         except Exception as e:
             logger.warning(f"Claude analysis failed: {e}, using heuristic fallback")
+            timings["levels5_8"] = time.perf_counter() - claude_start
             # Fall back to heuristic decision
-            return self._heuristic_fallback(features_a, features_b, level_results)
+            decision = self._heuristic_fallback(features_a, features_b, level_results)
+            decision.level_timings = timings
+            return decision
+        timings["levels5_8"] = time.perf_counter() - claude_start
 
         # If we reach here, no definitive decision - default to keep separate
         return MergeDecision(
             table_ids=[features_a.table_id, features_b.table_id],
             decision=MergeDecisionType.KEEP_SEPARATE,
-            merge_group_id=self._next_merge_group_id(),
+            merge_group_id="",
             level_reached=8,
             level_results=level_results,
             confidence=0.6,
             reasoning="No strong evidence for merging after all levels",
+            level_timings=timings,
         )
 
     def _level1_physical_continuation(
@@ -1312,7 +1386,7 @@ class TableMergeAnalyzer:
             return MergeDecision(
                 table_ids=[features_a.table_id, features_b.table_id],
                 decision=MergeDecisionType.SUGGEST_MERGE,
-                merge_group_id=self._next_merge_group_id(),
+                merge_group_id="",
                 level_reached=8,
                 level_results=level_results,
                 confidence=0.60,
@@ -1322,7 +1396,7 @@ class TableMergeAnalyzer:
         return MergeDecision(
             table_ids=[features_a.table_id, features_b.table_id],
             decision=MergeDecisionType.KEEP_SEPARATE,
-            merge_group_id=self._next_merge_group_id(),
+            merge_group_id="",
             level_reached=8,
             level_results=level_results,
             confidence=0.55,
@@ -1409,6 +1483,19 @@ class TableMergeAnalyzer:
         merge_count = 0
         separate_count = 0
 
+        # Per-level timing across pairs (LLM levels overlap between pairs,
+        # so totals can exceed wallClockSeconds)
+        level_timing: Dict[str, Dict[str, float]] = {}
+        for decision in pairwise_decisions:
+            for level_key, seconds in decision.level_timings.items():
+                stats = level_timing.setdefault(level_key, {"pairs": 0, "totalSeconds": 0.0, "maxSeconds": 0.0})
+                stats["pairs"] += 1
+                stats["totalSeconds"] += seconds
+                stats["maxSeconds"] = max(stats["maxSeconds"], seconds)
+        for stats in level_timing.values():
+            stats["totalSeconds"] = round(stats["totalSeconds"], 3)
+            stats["maxSeconds"] = round(stats["maxSeconds"], 3)
+
         for decision in pairwise_decisions:
             if decision.decision == MergeDecisionType.SUGGEST_MERGE:
                 merge_count += 1
@@ -1422,6 +1509,8 @@ class TableMergeAnalyzer:
             "suggestedMerges": merge_count,
             "suggestedSeparate": separate_count,
             "levelStatistics": level_stats,
+            "level1ShortCircuited": sum(1 for d in pairwise_decisions if d.level_reached == 1),
+            "levelTiming": level_timing,
         }
 
 
@@ -1433,6 +1522,7 @@ class TableMergeAnalyzer:
 async def analyze_tables_for_merge(
     per_table_results: List[Any],
     protocol_id: str,
+    max_concurrent_pairs: Optional[int] = None,
 ) -> MergePlan:
     """
     Convenience function to analyze tables for merging.
@@ -1440,11 +1530,12 @@ async def analyze_tables_for_merge(
     Args:
         per_table_results: List of PerTableResult from Phase 3
         protocol_id: Protocol identifier
+        max_concurrent_pairs: Max table pairs analyzed concurrently
 
     Returns:
         MergePlan with suggested merge groups
     """
-    analyzer = TableMergeAnalyzer()
+    analyzer = TableMergeAnalyzer(max_concurrent_pairs=max_concurrent_pairs)
     return await analyzer.analyze_merge_candidates(per_table_results, protocol_id)
 
 
@@ -16,6 +16,8 @@ from .terminology_mapper import (
     map_concepts_batch,
 )
 
+from .athena_search_index import build_search_index
+
 from .enrichment import (
     enrich_stage2_with_terminology,
     enrich_expansions_list,
@@ -31,6 +33,7 @@ __all__ = [
     "get_terminology_mapper",
     "map_concept",
     "map_concepts_batch",
+    "build_search_index",
     # Enrichment functions
     "enrich_stage2_with_terminology",
     "enrich_expansions_list",
@@ -0,0 +1,189 @@
+"""
+ATHENA Search Index for Terminology Mapping
+
+One-time build of a derived lookup table over the ATHENA vocabulary so
+that TerminologyMapper's exact, synonym and prefix searches become indexed
+probes instead of scans of the concept / concept_synonym tables.
+
+The ATHENA queries used to filter on standard_concept / invalid_reason at
+query time and match with COLLATE NOCASE / LIKE 'x%', which SQLite cannot
+serve from the concept_name index. The derived table is:
+- Pre-filtered to valid standard concepts (standard_concept = 'S' and
+  invalid_reason empty)
+- Keyed on lower(name) for both concept names and synonyms (source column)
+- Denormalized with vocabulary_id / domain_id and the ConceptMatch fields
+
+It is written to a side database next to ATHENA (ATHENA itself is opened
+read-only) and records the size / mtime of the ATHENA file it was built
+from, so a vocabulary refresh makes the index stale instead of wrong.
+
+Usage:
+    from soa_analyzer.terminology.athena_search_index import build_search_index
+
+    index_path = build_search_index(athena_db_path)
+
+    # or from the command line
+    python scripts/build_athena_search_index.py --db $ATHENA_DB_PATH
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout changes; older indexes are then treated as stale
+INDEX_VERSION = "1"
+
+SOURCE_NAME = "name"
+SOURCE_SYNONYM = "synonym"
+
+_SCHEMA = """
+    CREATE TABLE concept_search (
+        name_lower TEXT NOT NULL,
+        source TEXT NOT NULL,
+        matched_name TEXT NOT NULL,
+        concept_id INTEGER NOT NULL,
+        concept_name TEXT,
+        concept_code TEXT,
+        vocabulary_id TEXT,
+        domain_id TEXT,
+        concept_class_id TEXT,
+        standard_concept TEXT
+    );
+    CREATE TABLE index_meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+_INDEXES = """
+    CREATE INDEX idx_concept_search_name ON concept_search (name_lower, source);
+    CREATE INDEX idx_concept_search_vocab_name ON concept_search (vocabulary_id, name_lower);
+"""
+
+_VALID_STANDARD = "c.standard_concept = 'S' AND (c.invalid_reason IS NULL OR c.invalid_reason = '')"
+
+
+def default_index_path(athena_db_path: Path) -> Path:
+    """Side database path for an ATHENA database (athena.db -> athena_search_index.db)."""
+    athena_db_path = Path(athena_db_path)
+    return athena_db_path.with_name(f"{athena_db_path.stem}_search_index.db")
+
+
+def _source_fingerprint(athena_db_path: Path) -> Dict[str, str]:
+    stat = Path(athena_db_path).stat()
+    return {
+        "version": INDEX_VERSION,
+        "source_size": str(stat.st_size),
+        "source_mtime": str(int(stat.st_mtime)),
+    }
+
+
+def is_index_current(index_path: Path, athena_db_path: Path) -> bool:
+    """
+    Check that an index exists and was built from the current ATHENA file.
+
+    Args:
+        index_path: Search index database
+        athena_db_path: ATHENA database the index should reflect
+
+    Returns:
+        True if the index can be used for lookups
+    """
+    if not Path(index_path).exists() or not Path(athena_db_path).exists():
+        return False
+    try:
+        conn = sqlite3.connect(f"{Path(index_path).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM index_meta").fetchall())
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Unreadable ATHENA search index {index_path}: {e}")
+        return False
+    expected = _source_fingerprint(athena_db_path)
+    return all(meta.get(key) == value for key, value in expected.items())
+
+
+def build_search_index(
+    athena_db_path: Path,
+    index_path: Optional[Path] = None,
+    force: bool = False,
+) -> Path:
+    """
+    Build the derived search table for an ATHENA database.
+
+    The table is written to a temporary file and moved into place, so
+    readers never see a half-built index.
+
+    Args:
+        athena_db_path: ATHENA SQLite database (concept, concept_synonym)
+        index_path: Output database (default: default_index_path(athena_db_path))
+        force: Rebuild even if the existing index is current
+
+    Returns:
+        Path to the search index database
+    """
+    athena_db_path = Path(athena_db_path)
+    index_path = Path(index_path) if index_path else default_index_path(athena_db_path)
+    if not athena_db_path.exists():
+        raise FileNotFoundError(f"ATHENA database not found: {athena_db_path}")
+    if not force and is_index_current(index_path, athena_db_path):
+        logger.info(f"ATHENA search index is current: {index_path}")
+        return index_path
+
+    start = time.time()
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(str(tmp_path))
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript(_SCHEMA)
+        conn.execute("ATTACH DATABASE ? AS athena", (f"{athena_db_path.resolve().as_uri()}?mode=ro",))
+
+        # SQLite's lower() folds ASCII only, matching COLLATE NOCASE / LIKE
+        conn.execute(f"""
+            INSERT INTO concept_search
+            SELECT lower(c.concept_name), '{SOURCE_NAME}', c.concept_name,
+                   c.concept_id, c.concept_name, c.concept_code, c.vocabulary_id,
+                   c.domain_id, c.concept_class_id, c.standard_concept
+            FROM athena.concept c
+            WHERE {_VALID_STANDARD} AND c.concept_name IS NOT NULL
+        """)
+        names = conn.total_changes
+        conn.execute(f"""
+            INSERT INTO concept_search
+            SELECT lower(cs.concept_synonym_name), '{SOURCE_SYNONYM}', cs.concept_synonym_name,
+                   c.concept_id, c.concept_name, c.concept_code, c.vocabulary_id,
+                   c.domain_id, c.concept_class_id, c.standard_concept
+            FROM athena.concept_synonym cs
+            JOIN athena.concept c ON cs.concept_id = c.concept_id
+            WHERE {_VALID_STANDARD} AND cs.concept_synonym_name IS NOT NULL
+        """)
+        synonyms = conn.total_changes - names
+        conn.executescript(_INDEXES)
+        conn.executemany(
+            "INSERT INTO index_meta VALUES (?, ?)",
+            list(_source_fingerprint(athena_db_path).items()) + [
+                ("source_path", str(athena_db_path.resolve())),
+                ("built_at", str(int(time.time()))),
+            ],
+        )
+        conn.commit()
+        conn.execute("DETACH DATABASE athena")
+        conn.execute("ANALYZE")
+        conn.close()
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        conn.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    logger.info(
+        f"Built ATHENA search index {index_path}: {names:,} names, {synonyms:,} synonyms "
+        f"in {time.time() - start:.1f}s"
+    )
+    return index_path
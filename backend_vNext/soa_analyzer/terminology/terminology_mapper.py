@@ -111,6 +111,9 @@ class TerminologyMapperConfig:
     """Configuration for terminology mapper."""
     athena_db_path: Path = DEFAULT_ATHENA_DB
     cdisc_codelists_path: Path = DEFAULT_CDISC_CODELISTS
+    # Precomputed search index (see athena_search_index); None -> <athena stem>_search_index.db
+    search_index_path: Optional[Path] = None
+    use_search_index: bool = True
     # Matching thresholds
     exact_match_score: float = 1.0
     synonym_match_score: float = 0.95
@@ -155,6 +158,8 @@ class TerminologyMapper:
     def __init__(self, config: Optional[TerminologyMapperConfig] = None):
         self.config = config or TerminologyMapperConfig()
         self._db_connection: Optional[sqlite3.Connection] = None
+        self._index_connection: Optional[sqlite3.Connection] = None
+        self._index_checked = False
         self._cdisc_codelists: Dict[str, Any] = {}
         self._concept_cache: Dict[str, List[ConceptMatch]] = {}
         self._disambiguation_prompt: Optional[str] = None
@@ -175,6 +180,33 @@ class TerminologyMapper:
             logger.info(f"Connected to ATHENA database: {self.config.athena_db_path}")
         return self._db_connection
 
+    def _get_index_connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Get the search index connection, if a current index exists.
+
+        Returns None (callers fall back to querying ATHENA directly) when the
+        index is disabled, missing or was built from an older ATHENA file.
+        """
+        if self._index_checked:
+            return self._index_connection
+        self._index_checked = True
+        if not self.config.use_search_index:
+            return None
+
+        from .athena_search_index import default_index_path, is_index_current
+
+        index_path = Path(self.config.search_index_path or default_index_path(self.config.athena_db_path))
+        if not is_index_current(index_path, self.config.athena_db_path):
+            logger.info(
+                f"ATHENA search index not available ({index_path}); using direct ATHENA queries. "
+                f"Build it with scripts/build_athena_search_index.py"
+            )
+            return None
+        self._index_connection = sqlite3.connect(f"{index_path.resolve().as_uri()}?mode=ro", uri=True)
+        self._index_connection.row_factory = sqlite3.Row
+        logger.info(f"Using ATHENA search index: {index_path}")
+        return self._index_connection
+
     def _load_cdisc_codelists(self) -> None:
         """Load CDISC controlled terminology codelists."""
         if self.config.cdisc_codelists_path.exists():
@@ -272,18 +304,28 @@ JSON response:"""
         limit: int = 10
     ) -> List[ConceptMatch]:
         """Search for exact matches in ATHENA database."""
-        conn = self._get_db_connection()
+        conn = self._get_index_connection()
 
         # Build query
-        query = """
-            SELECT c.concept_id, c.concept_name, c.concept_code,
-                   c.vocabulary_id, c.domain_id, c.concept_class_id,
-                   c.standard_concept
-            FROM concept c
-            WHERE c.concept_name = ? COLLATE NOCASE
-              AND c.standard_concept = 'S'
-              AND (c.invalid_reason IS NULL OR c.invalid_reason = '')
-        """
+        if conn is not None:
+            query = """
+                SELECT c.concept_id, c.concept_name, c.concept_code,
+                       c.vocabulary_id, c.domain_id, c.concept_class_id,
+                       c.standard_concept
+                FROM concept_search c
+                WHERE c.name_lower = lower(?) AND c.source = 'name'
+            """
+        else:
+            conn = self._get_db_connection()
+            query = """
+                SELECT c.concept_id, c.concept_name, c.concept_code,
+                       c.vocabulary_id, c.domain_id, c.concept_class_id,
+                       c.standard_concept
+                FROM concept c
+                WHERE c.concept_name = ? COLLATE NOCASE
+                  AND c.standard_concept = 'S'
+                  AND (c.invalid_reason IS NULL OR c.invalid_reason = '')
+            """
         params: List[Any] = [term]
 
         if domain_filters:
@@ -323,19 +365,29 @@ JSON response:"""
         limit: int = 10
     ) -> List[ConceptMatch]:
         """Search for synonym matches in ATHENA database."""
-        conn = self._get_db_connection()
+        conn = self._get_index_connection()
 
-        # Search in concept_synonym table
-        query = """
-            SELECT c.concept_id, c.concept_name, c.concept_code,
-                   c.vocabulary_id, c.domain_id, c.concept_class_id,
-                   c.standard_concept, cs.concept_synonym_name
-            FROM concept_synonym cs
-            JOIN concept c ON cs.concept_id = c.concept_id
-            WHERE cs.concept_synonym_name = ? COLLATE NOCASE
-              AND c.standard_concept = 'S'
-              AND (c.invalid_reason IS NULL OR c.invalid_reason = '')
-        """
+        if conn is not None:
+            query = """
+                SELECT c.concept_id, c.concept_name, c.concept_code,
+                       c.vocabulary_id, c.domain_id, c.concept_class_id,
+                       c.standard_concept, c.matched_name AS concept_synonym_name
+                FROM concept_search c
+                WHERE c.name_lower = lower(?) AND c.source = 'synonym'
+            """
+        else:
+            # Search in concept_synonym table
+            conn = self._get_db_connection()
+            query = """
+                SELECT c.concept_id, c.concept_name, c.concept_code,
+                       c.vocabulary_id, c.domain_id, c.concept_class_id,
+                       c.standard_concept, cs.concept_synonym_name
+                FROM concept_synonym cs
+                JOIN concept c ON cs.concept_id = c.concept_id
+                WHERE cs.concept_synonym_name = ? COLLATE NOCASE
+                  AND c.standard_concept = 'S'
+                  AND (c.invalid_reason IS NULL OR c.invalid_reason = '')
+            """
         params: List[Any] = [term]
 
         if domain_filters:
@@ -378,11 +430,14 @@ JSON response:"""
         Search for fuzzy matches using optimized LIKE patterns.
 
         Performance optimized:
-        - Uses starts-with pattern first (can use index)
+        - Uses starts-with pattern first (a range probe on the search index)
         - Limits vocabulary scope for faster queries
         - Avoids expensive contains pattern on large tables
         """
-        conn = self._get_db_connection()
+        conn = self._get_index_connection()
+        indexed = conn is not None
+        if not indexed:
+            conn = self._get_db_connection()
         normalized = self._normalize_term(term)
 
         if not normalized or len(normalized) < 3:
@@ -395,18 +450,25 @@ JSON response:"""
         priority_vocabs = vocabulary_filters or ["LOINC", "SNOMED", "NCIt", "MeSH"]
 
         # Pattern 1: Starts with (fastest, can use index)
-        pattern = f"{normalized}%"
-
-        query = """
-            SELECT c.concept_id, c.concept_name, c.concept_code,
-                   c.vocabulary_id, c.domain_id, c.concept_class_id,
-                   c.standard_concept
-            FROM concept c
-            WHERE c.concept_name LIKE ? COLLATE NOCASE
-              AND c.standard_concept = 'S'
-              AND (c.invalid_reason IS NULL OR c.invalid_reason = '')
-        """
-        params: List[Any] = [pattern]
+        if indexed:
+            query = """
+                SELECT c.concept_id, c.concept_name, c.concept_code,
+                       c.vocabulary_id, c.domain_id, c.concept_class_id,
+                       c.standard_concept
+                FROM concept_search c
+                WHERE c.name_lower >= ? AND c.name_lower < ? AND c.source = 'name'
+            """
+        else:
+            query = """
+                SELECT c.concept_id, c.concept_name, c.concept_code,
+                       c.vocabulary_id, c.domain_id, c.concept_class_id,
+                       c.standard_concept
+                FROM concept c
+                WHERE c.concept_name LIKE ? COLLATE NOCASE
+                  AND c.standard_concept = 'S'
+                  AND (c.invalid_reason IS NULL OR c.invalid_reason = '')
+            """
+        params: List[Any] = self._prefix_params(normalized, indexed)
 
         if domain_filters:
             placeholders = ",".join("?" * len(domain_filters))
@@ -445,8 +507,8 @@ JSON response:"""
         if not results and " " in normalized:
             first_word = normalized.split()[0]
             if len(first_word) >= 3:
-                pattern = f"{first_word}%"
-                params[0] = pattern
+                prefix_params = self._prefix_params(first_word, indexed)
+                params[:len(prefix_params)] = prefix_params
                 cursor = conn.execute(query, params)
                 for row in cursor.fetchall():
                     if row["concept_id"] not in seen_ids:
@@ -468,6 +530,14 @@ JSON response:"""
         results.sort(key=lambda x: x.match_score, reverse=True)
         return results[:limit]
 
+    @staticmethod
+    def _prefix_params(prefix: str, indexed: bool) -> List[Any]:
+        """Parameters for a starts-with match: a LIKE pattern, or a range on the index."""
+        if not indexed:
+            return [f"{prefix}%"]
+        # Every string starting with prefix sorts in [prefix, prefix with last char bumped)
+        return [prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)]
+
     def _search_athena_batch(
         self,
         terms: List[str],
@@ -478,23 +548,37 @@ JSON response:"""
         Batch search for multiple terms in ATHENA database.
         More efficient than individual searches.
         """
-        conn = self._get_db_connection()
         results: Dict[str, List[ConceptMatch]] = {term: [] for term in terms}
 
         if not terms:
             return results
 
+        conn = self._get_index_connection()
+        indexed = conn is not None
+        if not indexed:
+            conn = self._get_db_connection()
+
         # Build batch query for exact matches
-        term_placeholders = ",".join("?" * len(terms))
-        query = f"""
-            SELECT c.concept_id, c.concept_name, c.concept_code,
-                   c.vocabulary_id, c.domain_id, c.concept_class_id,
-                   c.standard_concept
-            FROM concept c
-            WHERE c.concept_name COLLATE NOCASE IN ({term_placeholders})
-              AND c.standard_concept = 'S'
-              AND (c.invalid_reason IS NULL OR c.invalid_reason = '')
-        """
+        if indexed:
+            term_placeholders = ",".join("lower(?)" for _ in terms)
+            query = f"""
+                SELECT c.concept_id, c.concept_name, c.concept_code,
+                       c.vocabulary_id, c.domain_id, c.concept_class_id,
+                       c.standard_concept
+                FROM concept_search c
+                WHERE c.name_lower IN ({term_placeholders}) AND c.source = 'name'
+            """
+        else:
+            term_placeholders = ",".join("?" * len(terms))
+            query = f"""
+                SELECT c.concept_id, c.concept_name, c.concept_code,
+                       c.vocabulary_id, c.domain_id, c.concept_class_id,
+                       c.standard_concept
+                FROM concept c
+                WHERE c.concept_name COLLATE NOCASE IN ({term_placeholders})
+                  AND c.standard_concept = 'S'
+                  AND (c.invalid_reason IS NULL OR c.invalid_reason = '')
+            """
         params: List[Any] = list(terms)
 
         if domain_filters:
@@ -531,17 +615,27 @@ JSON response:"""
         # For terms with no exact matches, try synonym matches (batched)
         unmatched = [t for t in terms if not results[t]]
         if unmatched:
-            term_placeholders = ",".join("?" * len(unmatched))
-            query = f"""
-                SELECT c.concept_id, c.concept_name, c.concept_code,
-                       c.vocabulary_id, c.domain_id, c.concept_class_id,
-                       c.standard_concept, cs.concept_synonym_name
-                FROM concept_synonym cs
-                JOIN concept c ON cs.concept_id = c.concept_id
-                WHERE cs.concept_synonym_name COLLATE NOCASE IN ({term_placeholders})
-                  AND c.standard_concept = 'S'
-                  AND (c.invalid_reason IS NULL OR c.invalid_reason = '')
-            """
+            if indexed:
+                term_placeholders = ",".join("lower(?)" for _ in unmatched)
+                query = f"""
+                    SELECT c.concept_id, c.concept_name, c.concept_code,
+                           c.vocabulary_id, c.domain_id, c.concept_class_id,
+                           c.standard_concept, c.matched_name AS concept_synonym_name
+                    FROM concept_search c
+                    WHERE c.name_lower IN ({term_placeholders}) AND c.source = 'synonym'
+                """
+            else:
+                term_placeholders = ",".join("?" * len(unmatched))
+                query = f"""
+                    SELECT c.concept_id, c.concept_name, c.concept_code,
+                           c.vocabulary_id, c.domain_id, c.concept_class_id,
+                           c.standard_concept, cs.concept_synonym_name
+                    FROM concept_synonym cs
+                    JOIN concept c ON cs.concept_id = c.concept_id
+                    WHERE cs.concept_synonym_name COLLATE NOCASE IN ({term_placeholders})
+                      AND c.standard_concept = 'S'
+                      AND (c.invalid_reason IS NULL OR c.invalid_reason = '')
+                """
             params = list(unmatched)
 
             if domain_filters:
@@ -1173,10 +1267,14 @@ JSON response:"""
             logger.error(f"Failed to parse batch disambiguation response: {e}")
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connections."""
         if self._db_connection:
             self._db_connection.close()
             self._db_connection = None
+        if self._index_connection:
+            self._index_connection.close()
+            self._index_connection = None
+        self._index_checked = False
 
 
 # Module-level convenience function
@@ -0,0 +1,97 @@
+"""
+Unit tests for the NCI concept index used by CDISCCodeEnricher.
+
+Tests cover:
+- Exact / synonym / fuzzy results identical to a scan of all concepts
+- First concept in file order winning exact matches and score ties
+- Process-wide sharing of the index
+"""
+
+import random
+
+import pytest
+
+from ..interpretation import cdisc_code_enricher
+from ..interpretation.cdisc_code_enricher import NCIConceptIndex, _normalize_name
+
+
+def scan_concepts(concepts, activity_name):
+    """Reference implementation: the per-concept scan the index replaces."""
+    normalized = _normalize_name(activity_name)
+    best = None
+    best_score = 0.0
+    for concept_code, concept_data in concepts.items():
+        if not isinstance(concept_data, dict):
+            continue
+        concept_name = concept_data.get("name", "")
+        concept_normalized = _normalize_name(concept_name)
+        if concept_normalized == normalized:
+            return (concept_code, concept_name, "nci_exact", 0.95)
+        if normalized in concept_normalized or concept_normalized in normalized:
+            score = len(normalized) / max(len(concept_normalized), 1)
+            if score > best_score and score > 0.5:
+                best_score = score
+                best = (concept_code, concept_name, "nci_fuzzy", 0.80 * score)
+        for synonym in concept_data.get("synonyms", []):
+            if _normalize_name(synonym) == normalized:
+                return (concept_code, concept_name, "nci_synonym", 0.90)
+    return best
+
+
+def as_tuple(code):
+    return (code.code, code.decode, code.match_type, code.match_score) if code else None
+
+
+WORDS = ["blood", "pressure", "serum", "chemistry", "heart", "rate", "urine", "test", "ecg", "hb", "b", "ct scan"]
+
+
+@pytest.fixture
+def concepts():
+    rng = random.Random(3)
+    concepts = {"version": "test", "count": 300}  # non-dict entries are skipped
+    for i in range(300):
+        name = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+        if i % 7 == 0:
+            name = name.upper() + " (NOS)"
+        synonyms = [" ".join(rng.choice(WORDS) for _ in range(2)) for _ in range(rng.randint(0, 2))]
+        concepts[f"C{1000 + i}"] = {"name": name, "synonyms": synonyms}
+    concepts["C9999"] = {"name": "", "synonyms": ["Empty"]}
+    return concepts
+
+
+def test_index_matches_scan(concepts):
+    index = NCIConceptIndex(concepts)
+    rng = random.Random(5)
+    activities = ["", "x", "hb", "Blood Pressure", "Serum Chemistry (Local)", "ECG-12 lead", "unknown activity"]
+    activities += [" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5))) for _ in range(300)]
+    activities += [data["name"][1:-1] for data in concepts.values() if isinstance(data, dict) and data["name"]]
+
+    for activity in activities:
+        assert as_tuple(index.search(_normalize_name(activity))) == scan_concepts(concepts, activity), activity
+
+
+def test_first_concept_wins():
+    concepts = {
+        "C1": {"name": "Heart Rate Check", "synonyms": ["pulse"]},
+        "C2": {"name": "Pulse", "synonyms": []},
+        "C3": {"name": "Heart Rate Study", "synonyms": []},
+    }
+    index = NCIConceptIndex(concepts)
+    assert as_tuple(index.search("pulse")) == ("C1", "Heart Rate Check", "nci_synonym", 0.90)
+    assert index.search("heart rate").code == "C1"  # equal-length names tie on score
+    assert index.search("heart rate study").match_type == "nci_exact"
+
+
+def test_index_shared_across_enrichers(monkeypatch, tmp_path):
+    concepts_path = tmp_path / "cdisc_concepts.json"
+    concepts_path.write_text('{"C1": {"name": "Vital Signs", "synonyms": ["VS"]}}')
+    monkeypatch.setattr(cdisc_code_enricher, "NCI_CONCEPTS_PATH", concepts_path)
+    cdisc_code_enricher.reset_nci_concept_index()
+    try:
+        first = cdisc_code_enricher.CDISCCodeEnricher(use_llm_fallback=False)
+        second = cdisc_code_enricher.CDISCCodeEnricher(use_llm_fallback=False)
+        assert first._search_nci_evs("vs", "VS").match_type == "nci_synonym"
+        assert second._search_nci_evs("Vital signs", "VS").match_type == "nci_exact"
+        assert first._nci_index is second._nci_index
+    finally:
+        cdisc_code_enricher.reset_nci_concept_index()
@@ -0,0 +1,113 @@
+"""
+Unit tests for concurrent timeline-group interpretation in SOAHTMLInterpreter.
+
+Tests cover:
+- Timelines assembled in merge-plan order regardless of completion order
+- Default timeline IDs / names skipping groups without tables
+- Concurrency limit honoured
+- Per-group latency breakdown
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from ..soa_html_interpreter import SOAHTMLInterpreter
+
+
+class DelayedInterpreter(SOAHTMLInterpreter):
+    """Replaces the LLM phases with random delays and canned structures."""
+
+    def __init__(self, max_concurrent_groups=None, seed=0):
+        super().__init__(max_concurrent_groups=max_concurrent_groups)
+        self._rng = random.Random(seed)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _extract_structure(self, html_tables, protocol_id):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self._rng.random() * 0.02)
+        self.in_flight -= 1
+        table_id = html_tables[0]["id"]
+        return {
+            "visits": [
+                {"id": f"ENC-{table_id}", "name": "Screening"},
+                {"id": f"ENC-{table_id}-D1", "name": f"Day 1 {table_id}"},
+            ],
+            "activities": [
+                {"id": "ACT-1", "name": "Vital Signs"},
+                {"id": "ACT-2", "name": f"Activity {table_id}"},
+            ],
+            "footnotes": [],
+        }
+
+    async def _extract_matrix(self, html_tables, protocol_id, visits, activities):
+        await asyncio.sleep(self._rng.random() * 0.02)
+        return {}
+
+    def _post_process(self, structure, html_tables):
+        return structure
+
+
+def make_inputs(count):
+    html_tables = [{"id": f"SOA-{i}", "html": "<table></table>", "pages": [i]} for i in range(1, count + 1)]
+    merge_groups = [
+        {"tableIds": [f"SOA-{i}"], "sharedEncounters": ["Screening"]} for i in range(1, count + 1)
+    ]
+    return html_tables, {"mergeGroups": merge_groups}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_matches_sequential():
+    html_tables, merge_result = make_inputs(6)
+    sequential = await DelayedInterpreter(max_concurrent_groups=1, seed=1).interpret(
+        html_tables, "P-1", merge_result
+    )
+    concurrent = await DelayedInterpreter(max_concurrent_groups=6, seed=2).interpret(
+        html_tables, "P-1", merge_result
+    )
+
+    sequential.pop("timelineLatency")
+    concurrent.pop("timelineLatency")
+    assert concurrent == sequential
+    assert [t["sourceTables"] for t in concurrent["scheduleTimelines"]] == [
+        [f"SOA-{i}"] for i in range(1, 7)
+    ]
+    assert concurrent["activities"][0]["sourceTimelines"] == [f"TIMELINE-{i:03d}" for i in range(1, 7)]
+
+
+@pytest.mark.asyncio
+async def test_default_ids_skip_groups_without_tables():
+    html_tables, merge_result = make_inputs(3)
+    merge_result["mergeGroups"].insert(1, {"tableIds": ["MISSING"]})
+
+    result = await DelayedInterpreter().interpret(html_tables, "P-1", merge_result)
+
+    timelines = result["scheduleTimelines"]
+    assert [t["id"] for t in timelines] == ["TIMELINE-001", "TIMELINE-002", "TIMELINE-003"]
+    assert [t["name"] for t in timelines] == ["Schedule 1", "Schedule 2", "Schedule 3"]
+    assert [t["sourceTables"] for t in timelines] == [["SOA-1"], ["SOA-2"], ["SOA-3"]]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit():
+    html_tables, merge_result = make_inputs(8)
+    interpreter = DelayedInterpreter(max_concurrent_groups=3)
+    await interpreter.interpret(html_tables, "P-1", merge_result)
+    assert 1 < interpreter.max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_latency_breakdown():
+    html_tables, merge_result = make_inputs(4)
+    result = await DelayedInterpreter(max_concurrent_groups=2).interpret(html_tables, "P-1", merge_result)
+    latency = result["timelineLatency"]
+
+    assert latency["maxConcurrentGroups"] == 2
+    assert [g["timelineId"] for g in latency["groups"]] == [f"TIMELINE-{i:03d}" for i in range(1, 5)]
+    for group in latency["groups"]:
+        assert group["totalSeconds"] >= group["structureSeconds"]
+        assert {"matrixSeconds", "postProcessSeconds", "tableCount"} <= set(group)
+    assert latency["wallClockSeconds"] > 0
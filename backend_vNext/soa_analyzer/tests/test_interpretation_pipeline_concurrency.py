@@ -0,0 +1,105 @@
+"""
+Unit tests for running interpretation pipelines concurrently on one event loop.
+
+Tests cover:
+- Synchronous stage 2 / 3 handlers running off the event loop, so two
+  merge groups overlap while both are in stage 2
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ..interpretation.interpretation_pipeline import InterpretationPipeline, PipelineConfig
+
+
+class BlockingExpander:
+    """Fake ActivityExpander whose expand_activities blocks like a Gemini round-trip."""
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+    def expand_activities(self, usdm, extraction_outputs=None, gemini_file_uri=None):
+        self.tracker.enter()
+        time.sleep(0.1)
+        self.tracker.leave()
+        return SimpleNamespace(expansions=[])
+
+
+class BlockingHierarchyBuilder:
+    """Fake HierarchyBuilder with a blocking build_hierarchy."""
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+    def build_hierarchy(self, usdm, stage2_result):
+        self.tracker.enter()
+        time.sleep(0.1)
+        self.tracker.leave()
+        return SimpleNamespace()
+
+
+class OverlapTracker:
+    """Records the maximum number of handlers running at once."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+
+def make_pipeline(stage, handler):
+    pipeline = InterpretationPipeline()
+    pipeline._stage_handlers[stage] = handler
+    return pipeline
+
+
+def usdm():
+    return {"activities": [{"id": "ACT-1", "name": "Hematology"}], "visits": [], "scheduledActivityInstances": []}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stage, handler_cls", [(2, BlockingExpander), (3, BlockingHierarchyBuilder)])
+async def test_groups_overlap_in_sync_stages(stage, handler_cls):
+    tracker = OverlapTracker()
+    config = PipelineConfig(
+        skip_stages=[s for s in range(1, stage)],
+        stop_after_stage=stage,
+        skip_stage_11=True,
+    )
+    pipelines = [make_pipeline(stage, handler_cls(tracker)) for _ in range(2)]
+
+    results = await asyncio.gather(*(p.run(usdm(), config) for p in pipelines))
+
+    assert all(r.stage_statuses[stage] == "success" for r in results)
+    assert tracker.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_event_loop_responsive_during_stage2():
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    pipeline = make_pipeline(2, BlockingExpander(OverlapTracker()))
+    await pipeline.run(usdm(), PipelineConfig(skip_stages=[1], stop_after_stage=2, skip_stage_11=True))
+    task.cancel()
+
+    assert ticks > 3
@@ -0,0 +1,134 @@
+"""
+Unit tests for the shared LLM client registry.
+
+Tests cover:
+- Per-provider concurrency limit across threads and coroutines
+- Limit shared with the app LLM gateway
+- Call / error / latency / token counters per provider
+- usage_since deltas
+- Missing API keys returning no client
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.llm_gateway import LLMGateway
+
+from ..llm_client_registry import LLMClientRegistry, get_llm_client_registry, reset_llm_client_registry
+
+
+def gemini_response(prompt_tokens=10, output_tokens=5):
+    return SimpleNamespace(
+        text="{}",
+        usage_metadata=SimpleNamespace(prompt_token_count=prompt_tokens, candidates_token_count=output_tokens),
+    )
+
+
+class TrackingCall:
+    """Blocking fake SDK call recording max concurrency."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return gemini_response()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_per_provider():
+    registry = LLMClientRegistry(gateway=LLMGateway(limits={"gemini": 2}))
+    call = TrackingCall()
+
+    await asyncio.gather(
+        *[registry.run("gemini", call, "prompt") for _ in range(6)],
+        *[asyncio.to_thread(registry.call, "gemini", call, "prompt") for _ in range(2)],
+    )
+
+    assert call.max_in_flight == 2
+    assert registry.get_stats()["gemini"]["calls"] == 8
+    assert registry.get_stats()["gemini"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_limit_shared_with_gateway():
+    gateway = LLMGateway(limits={"claude": 2})
+    registry = LLMClientRegistry(gateway=gateway)
+    call = TrackingCall()
+
+    await asyncio.gather(
+        *[registry.run("claude", call) for _ in range(4)],
+        *[gateway.run("claude", call) for _ in range(4)],
+    )
+
+    assert call.max_in_flight == 2
+    assert registry.get_limit("claude") == gateway.get_limit("claude") == 2
+    assert gateway.get_stats()["claude"]["calls"] == 8
+
+
+def test_token_and_error_counters():
+    registry = LLMClientRegistry(gateway=LLMGateway())
+    registry.call("gemini", lambda: gemini_response(100, 20))
+    registry.call(
+        "claude",
+        lambda: SimpleNamespace(usage=SimpleNamespace(input_tokens=7, output_tokens=3)),
+    )
+    registry.call(
+        "azure",
+        lambda: SimpleNamespace(usage=SimpleNamespace(prompt_tokens=4, completion_tokens=2)),
+    )
+
+    def failing():
+        raise RuntimeError("rate limited")
+
+    with pytest.raises(RuntimeError):
+        registry.call("gemini", failing)
+
+    stats = registry.get_stats()
+    assert (stats["gemini"]["input_tokens"], stats["gemini"]["output_tokens"]) == (100, 20)
+    assert stats["gemini"]["calls"] == 2
+    assert stats["gemini"]["errors"] == 1
+    assert (stats["claude"]["input_tokens"], stats["claude"]["output_tokens"]) == (7, 3)
+    assert (stats["azure"]["input_tokens"], stats["azure"]["output_tokens"]) == (4, 2)
+    assert stats["gemini"]["limit"] == registry.gateway.get_limit("gemini")
+
+
+def test_usage_since_snapshot():
+    registry = LLMClientRegistry(gateway=LLMGateway())
+    registry.call("gemini", gemini_response)
+    snapshot = registry.get_stats()
+
+    registry.call("gemini", lambda: gemini_response(30, 1))
+    usage = registry.usage_since(snapshot)
+
+    assert usage["gemini"]["calls"] == 1
+    assert usage["gemini"]["input_tokens"] == 30
+    assert "claude" not in usage
+
+
+def test_missing_keys_return_no_client(monkeypatch):
+    for key in ("GEMINI_API_KEY", "ANTHROPIC_API_KEY", "AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT"):
+        monkeypatch.delenv(key, raising=False)
+    registry = LLMClientRegistry(gateway=LLMGateway())
+
+    assert registry.gemini_model("gemini-2.5-pro") is None
+    assert registry.claude_client() is None
+    assert registry.azure_client(timeout=120.0) is None
+
+
+def test_singleton():
+    reset_llm_client_registry()
+    assert get_llm_client_registry() is get_llm_client_registry()
+    reset_llm_client_registry()
@@ -0,0 +1,178 @@
+"""
+Unit tests for pipelined page extraction (render pool + concurrent OCR).
+
+Tests cover:
+- _render_page_rgb rendering a page to raw RGB samples
+- Results keyed by page in input order, whatever order pages finish in
+- Cached pages skipping both rendering and OCR
+- Freshly OCR'd pages written to the page cache
+- A failed page raising a RuntimeError naming the page, after the
+  other pages were cached
+- Rendering a real PDF in the spawn process pool
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+import pytest
+
+from .. import soa_extraction_pipeline as pipeline_module
+from ..soa_cache import SOACache
+from ..soa_extraction_pipeline import SOAExtractionPipeline, _render_page_rgb
+
+
+class InlineRenderPool(ThreadPoolExecutor):
+    """Thread-backed stand-in for the spawn ProcessPoolExecutor."""
+
+    def __init__(self, max_workers=None, mp_context=None):
+        super().__init__(max_workers=max_workers)
+
+
+class Renderer:
+    """Fake _render_page_rgb encoding the page number in the image width."""
+
+    def __init__(self):
+        self.rendered = []
+        self._lock = threading.Lock()
+
+    def __call__(self, pdf_path, page_num, zoom):
+        with self._lock:
+            self.rendered.append(page_num)
+        return page_num, 1, bytes(3 * page_num)
+
+
+class StubOCR:
+    """Fake LandingAI adapter; later pages return first."""
+
+    ADAPTER_VERSION = "1"
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.ocr_pages = []
+        self._lock = threading.Lock()
+
+    def extract_table(self, img):
+        page_num = img.width
+        with self._lock:
+            self.ocr_pages.append(page_num)
+        time.sleep(0.05 / page_num)
+        if page_num in self.failing:
+            raise ValueError("LandingAI timeout")
+        return {"html": f"<table><tr><td>page {page_num}</td></tr></table>"}
+
+
+class SizeRecordingOCR:
+    """Fake adapter recording the size of each rendered image."""
+
+    def __init__(self):
+        self.sizes = []
+
+    def extract_table(self, img):
+        self.sizes.append(img.size)
+        return {"html": "<table></table>"}
+
+
+def html_for(page_num):
+    return f"<table><tr><td>page {page_num}</td></tr></table>"
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    renderer = Renderer()
+    monkeypatch.setattr(pipeline_module, "ProcessPoolExecutor", InlineRenderPool)
+    monkeypatch.setattr(pipeline_module, "_render_page_rgb", renderer)
+    return renderer
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "protocol.pdf"
+    doc = fitz.open()
+    for i in range(3):
+        page = doc.new_page(width=20, height=10)
+        page.insert_text((2, 8), str(i + 1), fontsize=6)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def make_pipeline(tmp_path, ocr):
+    # Bypass __init__, which needs API keys for the OCR / LLM clients
+    pipeline = SOAExtractionPipeline.__new__(SOAExtractionPipeline)
+    pipeline.cache = SOACache(cache_dir=tmp_path / "cache")
+    pipeline.ocr = ocr
+    pipeline.render_workers = 2
+    pipeline.ocr_concurrency = 4
+    return pipeline
+
+
+def test_render_page_rgb(pdf_path):
+    width, height, samples = _render_page_rgb(pdf_path, 2, 2)
+
+    assert (width, height) == (40, 20)
+    assert len(samples) == width * height * 3
+
+
+@pytest.mark.asyncio
+async def test_results_keyed_in_input_order(tmp_path, pdf_path, renderer):
+    ocr = StubOCR()
+    pipeline = make_pipeline(tmp_path, ocr)
+    pipeline._set_cached_page(pdf_path, 3, html_for(3))
+
+    pages = [1, 2, 3, 5]
+    result = await pipeline._extract_pages_pipelined(pdf_path, pages)
+
+    assert list(result) == pages
+    assert result == {page_num: html_for(page_num) for page_num in pages}
+
+
+@pytest.mark.asyncio
+async def test_cached_pages_skip_render_and_ocr(tmp_path, pdf_path, renderer):
+    ocr = StubOCR()
+    pipeline = make_pipeline(tmp_path, ocr)
+    pipeline._set_cached_page(pdf_path, 2, html_for(2))
+
+    await pipeline._extract_pages_pipelined(pdf_path, [1, 2, 3])
+
+    assert sorted(renderer.rendered) == [1, 3]
+    assert sorted(ocr.ocr_pages) == [1, 3]
+    assert pipeline._get_cached_page(pdf_path, 1) == html_for(1)
+    assert pipeline._get_cached_page(pdf_path, 3) == html_for(3)
+
+    # Everything cached now: nothing is rendered or OCR'd again
+    renderer.rendered.clear()
+    ocr.ocr_pages.clear()
+    result = await pipeline._extract_pages_pipelined(pdf_path, [1, 2, 3])
+
+    assert list(result) == [1, 2, 3]
+    assert renderer.rendered == []
+    assert ocr.ocr_pages == []
+
+
+@pytest.mark.asyncio
+async def test_failed_page_raises_naming_page(tmp_path, pdf_path, renderer):
+    pipeline = make_pipeline(tmp_path, StubOCR(failing={2}))
+
+    with pytest.raises(RuntimeError, match=r"page\(s\) \[2\]") as exc_info:
+        await pipeline._extract_pages_pipelined(pdf_path, [1, 2, 3])
+
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    # Pages that succeeded are cached for the retry
+    assert pipeline._get_cached_page(pdf_path, 1) == html_for(1)
+    assert pipeline._get_cached_page(pdf_path, 3) == html_for(3)
+    assert pipeline._get_cached_page(pdf_path, 2) is None
+
+
+@pytest.mark.asyncio
+async def test_renders_real_pdf_in_process_pool(tmp_path, pdf_path):
+    ocr = SizeRecordingOCR()
+    pipeline = make_pipeline(tmp_path, ocr)
+    pipeline.ZOOM_FACTOR = 1
+
+    result = await asyncio.wait_for(pipeline._extract_pages_pipelined(pdf_path, [1, 3]), timeout=60)
+
+    assert list(result) == [1, 3]
+    assert ocr.sizes == [(20, 10), (20, 10)]
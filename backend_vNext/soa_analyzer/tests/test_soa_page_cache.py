@@ -0,0 +1,120 @@
+"""
+Unit tests for the extraction page cache and whole-result extraction cache.
+
+Tests cover:
+- Page cache hits for the same PDF, page, zoom and OCR adapter
+- Page cache misses when the zoom, adapter class, adapter version or PDF changes
+- Whole-result cache storing raw OCR HTML and sanitizing it on read
+"""
+
+import pytest
+
+from .. import soa_extraction_pipeline as pipeline_module
+from ..adapters.ocr.landingai_adapter import LandingAIOCRAdapter
+from ..soa_cache import SOACache
+from ..soa_extraction_pipeline import SOAExtractionPipeline
+
+RAW_HTML = "<table><tr><td>Visit 1</td></tr></table>"
+DETECTION = {"mergedTables": [{"id": "SOA-1", "pageStart": 1, "pageEnd": 2, "tableCategory": "MAIN_SOA"}]}
+
+
+class OtherOCRAdapter:
+    """Stand-in for a different OCR backend."""
+
+    ADAPTER_VERSION = "1"
+
+
+def make_pipeline(cache, ocr=None):
+    # Bypass __init__, which needs API keys for the OCR / LLM clients
+    pipeline = SOAExtractionPipeline.__new__(SOAExtractionPipeline)
+    pipeline.cache = cache
+    pipeline.ocr = ocr or LandingAIOCRAdapter.__new__(LandingAIOCRAdapter)
+    pipeline.use_gemini_fallback = True
+    pipeline.pipelined_extraction = True
+    return pipeline
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SOACache(cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "protocol.pdf"
+    path.write_bytes(b"%PDF-1.7 protocol A")
+    return str(path)
+
+
+class TestPageCacheKey:
+
+    def test_hit_for_same_settings(self, cache, pdf_path):
+        make_pipeline(cache)._set_cached_page(pdf_path, 3, RAW_HTML)
+
+        assert make_pipeline(cache)._get_cached_page(pdf_path, 3) == RAW_HTML
+        assert make_pipeline(cache)._get_cached_page(pdf_path, 4) is None
+
+    def test_empty_html_not_cached(self, cache, pdf_path):
+        make_pipeline(cache)._set_cached_page(pdf_path, 3, "")
+        assert make_pipeline(cache)._get_cached_page(pdf_path, 3) is None
+
+    def test_miss_when_zoom_changes(self, cache, pdf_path):
+        make_pipeline(cache)._set_cached_page(pdf_path, 3, RAW_HTML)
+
+        pipeline = make_pipeline(cache)
+        pipeline.ZOOM_FACTOR = SOAExtractionPipeline.ZOOM_FACTOR + 1
+        assert pipeline._get_cached_page(pdf_path, 3) is None
+
+    def test_miss_when_adapter_class_changes(self, cache, pdf_path):
+        make_pipeline(cache)._set_cached_page(pdf_path, 3, RAW_HTML)
+        assert make_pipeline(cache, ocr=OtherOCRAdapter())._get_cached_page(pdf_path, 3) is None
+
+    def test_miss_when_adapter_version_changes(self, cache, pdf_path, monkeypatch):
+        make_pipeline(cache)._set_cached_page(pdf_path, 3, RAW_HTML)
+
+        monkeypatch.setattr(LandingAIOCRAdapter, "ADAPTER_VERSION", LandingAIOCRAdapter.ADAPTER_VERSION + ".1")
+        assert make_pipeline(cache)._get_cached_page(pdf_path, 3) is None
+
+    def test_miss_when_pdf_changes(self, cache, pdf_path):
+        make_pipeline(cache)._set_cached_page(pdf_path, 3, RAW_HTML)
+
+        with open(pdf_path, "wb") as f:
+            f.write(b"%PDF-1.7 protocol B")
+        assert make_pipeline(cache)._get_cached_page(pdf_path, 3) is None
+
+
+class TestWholeResultCache:
+
+    @pytest.mark.asyncio
+    async def test_stores_raw_html_and_sanitizes_on_read(self, cache, pdf_path, monkeypatch):
+        monkeypatch.setattr(pipeline_module, "sanitize_landingai_html", lambda html: html.replace("td>", "th>"))
+        calls = []
+
+        async def extract_pages(path, pages):
+            calls.append(pages)
+            return {page_num: RAW_HTML for page_num in pages}
+
+        pipeline = make_pipeline(cache)
+        pipeline._extract_pages_pipelined = extract_pages
+        first = await pipeline._phase_extraction(pdf_path, DETECTION, "protocol")
+
+        assert first.success and not first.from_cache
+        assert calls == [[1, 2]]
+        assert "<th>Visit 1</th>" in first.data[0]["html"]
+        assert first.data[0]["html"].count("<!-- Page") == 2
+
+        layout_config = {
+            "tables": [["SOA-1", 1, 2, "MAIN_SOA"]],
+            "page_cache": pipeline._page_cache_config(),
+        }
+        stored = cache.get(pdf_path, "extraction_html_v4_hybrid", config=layout_config)
+        assert stored["data"] == {"pages": {"1": RAW_HTML, "2": RAW_HTML}}
+
+        # A sanitizer fix applies to cached results without re-running OCR
+        monkeypatch.setattr(pipeline_module, "sanitize_landingai_html", lambda html: html.upper())
+        second = await pipeline._phase_extraction(pdf_path, DETECTION, "protocol")
+
+        assert second.success and second.from_cache
+        assert calls == [[1, 2]]
+        assert "<TD>VISIT 1</TD>" in second.data[0]["html"]
+        assert second.data[0]["pages"] == [1, 2]
@@ -675,5 +675,61 @@ class TestAsyncMining:
             assert isinstance(updated_usdm, dict)
 
 
+class TestConcurrentBatches:
+    @staticmethod
+    def _activities(count):
+        return [
+            {"id": f"SAI-{i:03d}", "activityName": f"Activity {i}", "domain": "LB", "footnoteMarkers": []}
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently_and_merge_in_order(self):
+        import asyncio
+
+        miner = ProtocolMiner(Stage9Config(use_cache=False, batch_size=25, max_concurrent_batches=3))
+        activities = self._activities(150)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_batch(batch, available_modules, module_summaries):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later batches finish first
+            await asyncio.sleep(0.01 * (10 - int(batch[0]["id"][4:]) // 25))
+            in_flight -= 1
+            return miner._parse_match_response(json.dumps({"matches": []}), batch, "gemini")
+
+        with patch.object(miner, "_match_activities_batch", side_effect=fake_batch) as mock_batch, \
+                patch.object(miner, "_save_cache") as mock_save:
+            decisions = await miner._match_activities(activities, ["laboratory_specifications"], {})
+
+        assert mock_batch.call_count == 6
+        assert max_in_flight == 3
+        assert list(decisions) == [a["id"] for a in activities]
+        assert len(miner._cache) == 150
+        mock_save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_completed_batches_cached_when_one_fails(self):
+        miner = ProtocolMiner(Stage9Config(use_cache=True, batch_size=10, max_concurrent_batches=2))
+        miner._cache.clear()
+        activities = self._activities(30)
+
+        async def fake_batch(batch, available_modules, module_summaries):
+            if batch[0]["id"] == "SAI-010":
+                raise RuntimeError("All LLM calls failed")
+            return miner._parse_match_response(json.dumps({"matches": []}), batch, "gemini")
+
+        with patch.object(miner, "_match_activities_batch", side_effect=fake_batch), \
+                patch.object(miner, "_save_cache") as mock_save:
+            with pytest.raises(RuntimeError):
+                await miner._match_activities(activities, [], {})
+
+        assert mock_save.call_count == 2
+        assert len(miner._cache) == 20
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
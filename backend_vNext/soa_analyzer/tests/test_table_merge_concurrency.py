@@ -0,0 +1,109 @@
+"""
+Unit tests for concurrent pair analysis in TableMergeAnalyzer.
+
+Tests cover:
+- Identical merge plans (group IDs, order) for sequential and concurrent runs
+- Level 1 decisions never reaching the LLM levels
+- Concurrency limit honoured
+- Per-level timing in MergePlan.analysis_summary
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from ..table_merge_analyzer import TableMergeAnalyzer
+
+
+class FakeTableResult:
+    """Minimal PerTableResult for merge analysis."""
+
+    def __init__(self, index: int, page: int, category: str, visits):
+        self.table_id = f"SOA-{index}"
+        self.success = True
+        self.usdm = {
+            "_tableMetadata": {"category": category, "pageStart": page, "pageEnd": page},
+            "visits": [{"name": v} for v in visits],
+            "activities": [{"name": f"Activity {index}"}],
+        }
+
+
+class DelayedHeuristicAnalyzer(TableMergeAnalyzer):
+    """Uses the heuristic levels behind random delays instead of LLM calls."""
+
+    def __init__(self, max_concurrent_pairs=None, seed=0):
+        super().__init__(max_concurrent_pairs=max_concurrent_pairs)
+        self._rng = random.Random(seed)
+        self.llm_pairs = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _levels_2_4_gemini_analysis(self, features_a, features_b):
+        self.llm_pairs.append((features_a.table_id, features_b.table_id))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self._rng.random() * 0.02)
+        self.in_flight -= 1
+        return self._heuristic_levels_2_4(features_a, features_b)
+
+    async def _levels_5_8_claude_analysis(self, features_a, features_b):
+        await asyncio.sleep(self._rng.random() * 0.02)
+        return self._heuristic_levels_5_8(features_a, features_b)
+
+
+@pytest.fixture
+def table_results():
+    results = [
+        FakeTableResult(i, i * 3, "MAIN_SOA" if i % 2 else "PK_SOA", [f"Visit {i}"])
+        for i in range(1, 9)
+    ]
+    # SOA-4 continues SOA-3 on the next page (level 1 merge)
+    results[3].usdm["_tableMetadata"]["pageStart"] = results[2].usdm["_tableMetadata"]["pageEnd"] + 1
+    results[3].usdm["visits"] = [{"name": "Visit 10 (continued)"}]
+    return results
+
+
+@pytest.mark.asyncio
+async def test_concurrent_plan_matches_sequential(table_results):
+    sequential = await DelayedHeuristicAnalyzer(max_concurrent_pairs=1, seed=1).analyze_merge_candidates(
+        table_results, "P-1"
+    )
+    concurrent = await DelayedHeuristicAnalyzer(max_concurrent_pairs=8, seed=2).analyze_merge_candidates(
+        table_results, "P-1"
+    )
+
+    assert [g.to_dict() for g in concurrent.merge_groups] == [g.to_dict() for g in sequential.merge_groups]
+    assert concurrent.standalone_tables == sequential.standalone_tables
+
+
+@pytest.mark.asyncio
+async def test_level1_short_circuits_llm_levels(table_results):
+    analyzer = DelayedHeuristicAnalyzer(max_concurrent_pairs=4)
+    plan = await analyzer.analyze_merge_candidates(table_results, "P-1")
+
+    assert ("SOA-3", "SOA-4") not in analyzer.llm_pairs
+    assert len(analyzer.llm_pairs) == len(table_results) - 2
+    assert plan.analysis_summary["level1ShortCircuited"] == 1
+    assert plan.merge_groups[0].table_ids == ["SOA-3", "SOA-4"]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit(table_results):
+    analyzer = DelayedHeuristicAnalyzer(max_concurrent_pairs=2)
+    await analyzer.analyze_merge_candidates(table_results, "P-1")
+    assert analyzer.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_level_timing_summary(table_results):
+    plan = await DelayedHeuristicAnalyzer(max_concurrent_pairs=4).analyze_merge_candidates(
+        table_results, "P-1"
+    )
+    timing = plan.analysis_summary["levelTiming"]
+
+    assert timing["level1"]["pairs"] == len(table_results) - 1
+    assert timing["levels2_4"]["pairs"] == len(table_results) - 2
+    assert timing["levels2_4"]["totalSeconds"] >= timing["levels2_4"]["maxSeconds"]
+    assert plan.analysis_summary["maxConcurrentPairs"] == 4
+    assert plan.analysis_summary["wallClockSeconds"] > 0
@@ -0,0 +1,126 @@
+"""
+Unit tests for the precomputed ATHENA search index.
+
+Tests cover:
+- Index restricted to valid standard concepts
+- Exact / synonym / prefix / batch lookups matching direct ATHENA queries
+- Stale index (ATHENA changed) falling back to direct queries
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+from ..terminology.athena_search_index import build_search_index, default_index_path, is_index_current
+from ..terminology.terminology_mapper import TerminologyMapper, TerminologyMapperConfig
+
+CONCEPTS = [
+    # concept_id, name, domain, vocabulary, standard, invalid_reason
+    (1, "Hemoglobin", "Measurement", "LOINC", "S", None),
+    (2, "Hemoglobin A1c", "Measurement", "LOINC", "S", None),
+    (3, "Hemoglobin", "Measurement", "SNOMED", None, None),  # non-standard
+    (4, "Hemoglobin measurement", "Measurement", "SNOMED", "S", "D"),  # invalid
+    (5, "Systolic blood pressure", "Measurement", "LOINC", "S", ""),
+    (6, "Physical examination", "Procedure", "SNOMED", "S", None),
+    (7, "Heart rate", "Measurement", "LOINC", "S", None),
+]
+SYNONYMS = [(1, "HGB"), (5, "SBP"), (3, "Hb"), (6, "Physical exam")]
+
+
+@pytest.fixture
+def athena_db(tmp_path):
+    path = tmp_path / "athena.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE concept (
+            concept_id INTEGER PRIMARY KEY, concept_name TEXT, domain_id TEXT,
+            vocabulary_id TEXT, concept_class_id TEXT, standard_concept TEXT,
+            concept_code TEXT, invalid_reason TEXT
+        );
+        CREATE TABLE concept_synonym (concept_id INTEGER, concept_synonym_name TEXT);
+    """)
+    conn.executemany(
+        "INSERT INTO concept VALUES (?, ?, ?, ?, 'Lab Test', ?, ?, ?)",
+        [(cid, name, domain, vocab, std, f"C{cid}", invalid) for cid, name, domain, vocab, std, invalid in CONCEPTS],
+    )
+    conn.executemany("INSERT INTO concept_synonym VALUES (?, ?)", SYNONYMS)
+    conn.commit()
+    conn.close()
+    return path
+
+
+def make_mapper(athena_db, use_search_index):
+    config = TerminologyMapperConfig(
+        athena_db_path=athena_db,
+        use_search_index=use_search_index,
+        use_llm_disambiguation=False,
+    )
+    return TerminologyMapper(config)
+
+
+def summarize(matches):
+    return sorted((m.concept_id, m.match_type, m.matched_term, round(m.match_score, 4)) for m in matches)
+
+
+def test_index_contains_valid_standard_concepts_only(athena_db):
+    index_path = build_search_index(athena_db)
+    assert index_path == default_index_path(athena_db)
+
+    conn = sqlite3.connect(index_path)
+    rows = set(conn.execute("SELECT concept_id, source, name_lower FROM concept_search"))
+    conn.close()
+    assert (1, "synonym", "hgb") in rows
+    assert (5, "name", "systolic blood pressure") in rows
+    assert not {row for row in rows if row[0] in (3, 4)}
+
+
+@pytest.mark.parametrize("term", ["hemoglobin", "HEMOGLOBIN A1C", "Heart Rate", "Unknown"])
+def test_exact_and_synonym_match_direct_queries(athena_db, term):
+    direct = make_mapper(athena_db, use_search_index=False)
+    build_search_index(athena_db)
+    indexed = make_mapper(athena_db, use_search_index=True)
+    assert indexed._get_index_connection() is not None
+
+    assert summarize(indexed._search_athena_exact(term)) == summarize(direct._search_athena_exact(term))
+    for synonym in ("hgb", "Sbp", "HB", "physical EXAM"):
+        assert summarize(indexed._search_athena_synonym(synonym)) == summarize(direct._search_athena_synonym(synonym))
+
+
+@pytest.mark.parametrize("term", ["hemo", "systolic", "heart rhythm", "zzz"])
+def test_prefix_matches_direct_queries(athena_db, term):
+    direct = make_mapper(athena_db, use_search_index=False)
+    build_search_index(athena_db)
+    indexed = make_mapper(athena_db, use_search_index=True)
+
+    assert summarize(indexed._search_athena_fuzzy(term)) == summarize(direct._search_athena_fuzzy(term))
+
+
+def test_batch_matches_direct_queries(athena_db):
+    terms = ["Hemoglobin", "hgb", "SBP", "Physical examination", "Unknown"]
+    direct = make_mapper(athena_db, use_search_index=False)._search_athena_batch(terms, vocabulary_filters=["LOINC", "SNOMED"])
+    build_search_index(athena_db)
+    indexed = make_mapper(athena_db, use_search_index=True)._search_athena_batch(terms, vocabulary_filters=["LOINC", "SNOMED"])
+
+    assert {t: summarize(m) for t, m in indexed.items()} == {t: summarize(m) for t, m in direct.items()}
+
+
+def test_stale_index_falls_back(athena_db):
+    index_path = build_search_index(athena_db)
+    assert is_index_current(index_path, athena_db)
+
+    conn = sqlite3.connect(athena_db)
+    conn.execute("INSERT INTO concept VALUES (8, 'Body weight', 'Measurement', 'LOINC', 'Lab Test', 'S', 'C8', NULL)")
+    conn.commit()
+    conn.close()
+    os.utime(athena_db, (0, 0))
+
+    assert not is_index_current(index_path, athena_db)
+    mapper = make_mapper(athena_db, use_search_index=True)
+    assert mapper._get_index_connection() is None
+    assert summarize(mapper._search_athena_exact("body weight")) == [(8, "exact", "body weight", 1.0)]
+
+    build_search_index(athena_db)
+    mapper.close()
+    assert mapper._get_index_connection() is not None
+    assert summarize(mapper._search_athena_exact("body weight")) == [(8, "exact", "body weight", 1.0)]
@@ -0,0 +1,49 @@
+"""
+Unit tests for VisitNameParser.
+
+Tests cover:
+- Pattern type and canonical name for each pattern family
+- Non-visit headers rejected
+- parse_all reusing matches for repeated names with distinct visit IDs
+"""
+
+from ..utils.visit_name_parser import VisitNameParser
+
+
+def test_pattern_types():
+    parser = VisitNameParser()
+    expected = {
+        "Cycle 2 – 6 Day 1 *": ("cycle_day", "Cycle 2-6 Day 1"),
+        "C1D1": ("cycle_day", "Cycle 1 Day 1"),
+        "Day −7": ("absolute_day", "Day -7"),
+        "Week 12 ± 3 days": ("week", "Week 12"),
+        "30-day FU Visit": ("timed_followup", "30-Day Follow-up"),
+        "SCR": ("milestone", "Screening"),
+        "Final Visit": ("milestone", "End of Treatment"),
+        "Long-term Follow-up": ("milestone", "Survival Follow-up"),
+    }
+    for name, (pattern_type, canonical_name) in expected.items():
+        result = parser.parse(name)
+        assert result.pattern_type == pattern_type, name
+        assert result.canonical_visit.name == canonical_name, name
+
+
+def test_non_visit_and_unknown():
+    parser = VisitNameParser()
+    for header in ("Days", "visit schedule", "6 - 19", "−2", "Study Procedures"):
+        result = parser.parse(header)
+        assert result.pattern_type == "non_visit", header
+        assert result.canonical_visit is None
+    assert parser.parse("Visit 3").pattern_type == "unknown"
+    assert parser.parse("  ").review_reason == "Empty visit name"
+
+
+def test_parse_all_matches_parse():
+    names = ["SCR", "C1D1", "Days", "C1D1", "Visit 3", "Week 4", "SCR", "Visit 3", "C1D1"]
+    visits, protocol_type = VisitNameParser().parse_all(names)
+
+    single = VisitNameParser()
+    expected = [single.parse(name).canonical_visit for name in names]
+    assert visits == [visit for visit in expected if visit is not None]
+    assert len({visit.id for visit in visits}) == len(visits)
+    assert protocol_type.value == "hybrid"
@@ -13,7 +13,7 @@ regardless of protocol type. Supports 5 visit naming patterns:
 import re
 import uuid
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from soa_analyzer.models import (
     CanonicalVisit,
@@ -27,6 +27,13 @@ from soa_analyzer.models import (
     WindowType,
 )
 
+# Name cleaning (see VisitNameParser._clean_visit_name)
+_TRAILING_FOOTNOTE_RE = re.compile(r"[\*†‡§¶#]+$")
+_FOOTNOTE_RE = re.compile(r"\s*[\*†‡§¶#]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_DASH_RE = re.compile(r"[–—]")
+_DIGIT_RE = re.compile(r"\d")
+
 
 @dataclass
 class ParseResult:
@@ -123,14 +130,56 @@ class VisitNameParser:
         r"^Optional$",                   # Header indicating optional visits
     ]
 
+    # Pattern type -> parser method, for replaying a known match (parse_all)
+    _PARSERS_BY_TYPE = {
+        "timed_followup": "_parse_timed_followup",
+        "cycle_day": "_parse_cycle_day",
+        "week": "_parse_week",
+        "absolute_day": "_parse_absolute_day",
+        "milestone": "_parse_milestone",
+    }
+
     # ==========================================================================
     # CONSTRUCTOR
     # ==========================================================================
 
     def __init__(self):
-        """Initialize the parser."""
+        """Initialize the parser and compile the pattern tables."""
         self._visit_counter = 0
 
+        self._cycle_day_res = [re.compile(p) for p in self.CYCLE_DAY_PATTERNS]
+        self._absolute_day_res = [re.compile(p) for p in self.ABSOLUTE_DAY_PATTERNS]
+        self._week_res = [re.compile(p) for p in self.WEEK_PATTERNS]
+        self._timed_followup_res = [re.compile(p) for p in self.TIMED_FOLLOWUP_PATTERNS]
+
+        # One alternation per table: re.match tries the branches in order, so
+        # the first matching milestone (dict order) wins as before
+        self._milestone_re = re.compile(
+            "|".join(
+                f"(?P<{milestone_type}>{self._strip_inline_flags(pattern)})"
+                for milestone_type, pattern in self.MILESTONE_PATTERNS.items()
+            ),
+            re.IGNORECASE,
+        )
+        self._non_visit_re = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.NON_VISIT_PATTERNS),
+            re.IGNORECASE,
+        )
+
+        # Cascade in order of specificity; every pattern except the
+        # milestones needs a digit, so digit-free names go straight to them
+        self._numeric_parsers = (
+            self._parse_timed_followup,
+            self._parse_cycle_day,
+            self._parse_week,
+            self._parse_absolute_day,
+        )
+
+    @staticmethod
+    def _strip_inline_flags(pattern: str) -> str:
+        """Drop a leading (?i) so patterns can be joined (flags must lead the whole regex)."""
+        return pattern[4:] if pattern.startswith("(?i)") else pattern
+
     # ==========================================================================
     # MAIN PARSING METHOD
     # ==========================================================================
@@ -145,8 +194,33 @@ class VisitNameParser:
         Returns:
             ParseResult with canonical visit information and parsing metadata
         """
-        # Clean the input
-        clean_name = self._clean_visit_name(visit_name)
+        return self._parse(visit_name, table_id)
+
+    def _parse(
+        self,
+        visit_name: str,
+        table_id: Optional[int],
+        routes: Optional[Dict[str, Tuple[str, Any]]] = None,
+    ) -> ParseResult:
+        """Parse one visit name, reusing the pattern match of an identical earlier name.
+
+        Args:
+            visit_name: The visit name as it appears in the SOA table
+            table_id: Optional source table ID for provenance
+            routes: visit name -> (clean name, outcome), where outcome is the
+                parser that matched or "non_visit" / "unknown"; filled in as
+                names are parsed (see parse_all)
+
+        Returns:
+            ParseResult with canonical visit information and parsing metadata
+        """
+        route = routes.get(visit_name) if routes is not None else None
+        if route is not None:
+            clean_name, outcome = route
+        else:
+            # Clean the input
+            clean_name = self._clean_visit_name(visit_name)
+            outcome = None
 
         if not clean_name:
             return ParseResult(
@@ -156,8 +230,18 @@ class VisitNameParser:
                 review_reason="Empty visit name",
             )
 
-        # Check if this is a non-visit pattern (column/row header, etc.)
-        if self._is_non_visit(clean_name):
+        if outcome is None:
+            outcome = self._match_outcome(clean_name, visit_name, table_id)
+            if isinstance(outcome, ParseResult):
+                if routes is not None:
+                    routes[visit_name] = (clean_name, self._PARSERS_BY_TYPE[outcome.pattern_type])
+                return outcome
+            if routes is not None:
+                routes[visit_name] = (clean_name, outcome)
+        elif outcome not in ("non_visit", "unknown"):
+            return getattr(self, outcome)(clean_name, visit_name, table_id)
+
+        if outcome == "non_visit":
             return ParseResult(
                 success=False,
                 pattern_type="non_visit",
@@ -166,33 +250,6 @@ class VisitNameParser:
                 review_reason=f"'{visit_name}' is a non-visit pattern (header/label)",
             )
 
-        # Try each pattern type in order of specificity
-
-        # 1. Timed follow-up (most specific)
-        result = self._parse_timed_followup(clean_name, visit_name, table_id)
-        if result.success:
-            return result
-
-        # 2. Cycle-day pattern (oncology-specific)
-        result = self._parse_cycle_day(clean_name, visit_name, table_id)
-        if result.success:
-            return result
-
-        # 3. Week pattern
-        result = self._parse_week(clean_name, visit_name, table_id)
-        if result.success:
-            return result
-
-        # 4. Absolute day pattern
-        result = self._parse_absolute_day(clean_name, visit_name, table_id)
-        if result.success:
-            return result
-
-        # 5. Milestone pattern (most general)
-        result = self._parse_milestone(clean_name, visit_name, table_id)
-        if result.success:
-            return result
-
         # If no pattern matched, flag for review
         return ParseResult(
             success=False,
@@ -203,6 +260,36 @@ class VisitNameParser:
             review_reason=f"Visit name '{visit_name}' did not match any known pattern",
         )
 
+    def _match_outcome(
+        self,
+        clean_name: str,
+        original_name: str,
+        table_id: Optional[int],
+    ) -> Any:
+        """Run the pattern cascade on a cleaned name.
+
+        Returns:
+            The successful ParseResult, or "non_visit" / "unknown"
+        """
+        # Check if this is a non-visit pattern (column/row header, etc.)
+        if self._is_non_visit(clean_name):
+            return "non_visit"
+
+        # Try each pattern type in order of specificity: timed follow-up (most
+        # specific), cycle-day, week, absolute day, milestone (most general).
+        # Only milestones can match without a digit.
+        if _DIGIT_RE.search(clean_name):
+            parsers = self._numeric_parsers + (self._parse_milestone,)
+        else:
+            parsers = (self._parse_milestone,)
+
+        for parser in parsers:
+            result = parser(clean_name, original_name, table_id)
+            if result.success:
+                return result
+
+        return "unknown"
+
     def parse_all(
         self,
         visit_names: List[str],
@@ -210,6 +297,10 @@ class VisitNameParser:
     ) -> Tuple[List[CanonicalVisit], ProtocolType]:
         """Parse a list of visit names and detect protocol type.
 
+        Each distinct name runs the pattern cascade once; later occurrences
+        go straight to the parser that matched it (each still gets its own
+        CanonicalVisit and ID).
+
         Args:
             visit_names: List of visit names from SOA table
             table_id: Optional source table ID for provenance
@@ -228,8 +319,11 @@ class VisitNameParser:
             "non_visit": 0,  # Rejected patterns (headers, labels, etc.)
         }
 
+        # Repeated names (the same visit header across tables) reuse the
+        # pattern that matched the first occurrence
+        routes: Dict[str, Tuple[str, Any]] = {}
         for name in visit_names:
-            result = self.parse(name, table_id)
+            result = self._parse(name, table_id, routes)
             if result.canonical_visit:
                 visits.append(result.canonical_visit)
             pattern_counts[result.pattern_type] += 1
@@ -251,8 +345,8 @@ class VisitNameParser:
     ) -> ParseResult:
         """Parse cycle-day format visits."""
 
-        for pattern in self.CYCLE_DAY_PATTERNS:
-            match = re.match(pattern, clean_name)
+        for pattern in self._cycle_day_res:
+            match = pattern.match(clean_name)
             if match:
                 groups = match.groups()
 
@@ -340,8 +434,8 @@ class VisitNameParser:
     ) -> ParseResult:
         """Parse absolute day format visits."""
 
-        for pattern in self.ABSOLUTE_DAY_PATTERNS:
-            match = re.match(pattern, clean_name)
+        for pattern in self._absolute_day_res:
+            match = pattern.match(clean_name)
             if match:
                 day = int(match.group(1))
 
@@ -388,8 +482,8 @@ class VisitNameParser:
     ) -> ParseResult:
         """Parse week-based format visits."""
 
-        for pattern in self.WEEK_PATTERNS:
-            match = re.match(pattern, clean_name)
+        for pattern in self._week_res:
+            match = pattern.match(clean_name)
             if match:
                 groups = match.groups()
                 week = int(groups[0])
@@ -441,35 +535,36 @@ class VisitNameParser:
     ) -> ParseResult:
         """Parse milestone visits (Screening, Baseline, EOT, etc.)."""
 
-        for milestone_type, pattern in self.MILESTONE_PATTERNS.items():
-            if re.match(pattern, clean_name):
-                # Map milestone to visit type and reference point
-                milestone_config = self._get_milestone_config(milestone_type)
-
-                # Create classification
-                classification = VisitClassification(
-                    visit_type=milestone_config["visit_type"],
-                    is_required=milestone_config.get("is_required", True),
-                    is_repeating=milestone_config.get("is_repeating", False),
-                )
+        match = self._milestone_re.match(clean_name)
+        if match:
+            milestone_type = match.lastgroup
+            # Map milestone to visit type and reference point
+            milestone_config = self._get_milestone_config(milestone_type)
+
+            # Create classification
+            classification = VisitClassification(
+                visit_type=milestone_config["visit_type"],
+                is_required=milestone_config.get("is_required", True),
+                is_repeating=milestone_config.get("is_repeating", False),
+            )
 
-                visit = CanonicalVisit(
-                    id=self._generate_id("ENC"),
-                    name=milestone_config["canonical_name"],
-                    original_name=original_name,
-                    visit_type=milestone_config["visit_type"],
-                    timing_value=milestone_config.get("timing_value"),
-                    timing_unit="days",
-                    relative_to=milestone_config["relative_to"],
-                    classification=classification,
-                )
+            visit = CanonicalVisit(
+                id=self._generate_id("ENC"),
+                name=milestone_config["canonical_name"],
+                original_name=original_name,
+                visit_type=milestone_config["visit_type"],
+                timing_value=milestone_config.get("timing_value"),
+                timing_unit="days",
+                relative_to=milestone_config["relative_to"],
+                classification=classification,
+            )
 
-                return ParseResult(
-                    success=True,
-                    pattern_type="milestone",
-                    canonical_visit=visit,
-                    confidence=0.90,
-                )
+            return ParseResult(
+                success=True,
+                pattern_type="milestone",
+                canonical_visit=visit,
+                confidence=0.90,
+            )
 
         return ParseResult(success=False, pattern_type="milestone")
 
@@ -481,8 +576,8 @@ class VisitNameParser:
     ) -> ParseResult:
         """Parse timed follow-up visits (30-day FU, Week 4 Follow-up, etc.)."""
 
-        for i, pattern in enumerate(self.TIMED_FOLLOWUP_PATTERNS):
-            match = re.match(pattern, clean_name)
+        for i, pattern in enumerate(self._timed_followup_res):
+            match = pattern.match(clean_name)
             if match:
                 value = int(match.group(1))
 
@@ -541,10 +636,7 @@ class VisitNameParser:
         Returns:
             True if this matches a non-visit pattern and should be rejected
         """
-        for pattern in self.NON_VISIT_PATTERNS:
-            if re.match(pattern, clean_name, re.IGNORECASE):
-                return True
-        return False
+        return self._non_visit_re.match(clean_name) is not None
 
     def _clean_visit_name(self, name: str) -> str:
         """Clean and normalize a visit name for parsing."""
@@ -555,14 +647,14 @@ class VisitNameParser:
         clean = name.strip()
 
         # Remove footnote markers (superscripts, asterisks, etc.)
-        clean = re.sub(r"[\*†‡§¶#]+$", "", clean)
-        clean = re.sub(r"\s*[\*†‡§¶#]+", "", clean)
+        clean = _TRAILING_FOOTNOTE_RE.sub("", clean)
+        clean = _FOOTNOTE_RE.sub("", clean)
 
         # Normalize whitespace
-        clean = re.sub(r"\s+", " ", clean)
+        clean = _WHITESPACE_RE.sub(" ", clean)
 
         # Normalize dashes (en-dash, em-dash)
-        clean = re.sub(r"[–—]", "-", clean)
+        clean = _DASH_RE.sub("-", clean)
 
         # Normalize Unicode minus sign to regular minus
         clean = clean.replace("−", "-")  # Unicode minus U+2212
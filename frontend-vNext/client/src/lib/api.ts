@@ -8,7 +8,10 @@ export interface FieldUpdateParams {
   updatedBy: string;
 }
 
-export type DocumentSummary = Pick<UsdmDocument, 'id' | 'studyId' | 'studyTitle' | 'createdAt' | 'usdmData'>;
+export type DocumentSummary = Pick<UsdmDocument, 'id' | 'studyId' | 'studyTitle' | 'createdAt' | 'usdmData'> & {
+  // Card fields of usdmData.study; the listing omits usdmData unless include_usdm=true
+  studySummary?: Record<string, any> | null;
+};
 
 const API_BASE = "";
 export const BACKEND_API_BASE = `${API_BASE}/api/backend`;
@@ -416,8 +416,7 @@ export default function LandingPage() {
           ) : documents && documents.length > 0 ? (
             <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6 mb-12">
               {documents.map((doc) => {
-                const usdm = doc.usdmData as any;
-                const study = usdm?.study;
+                const study = doc.studySummary ?? (doc.usdmData as any)?.study;
                 const status = (doc as any).extractionStatus;
                 const isCompleted = status === 'completed' || status === 'completed_with_errors';
                 const isProcessing = extractingProtocols.has(String(doc.id)) || pollingJobs.has(String(doc.id)) || status === 'processing';
@@ -124,7 +124,8 @@ export async function registerRoutes(
       let localDoc = await storage.getDocument(studyId);
 
       // Try to get from backend protocols table (primary source of truth)
-      const backendUrl = `${BACKEND_URL}/api/v1/protocols`;
+      // The listing omits USDM data unless asked; this document view needs it
+      const backendUrl = `${BACKEND_URL}/api/v1/protocols?include_usdm=true`;
       const backendResponse = await fetch(backendUrl);
 
       if (backendResponse.ok) {